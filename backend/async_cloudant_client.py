@@ -0,0 +1,946 @@
+"""
+Async Cloudant Client
+IBM Dev Day AI Demystified Hackathon 2026
+Team: AI Kings 👑
+
+Non-blocking Cloudant client for the API routers. Requests go over one pooled
+keep-alive HTTP client, so many concurrent queries share a handful of sockets,
+and all of them share one IAM token that is refreshed once before it expires.
+Databases held by the local replica are read from it instead of Cloudant.
+"""
+
+import asyncio
+import os
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, List, Optional, Union
+from urllib.parse import quote
+
+import httpx
+from ibm_cloud_sdk_core.authenticators import Authenticator
+
+from backend.cloudant_client import (
+    CloudantPartitioning,
+    golden_clause_selector,
+    parse_document,
+    precedent_selector,
+    precedent_sort,
+    project,
+    regulatory_mapping_selector,
+)
+from backend.cloudant_replica import get_cloudant_replica
+from backend.cloudant_views import (
+    STATS_DESIGN_DOC,
+    acceptance_rates,
+    key_range,
+    rows_by_key,
+    stats_by_key,
+)
+from backend.iam_tokens import SharedIAMAuthenticator, get_iam_token_provider
+from backend.models import GoldenClause, HistoricalDecision, RegulatoryMapping
+from backend.resilience import CircuitBreaker, RetryPolicy, create_circuit_breaker
+import logging
+
+if TYPE_CHECKING:
+    from backend.cloudant_replica import CloudantReplica, ReplicaDatabase
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncCloudantClient:
+    """
+    Async Cloudant database client over a pooled HTTP connection.
+
+    Mirrors the query methods of CloudantClient with coroutine versions that
+    never block the event loop.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        timeout: Optional[float] = None,
+        authenticator: Optional[Authenticator] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        partitioning: Optional[CloudantPartitioning] = None,
+        replica: Optional["CloudantReplica"] = None,
+    ):
+        """
+        Initialize async Cloudant client.
+
+        Args:
+            url: Cloudant URL (defaults to CLOUDANT_URL env var)
+            api_key: Cloudant API key (defaults to CLOUDANT_API_KEY env var)
+            max_retries: Maximum number of retry attempts
+            retry_delay: Initial delay between retries in seconds
+            max_connections: Connection pool size
+                (defaults to CLOUDANT_POOL_MAX_CONNECTIONS env var or 10)
+            max_keepalive_connections: Idle connections kept open
+                (defaults to CLOUDANT_POOL_MAX_KEEPALIVE env var or 5)
+            timeout: Request timeout in seconds (defaults to CLOUDANT_TIMEOUT_SECONDS or 30)
+            authenticator: Authenticator signing requests (defaults to the shared IAM token of api_key)
+            transport: HTTP transport (for tests)
+            breaker: Circuit breaker (defaults to a new breaker registered as cloudant_async)
+            partitioning: Partitioning of the Golden Clause and historical decision
+                databases (defaults to the CLOUDANT_PARTITIONED settings)
+            replica: Local SQLite replica serving reads of the databases it holds
+        """
+        self.url = url or os.getenv("CLOUDANT_URL")
+        self.api_key = api_key or os.getenv("CLOUDANT_API_KEY")
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.page_size = int(os.getenv("CLOUDANT_PAGE_SIZE", "200"))
+
+        if not self.url or (not self.api_key and authenticator is None):
+            raise ValueError(
+                "Cloudant credentials required. Set CLOUDANT_URL and CLOUDANT_API_KEY "
+                "environment variables or pass them to constructor."
+            )
+
+        # Database names
+        self.db_golden_clauses = os.getenv("CLOUDANT_DB_GOLDEN_CLAUSES", "golden_clauses")
+        self.db_historical_decisions = os.getenv(
+            "CLOUDANT_DB_HISTORICAL_DECISIONS", "historical_decisions"
+        )
+        self.db_regulatory_mappings = os.getenv(
+            "CLOUDANT_DB_REGULATORY_MAPPINGS", "regulatory_mappings"
+        )
+        self.partitioning = partitioning or CloudantPartitioning()
+        self.replica = replica
+
+        # Pooled keep-alive HTTP client
+        self.max_connections = max_connections or int(
+            os.getenv("CLOUDANT_POOL_MAX_CONNECTIONS", "10")
+        )
+        self.max_keepalive_connections = max_keepalive_connections or int(
+            os.getenv("CLOUDANT_POOL_MAX_KEEPALIVE", "5")
+        )
+        timeout = timeout or float(os.getenv("CLOUDANT_TIMEOUT_SECONDS", "30"))
+        self.http = httpx.AsyncClient(
+            base_url=self.url.rstrip("/"),
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=float(os.getenv("CLOUDANT_POOL_KEEPALIVE_SECONDS", "30")),
+            ),
+            timeout=timeout,
+            transport=transport,
+        )
+
+        # IAM token shared by all concurrent requests
+        self.authenticator = authenticator or SharedIAMAuthenticator(
+            get_iam_token_provider(self.api_key)
+        )
+        self._authorization: Optional[str] = None
+        self._authorization_refresh_at = 0.0
+        self._auth_lock = asyncio.Lock()
+
+        self.breaker = breaker or create_circuit_breaker("cloudant_async")
+        self.retry_policy = RetryPolicy(
+            "Cloudant",
+            max_retries=self.max_retries,
+            base_delay=self.retry_delay,
+            breaker=self.breaker,
+        )
+
+        logger.info(
+            f"Async Cloudant client initialized: {self.url} "
+            f"(pool: {self.max_connections} connections)"
+        )
+
+    async def _auth_headers(self) -> Dict[str, str]:
+        """
+        Get the Authorization header, refreshing the shared token when due.
+
+        Only one coroutine refreshes; the others wait for its token. The
+        token request itself runs on a worker thread.
+
+        Returns:
+            Headers to add to a request
+        """
+        if isinstance(self.authenticator, SharedIAMAuthenticator):
+            # Refreshed in the background; only a cold token is fetched here
+            provider = self.authenticator.provider
+            token = provider.cached_token() or await asyncio.to_thread(provider.get_token)
+            return {"Authorization": f"Bearer {token}"}
+
+        if self._authorization is None or time.time() >= self._authorization_refresh_at:
+            async with self._auth_lock:
+                if self._authorization is None or time.time() >= self._authorization_refresh_at:
+                    request: Dict[str, Any] = {"headers": {}}
+                    await asyncio.to_thread(self.authenticator.authenticate, request)
+                    self._authorization = request["headers"].get("Authorization", "")
+
+                    token_manager = getattr(self.authenticator, "token_manager", None)
+                    refresh_time = getattr(token_manager, "refresh_time", None)
+                    self._authorization_refresh_at = refresh_time if refresh_time else float("inf")
+
+        return {"Authorization": self._authorization} if self._authorization else {}
+
+    async def _request(self, method: str, path: str, **kwargs) -> Dict[str, Any]:
+        """
+        Send one authenticated request and decode the JSON response.
+
+        Args:
+            method: HTTP method
+            path: Path relative to the Cloudant URL
+            **kwargs: Arguments for httpx.AsyncClient.request
+
+        Returns:
+            Decoded response body
+
+        Raises:
+            httpx.HTTPStatusError: On an error status
+        """
+        headers = await self._auth_headers()
+        response = await self.http.request(method, path, headers=headers, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    def has_replica(self, db_name: str) -> bool:
+        """Whether reads of a database are served by a complete local replica."""
+        local = self.replica.get(db_name) if self.replica is not None else None
+        return local is not None and local.ready
+
+    async def _read_replica(
+        self, db_name: str, read: Callable[["ReplicaDatabase"], Any]
+    ) -> Optional[Any]:
+        """
+        Run a read against the local replica of a database, on a worker thread.
+
+        Args:
+            db_name: Database name
+            read: Function querying the ReplicaDatabase
+
+        Returns:
+            Result of read, or None when the database has no complete replica
+            or the read failed (the caller then queries Cloudant)
+        """
+        if not self.has_replica(db_name):
+            return None
+        try:
+            return await asyncio.to_thread(read, self.replica.get(db_name))
+        except Exception as e:
+            logger.warning(f"Replica read of {db_name} failed, querying Cloudant: {e}")
+            return None
+
+    @staticmethod
+    def _find_path(db_name: str, partition: Optional[str] = None) -> str:
+        """Path of the _find endpoint, scoped to a partition when one is given."""
+        path = f"/{quote(db_name, safe='')}"
+        if partition:
+            path += f"/_partition/{quote(partition, safe='')}"
+        return f"{path}/_find"
+
+    async def _find(
+        self, db_name: str, query: Dict[str, Any], partition: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run a Mango query with retries.
+
+        Args:
+            db_name: Database name
+            query: Body of the _find request
+            partition: Partition key, or None for a global query
+
+        Returns:
+            Matching documents
+        """
+        result = await self.retry_policy.acall(
+            self._request, "POST", self._find_path(db_name, partition), json=query
+        )
+        return result.get("docs", [])
+
+    async def query_golden_clauses(
+        self,
+        contract_type: str,
+        jurisdiction: Optional[str] = None,
+        mandatory_only: bool = False,
+        limit: int = 100,
+        fields: Optional[List[str]] = None,
+    ) -> List[Union[GoldenClause, Dict[str, Any]]]:
+        """
+        Query Golden Clauses by contract type.
+
+        Args:
+            contract_type: Contract type to filter by
+            jurisdiction: Optional jurisdiction filter
+            mandatory_only: If True, return only mandatory clauses
+            limit: Maximum number of results
+            fields: Optional projection (e.g. GOLDEN_CLAUSE_SUMMARY_FIELDS)
+
+        Returns:
+            List of GoldenClause objects, or the projected documents as dicts
+            (not validated) when fields is given
+        """
+        docs = await self._read_replica(
+            self.db_golden_clauses,
+            lambda local: local.golden_clauses(contract_type, jurisdiction, mandatory_only, limit),
+        )
+        if docs is None:
+            selector = golden_clause_selector(contract_type, jurisdiction, mandatory_only)
+            query: Dict[str, Any] = {"selector": selector, "limit": limit}
+            if fields:
+                query["fields"] = fields
+            docs = await self._find(
+                self.db_golden_clauses,
+                query,
+                self.partitioning.key_for(contract_type, jurisdiction),
+            )
+
+        if fields:
+            docs = [project(doc, fields) for doc in docs]
+            logger.info(f"Retrieved {len(docs)} projected Golden Clauses for {contract_type}")
+            return docs
+
+        clauses = []
+        for doc in docs:
+            try:
+                clauses.append(GoldenClause(**doc))
+            except Exception as e:
+                logger.warning(f"Failed to parse Golden Clause: {e}")
+
+        logger.info(f"Retrieved {len(clauses)} Golden Clauses for {contract_type}")
+        return clauses
+
+    async def get_precedents(
+        self,
+        contract_type: str,
+        jurisdiction: Optional[str] = None,
+        min_confidence: float = 0.0,
+        limit: int = 10,
+        fields: Optional[List[str]] = None,
+    ) -> List[Union[HistoricalDecision, Dict[str, Any]]]:
+        """
+        Get historical precedents for a contract type.
+
+        Args:
+            contract_type: Contract type to filter by
+            jurisdiction: Optional jurisdiction filter
+            min_confidence: Minimum confidence score
+            limit: Maximum number of results
+            fields: Optional projection (e.g. PRECEDENT_SCORING_FIELDS)
+
+        Returns:
+            List of HistoricalDecision objects sorted by confidence (descending),
+            or the projected documents as dicts (not validated) when fields is given
+        """
+        docs = await self._read_replica(
+            self.db_historical_decisions,
+            lambda local: local.precedents(contract_type, jurisdiction, min_confidence, limit),
+        )
+        if docs is None:
+            selector = precedent_selector(contract_type, jurisdiction, min_confidence)
+            query: Dict[str, Any] = {
+                "selector": selector,
+                "sort": precedent_sort(contract_type, jurisdiction),
+                "limit": limit,
+            }
+            if fields:
+                query["fields"] = fields
+            docs = await self._find(
+                self.db_historical_decisions,
+                query,
+                self.partitioning.key_for(contract_type, jurisdiction),
+            )
+
+        if fields:
+            docs = [project(doc, fields) for doc in docs]
+            logger.info(f"Retrieved {len(docs)} projected precedents for {contract_type}")
+            return docs
+
+        decisions = []
+        for doc in docs:
+            try:
+                decisions.append(HistoricalDecision(**doc))
+            except Exception as e:
+                logger.warning(f"Failed to parse Historical Decision: {e}")
+
+        logger.info(
+            f"Retrieved {len(decisions)} precedents for {contract_type} "
+            f"(min confidence: {min_confidence})"
+        )
+        return decisions
+
+    async def get_precedents_by_ids(self, doc_ids: List[str]) -> List[HistoricalDecision]:
+        """
+        Get full historical decisions, e.g. for the top-ranked projected precedents.
+
+        Args:
+            doc_ids: Document IDs
+
+        Returns:
+            HistoricalDecision objects in the order of doc_ids (missing IDs skipped)
+        """
+        if not doc_ids:
+            return []
+
+        docs = await self.get_documents_by_ids(self.db_historical_decisions, doc_ids)
+        decisions = [parse_document(doc, HistoricalDecision) for doc in docs.values() if doc]
+        return [decision for decision in decisions if decision is not None]
+
+    async def store_precedent(self, decision: HistoricalDecision) -> str:
+        """
+        Store a new historical decision.
+
+        Args:
+            decision: HistoricalDecision object to store
+
+        Returns:
+            Document ID of stored decision
+        """
+        doc = decision.model_dump(by_alias=True, exclude_none=True)
+
+        # Remove _id and _rev if present (will be assigned by Cloudant,
+        # or within the decision's partition when partitioned)
+        doc.pop("_id", None)
+        doc.pop("_rev", None)
+        doc = self.partitioning.precedent_document(doc)
+
+        result = await self.retry_policy.acall(
+            self._request,
+            "POST",
+            f"/{quote(self.db_historical_decisions, safe='')}",
+            json=doc,
+        )
+
+        doc_id = result.get("id")
+        logger.info(f"Stored precedent: {doc_id}")
+        return doc_id
+
+    async def bulk_store_documents(
+        self, db_name: str, documents: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Store several documents in one _bulk_docs request.
+
+        Args:
+            db_name: Database name
+            documents: Documents to store
+
+        Returns:
+            One result per document, in order: {'id', 'rev', 'ok'} on success or
+            {'id', 'error', 'reason'} when that document was rejected
+        """
+        results = await self.retry_policy.acall(
+            self._request,
+            "POST",
+            f"/{quote(db_name, safe='')}/_bulk_docs",
+            json={"docs": documents},
+        )
+        logger.info(f"Bulk stored {len(documents)} documents in {db_name}")
+        return results
+
+    async def get_regulatory_mappings(
+        self,
+        jurisdiction: Optional[str] = None,
+        regulation_type: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[RegulatoryMapping]:
+        """
+        Get regulatory mappings.
+
+        Args:
+            jurisdiction: Optional jurisdiction filter
+            regulation_type: Optional regulation type filter
+            limit: Maximum number of results
+
+        Returns:
+            List of RegulatoryMapping objects
+        """
+        docs = await self._read_replica(
+            self.db_regulatory_mappings,
+            lambda local: local.regulatory_mappings(jurisdiction, regulation_type, limit),
+        )
+        if docs is None:
+            selector = regulatory_mapping_selector(jurisdiction, regulation_type)
+            docs = await self._find(
+                self.db_regulatory_mappings, {"selector": selector, "limit": limit}
+            )
+
+        mappings = []
+        for doc in docs:
+            try:
+                mappings.append(RegulatoryMapping(**doc))
+            except Exception as e:
+                logger.warning(f"Failed to parse Regulatory Mapping: {e}")
+
+        logger.info(
+            f"Retrieved {len(mappings)} regulatory mappings "
+            f"(jurisdiction: {jurisdiction}, type: {regulation_type})"
+        )
+        return mappings
+
+    async def aiter_find(
+        self,
+        db_name: str,
+        selector: Dict[str, Any],
+        sort: Optional[List[Dict[str, str]]] = None,
+        fields: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        partition: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over every document matching a Mango query, page by page.
+
+        Pages are followed with Cloudant bookmarks. The next page is requested
+        while the caller processes the current one, so at most two pages are
+        held in memory.
+
+        Args:
+            db_name: Database name
+            selector: Mango selector
+            sort: Optional sort specification
+            fields: Optional fields to return
+            page_size: Documents per request (defaults to CLOUDANT_PAGE_SIZE env var or 200)
+            partition: Partition key to scope the query to
+            limit: Maximum documents to read (no page is requested past it)
+
+        Yields:
+            Matching documents
+        """
+        page_size = page_size or self.page_size
+        if limit is not None:
+            page_size = min(page_size, limit)
+        path = self._find_path(db_name, partition)
+        remaining = limit
+
+        async def _fetch(bookmark: Optional[str]) -> Dict[str, Any]:
+            query: Dict[str, Any] = {"selector": selector, "limit": page_size}
+            if sort:
+                query["sort"] = sort
+            if fields:
+                query["fields"] = fields
+            if bookmark:
+                query["bookmark"] = bookmark
+            return await self.retry_policy.acall(self._request, "POST", path, json=query)
+
+        next_page = asyncio.create_task(_fetch(None))
+        try:
+            while True:
+                result = await next_page
+                docs = result.get("docs", [])
+                bookmark = result.get("bookmark")
+
+                has_more = len(docs) >= page_size and bool(bookmark)
+                if remaining is not None:
+                    docs = docs[:remaining]
+                    remaining -= len(docs)
+                    has_more = has_more and remaining > 0
+                if has_more:
+                    next_page = asyncio.create_task(_fetch(bookmark))
+
+                for doc in docs:
+                    yield doc
+
+                if not has_more:
+                    return
+        finally:
+            if not next_page.done():
+                next_page.cancel()
+
+    async def aiter_golden_clauses(
+        self,
+        contract_type: str,
+        jurisdiction: Optional[str] = None,
+        mandatory_only: bool = False,
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[GoldenClause]:
+        """
+        Iterate over every Golden Clause of a contract type.
+
+        Args:
+            contract_type: Contract type to filter by
+            jurisdiction: Optional jurisdiction filter
+            mandatory_only: If True, return only mandatory clauses
+            page_size: Documents per request
+
+        Yields:
+            GoldenClause objects
+        """
+        selector = golden_clause_selector(contract_type, jurisdiction, mandatory_only)
+        async for doc in self.aiter_find(
+            self.db_golden_clauses,
+            selector,
+            page_size=page_size,
+            partition=self.partitioning.key_for(contract_type, jurisdiction),
+        ):
+            clause = parse_document(doc, GoldenClause)
+            if clause is not None:
+                yield clause
+
+    async def aiter_precedents(
+        self,
+        contract_type: Optional[str] = None,
+        jurisdiction: Optional[str] = None,
+        min_confidence: float = 0.0,
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[HistoricalDecision]:
+        """
+        Iterate over every historical decision matching the filters (unsorted).
+
+        Args:
+            contract_type: Optional contract type filter (all decisions if None)
+            jurisdiction: Optional jurisdiction filter
+            min_confidence: Minimum confidence score
+            page_size: Documents per request
+
+        Yields:
+            HistoricalDecision objects
+        """
+        selector = precedent_selector(contract_type, jurisdiction, min_confidence)
+        async for doc in self.aiter_find(
+            self.db_historical_decisions,
+            selector,
+            page_size=page_size,
+            partition=self.partitioning.key_for(contract_type, jurisdiction),
+        ):
+            decision = parse_document(doc, HistoricalDecision)
+            if decision is not None:
+                yield decision
+
+    async def aiter_regulatory_mappings(
+        self,
+        jurisdiction: Optional[str] = None,
+        regulation_type: Optional[str] = None,
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[RegulatoryMapping]:
+        """
+        Iterate over every regulatory mapping matching the filters.
+
+        Args:
+            jurisdiction: Optional jurisdiction filter
+            regulation_type: Optional regulation type filter
+            page_size: Documents per request
+
+        Yields:
+            RegulatoryMapping objects
+        """
+        selector = regulatory_mapping_selector(jurisdiction, regulation_type)
+        async for doc in self.aiter_find(
+            self.db_regulatory_mappings, selector, page_size=page_size
+        ):
+            mapping = parse_document(doc, RegulatoryMapping)
+            if mapping is not None:
+                yield mapping
+
+    async def query_view(
+        self, db_name: str, view: str, group_level: Optional[int] = None, **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Query a reduced view of the stats design document.
+
+        Args:
+            db_name: Database name
+            view: View name
+            group_level: Number of key elements to group by (None reduces everything)
+            **kwargs: Other view parameters (start_key, end_key, ...)
+
+        Returns:
+            View rows with 'key' and 'value'
+        """
+        body: Dict[str, Any] = dict(kwargs)
+        if group_level is not None:
+            body["group_level"] = group_level
+        path = (
+            f"/{quote(db_name, safe='')}/_design/{STATS_DESIGN_DOC}"
+            f"/_view/{quote(view, safe='')}"
+        )
+        result = await self.retry_policy.acall(self._request, "POST", path, json=body)
+        return result.get("rows", [])
+
+    async def get_confidence_stats_by_contract_type(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get precedent confidence statistics per contract type.
+
+        Returns:
+            Dict mapping contract type to count, avg, min and max confidence
+        """
+        rows = await self.query_view(self.db_historical_decisions, "confidence_by_contract_type", 1)
+        return stats_by_key(rows)
+
+    async def get_confidence_stats_by_jurisdiction(
+        self, contract_type: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get precedent confidence statistics of a contract type per jurisdiction.
+
+        Args:
+            contract_type: Contract type
+
+        Returns:
+            Dict mapping jurisdiction to count, avg, min and max confidence
+        """
+        rows = await self.query_view(
+            self.db_historical_decisions,
+            "confidence_by_contract_type",
+            2,
+            **key_range([contract_type]),
+        )
+        return stats_by_key(rows, 1)
+
+    async def get_decision_counts_by_jurisdiction(self) -> Dict[str, int]:
+        """
+        Get the number of historical decisions per jurisdiction.
+
+        Returns:
+            Dict mapping jurisdiction to decision count
+        """
+        rows = await self.query_view(self.db_historical_decisions, "decisions_by_jurisdiction", 1)
+        return rows_by_key(rows)
+
+    async def get_modification_acceptance_rates(
+        self, contract_type: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get how often each clause modification of a contract type was accepted.
+
+        Args:
+            contract_type: Contract type
+
+        Returns:
+            Dict mapping modified clause to its decision count and acceptance rate
+        """
+        rows = await self.query_view(
+            self.db_historical_decisions,
+            "modification_outcomes",
+            2,
+            **key_range([contract_type]),
+        )
+        return acceptance_rates(rows)
+
+    async def get_golden_clause_counts_by_contract_type(self) -> Dict[str, int]:
+        """
+        Get the number of Golden Clauses applying to each contract type.
+
+        Returns:
+            Dict mapping contract type to clause count
+        """
+        rows = await self.query_view(self.db_golden_clauses, "clauses_by_contract_type", 1)
+        return rows_by_key(rows)
+
+    async def get_document_by_id(self, db_name: str, doc_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a document by ID.
+
+        Args:
+            db_name: Database name
+            doc_id: Document ID
+
+        Returns:
+            Document as dict or None if not found
+        """
+        docs = await self._read_replica(db_name, lambda local: local.get_documents([doc_id]))
+        if docs:
+            return docs[doc_id]
+
+        try:
+            return await self.retry_policy.acall(
+                self._request,
+                "GET",
+                f"/{quote(db_name, safe='')}/{quote(doc_id, safe='')}",
+            )
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+    async def get_documents_by_ids(
+        self, db_name: str, doc_ids: List[str], chunk_size: Optional[int] = None
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get several documents by ID with _all_docs, chunks of IDs fetched concurrently.
+
+        Args:
+            db_name: Database name
+            doc_ids: Document IDs
+            chunk_size: IDs per request (defaults to CLOUDANT_PAGE_SIZE)
+
+        Returns:
+            Dict mapping each requested ID, in order, to its document, or to
+            None when the document is missing or deleted
+        """
+        keys = list(dict.fromkeys(doc_ids))
+        chunk_size = chunk_size or self.page_size
+        path = f"/{quote(db_name, safe='')}/_all_docs"
+
+        # Documents the replica does not hold (yet) are read from Cloudant
+        docs = await self._read_replica(db_name, lambda local: local.get_documents(keys)) or {}
+        missing = [doc_id for doc_id in keys if doc_id not in docs]
+
+        results = await asyncio.gather(
+            *(
+                self.retry_policy.acall(
+                    self._request,
+                    "POST",
+                    path,
+                    json={"keys": missing[start : start + chunk_size], "include_docs": True},
+                )
+                for start in range(0, len(missing), chunk_size)
+            )
+        )
+        for result in results:
+            for row in result.get("rows", []):
+                docs[row["key"]] = row.get("doc")
+        return {doc_id: docs.get(doc_id) for doc_id in keys}
+
+    async def get_database_info(self, db_name: str) -> Dict[str, Any]:
+        """
+        Get database information, including its current update_seq.
+
+        Args:
+            db_name: Database name
+
+        Returns:
+            Database information
+        """
+        return await self.retry_policy.acall(self._request, "GET", f"/{quote(db_name, safe='')}")
+
+    async def health_check(self) -> Dict[str, Any]:
+        """
+        Check Cloudant connection health, querying the databases concurrently.
+
+        Probes bypass retries and the circuit breaker, so they report the
+        state of Cloudant itself.
+
+        Returns:
+            Dict with health status
+        """
+        db_names = [
+            self.db_golden_clauses,
+            self.db_historical_decisions,
+            self.db_regulatory_mappings,
+        ]
+        info, *db_infos = await asyncio.gather(
+            self._request("GET", "/"),
+            *(self._request("GET", f"/{quote(db_name, safe='')}") for db_name in db_names),
+            return_exceptions=True,
+        )
+        if isinstance(info, BaseException):
+            return {"status": "unhealthy", "error": str(info)}
+
+        databases = {}
+        for db_name, db_info in zip(db_names, db_infos):
+            if isinstance(db_info, BaseException):
+                databases[db_name] = {"status": "error", "error": str(db_info)}
+            else:
+                databases[db_name] = {"status": "ok", "doc_count": db_info.get("doc_count", 0)}
+
+        return {
+            "status": (
+                "healthy" if all(db["status"] == "ok" for db in databases.values()) else "degraded"
+            ),
+            "version": info.get("version"),
+            "databases": databases,
+        }
+
+    async def get_all_documents(self, db_name: str) -> List[Dict[str, Any]]:
+        """
+        Get every document of a database (design documents excluded).
+
+        Args:
+            db_name: Database name
+
+        Returns:
+            Documents
+        """
+        result = await self.retry_policy.acall(
+            self._request,
+            "GET",
+            f"/{quote(db_name, safe='')}/_all_docs",
+            params={"include_docs": "true"},
+        )
+        return [
+            row["doc"]
+            for row in result.get("rows", [])
+            if row.get("doc") and not row["id"].startswith("_design/")
+        ]
+
+    async def get_changes(
+        self,
+        db_name: str,
+        since: str = "0",
+        longpoll_timeout_ms: int = 60000,
+        limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Wait for changes after a sequence ID on the longpoll _changes feed.
+
+        Not retried: feed consumers poll again from the same sequence ID.
+
+        Args:
+            db_name: Database name
+            since: Sequence ID to read changes after
+            longpoll_timeout_ms: Time Cloudant waits for a change before answering
+            limit: Maximum number of changes to return
+
+        Returns:
+            Dict with 'results' (changes with their documents) and 'last_seq'
+        """
+        params: Dict[str, Any] = {
+            "feed": "longpoll",
+            "since": since,
+            "include_docs": "true",
+            "timeout": longpoll_timeout_ms,
+        }
+        if limit:
+            params["limit"] = limit
+
+        return await self._request(
+            "GET",
+            f"/{quote(db_name, safe='')}/_changes",
+            params=params,
+            timeout=longpoll_timeout_ms / 1000 + 30,
+        )
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Get connection pool configuration.
+
+        Returns:
+            Dict with pool limits and breaker state
+        """
+        return {
+            "max_connections": self.max_connections,
+            "max_keepalive_connections": self.max_keepalive_connections,
+            "circuit_breaker": self.breaker.get_stats(),
+        }
+
+    async def aclose(self):
+        """Close pooled connections."""
+        await self.http.aclose()
+
+
+# ============================================================================
+# Singleton instance
+# ============================================================================
+
+_async_cloudant_client: Optional[AsyncCloudantClient] = None
+
+
+def get_async_cloudant_client() -> AsyncCloudantClient:
+    """
+    Get singleton async Cloudant client instance, shared by all requests.
+
+    Returns:
+        AsyncCloudantClient instance
+    """
+    global _async_cloudant_client
+    if _async_cloudant_client is None:
+        _async_cloudant_client = AsyncCloudantClient()
+    # Follow the local replica, which starts and stops independently of the client
+    _async_cloudant_client.replica = get_cloudant_replica()
+    return _async_cloudant_client
+
+
+async def close_async_cloudant_client():
+    """Close the singleton client's connections, if it was created."""
+    global _async_cloudant_client
+    if _async_cloudant_client is not None:
+        await _async_cloudant_client.aclose()
+        _async_cloudant_client = None
@@ -6,16 +6,350 @@ Team: AI Kings 👑
 Wrapper for IBM Cloudant database operations with error handling and retry logic.
 """
 
+import contextvars
 import os
-import time
-from typing import List, Optional, Dict, Any
+import re
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
 from ibmcloudant.cloudant_v1 import CloudantV1
-from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
+from backend.cloudant_views import (
+    STATS_DESIGN_DOC,
+    acceptance_rates,
+    design_document,
+    key_range,
+    rows_by_key,
+    stats_by_key,
+)
+from backend.iam_tokens import SharedIAMAuthenticator, get_iam_token_provider
 from backend.models import GoldenClause, HistoricalDecision, RegulatoryMapping
+from backend.resilience import RetryPolicy, create_circuit_breaker, is_not_found
 import logging
 
+if TYPE_CHECKING:
+    from backend.cloudant_replica import CloudantReplica, ReplicaDatabase
+
 logger = logging.getLogger(__name__)
 
+DocumentModel = TypeVar("DocumentModel", GoldenClause, HistoricalDecision, RegulatoryMapping)
+
+# Field projections of historical decisions: enough to rank candidates, or to
+# display a precedent without its original text
+PRECEDENT_SCORING_FIELDS = [
+    "_id",
+    "decision_id",
+    "contract_type",
+    "jurisdiction",
+    "confidence",
+    "date",
+    "tags",
+]
+PRECEDENT_DISPLAY_FIELDS = PRECEDENT_SCORING_FIELDS + [
+    "clause_modified",
+    "modified_text",
+    "rationale",
+    "approved_by",
+    "regulatory_basis",
+]
+
+# Field projection of Golden Clauses without their text
+GOLDEN_CLAUSE_SUMMARY_FIELDS = [
+    "_id",
+    "clause_id",
+    "type",
+    "contract_types",
+    "jurisdiction",
+    "mandatory",
+    "risk_level",
+    "tags",
+]
+
+
+# ============================================================================
+# Query selectors (shared with the async client)
+# ============================================================================
+
+
+def golden_clause_selector(
+    contract_type: str, jurisdiction: Optional[str] = None, mandatory_only: bool = False
+) -> Dict[str, Any]:
+    """Build the Mango selector for Golden Clauses of a contract type."""
+    selector: Dict[str, Any] = {"contract_types": {"$elemMatch": {"$eq": contract_type}}}
+
+    if jurisdiction:
+        selector["jurisdiction"] = jurisdiction
+
+    if mandatory_only:
+        selector["mandatory"] = True
+
+    return selector
+
+
+def precedent_selector(
+    contract_type: Optional[str] = None,
+    jurisdiction: Optional[str] = None,
+    min_confidence: float = 0.0,
+) -> Dict[str, Any]:
+    """Build the Mango selector for historical decisions (all contract types if None)."""
+    selector: Dict[str, Any] = {"confidence": {"$gte": min_confidence}}
+
+    if contract_type:
+        selector["contract_type"] = contract_type
+
+    if jurisdiction:
+        selector["jurisdiction"] = jurisdiction
+
+    return selector
+
+
+def precedent_sort(
+    contract_type: Optional[str] = None, jurisdiction: Optional[str] = None
+) -> List[Dict[str, str]]:
+    """
+    Build the sort of precedent queries: by confidence, descending.
+
+    The equality-filtered fields lead the sort so that the composite
+    (contract_type, jurisdiction, confidence) indexes can serve it.
+    """
+    sort = []
+    if contract_type:
+        sort.append({"contract_type": "desc"})
+    if jurisdiction:
+        sort.append({"jurisdiction": "desc"})
+    sort.append({"confidence": "desc"})
+    return sort
+
+
+def coalesced_golden_clause_selector(
+    contract_types: Iterable[str],
+    jurisdictions: Optional[Iterable[str]] = None,
+    mandatory_only: bool = False,
+) -> Dict[str, Any]:
+    """Build the Mango selector of several Golden Clause queries merged into one."""
+    selector: Dict[str, Any] = {"contract_types": {"$elemMatch": {"$in": sorted(contract_types)}}}
+
+    if jurisdictions:
+        selector["jurisdiction"] = {"$in": sorted(jurisdictions)}
+
+    if mandatory_only:
+        selector["mandatory"] = True
+
+    return selector
+
+
+def coalesced_precedent_selector(
+    contract_types: Iterable[str],
+    jurisdictions: Optional[Iterable[str]] = None,
+    min_confidence: float = 0.0,
+) -> Dict[str, Any]:
+    """Build the Mango selector of several precedent queries merged into one."""
+    selector: Dict[str, Any] = {
+        "confidence": {"$gte": min_confidence},
+        "contract_type": {"$in": sorted(contract_types)},
+    }
+
+    if jurisdictions:
+        selector["jurisdiction"] = {"$in": sorted(jurisdictions)}
+
+    return selector
+
+
+def regulatory_mapping_selector(
+    jurisdiction: Optional[str] = None, regulation_type: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build the Mango selector for regulatory mappings (all mappings if unfiltered)."""
+    selector: Dict[str, Any] = {}
+
+    if jurisdiction:
+        selector["jurisdiction"] = jurisdiction
+
+    if regulation_type:
+        selector["regulation_type"] = regulation_type
+
+    # If no filters, get all
+    if not selector:
+        selector = {"_id": {"$gt": None}}
+
+    return selector
+
+
+def parse_document(doc: Dict[str, Any], model: Type[DocumentModel]) -> Optional[DocumentModel]:
+    """Convert a document to its model, logging and skipping invalid documents."""
+    try:
+        return model(**doc)
+    except Exception as e:
+        logger.warning(f"Failed to parse {model.__name__} {doc.get('_id')}: {e}")
+        return None
+
+
+def project(doc: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """
+    Keep only the given top-level fields of a document, like a _find projection.
+
+    Args:
+        doc: Document
+        fields: Fields to keep, or None for the whole document
+
+    Returns:
+        Projected document
+    """
+    if not fields:
+        return doc
+    return {name: doc[name] for name in fields if name in doc}
+
+
+# ============================================================================
+# Partitioning (shared with the async client)
+# ============================================================================
+
+PARTITION_SCHEMES = ("contract_type", "contract_type_jurisdiction")
+
+
+def partition_key(contract_type: str, jurisdiction: Optional[str] = None) -> str:
+    """
+    Build the partition key for a contract type and optional jurisdiction.
+
+    Partition keys cannot contain ':' or start with '_', so each part is
+    lowercased and reduced to letters, digits and dashes ("MSA", "US" -> "msa.us").
+    """
+    parts = [contract_type] + ([jurisdiction] if jurisdiction else [])
+    return ".".join(
+        re.sub(r"[^a-z0-9]+", "-", str(getattr(part, "value", part)).lower()).strip("-") or "none"
+        for part in parts
+    )
+
+
+class CloudantPartitioning:
+    """
+    Partitioning of the golden_clauses and historical_decisions databases.
+
+    When enabled, document IDs are "<partition>:<id>", with the partition key
+    built from the contract type (scheme "contract_type") or from the contract
+    type and jurisdiction (scheme "contract_type_jurisdiction"). Queries that
+    name their partition only read that partition, so their cost depends on
+    the partition size rather than on the size of the database.
+    """
+
+    def __init__(self, enabled: Optional[bool] = None, scheme: Optional[str] = None):
+        """
+        Initialize partitioning settings.
+
+        Args:
+            enabled: Whether the databases are partitioned
+                (defaults to CLOUDANT_PARTITIONED env var or false)
+            scheme: Partition key scheme, "contract_type" or "contract_type_jurisdiction"
+                (defaults to CLOUDANT_PARTITION_KEY env var or contract_type)
+        """
+        self.enabled = (
+            enabled
+            if enabled is not None
+            else os.getenv("CLOUDANT_PARTITIONED", "false").lower() == "true"
+        )
+        self.scheme = scheme or os.getenv("CLOUDANT_PARTITION_KEY", "contract_type")
+
+        if self.scheme not in PARTITION_SCHEMES:
+            raise ValueError(
+                f"Unknown partition key scheme '{self.scheme}'. "
+                f"Use one of: {', '.join(PARTITION_SCHEMES)}"
+            )
+
+    @property
+    def includes_jurisdiction(self) -> bool:
+        """Whether partition keys include the jurisdiction."""
+        return self.scheme == "contract_type_jurisdiction"
+
+    def key_for(
+        self, contract_type: Optional[str], jurisdiction: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Get the partition a query can be scoped to.
+
+        Args:
+            contract_type: Contract type filter of the query
+            jurisdiction: Jurisdiction filter of the query
+
+        Returns:
+            Partition key, or None when the query has to run across partitions
+        """
+        if not self.enabled or not contract_type:
+            return None
+        if self.includes_jurisdiction:
+            return partition_key(contract_type, jurisdiction) if jurisdiction else None
+        return partition_key(contract_type)
+
+    def document_id(
+        self, contract_type: str, jurisdiction: Optional[str] = None, doc_id: Optional[str] = None
+    ) -> str:
+        """
+        Build a partitioned document ID.
+
+        Args:
+            contract_type: Contract type of the document
+            jurisdiction: Jurisdiction of the document
+            doc_id: Existing ID to keep (any partition prefix is replaced), or None for a new ID
+
+        Returns:
+            Document ID of the form "<partition>:<id>"
+        """
+        partition = partition_key(
+            contract_type, jurisdiction if self.includes_jurisdiction else None
+        )
+        local_id = doc_id.split(":", 1)[-1] if doc_id else uuid.uuid4().hex
+        return f"{partition}:{local_id}"
+
+    def precedent_document(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Assign a historical decision document its partitioned ID.
+
+        Args:
+            doc: Decision document (an existing '_id' is kept as the local ID)
+
+        Returns:
+            The document, unchanged when partitioning is disabled
+        """
+        if not self.enabled:
+            return doc
+        doc = dict(doc)
+        doc["_id"] = self.document_id(doc["contract_type"], doc.get("jurisdiction"), doc.get("_id"))
+        return doc
+
+    def golden_clause_documents(self, doc: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Split a Golden Clause document into one copy per contract type.
+
+        A document lives in exactly one partition, so a clause that applies to
+        several contract types is stored once in each of their partitions.
+
+        Args:
+            doc: Golden Clause document
+
+        Returns:
+            Documents to store (the document itself when partitioning is disabled)
+        """
+        if not self.enabled:
+            return [doc]
+
+        copies = []
+        for contract_type in doc.get("contract_types", []):
+            copy = dict(doc, contract_types=[contract_type])
+            copy["_id"] = self.document_id(
+                contract_type, doc.get("jurisdiction"), doc.get("_id") or doc.get("clause_id")
+            )
+            copies.append(copy)
+        return copies
+
 
 class CloudantClient:
     """
@@ -31,6 +365,8 @@ class CloudantClient:
         api_key: Optional[str] = None,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        partitioning: Optional[CloudantPartitioning] = None,
+        replica: Optional["CloudantReplica"] = None,
     ):
         """
         Initialize Cloudant client.
@@ -40,11 +376,15 @@ class CloudantClient:
             api_key: Cloudant API key (defaults to CLOUDANT_API_KEY env var)
             max_retries: Maximum number of retry attempts
             retry_delay: Initial delay between retries in seconds
+            partitioning: Partitioning of the Golden Clause and historical decision
+                databases (defaults to the CLOUDANT_PARTITIONED settings)
+            replica: Local SQLite replica serving reads of the databases it holds
         """
         self.url = url or os.getenv("CLOUDANT_URL")
         self.api_key = api_key or os.getenv("CLOUDANT_API_KEY")
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.page_size = int(os.getenv("CLOUDANT_PAGE_SIZE", "200"))
 
         if not self.url or not self.api_key:
             raise ValueError(
@@ -60,18 +400,32 @@ class CloudantClient:
         self.db_regulatory_mappings = os.getenv(
             "CLOUDANT_DB_REGULATORY_MAPPINGS", "regulatory_mappings"
         )
+        self.partitioning = partitioning or CloudantPartitioning()
+        self.replica = replica
 
         # Initialize client
-        authenticator = IAMAuthenticator(self.api_key)
+        authenticator = SharedIAMAuthenticator(get_iam_token_provider(self.api_key))
         self.client = CloudantV1(authenticator=authenticator)
         self.client.set_service_url(self.url)
 
+        # Shared retry policy behind this backend's circuit breaker
+        self.breaker = create_circuit_breaker("cloudant")
+        self.retry_policy = RetryPolicy(
+            "Cloudant",
+            max_retries=self.max_retries,
+            base_delay=self.retry_delay,
+            breaker=self.breaker,
+        )
+
         logger.info(f"Cloudant client initialized: {self.url}")
 
     def _retry_operation(self, operation, *args, **kwargs):
         """
         Execute operation with retry logic.
 
+        Transient errors are retried with full-jitter exponential backoff,
+        behind the Cloudant circuit breaker and the request retry budget.
+
         Args:
             operation: Function to execute
             *args: Positional arguments for operation
@@ -81,35 +435,89 @@ class CloudantClient:
             Result of operation
 
         Raises:
-            Exception: If all retries fail
+            CircuitOpenError: If the Cloudant circuit breaker is open
+            Exception: If all retries fail or the error is not retryable
         """
-        last_exception = None
+        return self.retry_policy.call(operation, *args, **kwargs)
 
-        for attempt in range(self.max_retries):
-            try:
-                return operation(*args, **kwargs)
-            except Exception as e:
-                last_exception = e
-                error_msg = str(e).lower()
+    def _read_replica(
+        self, db_name: str, read: Callable[["ReplicaDatabase"], Any]
+    ) -> Optional[Any]:
+        """
+        Run a read against the local replica of a database.
 
-                # Don't retry on certain errors
-                if "not found" in error_msg or "invalid" in error_msg:
-                    raise
+        Args:
+            db_name: Database name
+            read: Function querying the ReplicaDatabase
 
-                # Retry on rate limiting or temporary errors
-                if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (2**attempt)  # Exponential backoff
-                    logger.warning(
-                        f"Cloudant operation failed (attempt {attempt + 1}/{self.max_retries}): {e}. "
-                        f"Retrying in {delay}s..."
-                    )
-                    time.sleep(delay)
-                else:
-                    logger.error(
-                        f"Cloudant operation failed after {self.max_retries} attempts: {e}"
-                    )
-
-        raise last_exception
+        Returns:
+            Result of read, or None when the database has no complete replica
+            or the read failed (the caller then queries Cloudant)
+        """
+        local = self.replica.get(db_name) if self.replica is not None else None
+        if local is None or not local.ready:
+            return None
+        try:
+            return read(local)
+        except Exception as e:
+            logger.warning(f"Replica read of {db_name} failed, querying Cloudant: {e}")
+            return None
+
+    def _write_replica(self, db_name: str, doc: Dict[str, Any]):
+        """Apply a document Cloudant accepted to the local replica, if there is one."""
+        local = self.replica.get(db_name) if self.replica is not None else None
+        if local is None:
+            return
+        try:
+            local.put(doc)
+        except Exception as e:
+            logger.warning(f"Replica write of {doc.get('_id')} to {db_name} failed: {e}")
+
+    def _post_find(
+        self, db_name: str, selector: Dict[str, Any], partition: Optional[str] = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Run one Mango query, scoped to a partition when one is given.
+
+        Args:
+            db_name: Database name
+            selector: Mango selector
+            partition: Partition key, or None for a global query
+            **kwargs: Other _find parameters (limit, sort, fields, bookmark)
+
+        Returns:
+            _find result with 'docs' and 'bookmark'
+        """
+        if partition:
+            return self.client.post_partition_find(
+                db=db_name, partition_key=partition, selector=selector, **kwargs
+            ).get_result()
+        return self.client.post_find(db=db_name, selector=selector, **kwargs).get_result()
+
+    def explain(
+        self, db_name: str, selector: Dict[str, Any], partition: Optional[str] = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Get the query plan Cloudant would use for a Mango query.
+
+        Args:
+            db_name: Database name
+            selector: Mango selector
+            partition: Partition key, or None for a global query
+            **kwargs: Other _find parameters (limit, sort, fields)
+
+        Returns:
+            _explain result, with the chosen index under 'index'
+        """
+
+        def _explain():
+            if partition:
+                return self.client.post_partition_explain(
+                    db=db_name, partition_key=partition, selector=selector, **kwargs
+                ).get_result()
+            return self.client.post_explain(db=db_name, selector=selector, **kwargs).get_result()
+
+        return self._retry_operation(_explain)
 
     def query_golden_clauses(
         self,
@@ -117,7 +525,8 @@ class CloudantClient:
         jurisdiction: Optional[str] = None,
         mandatory_only: bool = False,
         limit: int = 100,
-    ) -> List[GoldenClause]:
+        fields: Optional[List[str]] = None,
+    ) -> List[Union[GoldenClause, Dict[str, Any]]]:
         """
         Query Golden Clauses by contract type.
 
@@ -126,39 +535,49 @@ class CloudantClient:
             jurisdiction: Optional jurisdiction filter
             mandatory_only: If True, return only mandatory clauses
             limit: Maximum number of results
+            fields: Optional projection (e.g. GOLDEN_CLAUSE_SUMMARY_FIELDS)
 
         Returns:
-            List of GoldenClause objects
+            List of GoldenClause objects, or the projected documents as dicts
+            (not validated) when fields is given
         """
 
         def _query():
-            # Build selector
-            selector = {"contract_types": {"$elemMatch": {"$eq": contract_type}}}
+            selector = golden_clause_selector(contract_type, jurisdiction, mandatory_only)
 
-            if jurisdiction:
-                selector["jurisdiction"] = jurisdiction
-
-            if mandatory_only:
-                selector["mandatory"] = True
+            # Execute query (within the contract type's partition when partitioned)
+            result = self._post_find(
+                self.db_golden_clauses,
+                selector,
+                self.partitioning.key_for(contract_type, jurisdiction),
+                limit=limit,
+                fields=fields,
+            )
+            return result.get("docs", [])
 
-            # Execute query
-            result = self.client.post_find(
-                db=self.db_golden_clauses, selector=selector, limit=limit
-            ).get_result()
+        docs = self._read_replica(
+            self.db_golden_clauses,
+            lambda local: local.golden_clauses(contract_type, jurisdiction, mandatory_only, limit),
+        )
+        if docs is None:
+            docs = self._retry_operation(_query)
 
-            # Convert to GoldenClause objects
-            clauses = []
-            for doc in result.get("docs", []):
-                try:
-                    clause = GoldenClause(**doc)
-                    clauses.append(clause)
-                except Exception as e:
-                    logger.warning(f"Failed to parse Golden Clause: {e}")
+        if fields:
+            docs = [project(doc, fields) for doc in docs]
+            logger.info(f"Retrieved {len(docs)} projected Golden Clauses for {contract_type}")
+            return docs
 
-            logger.info(f"Retrieved {len(clauses)} Golden Clauses for {contract_type}")
-            return clauses
+        # Convert to GoldenClause objects
+        clauses = []
+        for doc in docs:
+            try:
+                clause = GoldenClause(**doc)
+                clauses.append(clause)
+            except Exception as e:
+                logger.warning(f"Failed to parse Golden Clause: {e}")
 
-        return self._retry_operation(_query)
+        logger.info(f"Retrieved {len(clauses)} Golden Clauses for {contract_type}")
+        return clauses
 
     def get_precedents(
         self,
@@ -166,7 +585,8 @@ class CloudantClient:
         jurisdiction: Optional[str] = None,
         min_confidence: float = 0.0,
         limit: int = 10,
-    ) -> List[HistoricalDecision]:
+        fields: Optional[List[str]] = None,
+    ) -> List[Union[HistoricalDecision, Dict[str, Any]]]:
         """
         Get historical precedents for a contract type.
 
@@ -175,45 +595,70 @@ class CloudantClient:
             jurisdiction: Optional jurisdiction filter
             min_confidence: Minimum confidence score
             limit: Maximum number of results
+            fields: Optional projection (e.g. PRECEDENT_SCORING_FIELDS)
 
         Returns:
-            List of HistoricalDecision objects sorted by confidence (descending)
+            List of HistoricalDecision objects sorted by confidence (descending),
+            or the projected documents as dicts (not validated) when fields is given
         """
 
         def _query():
-            # Build selector
-            selector = {
-                "contract_type": contract_type,
-                "confidence": {"$gte": min_confidence},
-            }
-
-            if jurisdiction:
-                selector["jurisdiction"] = jurisdiction
+            selector = precedent_selector(contract_type, jurisdiction, min_confidence)
 
             # Execute query with sorting
-            result = self.client.post_find(
-                db=self.db_historical_decisions,
-                selector=selector,
-                sort=[{"confidence": "desc"}],
+            result = self._post_find(
+                self.db_historical_decisions,
+                selector,
+                self.partitioning.key_for(contract_type, jurisdiction),
+                sort=precedent_sort(contract_type, jurisdiction),
                 limit=limit,
-            ).get_result()
+                fields=fields,
+            )
+            return result.get("docs", [])
 
-            # Convert to HistoricalDecision objects
-            decisions = []
-            for doc in result.get("docs", []):
-                try:
-                    decision = HistoricalDecision(**doc)
-                    decisions.append(decision)
-                except Exception as e:
-                    logger.warning(f"Failed to parse Historical Decision: {e}")
+        docs = self._read_replica(
+            self.db_historical_decisions,
+            lambda local: local.precedents(contract_type, jurisdiction, min_confidence, limit),
+        )
+        if docs is None:
+            docs = self._retry_operation(_query)
 
-            logger.info(
-                f"Retrieved {len(decisions)} precedents for {contract_type} "
-                f"(min confidence: {min_confidence})"
-            )
-            return decisions
+        if fields:
+            docs = [project(doc, fields) for doc in docs]
+            logger.info(f"Retrieved {len(docs)} projected precedents for {contract_type}")
+            return docs
+
+        # Convert to HistoricalDecision objects
+        decisions = []
+        for doc in docs:
+            try:
+                decision = HistoricalDecision(**doc)
+                decisions.append(decision)
+            except Exception as e:
+                logger.warning(f"Failed to parse Historical Decision: {e}")
+
+        logger.info(
+            f"Retrieved {len(decisions)} precedents for {contract_type} "
+            f"(min confidence: {min_confidence})"
+        )
+        return decisions
+
+    def get_precedents_by_ids(self, doc_ids: List[str]) -> List[HistoricalDecision]:
+        """
+        Get full historical decisions, e.g. for the top-ranked projected precedents.
+
+        Args:
+            doc_ids: Document IDs
 
-        return self._retry_operation(_query)
+        Returns:
+            HistoricalDecision objects in the order of doc_ids (missing IDs skipped)
+        """
+        if not doc_ids:
+            return []
+
+        docs = self.get_documents_by_ids(self.db_historical_decisions, doc_ids)
+        decisions = [parse_document(doc, HistoricalDecision) for doc in docs.values() if doc]
+        return [decision for decision in decisions if decision is not None]
 
     def store_precedent(self, decision: HistoricalDecision) -> str:
         """
@@ -230,9 +675,11 @@ class CloudantClient:
             # Convert to dict
             doc = decision.model_dump(by_alias=True, exclude_none=True)
 
-            # Remove _id and _rev if present (will be assigned by Cloudant)
+            # Remove _id and _rev if present (will be assigned by Cloudant,
+            # or within the decision's partition when partitioned)
             doc.pop("_id", None)
             doc.pop("_rev", None)
+            doc = self.partitioning.precedent_document(doc)
 
             # Store document
             result = self.client.post_document(
@@ -240,11 +687,42 @@ class CloudantClient:
             ).get_result()
 
             doc_id = result.get("id")
+            self._write_replica(
+                self.db_historical_decisions, {**doc, "_id": doc_id, "_rev": result.get("rev")}
+            )
             logger.info(f"Stored precedent: {doc_id}")
             return doc_id
 
         return self._retry_operation(_store)
 
+    def bulk_store_documents(
+        self, db_name: str, documents: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Store several documents in one _bulk_docs request.
+
+        Args:
+            db_name: Database name
+            documents: Documents to store
+
+        Returns:
+            One result per document, in order: {'id', 'rev', 'ok'} on success or
+            {'id', 'error', 'reason'} when that document was rejected
+        """
+
+        def _store():
+            result = self.client.post_bulk_docs(
+                db=db_name, bulk_docs={"docs": documents}
+            ).get_result()
+            logger.info(f"Bulk stored {len(documents)} documents in {db_name}")
+            return result
+
+        results = self._retry_operation(_store)
+        for doc, result in zip(documents, results):
+            if not result.get("error"):
+                self._write_replica(db_name, {**doc, "_id": result["id"], "_rev": result["rev"]})
+        return results
+
     def get_regulatory_mappings(
         self,
         jurisdiction: Optional[str] = None,
@@ -264,40 +742,323 @@ class CloudantClient:
         """
 
         def _query():
-            # Build selector
-            selector = {}
-
-            if jurisdiction:
-                selector["jurisdiction"] = jurisdiction
-
-            if regulation_type:
-                selector["regulation_type"] = regulation_type
-
-            # If no filters, get all
-            if not selector:
-                selector = {"_id": {"$gt": None}}
+            selector = regulatory_mapping_selector(jurisdiction, regulation_type)
 
             # Execute query
             result = self.client.post_find(
                 db=self.db_regulatory_mappings, selector=selector, limit=limit
             ).get_result()
+            return result.get("docs", [])
+
+        docs = self._read_replica(
+            self.db_regulatory_mappings,
+            lambda local: local.regulatory_mappings(jurisdiction, regulation_type, limit),
+        )
+        if docs is None:
+            docs = self._retry_operation(_query)
+
+        # Convert to RegulatoryMapping objects
+        mappings = []
+        for doc in docs:
+            try:
+                mapping = RegulatoryMapping(**doc)
+                mappings.append(mapping)
+            except Exception as e:
+                logger.warning(f"Failed to parse Regulatory Mapping: {e}")
+
+        logger.info(
+            f"Retrieved {len(mappings)} regulatory mappings "
+            f"(jurisdiction: {jurisdiction}, type: {regulation_type})"
+        )
+        return mappings
+
+    def iter_find(
+        self,
+        db_name: str,
+        selector: Dict[str, Any],
+        sort: Optional[List[Dict[str, str]]] = None,
+        fields: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        partition: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every document matching a Mango query, page by page.
+
+        Pages are followed with Cloudant bookmarks. The next page is fetched on
+        a worker thread while the caller processes the current one, so at most
+        two pages are held in memory.
+
+        Args:
+            db_name: Database name
+            selector: Mango selector
+            sort: Optional sort specification
+            fields: Optional fields to return
+            page_size: Documents per request (defaults to CLOUDANT_PAGE_SIZE env var or 200)
+            partition: Partition key to scope the query to
+
+        Yields:
+            Matching documents
+        """
+        page_size = page_size or self.page_size
+
+        def _fetch(bookmark: Optional[str]) -> Dict[str, Any]:
+            def _query():
+                return self._post_find(
+                    db_name,
+                    selector,
+                    partition,
+                    sort=sort,
+                    fields=fields,
+                    limit=page_size,
+                    bookmark=bookmark,
+                )
+
+            return self._retry_operation(_query)
+
+        def _prefetch(bookmark: Optional[str]) -> Future:
+            # Run in a copy of the caller's context to keep its retry budget
+            return executor.submit(contextvars.copy_context().run, _fetch, bookmark)
+
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cloudant-prefetch")
+        try:
+            next_page = _prefetch(None)
+            pages = 0
+            while True:
+                result = next_page.result()
+                docs = result.get("docs", [])
+                bookmark = result.get("bookmark")
+                pages += 1
+
+                has_more = len(docs) >= page_size and bool(bookmark)
+                if has_more:
+                    next_page = _prefetch(bookmark)
+
+                yield from docs
+
+                if not has_more:
+                    logger.debug(f"Scanned {pages} pages of {db_name}")
+                    return
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_golden_clauses(
+        self,
+        contract_type: str,
+        jurisdiction: Optional[str] = None,
+        mandatory_only: bool = False,
+        page_size: Optional[int] = None,
+    ) -> Iterator[GoldenClause]:
+        """
+        Iterate over every Golden Clause of a contract type.
+
+        Args:
+            contract_type: Contract type to filter by
+            jurisdiction: Optional jurisdiction filter
+            mandatory_only: If True, return only mandatory clauses
+            page_size: Documents per request
+
+        Yields:
+            GoldenClause objects
+        """
+        selector = golden_clause_selector(contract_type, jurisdiction, mandatory_only)
+        for doc in self.iter_find(
+            self.db_golden_clauses,
+            selector,
+            page_size=page_size,
+            partition=self.partitioning.key_for(contract_type, jurisdiction),
+        ):
+            clause = parse_document(doc, GoldenClause)
+            if clause is not None:
+                yield clause
+
+    def iter_precedents(
+        self,
+        contract_type: Optional[str] = None,
+        jurisdiction: Optional[str] = None,
+        min_confidence: float = 0.0,
+        page_size: Optional[int] = None,
+    ) -> Iterator[HistoricalDecision]:
+        """
+        Iterate over every historical decision matching the filters.
+
+        Unlike get_precedents, results are not sorted, so a full scan needs no
+        sort index.
+
+        Args:
+            contract_type: Optional contract type filter (all decisions if None)
+            jurisdiction: Optional jurisdiction filter
+            min_confidence: Minimum confidence score
+            page_size: Documents per request
+
+        Yields:
+            HistoricalDecision objects
+        """
+        selector = precedent_selector(contract_type, jurisdiction, min_confidence)
+        for doc in self.iter_find(
+            self.db_historical_decisions,
+            selector,
+            page_size=page_size,
+            partition=self.partitioning.key_for(contract_type, jurisdiction),
+        ):
+            decision = parse_document(doc, HistoricalDecision)
+            if decision is not None:
+                yield decision
+
+    def iter_regulatory_mappings(
+        self,
+        jurisdiction: Optional[str] = None,
+        regulation_type: Optional[str] = None,
+        page_size: Optional[int] = None,
+    ) -> Iterator[RegulatoryMapping]:
+        """
+        Iterate over every regulatory mapping matching the filters.
+
+        Args:
+            jurisdiction: Optional jurisdiction filter
+            regulation_type: Optional regulation type filter
+            page_size: Documents per request
+
+        Yields:
+            RegulatoryMapping objects
+        """
+        selector = regulatory_mapping_selector(jurisdiction, regulation_type)
+        for doc in self.iter_find(self.db_regulatory_mappings, selector, page_size=page_size):
+            mapping = parse_document(doc, RegulatoryMapping)
+            if mapping is not None:
+                yield mapping
 
-            # Convert to RegulatoryMapping objects
-            mappings = []
-            for doc in result.get("docs", []):
+    # ------------------------------------------------------------------------
+    # MapReduce statistics (views of the stats design documents)
+    # ------------------------------------------------------------------------
+
+    def sync_design_documents(self) -> List[str]:
+        """
+        Create or update the stats design documents whose views changed.
+
+        Returns:
+            Names of the databases whose design document was written
+        """
+        updated = []
+        for db, db_name in [
+            ("historical_decisions", self.db_historical_decisions),
+            ("golden_clauses", self.db_golden_clauses),
+        ]:
+            body = design_document(db)
+
+            def _get():
                 try:
-                    mapping = RegulatoryMapping(**doc)
-                    mappings.append(mapping)
+                    return self.client.get_design_document(
+                        db=db_name, ddoc=STATS_DESIGN_DOC
+                    ).get_result()
                 except Exception as e:
-                    logger.warning(f"Failed to parse Regulatory Mapping: {e}")
+                    if is_not_found(e):
+                        return None
+                    raise
+
+            existing = self._retry_operation(_get)
+            if existing and existing.get("views") == body["views"]:
+                continue
+            if existing:
+                body["_rev"] = existing["_rev"]
 
-            logger.info(
-                f"Retrieved {len(mappings)} regulatory mappings "
-                f"(jurisdiction: {jurisdiction}, type: {regulation_type})"
+            self._retry_operation(
+                lambda: self.client.put_design_document(
+                    db=db_name, ddoc=STATS_DESIGN_DOC, design_document=body
+                ).get_result()
             )
-            return mappings
+            logger.info(f"Updated _design/{STATS_DESIGN_DOC} in {db_name}")
+            updated.append(db_name)
+
+        return updated
+
+    def query_view(
+        self, db_name: str, view: str, group_level: Optional[int] = None, **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Query a reduced view of the stats design document.
+
+        Args:
+            db_name: Database name
+            view: View name
+            group_level: Number of key elements to group by (None reduces everything)
+            **kwargs: Other view parameters (start_key, end_key, ...)
+
+        Returns:
+            View rows with 'key' and 'value'
+        """
+
+        def _query():
+            return self.client.post_view(
+                db=db_name, ddoc=STATS_DESIGN_DOC, view=view, group_level=group_level, **kwargs
+            ).get_result()
+
+        return self._retry_operation(_query).get("rows", [])
 
-        return self._retry_operation(_query)
+    def get_confidence_stats_by_contract_type(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get precedent confidence statistics per contract type.
+
+        Returns:
+            Dict mapping contract type to count, avg, min and max confidence
+        """
+        rows = self.query_view(self.db_historical_decisions, "confidence_by_contract_type", 1)
+        return stats_by_key(rows)
+
+    def get_confidence_stats_by_jurisdiction(self, contract_type: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get precedent confidence statistics of a contract type per jurisdiction.
+
+        Args:
+            contract_type: Contract type
+
+        Returns:
+            Dict mapping jurisdiction to count, avg, min and max confidence
+        """
+        rows = self.query_view(
+            self.db_historical_decisions,
+            "confidence_by_contract_type",
+            2,
+            **key_range([contract_type]),
+        )
+        return stats_by_key(rows, 1)
+
+    def get_decision_counts_by_jurisdiction(self) -> Dict[str, int]:
+        """
+        Get the number of historical decisions per jurisdiction.
+
+        Returns:
+            Dict mapping jurisdiction to decision count
+        """
+        rows = self.query_view(self.db_historical_decisions, "decisions_by_jurisdiction", 1)
+        return rows_by_key(rows)
+
+    def get_modification_acceptance_rates(self, contract_type: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get how often each clause modification of a contract type was accepted.
+
+        Args:
+            contract_type: Contract type
+
+        Returns:
+            Dict mapping modified clause to its decision count and acceptance rate
+        """
+        rows = self.query_view(
+            self.db_historical_decisions,
+            "modification_outcomes",
+            2,
+            **key_range([contract_type]),
+        )
+        return acceptance_rates(rows)
+
+    def get_golden_clause_counts_by_contract_type(self) -> Dict[str, int]:
+        """
+        Get the number of Golden Clauses applying to each contract type.
+
+        Returns:
+            Dict mapping contract type to clause count
+        """
+        rows = self.query_view(self.db_golden_clauses, "clauses_by_contract_type", 1)
+        return rows_by_key(rows)
 
     def get_document_by_id(self, db_name: str, doc_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -311,17 +1072,80 @@ class CloudantClient:
             Document as dict or None if not found
         """
 
+        docs = self._read_replica(db_name, lambda local: local.get_documents([doc_id]))
+        if docs:
+            return docs[doc_id]
+
         def _get():
             try:
                 result = self.client.get_document(db=db_name, doc_id=doc_id).get_result()
                 return result
             except Exception as e:
-                if "not found" in str(e).lower():
+                if is_not_found(e):
                     return None
                 raise
 
         return self._retry_operation(_get)
 
+    def get_documents_by_ids(
+        self, db_name: str, doc_ids: List[str], chunk_size: Optional[int] = None
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get several documents by ID with _all_docs, one request per chunk of IDs.
+
+        Args:
+            db_name: Database name
+            doc_ids: Document IDs
+            chunk_size: IDs per request (defaults to CLOUDANT_PAGE_SIZE)
+
+        Returns:
+            Dict mapping each requested ID, in order, to its document, or to
+            None when the document is missing or deleted
+        """
+        keys = list(dict.fromkeys(doc_ids))
+        chunk_size = chunk_size or self.page_size
+
+        # Documents the replica does not hold (yet) are read from Cloudant
+        docs = self._read_replica(db_name, lambda local: local.get_documents(keys)) or {}
+        missing = [doc_id for doc_id in keys if doc_id not in docs]
+
+        def _fetch(chunk: List[str]):
+            return self.client.post_all_docs(db=db_name, keys=chunk, include_docs=True).get_result()
+
+        for start in range(0, len(missing), chunk_size):
+            result = self._retry_operation(_fetch, missing[start : start + chunk_size])
+            for row in result.get("rows", []):
+                docs[row["key"]] = row.get("doc")
+
+        found = {doc_id: docs.get(doc_id) for doc_id in keys}
+        logger.info(
+            f"Retrieved {sum(doc is not None for doc in found.values())}/{len(keys)} "
+            f"documents from {db_name}"
+        )
+        return found
+
+    def get_changes(
+        self, db_name: str, since: str = "0", limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the changes after a sequence ID, with their documents.
+
+        Args:
+            db_name: Database name
+            since: Sequence ID to read changes after
+            limit: Maximum number of changes to return
+
+        Returns:
+            Dict with 'results' (changes with their documents) and 'last_seq'
+        """
+
+        def _get():
+            return self.client.post_changes(
+                db=db_name, since=since, include_docs=True, limit=limit
+            ).get_result()
+
+        return self._retry_operation(_get)
+
     def health_check(self) -> Dict[str, Any]:
         """
         Check Cloudant connection health.
@@ -353,6 +1177,10 @@ class CloudantClient:
                 "status": "healthy",
                 "version": info.get("version"),
                 "databases": databases,
+                "partitioning": {
+                    "enabled": self.partitioning.enabled,
+                    "scheme": self.partitioning.scheme,
+                },
             }
         except Exception as e:
             return {"status": "unhealthy", "error": str(e)}
@@ -0,0 +1,352 @@
+"""
+Cloudant Index Specification
+IBM Dev Day AI Demystified Hackathon 2026
+Team: AI Kings 👑
+
+Declarative spec of the Mango queries CloudantClient issues and of the JSON
+indexes that serve them. Reconciliation creates the indexes a database is
+missing, and query plan verification asks Cloudant (_explain) which index
+each query uses, so a query silently falling back to a full scan is caught.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from backend.cloudant_client import (
+    CloudantClient,
+    coalesced_golden_clause_selector,
+    coalesced_precedent_selector,
+    golden_clause_selector,
+    precedent_selector,
+    precedent_sort,
+    regulatory_mapping_selector,
+)
+
+logger = logging.getLogger(__name__)
+
+GOLDEN_CLAUSES = "golden_clauses"
+HISTORICAL_DECISIONS = "historical_decisions"
+REGULATORY_MAPPINGS = "regulatory_mappings"
+
+# Databases whose documents are partitioned when partitioning is enabled
+PARTITIONED_DATABASES = (GOLDEN_CLAUSES, HISTORICAL_DECISIONS)
+
+
+class QueryPlanError(Exception):
+    """Raised when a query is not served by an index."""
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """JSON index required by one or more queries."""
+
+    db: str
+    name: str
+    fields: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class QuerySpec:
+    """
+    A query CloudantClient issues, with representative filter values.
+
+    Queries with ``allow_scan`` are expected to read the primary index: reads
+    of a whole (small) collection. Lookups by ID go through _all_docs.
+    """
+
+    name: str
+    db: str
+    selector: Dict[str, Any]
+    sort: Optional[List[Dict[str, str]]] = None
+    contract_type: Optional[str] = None
+    jurisdiction: Optional[str] = None
+    allow_scan: bool = False
+    scan_reason: str = ""
+
+
+def _precedent_query(name: str, contract_type=None, jurisdiction=None, sort=True) -> QuerySpec:
+    return QuerySpec(
+        name=name,
+        db=HISTORICAL_DECISIONS,
+        selector=precedent_selector(contract_type, jurisdiction, 0.0),
+        sort=precedent_sort(contract_type, jurisdiction) if sort else None,
+        contract_type=contract_type,
+        jurisdiction=jurisdiction,
+    )
+
+
+QUERY_SPECS: List[QuerySpec] = [
+    # get_precedents (sorted) and iter_precedents (unsorted)
+    _precedent_query("precedents_by_contract_type", "NDA"),
+    _precedent_query("precedents_by_contract_type_jurisdiction", "NDA", "US"),
+    _precedent_query("iter_precedents", sort=False),
+    _precedent_query("iter_precedents_by_contract_type", "NDA", sort=False),
+    _precedent_query("iter_precedents_by_contract_type_jurisdiction", "NDA", "US", sort=False),
+    # query_golden_clauses
+    QuerySpec(
+        name="golden_clauses_by_contract_type",
+        db=GOLDEN_CLAUSES,
+        selector=golden_clause_selector("NDA"),
+        contract_type="NDA",
+        allow_scan=True,
+        scan_reason=(
+            "$elemMatch on contract_types cannot use a JSON index; the collection is small, "
+            "partition-scoped when partitioned and served from the Golden Clause cache"
+        ),
+    ),
+    QuerySpec(
+        name="golden_clauses_by_contract_type_jurisdiction",
+        db=GOLDEN_CLAUSES,
+        selector=golden_clause_selector("NDA", "US"),
+        contract_type="NDA",
+        jurisdiction="US",
+    ),
+    QuerySpec(
+        name="mandatory_golden_clauses",
+        db=GOLDEN_CLAUSES,
+        selector=golden_clause_selector("NDA", mandatory_only=True),
+        contract_type="NDA",
+    ),
+    QuerySpec(
+        name="mandatory_golden_clauses_by_jurisdiction",
+        db=GOLDEN_CLAUSES,
+        selector=golden_clause_selector("NDA", "US", mandatory_only=True),
+        contract_type="NDA",
+        jurisdiction="US",
+    ),
+    # Concurrent lookups merged by the query coalescer
+    QuerySpec(
+        name="coalesced_precedents",
+        db=HISTORICAL_DECISIONS,
+        selector=coalesced_precedent_selector(["NDA", "MSA"], ["US", "EU"]),
+        sort=[{"confidence": "desc"}],
+        contract_type="NDA",
+    ),
+    QuerySpec(
+        name="coalesced_golden_clauses",
+        db=GOLDEN_CLAUSES,
+        selector=coalesced_golden_clause_selector(["NDA", "MSA"], ["US", "EU"]),
+        contract_type="NDA",
+    ),
+    # get_regulatory_mappings
+    QuerySpec(
+        name="regulatory_mappings_by_jurisdiction",
+        db=REGULATORY_MAPPINGS,
+        selector=regulatory_mapping_selector("US"),
+    ),
+    QuerySpec(
+        name="regulatory_mappings_by_type",
+        db=REGULATORY_MAPPINGS,
+        selector=regulatory_mapping_selector(regulation_type="privacy"),
+    ),
+    QuerySpec(
+        name="regulatory_mappings_by_jurisdiction_type",
+        db=REGULATORY_MAPPINGS,
+        selector=regulatory_mapping_selector("US", "privacy"),
+    ),
+    QuerySpec(
+        name="all_regulatory_mappings",
+        db=REGULATORY_MAPPINGS,
+        selector=regulatory_mapping_selector(),
+        allow_scan=True,
+        scan_reason="reads every mapping of a small collection",
+    ),
+]
+
+INDEX_SPECS: List[IndexSpec] = [
+    IndexSpec(
+        HISTORICAL_DECISIONS, "idx_contract_type_confidence", ("contract_type", "confidence")
+    ),
+    IndexSpec(
+        HISTORICAL_DECISIONS,
+        "idx_contract_type_jurisdiction_confidence",
+        ("contract_type", "jurisdiction", "confidence"),
+    ),
+    IndexSpec(HISTORICAL_DECISIONS, "idx_confidence", ("confidence",)),
+    IndexSpec(GOLDEN_CLAUSES, "idx_jurisdiction", ("jurisdiction",)),
+    IndexSpec(GOLDEN_CLAUSES, "idx_mandatory", ("mandatory",)),
+    IndexSpec(GOLDEN_CLAUSES, "idx_jurisdiction_mandatory", ("jurisdiction", "mandatory")),
+    IndexSpec(REGULATORY_MAPPINGS, "idx_jurisdiction", ("jurisdiction",)),
+    IndexSpec(REGULATORY_MAPPINGS, "idx_regulation_type", ("regulation_type",)),
+    IndexSpec(
+        REGULATORY_MAPPINGS,
+        "idx_jurisdiction_regulation_type",
+        ("jurisdiction", "regulation_type"),
+    ),
+]
+
+
+def index_can_serve(
+    fields: Tuple[str, ...], selector: Dict[str, Any], sort: Optional[List[Dict[str, str]]] = None
+) -> bool:
+    """
+    Whether a JSON index can serve a query, by Cloudant's selection rules.
+
+    Every indexed field must be constrained by the selector (documents without
+    the field are not in the index), not through $elemMatch, and the sort
+    fields must be a prefix of the indexed fields.
+
+    Args:
+        fields: Indexed fields, in order
+        selector: Mango selector
+        sort: Optional sort specification
+
+    Returns:
+        True if the index is usable for the query
+    """
+    for field in fields:
+        condition = selector.get(field)
+        if condition is None:
+            return False
+        if isinstance(condition, dict) and "$elemMatch" in condition:
+            return False
+
+    sort_fields = [field for entry in sort or [] for field in entry]
+    return list(fields[: len(sort_fields)]) == sort_fields
+
+
+def serving_indexes(query: QuerySpec) -> List[IndexSpec]:
+    """
+    Get the spec indexes that can serve a query.
+
+    Args:
+        query: Query spec
+
+    Returns:
+        Indexes of the query's database usable for it
+    """
+    return [
+        index
+        for index in INDEX_SPECS
+        if index.db == query.db and index_can_serve(index.fields, query.selector, query.sort)
+    ]
+
+
+def _database_names(client: CloudantClient) -> Dict[str, str]:
+    return {
+        GOLDEN_CLAUSES: client.db_golden_clauses,
+        HISTORICAL_DECISIONS: client.db_historical_decisions,
+        REGULATORY_MAPPINGS: client.db_regulatory_mappings,
+    }
+
+
+def _index_variants(client: CloudantClient, index: IndexSpec) -> List[Tuple[str, Optional[bool]]]:
+    """Index names and partitioned flags to create for a spec index."""
+    if client.partitioning.enabled and index.db in PARTITIONED_DATABASES:
+        # Partition-scoped queries need partitioned indexes, global queries global ones
+        return [(index.name, True), (f"{index.name}_global", False)]
+    return [(index.name, None)]
+
+
+def reconcile_indexes(client: CloudantClient, dry_run: bool = False) -> List[str]:
+    """
+    Create the spec indexes that are missing from the databases.
+
+    Existing indexes are matched by their fields (and partitioning), whatever
+    their names, so indexes created by hand are not duplicated.
+
+    Args:
+        client: Cloudant client
+        dry_run: If True, only report the missing indexes
+
+    Returns:
+        "<database>/<index name>" of each created (or missing, on dry run) index
+    """
+    db_names = _database_names(client)
+    created = []
+
+    for db, db_name in db_names.items():
+        existing = set()
+        result = client._retry_operation(
+            lambda: client.client.get_indexes_information(db=db_name).get_result()
+        )
+        for index in result.get("indexes", []):
+            if index.get("type") != "json":
+                continue
+            fields = tuple(field for entry in index["def"]["fields"] for field in entry)
+            existing.add((fields, bool(index.get("partitioned", False))))
+
+        for index in (spec for spec in INDEX_SPECS if spec.db == db):
+            for name, partitioned in _index_variants(client, index):
+                if (index.fields, bool(partitioned)) in existing:
+                    continue
+
+                created.append(f"{db_name}/{name}")
+                if dry_run:
+                    continue
+
+                client._retry_operation(
+                    lambda: client.client.post_index(
+                        db=db_name,
+                        index={"fields": list(index.fields)},
+                        ddoc=name,
+                        name=name,
+                        partitioned=partitioned,
+                        type="json",
+                    ).get_result()
+                )
+                logger.info(f"Created index {name} on {list(index.fields)} in {db_name}")
+
+    return created
+
+
+def verify_query_plans(client: CloudantClient, strict: Optional[bool] = None) -> Dict[str, Any]:
+    """
+    Ask Cloudant which index each spec query uses.
+
+    Args:
+        client: Cloudant client
+        strict: Raise on queries falling back to a full scan
+            (defaults to CLOUDANT_STRICT_QUERY_PLANS env var or false)
+
+    Returns:
+        Dict mapping query names to the index used and whether it is a full scan
+
+    Raises:
+        QueryPlanError: In strict mode, if a query without allow_scan uses no index
+    """
+    if strict is None:
+        strict = os.getenv("CLOUDANT_STRICT_QUERY_PLANS", "false").lower() == "true"
+
+    db_names = _database_names(client)
+    plans: Dict[str, Any] = {}
+    scans = []
+
+    for query in QUERY_SPECS:
+        partition = (
+            client.partitioning.key_for(query.contract_type, query.jurisdiction)
+            if query.db in PARTITIONED_DATABASES
+            else None
+        )
+        kwargs: Dict[str, Any] = {"limit": 1}
+        if query.sort:
+            kwargs["sort"] = query.sort
+
+        result = client.explain(db_names[query.db], query.selector, partition, **kwargs)
+        index = result.get("index", {})
+        full_scan = index.get("type") == "special"
+        plans[query.name] = {
+            "index": index.get("name"),
+            "ddoc": index.get("ddoc"),
+            "full_scan": full_scan,
+            "partition": partition,
+        }
+
+        if full_scan and not query.allow_scan:
+            scans.append(query.name)
+            logger.error(f"Query {query.name} on {db_names[query.db]} falls back to a full scan")
+
+    if scans:
+        message = (
+            f"Queries without an index: {', '.join(scans)}. "
+            "Run scripts/reconcile_cloudant_indexes.py to create the missing indexes"
+        )
+        if strict:
+            raise QueryPlanError(message)
+        logger.error(message)
+    else:
+        logger.info(f"Verified query plans of {len(plans)} Cloudant queries")
+
+    return plans
@@ -0,0 +1,543 @@
+"""
+Cloudant Replica
+IBM Dev Day AI Demystified Hackathon 2026
+Team: AI Kings 👑
+
+Local SQLite copy of Cloudant databases, one file per database, kept in sync
+from the _changes feed by a background thread. CloudantClient serves reads of
+replicated databases from it, so they are local disk (or page cache) reads
+that keep working while Cloudant is unreachable. Writes still go to Cloudant
+and are applied to the replica once Cloudant accepts them.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import logging
+
+from backend.cloudant_client import CloudantClient, get_cloudant_client
+from backend.cloudant_indexes import (
+    GOLDEN_CLAUSES,
+    HISTORICAL_DECISIONS,
+    INDEX_SPECS,
+    REGULATORY_MAPPINGS,
+)
+from backend.resilience import full_jitter_delay
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (id TEXT PRIMARY KEY, rev TEXT NOT NULL, body TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+# Revisions are "<generation>-<hash>"; SQLite casts them to their generation
+UPSERT = """
+INSERT INTO docs (id, rev, body) VALUES (?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET rev = excluded.rev, body = excluded.body
+WHERE CAST(excluded.rev AS INTEGER) >= CAST(docs.rev AS INTEGER)
+"""
+DELETE = "DELETE FROM docs WHERE id = ? AND CAST(rev AS INTEGER) <= CAST(? AS INTEGER)"
+
+_FIELD_NAME = re.compile(r"^\w+$")
+
+
+def field(name: str) -> str:
+    """
+    SQL expression of a top-level document field.
+
+    Queries must use this exact expression for SQLite to pick the JSON1
+    expression indexes.
+
+    Args:
+        name: Field name
+
+    Returns:
+        json_extract expression
+    """
+    if not _FIELD_NAME.match(name):
+        raise ValueError(f"Invalid field name: {name}")
+    return f"json_extract(body, '$.{name}')"
+
+
+class ReplicaDatabase:
+    """
+    SQLite replica of one Cloudant database.
+
+    Documents are stored as JSON with their revision, next to the last
+    applied sequence ID, and indexed with JSON1 expression indexes on the
+    fields of the Cloudant index spec.
+    """
+
+    def __init__(
+        self,
+        db_name: str,
+        path: str,
+        indexes: Iterable[Tuple[str, ...]] = (),
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Open (or create) a replica database.
+
+        Args:
+            db_name: Cloudant database name
+            path: SQLite file path (":memory:" for tests)
+            indexes: Field tuples to index
+            clock: Time source (for tests)
+        """
+        self.db_name = db_name
+        self.path = path
+        self.clock = clock
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        for fields in indexes:
+            name = "idx_" + "_".join(fields)
+            columns = ", ".join(field(name) for name in fields)
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON docs ({columns})")
+        self._conn.commit()
+
+        self.last_seq: Optional[str] = self._get_meta("last_seq")
+        self.ready = self._get_meta("complete") is not None
+        self.last_synced_at: Optional[float] = None
+        self.changes_applied = 0
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @property
+    def staleness(self) -> Optional[float]:
+        """Seconds since the replica was last known to be up to date in this process."""
+        if self.last_synced_at is None:
+            return None
+        return max(0.0, self.clock() - self.last_synced_at)
+
+    # ------------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------------
+
+    def apply_changes(self, changes: List[Dict[str, Any]], last_seq: str) -> int:
+        """
+        Apply _changes feed results and record the sequence ID, in one transaction.
+
+        Args:
+            changes: Changes with 'id', 'changes', optional 'deleted' and 'doc'
+            last_seq: Sequence ID of the last change
+
+        Returns:
+            Number of changes applied
+        """
+        applied = 0
+        with self._lock, self._conn:
+            for change in changes:
+                doc_id = change["id"]
+                if doc_id.startswith("_design/"):
+                    continue
+                doc = change.get("doc")
+                rev = doc.get("_rev") if doc else change["changes"][0]["rev"]
+                if change.get("deleted") or not doc:
+                    self._conn.execute(DELETE, (doc_id, rev))
+                else:
+                    self._conn.execute(UPSERT, (doc_id, rev, json.dumps(doc)))
+                applied += 1
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('last_seq', ?)", (last_seq,)
+            )
+
+        self.last_seq = last_seq
+        self.changes_applied += applied
+        return applied
+
+    def put(self, doc: Dict[str, Any]):
+        """
+        Store a document Cloudant accepted (write-through), unless a newer revision is held.
+
+        Args:
+            doc: Document with '_id' and '_rev'
+        """
+        with self._lock, self._conn:
+            self._conn.execute(UPSERT, (doc["_id"], doc["_rev"], json.dumps(doc)))
+
+    def sync(self, client: CloudantClient, batch_size: int = 500) -> int:
+        """
+        Apply every change after the last sequence ID.
+
+        Args:
+            client: Cloudant client to read the _changes feed with
+            batch_size: Changes per request
+
+        Returns:
+            Number of changes applied
+        """
+        applied = 0
+        while True:
+            result = client.get_changes(self.db_name, since=self.last_seq or "0", limit=batch_size)
+            changes = result.get("results", [])
+            applied += self.apply_changes(changes, result.get("last_seq", self.last_seq or "0"))
+            if len(changes) < batch_size:
+                break
+
+        if not self.ready:
+            # A full copy from now on, even when a restart finds it stale
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('complete', '1')"
+                )
+            self.ready = True
+        self.last_synced_at = self.clock()
+        if applied:
+            logger.info(f"Replica {self.db_name}: applied {applied} changes")
+        return applied
+
+    # ------------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------------
+
+    def find(
+        self,
+        where: Sequence[str] = (),
+        params: Sequence[Any] = (),
+        order_by: str = "id",
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Select documents.
+
+        Args:
+            where: SQL conditions, joined with AND
+            params: Parameters of the conditions
+            order_by: SQL ordering
+            limit: Maximum number of results
+
+        Returns:
+            Matching documents
+        """
+        sql = "SELECT body FROM docs"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {order_by}"
+        params = list(params)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(body) for (body,) in rows]
+
+    def get_documents(self, doc_ids: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get documents by ID.
+
+        Args:
+            doc_ids: Document IDs
+
+        Returns:
+            Dict mapping the IDs held by the replica to their documents
+        """
+        if not doc_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in doc_ids)
+        docs = self.find([f"id IN ({placeholders})"], list(doc_ids))
+        return {doc["_id"]: doc for doc in docs}
+
+    def golden_clauses(
+        self,
+        contract_type: str,
+        jurisdiction: Optional[str] = None,
+        mandatory_only: bool = False,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Golden Clause documents matching golden_clause_selector."""
+        where = ["EXISTS (SELECT 1 FROM json_each(body, '$.contract_types') WHERE value = ?)"]
+        params: List[Any] = [contract_type]
+        if jurisdiction:
+            where.append(f"{field('jurisdiction')} = ?")
+            params.append(jurisdiction)
+        if mandatory_only:
+            where.append(f"{field('mandatory')} = 1")
+        return self.find(where, params, limit=limit)
+
+    def precedents(
+        self,
+        contract_type: Optional[str] = None,
+        jurisdiction: Optional[str] = None,
+        min_confidence: float = 0.0,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Historical decision documents matching precedent_selector, by confidence (descending)."""
+        where = [f"{field('confidence')} >= ?"]
+        params: List[Any] = [min_confidence]
+        if contract_type:
+            where.append(f"{field('contract_type')} = ?")
+            params.append(contract_type)
+        if jurisdiction:
+            where.append(f"{field('jurisdiction')} = ?")
+            params.append(jurisdiction)
+        return self.find(where, params, order_by=f"{field('confidence')} DESC, id", limit=limit)
+
+    def regulatory_mappings(
+        self,
+        jurisdiction: Optional[str] = None,
+        regulation_type: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Regulatory mapping documents matching regulatory_mapping_selector."""
+        where, params = [], []
+        if jurisdiction:
+            where.append(f"{field('jurisdiction')} = ?")
+            params.append(jurisdiction)
+        if regulation_type:
+            where.append(f"{field('regulation_type')} = ?")
+            params.append(regulation_type)
+        return self.find(where, params, limit=limit)
+
+    def count(self) -> int:
+        """Number of documents held."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+
+    def close(self):
+        """Close the SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get replica size and freshness.
+
+        Returns:
+            Dict with replica statistics
+        """
+        staleness = self.staleness
+        return {
+            "path": self.path,
+            "ready": self.ready,
+            "documents": self.count(),
+            "last_seq": self.last_seq,
+            "staleness_seconds": round(staleness, 3) if staleness is not None else None,
+            "changes_applied": self.changes_applied,
+        }
+
+
+class CloudantReplica:
+    """
+    SQLite replicas of several Cloudant databases and the thread syncing them.
+
+    By default only the small, read-mostly reference corpora (Golden Clauses
+    and regulatory mappings) are replicated.
+    """
+
+    def __init__(
+        self,
+        databases: Dict[str, str],
+        directory: Optional[str] = None,
+        sync_interval: Optional[float] = None,
+        batch_size: int = 500,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Open the replica databases.
+
+        Args:
+            databases: Cloudant database names by key ("golden_clauses", ...)
+            directory: Directory of the SQLite files (defaults to CLOUDANT_REPLICA_DIR
+                env var or ".replica"), or ":memory:" for tests
+            sync_interval: Seconds between syncs (defaults to
+                CLOUDANT_REPLICA_SYNC_INTERVAL_SECONDS env var or 30)
+            batch_size: Changes per _changes request
+            clock: Time source (for tests)
+        """
+        self.directory = directory or os.getenv("CLOUDANT_REPLICA_DIR", ".replica")
+        self.sync_interval = (
+            sync_interval
+            if sync_interval is not None
+            else float(os.getenv("CLOUDANT_REPLICA_SYNC_INTERVAL_SECONDS", "30"))
+        )
+        self.batch_size = batch_size
+
+        self.databases: Dict[str, ReplicaDatabase] = {}
+        for key, db_name in databases.items():
+            path = (
+                ":memory:"
+                if self.directory == ":memory:"
+                else str(Path(self.directory) / f"{db_name}.sqlite3")
+            )
+            indexes = [index.fields for index in INDEX_SPECS if index.db == key]
+            self.databases[db_name] = ReplicaDatabase(db_name, path, indexes, clock)
+
+        self.sync_errors = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def for_client(
+        cls, client: CloudantClient, keys: Optional[List[str]] = None, **kwargs
+    ) -> "CloudantReplica":
+        """
+        Create a replica of a client's databases.
+
+        Args:
+            client: Cloudant client
+            keys: Database keys to replicate (defaults to CLOUDANT_REPLICA_DATABASES
+                env var or "golden_clauses,regulatory_mappings")
+            **kwargs: Other CloudantReplica arguments
+
+        Returns:
+            CloudantReplica instance
+        """
+        if keys is None:
+            keys = os.getenv(
+                "CLOUDANT_REPLICA_DATABASES", f"{GOLDEN_CLAUSES},{REGULATORY_MAPPINGS}"
+            ).split(",")
+        names = {
+            GOLDEN_CLAUSES: client.db_golden_clauses,
+            HISTORICAL_DECISIONS: client.db_historical_decisions,
+            REGULATORY_MAPPINGS: client.db_regulatory_mappings,
+        }
+        unknown = [key for key in keys if key.strip() not in names]
+        if unknown:
+            raise ValueError(f"Unknown databases to replicate: {', '.join(unknown)}")
+        return cls({key.strip(): names[key.strip()] for key in keys}, **kwargs)
+
+    def get(self, db_name: str) -> Optional[ReplicaDatabase]:
+        """
+        Get the replica of a database.
+
+        Args:
+            db_name: Cloudant database name
+
+        Returns:
+            ReplicaDatabase, or None if the database is not replicated
+        """
+        return self.databases.get(db_name)
+
+    def sync(self, client: CloudantClient) -> int:
+        """
+        Bring every replica up to date.
+
+        Args:
+            client: Cloudant client to read the _changes feeds with
+
+        Returns:
+            Number of changes applied
+        """
+        return sum(db.sync(client, self.batch_size) for db in self.databases.values())
+
+    def _run(self, client: CloudantClient):
+        """Sync until stopped, backing off on errors."""
+        failures = 0
+        while not self._stop.is_set():
+            try:
+                self.sync(client)
+                failures = 0
+                delay = self.sync_interval
+            except Exception as e:
+                self.sync_errors += 1
+                delay = full_jitter_delay(failures, 1.0, max(self.sync_interval, 1.0))
+                failures += 1
+                logger.warning(f"Cloudant replica sync failed: {e}. Retrying in {delay:.1f}s")
+            self._stop.wait(delay)
+
+    def start(self, client: CloudantClient):
+        """
+        Start syncing in a background thread.
+
+        Args:
+            client: Cloudant client to read the _changes feeds with
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(client,), name="cloudant-replica", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Stop syncing.
+
+        Args:
+            timeout: Seconds to wait for an ongoing sync to finish
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def close(self):
+        """Stop syncing and close the replica databases."""
+        self.stop()
+        for db in self.databases.values():
+            db.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get size and freshness of every replica.
+
+        Returns:
+            Dict with replica statistics
+        """
+        return {
+            "enabled": True,
+            "sync_running": self._thread is not None and self._thread.is_alive(),
+            "sync_interval_seconds": self.sync_interval,
+            "sync_errors": self.sync_errors,
+            "databases": {name: db.get_stats() for name, db in self.databases.items()},
+        }
+
+
+# ============================================================================
+# Singleton instance
+# ============================================================================
+
+_cloudant_replica: Optional[CloudantReplica] = None
+
+
+def get_cloudant_replica() -> Optional[CloudantReplica]:
+    """
+    Get singleton replica instance.
+
+    Returns:
+        CloudantReplica instance, or None when it was not started
+    """
+    return _cloudant_replica
+
+
+def start_cloudant_replica() -> Optional[CloudantReplica]:
+    """
+    Replicate the shared client's databases and serve its reads from them.
+
+    Returns:
+        CloudantReplica instance, or None when CLOUDANT_REPLICA_ENABLED is false
+    """
+    global _cloudant_replica
+    if os.getenv("CLOUDANT_REPLICA_ENABLED", "false").lower() != "true":
+        return None
+    if _cloudant_replica is None:
+        client = get_cloudant_client()
+        _cloudant_replica = CloudantReplica.for_client(client)
+        client.replica = _cloudant_replica
+        _cloudant_replica.start(client)
+    return _cloudant_replica
+
+
+def stop_cloudant_replica():
+    """Stop the singleton replica's sync thread and close its files, if it was started."""
+    global _cloudant_replica
+    if _cloudant_replica is not None:
+        get_cloudant_client().replica = None
+        _cloudant_replica.close()
+        _cloudant_replica = None
@@ -0,0 +1,174 @@
+"""
+Cloudant MapReduce Views
+IBM Dev Day AI Demystified Hackathon 2026
+Team: AI Kings 👑
+
+Design documents with MapReduce views for precedent and Golden Clause
+statistics. The built-in reducers (_stats, _count) keep the aggregates
+up to date incrementally inside Cloudant, so reading them is one small
+request whatever the size of the database.
+"""
+
+from typing import Any, Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+STATS_DESIGN_DOC = "stats"
+
+# Design documents per database. Views are global (not partitioned) so they
+# aggregate across the partitions of a partitioned database.
+DESIGN_DOCUMENTS: Dict[str, Dict[str, Any]] = {
+    "historical_decisions": {
+        "views": {
+            # Confidence statistics keyed by [contract_type, jurisdiction]
+            "confidence_by_contract_type": {
+                "map": (
+                    "function (doc) {\n"
+                    "  if (doc.contract_type && typeof doc.confidence === 'number') {\n"
+                    "    emit([doc.contract_type, doc.jurisdiction || null], doc.confidence);\n"
+                    "  }\n"
+                    "}"
+                ),
+                "reduce": "_stats",
+            },
+            # Decision counts keyed by [jurisdiction, contract_type]
+            "decisions_by_jurisdiction": {
+                "map": (
+                    "function (doc) {\n"
+                    "  if (doc.contract_type && doc.jurisdiction) {\n"
+                    "    emit([doc.jurisdiction, doc.contract_type], null);\n"
+                    "  }\n"
+                    "}"
+                ),
+                "reduce": "_count",
+            },
+            # Outcome of each modification keyed by [contract_type, clause_modified]:
+            # 1 if accepted, 0 if rejected. Stored decisions were approved unless
+            # they record another outcome.
+            "modification_outcomes": {
+                "map": (
+                    "function (doc) {\n"
+                    "  if (doc.contract_type && doc.clause_modified) {\n"
+                    "    var accepted = !doc.outcome || doc.outcome === 'accepted' ? 1 : 0;\n"
+                    "    emit([doc.contract_type, doc.clause_modified], accepted);\n"
+                    "  }\n"
+                    "}"
+                ),
+                "reduce": "_stats",
+            },
+        },
+    },
+    "golden_clauses": {
+        "views": {
+            # Clause counts keyed by [contract_type, jurisdiction, mandatory]
+            "clauses_by_contract_type": {
+                "map": (
+                    "function (doc) {\n"
+                    "  if (doc.contract_types && doc.clause_id) {\n"
+                    "    doc.contract_types.forEach(function (type) {\n"
+                    "      emit([type, doc.jurisdiction || null, !!doc.mandatory], null);\n"
+                    "    });\n"
+                    "  }\n"
+                    "}"
+                ),
+                "reduce": "_count",
+            },
+        },
+    },
+}
+
+
+def design_document(db: str) -> Dict[str, Any]:
+    """
+    Get the stats design document of a database.
+
+    Args:
+        db: Database key ("historical_decisions" or "golden_clauses")
+
+    Returns:
+        Design document body (without _id and _rev)
+    """
+    return {
+        "language": "javascript",
+        "views": DESIGN_DOCUMENTS[db]["views"],
+        "options": {"partitioned": False},
+    }
+
+
+def summarize_stats(value: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a _stats reduce value to count, average, min and max.
+
+    Args:
+        value: Reduce value with sum, count, min, max and sumsqr
+
+    Returns:
+        Dict with count, avg, min and max
+    """
+    count = value.get("count", 0)
+    return {
+        "count": count,
+        "avg": round(value.get("sum", 0) / count, 4) if count else 0.0,
+        "min": value.get("min"),
+        "max": value.get("max"),
+    }
+
+
+def rows_by_key(rows: List[Dict[str, Any]], position: int = 0) -> Dict[str, Any]:
+    """
+    Index grouped view rows by one element of their array keys.
+
+    Args:
+        rows: Rows of a grouped view query
+        position: Key element to index by
+
+    Returns:
+        Dict mapping the key element to the row value
+    """
+    return {row["key"][position]: row["value"] for row in rows}
+
+
+def stats_by_key(rows: List[Dict[str, Any]], position: int = 0) -> Dict[str, Dict[str, Any]]:
+    """
+    Index grouped _stats rows by one key element, summarized.
+
+    Args:
+        rows: Rows of a grouped _stats view query
+        position: Key element to index by
+
+    Returns:
+        Dict mapping the key element to count, avg, min and max
+    """
+    return {key: summarize_stats(value) for key, value in rows_by_key(rows, position).items()}
+
+
+def acceptance_rates(rows: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Convert modification_outcomes rows grouped by clause to acceptance rates.
+
+    Args:
+        rows: Rows grouped by [contract_type, clause_modified]
+
+    Returns:
+        Dict mapping modified clause to its decision count and acceptance rate
+    """
+    return {
+        clause: {"decisions": stats["count"], "acceptance_rate": stats["avg"]}
+        for clause, stats in stats_by_key(rows, 1).items()
+    }
+
+
+def key_range(prefix: Optional[List[Any]] = None) -> Dict[str, Any]:
+    """
+    Get start_key and end_key selecting array keys beginning with prefix.
+
+    Args:
+        prefix: Leading key elements, or None for every key
+
+    Returns:
+        View query parameters (empty for no prefix)
+    """
+    if not prefix:
+        return {}
+    return {"start_key": list(prefix), "end_key": list(prefix) + [{}]}
@@ -13,6 +13,8 @@ from typing import List, Optional, Dict, Any
 import ibm_boto3
 from ibm_botocore.client import Config
 from ibm_botocore.exceptions import ClientError
+from backend.iam_tokens import SharedCOSTokenManager, get_iam_token_provider
+from backend.resilience import RetryPolicy, create_circuit_breaker
 import logging
 
 logger = logging.getLogger(__name__)
@@ -62,10 +64,10 @@ class COSClient:
                 "COS_ENDPOINT, and COS_BUCKET_NAME environment variables."
             )
 
-        # Initialize S3 client
+        # Initialize S3 client, signing with the process-wide IAM token
         self.client = ibm_boto3.client(
             "s3",
-            ibm_api_key_id=self.api_key,
+            token_manager=SharedCOSTokenManager(get_iam_token_provider(self.api_key)),
             ibm_service_instance_id=self.instance_id,
             config=Config(signature_version="oauth"),
             endpoint_url=f"https://{self.endpoint}",
@@ -74,12 +76,24 @@ class COSClient:
         # Cache for frequently accessed documents
         self._cache: Dict[str, Dict[str, Any]] = {}
 
+        # Shared retry policy behind this backend's circuit breaker
+        self.breaker = create_circuit_breaker("cos")
+        self.retry_policy = RetryPolicy(
+            "COS",
+            max_retries=self.max_retries,
+            base_delay=self.retry_delay,
+            breaker=self.breaker,
+        )
+
         logger.info(f"COS client initialized: {self.endpoint}/{self.bucket_name}")
 
     def _retry_operation(self, operation, *args, **kwargs):
         """
         Execute operation with retry logic.
 
+        Transient errors are retried with full-jitter exponential backoff,
+        behind the COS circuit breaker and the request retry budget.
+
         Args:
             operation: Function to execute
             *args: Positional arguments for operation
@@ -89,44 +103,10 @@ class COSClient:
             Result of operation
 
         Raises:
-            Exception: If all retries fail
+            CircuitOpenError: If the COS circuit breaker is open
+            Exception: If all retries fail or the error is not retryable
         """
-        last_exception = None
-
-        for attempt in range(self.max_retries):
-            try:
-                return operation(*args, **kwargs)
-            except ClientError as e:
-                last_exception = e
-                error_code = e.response.get("Error", {}).get("Code", "")
-
-                # Don't retry on certain errors
-                if error_code in ["NoSuchKey", "NoSuchBucket", "InvalidArgument"]:
-                    raise
-
-                # Retry on rate limiting or temporary errors
-                if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (2**attempt)  # Exponential backoff
-                    logger.warning(
-                        f"COS operation failed (attempt {attempt + 1}/{self.max_retries}): {e}. "
-                        f"Retrying in {delay}s..."
-                    )
-                    time.sleep(delay)
-                else:
-                    logger.error(f"COS operation failed after {self.max_retries} attempts: {e}")
-            except Exception as e:
-                last_exception = e
-                if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (2**attempt)
-                    logger.warning(
-                        f"COS operation failed (attempt {attempt + 1}/{self.max_retries}): {e}. "
-                        f"Retrying in {delay}s..."
-                    )
-                    time.sleep(delay)
-                else:
-                    logger.error(f"COS operation failed after {self.max_retries} attempts: {e}")
-
-        raise last_exception
+        return self.retry_policy.call(operation, *args, **kwargs)
 
     def _get_from_cache(self, key: str) -> Optional[str]:
         """
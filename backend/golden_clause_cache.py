@@ -0,0 +1,385 @@
+"""
+Golden Clause Cache
+IBM Dev Day AI Demystified Hackathon 2026
+Team: AI Kings 👑
+
+In-process, read-through cache of the golden_clauses database. The cache is
+loaded in full on first use and then kept fresh by a background consumer of
+the Cloudant _changes feed, so Golden Clause queries are answered from memory.
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Set
+import logging
+
+from backend.async_cloudant_client import AsyncCloudantClient, get_async_cloudant_client
+from backend.models import GoldenClause
+from backend.resilience import full_jitter_delay
+
+logger = logging.getLogger(__name__)
+
+
+class GoldenClauseCache:
+    """
+    Golden Clauses held in memory, indexed by contract type, jurisdiction and
+    mandatory flag, and updated incrementally from the _changes feed.
+
+    Queries fall through to Cloudant while the cache is not loaded or when it
+    has not heard from the feed for longer than ``max_staleness`` seconds.
+    """
+
+    def __init__(
+        self,
+        client: Optional[AsyncCloudantClient] = None,
+        db_name: Optional[str] = None,
+        max_staleness: Optional[float] = None,
+        longpoll_timeout_ms: int = 60000,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize Golden Clause cache.
+
+        Args:
+            client: Async Cloudant client (defaults to the shared client)
+            db_name: Database name (defaults to the client's Golden Clause database)
+            max_staleness: Seconds without a feed response after which queries go to
+                Cloudant (defaults to GOLDEN_CLAUSE_CACHE_MAX_STALENESS_SECONDS or 300)
+            longpoll_timeout_ms: Time Cloudant holds each _changes request open
+            clock: Time source (for tests)
+        """
+        self._client = client
+        self._db_name = db_name
+        self.max_staleness = (
+            max_staleness
+            if max_staleness is not None
+            else float(os.getenv("GOLDEN_CLAUSE_CACHE_MAX_STALENESS_SECONDS", "300"))
+        )
+        self.longpoll_timeout_ms = longpoll_timeout_ms
+        self.clock = clock
+
+        # Documents and indexes (document IDs per key)
+        self._clauses: Dict[str, GoldenClause] = {}
+        self._by_contract_type: Dict[str, Set[str]] = {}
+        self._by_jurisdiction: Dict[str, Set[str]] = {}
+        self._mandatory: Set[str] = set()
+
+        self.last_seq: Optional[str] = None
+        self.loaded = False
+        self._load_lock = asyncio.Lock()
+        self._feed_task: Optional[asyncio.Task] = None
+
+        # Backoff after failed loads, so that queries during an outage go
+        # straight to Cloudant instead of each attempting a full load
+        self.load_failures = 0
+        self._next_load_at = 0.0
+
+        # Freshness statistics
+        self.loaded_at: Optional[float] = None
+        self.last_synced_at: Optional[float] = None
+        self.last_change_at: Optional[float] = None
+        self.changes_applied = 0
+        self.feed_errors = 0
+        self.hits = 0
+        self.fallbacks = 0
+
+    @property
+    def client(self) -> AsyncCloudantClient:
+        """Async Cloudant client, created on first use."""
+        if self._client is None:
+            self._client = get_async_cloudant_client()
+        return self._client
+
+    @property
+    def db_name(self) -> str:
+        """Golden Clause database name."""
+        return self._db_name or self.client.db_golden_clauses
+
+    @property
+    def staleness(self) -> Optional[float]:
+        """Seconds since the cache was last known to be up to date."""
+        if self.last_synced_at is None:
+            return None
+        return max(0.0, self.clock() - self.last_synced_at)
+
+    def is_fresh(self) -> bool:
+        """Whether queries can be served from memory."""
+        staleness = self.staleness
+        return self.loaded and staleness is not None and staleness <= self.max_staleness
+
+    # ------------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------------
+
+    def _unindex(self, doc_id: str):
+        clause = self._clauses.pop(doc_id, None)
+        if clause is None:
+            return
+        for contract_type in clause.contract_types:
+            self._discard(self._by_contract_type, contract_type, doc_id)
+        self._discard(self._by_jurisdiction, clause.jurisdiction, doc_id)
+        self._mandatory.discard(doc_id)
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[str]], key: str, doc_id: str):
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(doc_id)
+            if not ids:
+                del index[key]
+
+    def _index(self, doc: Dict[str, Any]):
+        """Add or replace a document in the cache."""
+        doc_id = doc["_id"]
+        self._unindex(doc_id)
+        try:
+            clause = GoldenClause(**doc)
+        except Exception as e:
+            logger.warning(f"Failed to parse Golden Clause {doc_id}: {e}")
+            return
+
+        self._clauses[doc_id] = clause
+        for contract_type in clause.contract_types:
+            self._by_contract_type.setdefault(contract_type, set()).add(doc_id)
+        self._by_jurisdiction.setdefault(clause.jurisdiction, set()).add(doc_id)
+        if clause.mandatory:
+            self._mandatory.add(doc_id)
+
+    def apply_change(self, change: Dict[str, Any]):
+        """
+        Apply one _changes feed result.
+
+        Args:
+            change: Change with 'id', optional 'deleted' and the document in 'doc'
+        """
+        doc_id = change["id"]
+        if doc_id.startswith("_design/"):
+            return
+
+        if change.get("deleted") or not change.get("doc"):
+            self._unindex(doc_id)
+        else:
+            self._index(change["doc"])
+
+        self.changes_applied += 1
+        self.last_change_at = self.clock()
+
+    # ------------------------------------------------------------------------
+    # Loading and the changes feed
+    # ------------------------------------------------------------------------
+
+    async def load(self):
+        """
+        Load every Golden Clause, replacing the cache contents.
+
+        The sequence ID is read before the documents, so changes made during
+        the load are replayed from the feed afterwards.
+        """
+        info = await self.client.get_database_info(self.db_name)
+        docs = await self.client.get_all_documents(self.db_name)
+
+        self._clauses.clear()
+        self._by_contract_type.clear()
+        self._by_jurisdiction.clear()
+        self._mandatory.clear()
+        for doc in docs:
+            self._index(doc)
+
+        self.last_seq = info.get("update_seq", "0")
+        self.loaded = True
+        self.loaded_at = self.last_synced_at = self.clock()
+        logger.info(f"Golden Clause cache loaded: {len(self._clauses)} clauses")
+
+    async def sync_once(self) -> int:
+        """
+        Apply the changes after the last sequence ID (waiting for them on longpoll).
+
+        Returns:
+            Number of changes applied
+        """
+        result = await self.client.get_changes(
+            self.db_name, since=self.last_seq or "0", longpoll_timeout_ms=self.longpoll_timeout_ms
+        )
+        changes = result.get("results", [])
+        for change in changes:
+            self.apply_change(change)
+
+        self.last_seq = result.get("last_seq", self.last_seq)
+        self.last_synced_at = self.clock()
+        return len(changes)
+
+    async def _consume_feed(self):
+        """Follow the _changes feed until cancelled, backing off on errors."""
+        failures = 0
+        while True:
+            try:
+                await self.sync_once()
+                failures = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.feed_errors += 1
+                delay = full_jitter_delay(failures, 1.0, 60.0)
+                failures += 1
+                logger.warning(f"Golden Clause changes feed failed: {e}. Retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    async def ensure_started(self):
+        """
+        Load the cache on first use and start following the changes feed.
+
+        After a failed load, no load is attempted again until a jittered,
+        exponentially growing delay has passed.
+
+        Raises:
+            Exception: If the load attempted by this call failed
+        """
+        if not self.loaded:
+            if self.clock() < self._next_load_at:
+                return
+            async with self._load_lock:
+                if not self.loaded and self.clock() >= self._next_load_at:
+                    try:
+                        await self.load()
+                        self.load_failures = 0
+                    except Exception:
+                        delay = 1.0 + full_jitter_delay(self.load_failures, 1.0, 60.0)
+                        self.load_failures += 1
+                        self._next_load_at = self.clock() + delay
+                        raise
+            if not self.loaded:
+                return
+
+        if self._feed_task is None or self._feed_task.done():
+            self._feed_task = asyncio.create_task(self._consume_feed())
+
+    async def stop(self):
+        """Stop following the changes feed."""
+        if self._feed_task is not None:
+            self._feed_task.cancel()
+            try:
+                await self._feed_task
+            except asyncio.CancelledError:
+                pass
+            self._feed_task = None
+
+    # ------------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------------
+
+    def query(
+        self,
+        contract_type: str,
+        jurisdiction: Optional[str] = None,
+        mandatory_only: bool = False,
+        limit: int = 100,
+    ) -> List[GoldenClause]:
+        """
+        Query cached Golden Clauses (same filters as Cloudant's query_golden_clauses).
+
+        Args:
+            contract_type: Contract type to filter by
+            jurisdiction: Optional jurisdiction filter
+            mandatory_only: If True, return only mandatory clauses
+            limit: Maximum number of results
+
+        Returns:
+            List of GoldenClause objects in document ID order
+        """
+        ids = self._by_contract_type.get(contract_type, set())
+        if jurisdiction:
+            ids = ids & self._by_jurisdiction.get(jurisdiction, set())
+        if mandatory_only:
+            ids = ids & self._mandatory
+
+        return [self._clauses[doc_id] for doc_id in sorted(ids)[:limit]]
+
+    async def query_golden_clauses(
+        self,
+        contract_type: str,
+        jurisdiction: Optional[str] = None,
+        mandatory_only: bool = False,
+        limit: int = 100,
+    ) -> List[GoldenClause]:
+        """
+        Query Golden Clauses from memory, reading through to Cloudant when stale.
+
+        Args:
+            contract_type: Contract type to filter by
+            jurisdiction: Optional jurisdiction filter
+            mandatory_only: If True, return only mandatory clauses
+            limit: Maximum number of results
+
+        Returns:
+            List of GoldenClause objects
+        """
+        try:
+            await self.ensure_started()
+        except Exception as e:
+            logger.warning(f"Golden Clause cache load failed: {e}")
+
+        if self.is_fresh():
+            self.hits += 1
+            return self.query(contract_type, jurisdiction, mandatory_only, limit)
+
+        self.fallbacks += 1
+        return await self.client.query_golden_clauses(
+            contract_type, jurisdiction=jurisdiction, mandatory_only=mandatory_only, limit=limit
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache size, freshness and traffic.
+
+        Returns:
+            Dict with cache statistics
+        """
+        staleness = self.staleness
+        return {
+            "loaded": self.loaded,
+            "fresh": self.is_fresh(),
+            "clauses": len(self._clauses),
+            "contract_types": len(self._by_contract_type),
+            "last_seq": self.last_seq,
+            "staleness_seconds": round(staleness, 3) if staleness is not None else None,
+            "seconds_since_last_change": (
+                round(self.clock() - self.last_change_at, 3)
+                if self.last_change_at is not None
+                else None
+            ),
+            "changes_applied": self.changes_applied,
+            "load_failures": self.load_failures,
+            "feed_errors": self.feed_errors,
+            "feed_running": self._feed_task is not None and not self._feed_task.done(),
+            "hits": self.hits,
+            "fallbacks": self.fallbacks,
+        }
+
+
+# ============================================================================
+# Singleton instance
+# ============================================================================
+
+_golden_clause_cache: Optional[GoldenClauseCache] = None
+
+
+def get_golden_clause_cache() -> Optional[GoldenClauseCache]:
+    """
+    Get singleton Golden Clause cache instance.
+
+    Returns:
+        GoldenClauseCache instance, or None when GOLDEN_CLAUSE_CACHE_ENABLED is false
+    """
+    global _golden_clause_cache
+    if os.getenv("GOLDEN_CLAUSE_CACHE_ENABLED", "true").lower() != "true":
+        return None
+    if _golden_clause_cache is None:
+        _golden_clause_cache = GoldenClauseCache()
+    return _golden_clause_cache
+
+
+async def stop_golden_clause_cache():
+    """Stop the singleton cache's changes feed, if it was started."""
+    if _golden_clause_cache is not None:
+        await _golden_clause_cache.stop()
@@ -0,0 +1,329 @@
+"""
+Dependency Health Monitor
+IBM Dev Day AI Demystified Hackathon 2026
+Team: AI Kings 👑
+
+Background health checks of Cloudant, COS and watsonx.ai. Each dependency is
+probed concurrently on its own interval and the latest status and latency are
+kept in memory, so /health and /health/deep serve a cached snapshot without
+calling any dependency on the request path. A dependency without credentials
+is reported as not configured and does not degrade the service.
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import logging
+
+from backend.async_cloudant_client import get_async_cloudant_client
+from backend.cos_client import get_cos_client
+from backend.watsonx_client import get_watsonx_client
+
+logger = logging.getLogger(__name__)
+
+Probe = Callable[[], Awaitable[Dict[str, Any]]]
+
+# Status of a dependency the deployment has no credentials for
+NOT_CONFIGURED = "not_configured"
+
+
+@dataclass(frozen=True)
+class DependencyCheck:
+    """A dependency probe and its schedule."""
+
+    name: str
+    probe: Probe
+    interval: float
+    timeout: float
+
+
+@dataclass
+class DependencyStatus:
+    """Latest result of a dependency's probe."""
+
+    status: str = "unknown"
+    latency_ms: Optional[float] = None
+    checked_at: Optional[float] = None
+    error: Optional[str] = None
+    details: Optional[Dict[str, Any]] = None
+    consecutive_failures: int = 0
+
+
+class HealthMonitor:
+    """
+    Probes dependencies in the background and keeps their latest status.
+
+    Probes run as tasks on the event loop, one loop per dependency, so a slow
+    or hanging dependency (bounded by its timeout) delays no other check. A
+    probe that timed out is left to finish (a worker thread cannot be
+    interrupted); until it does, its dependency is reported unhealthy without
+    starting another, so a hung dependency holds at most one thread.
+    """
+
+    def __init__(self, checks: List[DependencyCheck], clock: Callable[[], float] = time.time):
+        """
+        Initialize health monitor.
+
+        Args:
+            checks: Dependencies to probe
+            clock: Time source (for tests)
+        """
+        self.checks = {check.name: check for check in checks}
+        self.clock = clock
+        self._statuses: Dict[str, DependencyStatus] = {
+            name: DependencyStatus() for name in self.checks
+        }
+        self._tasks: List[asyncio.Task] = []
+        self._probes: Dict[str, asyncio.Future] = {}
+
+    async def run_check(self, name: str) -> DependencyStatus:
+        """
+        Probe one dependency now and record the result.
+
+        Args:
+            name: Dependency name
+
+        Returns:
+            The new status
+        """
+        check = self.checks[name]
+        previous = self._statuses[name]
+        started = time.monotonic()
+
+        probe = self._probes.get(name)
+        if probe is not None and not probe.done():
+            details, status, error = None, "unhealthy", "Previous probe still running"
+        else:
+            probe = self._probes[name] = asyncio.ensure_future(check.probe())
+            probe.add_done_callback(_consume_result)
+            try:
+                details = await asyncio.wait_for(asyncio.shield(probe), timeout=check.timeout)
+                status = details.get("status", "healthy")
+                error = details.get("error")
+            except asyncio.TimeoutError:
+                details, status, error = None, "unhealthy", f"Timed out after {check.timeout}s"
+            except Exception as e:
+                details, status, error = None, "unhealthy", str(e)
+
+        result = DependencyStatus(
+            status=status,
+            latency_ms=round((time.monotonic() - started) * 1000, 1),
+            checked_at=self.clock(),
+            error=error,
+            details=details,
+            consecutive_failures=(
+                0 if status in ("healthy", NOT_CONFIGURED) else previous.consecutive_failures + 1
+            ),
+        )
+        if status not in ("healthy", NOT_CONFIGURED) and previous.status != status:
+            logger.warning(f"Dependency {name} is {status}: {error}")
+        self._statuses[name] = result
+        return result
+
+    async def check_all(self):
+        """Probe every dependency once, concurrently."""
+        await asyncio.gather(*(self.run_check(name) for name in self.checks))
+
+    async def _run(self, name: str):
+        """Probe a dependency on its interval until cancelled."""
+        interval = self.checks[name].interval
+        while True:
+            await self.run_check(name)
+            await asyncio.sleep(interval)
+
+    def start(self):
+        """Start probing every dependency in the background."""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._run(name), name=f"health-{name}") for name in self.checks
+        ]
+        logger.info(f"Health monitor started: {', '.join(self.checks)}")
+
+    async def stop(self):
+        """Stop the background probes."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for probe in self._probes.values():
+            probe.cancel()
+        self._probes.clear()
+
+    @property
+    def status(self) -> str:
+        """Overall status: healthy only when every configured dependency is."""
+        statuses = {
+            status.status for status in self._statuses.values() if status.status != NOT_CONFIGURED
+        }
+        if statuses <= {"healthy"}:
+            return "healthy"
+        if statuses == {"unknown"}:
+            return "starting"
+        return "degraded"
+
+    def _age(self, status: DependencyStatus) -> Optional[float]:
+        if status.checked_at is None:
+            return None
+        return round(self.clock() - status.checked_at, 1)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the status and latency of each dependency.
+
+        Returns:
+            Dict of dependency name to {'status', 'latency_ms', 'age_seconds'}
+        """
+        return {
+            name: {
+                "status": status.status,
+                "latency_ms": status.latency_ms,
+                "age_seconds": self._age(status),
+            }
+            for name, status in self._statuses.items()
+        }
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the full latest result of each dependency.
+
+        Returns:
+            Dict of dependency name to its status, probe details and schedule
+        """
+        return {
+            name: {
+                "status": status.status,
+                "latency_ms": status.latency_ms,
+                "checked_at": (
+                    datetime.fromtimestamp(status.checked_at, timezone.utc).isoformat()
+                    if status.checked_at is not None
+                    else None
+                ),
+                "age_seconds": self._age(status),
+                "interval_seconds": self.checks[name].interval,
+                "consecutive_failures": status.consecutive_failures,
+                "error": status.error,
+                "details": status.details,
+            }
+            for name, status in self._statuses.items()
+        }
+
+
+# ============================================================================
+# Dependency probes
+# ============================================================================
+
+
+def _consume_result(probe: asyncio.Future):
+    """Retrieve the outcome of a probe nobody awaits any more (after a timeout)."""
+    if not probe.cancelled():
+        probe.exception()
+
+
+def _not_configured(error: ValueError) -> Dict[str, Any]:
+    """Result of a dependency whose client cannot be created without credentials."""
+    return {"status": NOT_CONFIGURED, "detail": str(error)}
+
+
+async def _probe_cloudant() -> Dict[str, Any]:
+    try:
+        client = get_async_cloudant_client()
+    except ValueError as e:
+        return _not_configured(e)
+    return await client.health_check()
+
+
+async def _probe_cos() -> Dict[str, Any]:
+    try:
+        client = await asyncio.to_thread(get_cos_client)
+    except ValueError as e:
+        return _not_configured(e)
+    return await asyncio.to_thread(client.health_check)
+
+
+async def _probe_watsonx() -> Dict[str, Any]:
+    try:
+        client = await asyncio.to_thread(get_watsonx_client)
+    except ValueError as e:
+        return _not_configured(e)
+    return await asyncio.to_thread(client.probe)
+
+
+DEFAULT_PROBES: Dict[str, Probe] = {
+    "cloudant": _probe_cloudant,
+    "cos": _probe_cos,
+    "watsonx": _probe_watsonx,
+}
+
+DEFAULT_INTERVALS = {"cloudant": 15.0, "cos": 30.0, "watsonx": 60.0}
+
+
+def default_checks() -> List[DependencyCheck]:
+    """
+    Build the checks of Cloudant, COS and watsonx.ai from the environment.
+
+    Each interval defaults to HEALTH_CHECK_<NAME>_INTERVAL_SECONDS (15s for
+    Cloudant, 30s for COS, 60s for watsonx.ai), and each probe is bounded by
+    HEALTH_CHECK_TIMEOUT_SECONDS (default 5).
+
+    Returns:
+        Dependency checks
+    """
+    timeout = float(os.getenv("HEALTH_CHECK_TIMEOUT_SECONDS", "5"))
+    return [
+        DependencyCheck(
+            name=name,
+            probe=probe,
+            interval=float(
+                os.getenv(
+                    f"HEALTH_CHECK_{name.upper()}_INTERVAL_SECONDS", str(DEFAULT_INTERVALS[name])
+                )
+            ),
+            timeout=timeout,
+        )
+        for name, probe in DEFAULT_PROBES.items()
+    ]
+
+
+# ============================================================================
+# Singleton instance
+# ============================================================================
+
+_health_monitor: Optional[HealthMonitor] = None
+
+
+def get_health_monitor() -> Optional[HealthMonitor]:
+    """
+    Get the running health monitor.
+
+    Returns:
+        HealthMonitor instance, or None when it was not started
+    """
+    return _health_monitor
+
+
+def start_health_monitor() -> Optional[HealthMonitor]:
+    """
+    Start probing the dependencies in the background (call from the event loop).
+
+    Returns:
+        HealthMonitor instance, or None when HEALTH_MONITOR_ENABLED is false
+    """
+    global _health_monitor
+    if os.getenv("HEALTH_MONITOR_ENABLED", "true").lower() != "true":
+        return None
+    if _health_monitor is None:
+        _health_monitor = HealthMonitor(default_checks())
+    _health_monitor.start()
+    return _health_monitor
+
+
+async def stop_health_monitor():
+    """Stop the background probes, if they were started."""
+    global _health_monitor
+    if _health_monitor is not None:
+        await _health_monitor.stop()
+        _health_monitor = None
@@ -0,0 +1,310 @@
+"""
+Shared IAM Tokens
+IBM Dev Day AI Demystified Hackathon 2026
+Team: AI Kings 👑
+
+One IAM access token per API key for the whole process, shared by the
+Cloudant, COS and watsonx.ai clients. A background thread refreshes each token
+well before it expires, and concurrent refreshes collapse into one IAM request,
+so requests read a cached token instead of waiting on IAM.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+
+from ibm_botocore.credentials import TokenManager
+from ibm_cloud_sdk_core.authenticators import Authenticator
+from ibm_cloud_sdk_core.token_managers.iam_token_manager import IAMTokenManager
+
+from backend.resilience import full_jitter_delay
+
+logger = logging.getLogger(__name__)
+
+
+class IAMTokenProvider:
+    """
+    IAM access token of one API key, refreshed in the background before expiry.
+
+    ``get_token`` returns the cached token while it is valid; it only requests
+    one itself when there is no valid token (before the first refresh, or when
+    IAM has been failing for the whole token lifetime). Background refresh
+    starts with the first token.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        url: Optional[str] = None,
+        refresh_fraction: Optional[float] = None,
+        token_manager: Optional[Any] = None,
+        background_refresh: Optional[bool] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize token provider.
+
+        Args:
+            api_key: IBM Cloud API key
+            url: IAM endpoint (defaults to IAM_URL env var or the public IAM endpoint)
+            refresh_fraction: Fraction of the token lifetime after which it is refreshed
+                (defaults to IAM_TOKEN_REFRESH_FRACTION env var or 0.8)
+            token_manager: Object whose request_token() calls IAM (for tests)
+            background_refresh: Refresh in a background thread (defaults to
+                IAM_TOKEN_BACKGROUND_REFRESH env var or true)
+            clock: Time source (for tests)
+        """
+        if not api_key:
+            raise ValueError("IAM API key required")
+
+        self.api_key = api_key
+        self.token_manager = token_manager or IAMTokenManager(
+            api_key, url=url or os.getenv("IAM_URL") or None
+        )
+        self.refresh_fraction = (
+            refresh_fraction
+            if refresh_fraction is not None
+            else float(os.getenv("IAM_TOKEN_REFRESH_FRACTION", "0.8"))
+        )
+        self.background_refresh = (
+            background_refresh
+            if background_refresh is not None
+            else os.getenv("IAM_TOKEN_BACKGROUND_REFRESH", "true").lower() == "true"
+        )
+        self.clock = clock
+
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._refresh_at = 0.0
+        self._refresh_lock = threading.Lock()
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Statistics
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self.request_path_fetches = 0
+
+    @property
+    def expires_in(self) -> Optional[float]:
+        """Seconds until the current token expires."""
+        if self._token is None:
+            return None
+        return self._expires_at - self.clock()
+
+    def refresh(self, force: bool = False) -> str:
+        """
+        Request a new token, unless one is not due yet.
+
+        Single-flight: callers arriving during a refresh wait for it and get
+        its token instead of requesting their own.
+
+        Args:
+            force: Request a token even if the current one is not due for refresh
+
+        Returns:
+            Access token
+        """
+        with self._refresh_lock:
+            if not force and self._token is not None and self.clock() < self._refresh_at:
+                return self._token
+
+            result = self.token_manager.request_token()
+            now = self.clock()
+            expires_in = float(result.get("expires_in", 3600))
+            self._token = result["access_token"]
+            self._expires_at = now + expires_in
+            self._refresh_at = now + expires_in * self.refresh_fraction
+            self.refreshes += 1
+            return self._token
+
+    def cached_token(self) -> Optional[str]:
+        """
+        Get the current token without ever calling IAM.
+
+        Returns:
+            Token, or None when there is no valid token
+        """
+        token = self._token
+        if token is not None and self.clock() < self._expires_at:
+            return token
+        return None
+
+    def get_token(self) -> str:
+        """
+        Get a valid access token.
+
+        Returns:
+            Cached token, or a new one when there is no valid token
+        """
+        token = self.cached_token()
+        if token is None:
+            self.request_path_fetches += 1
+            token = self.refresh()
+        if self.background_refresh:
+            self.start()
+        return token
+
+    def _run(self):
+        """Refresh the token when due until stopped, backing off on errors."""
+        failures = 0
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+                failures = 0
+                delay = max(self._refresh_at - self.clock(), 1.0)
+            except Exception as e:
+                self.refresh_errors += 1
+                delay = full_jitter_delay(failures, 1.0, 60.0)
+                failures += 1
+                logger.warning(f"IAM token refresh failed: {e}. Retrying in {delay:.1f}s")
+            self._stop.wait(delay)
+
+    def start(self):
+        """Start refreshing the token in a background thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._refresh_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="iam-token-refresh", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Stop refreshing the token.
+
+        Args:
+            timeout: Seconds to wait for an ongoing refresh to finish
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get token freshness and refresh counts.
+
+        Returns:
+            Dict with token statistics
+        """
+        expires_in = self.expires_in
+        return {
+            "has_token": self._token is not None,
+            "expires_in_seconds": round(expires_in, 1) if expires_in is not None else None,
+            "refresh_running": self._thread is not None and self._thread.is_alive(),
+            "refreshes": self.refreshes,
+            "refresh_errors": self.refresh_errors,
+            "request_path_fetches": self.request_path_fetches,
+        }
+
+
+class SharedIAMAuthenticator(Authenticator):
+    """Authenticator for IBM Cloud SDK clients (Cloudant) signing with a shared token."""
+
+    def __init__(self, provider: IAMTokenProvider):
+        """
+        Initialize authenticator.
+
+        Args:
+            provider: Token provider
+        """
+        self.provider = provider
+
+    def authenticate(self, req: dict) -> None:
+        """Add the Authorization header to a request."""
+        req["headers"]["Authorization"] = f"Bearer {self.provider.get_token()}"
+
+    def validate(self) -> None:
+        """The provider validated its API key."""
+
+    def authentication_type(self) -> str:
+        """Returns the authenticator's type."""
+        return Authenticator.AUTHTYPE_IAM
+
+
+class SharedCOSTokenManager(TokenManager):
+    """Token manager for ibm_boto3 (COS) clients signing with a shared token."""
+
+    def __init__(self, provider: IAMTokenProvider):
+        """
+        Initialize token manager.
+
+        Args:
+            provider: Token provider
+        """
+        self.provider = provider
+
+    def get_token(self) -> str:
+        """Returns a valid token."""
+        return self.provider.get_token()
+
+
+# ============================================================================
+# Process-wide providers
+# ============================================================================
+
+_providers: Dict[Tuple[str, Optional[str]], IAMTokenProvider] = {}
+_providers_lock = threading.Lock()
+
+
+def get_iam_token_provider(api_key: str, url: Optional[str] = None) -> IAMTokenProvider:
+    """
+    Get the process-wide token provider of an API key.
+
+    Args:
+        api_key: IBM Cloud API key
+        url: IAM endpoint
+
+    Returns:
+        IAMTokenProvider shared by every client using the API key
+    """
+    key = (api_key, url)
+    provider = _providers.get(key)
+    if provider is None:
+        with _providers_lock:
+            provider = _providers.get(key)
+            if provider is None:
+                provider = _providers[key] = IAMTokenProvider(api_key, url)
+    return provider
+
+
+def warm_iam_tokens() -> int:
+    """
+    Fetch the tokens of the configured API keys before the first request.
+
+    Returns:
+        Number of distinct API keys
+    """
+    api_keys = {os.getenv(name) for name in ("CLOUDANT_API_KEY", "COS_API_KEY", "WATSONX_API_KEY")}
+    api_keys.discard(None)
+    api_keys.discard("")
+    for api_key in api_keys:
+        try:
+            get_iam_token_provider(api_key).get_token()
+        except Exception as e:
+            logger.warning(f"IAM token warm-up failed: {e}")
+    return len(api_keys)
+
+
+def get_iam_token_stats() -> List[Dict[str, Any]]:
+    """
+    Get the statistics of every provider (API keys are not included).
+
+    Returns:
+        One dict per provider
+    """
+    return [provider.get_stats() for provider in list(_providers.values())]
+
+
+def stop_iam_token_providers():
+    """Stop the background refresh of every provider."""
+    with _providers_lock:
+        for provider in _providers.values():
+            provider.stop(timeout=5.0)
+        _providers.clear()
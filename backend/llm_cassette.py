@@ -0,0 +1,238 @@
+"""
+LLM Cassette Recording and Replay
+IBM Dev Day AI Demystified Hackathon 2026
+Team: AI Kings 👑
+
+Record watsonx.ai generations to a JSON Lines cassette file and replay them
+offline, optionally with the recorded latencies, for reproducible benchmarks
+and regression tests.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_MODES = ("off", "record", "replay")
+
+
+class CassetteMissError(KeyError):
+    """Raised in replay mode when a request was never recorded."""
+
+
+def cassette_key(model_id: str, prompt: str, params: Dict[str, Any]) -> str:
+    """
+    Build the lookup key for a generation request.
+
+    Args:
+        model_id: Model ID
+        prompt: Prompt text
+        params: Generation parameters
+
+    Returns:
+        Hex digest identifying the request
+    """
+    payload = json.dumps(
+        {"model_id": model_id, "prompt": prompt, "params": params},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def stream_events(result: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Split a normalized generation result into raw stream events, one per word.
+
+    Args:
+        result: Generation result with 'text', 'input_tokens', 'output_tokens'
+            and 'stop_reason'
+
+    Yields:
+        Stream events in the watsonx.ai raw response format
+    """
+    words = result.get("text", "").split(" ")
+    for i, word in enumerate(words):
+        last = i == len(words) - 1
+        yield {
+            "results": [
+                {
+                    "generated_text": word if last else word + " ",
+                    "generated_token_count": result.get("output_tokens", 0) if last else i + 1,
+                    "input_token_count": result.get("input_tokens", 0),
+                    "stop_reason": (
+                        result.get("stop_reason", "unknown") if last else "not_finished"
+                    ),
+                }
+            ]
+        }
+
+
+class Cassette:
+    """
+    Cassette of recorded watsonx.ai generations.
+
+    Entries are stored one compact JSON object per line, appended as they are
+    recorded. When the same request was recorded several times, replay cycles
+    through the recordings in order.
+    """
+
+    def __init__(self, path: str, mode: str = "replay", simulate_latency: bool = False):
+        """
+        Initialize cassette.
+
+        Args:
+            path: Cassette file path
+            mode: 'record' to append new generations, 'replay' to serve them
+            simulate_latency: In replay mode, sleep for the recorded latency
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Invalid cassette mode: {mode}")
+        if path.endswith(".gz"):
+            # Appending entry by entry would write one gzip member per entry
+            raise ValueError(f"Cassettes are plain JSON Lines files, got {path}")
+
+        self.path = path
+        self.mode = mode
+        self.simulate_latency = simulate_latency
+        self._lock = threading.Lock()
+        self._entries: Dict[str, List[Dict[str, Any]]] = {}
+        self._positions: Dict[str, int] = {}
+
+        if mode == "replay":
+            self._load()
+        else:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        logger.info(f"Cassette {mode} mode: {self.path} ({len(self)} recorded requests)")
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    def _load(self):
+        """Load recorded entries from the cassette file."""
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(f"Cassette not found: {self.path}")
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                self._entries.setdefault(entry["key"], []).append(entry)
+
+    def record(
+        self,
+        model_id: str,
+        prompt: str,
+        params: Dict[str, Any],
+        response: Dict[str, Any],
+        latency: float,
+    ):
+        """
+        Append a generation to the cassette.
+
+        Args:
+            model_id: Model ID
+            prompt: Prompt text
+            params: Generation parameters
+            response: Normalized generation result
+            latency: Request latency in seconds
+        """
+        entry = {
+            "key": cassette_key(model_id, prompt, params),
+            "model_id": model_id,
+            "prompt": prompt,
+            "params": params,
+            "response": response,
+            "latency_ms": round(latency * 1000, 2),
+        }
+        line = json.dumps(entry, separators=(",", ":"), default=str)
+
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            self._entries.setdefault(entry["key"], []).append(entry)
+
+    def lookup(self, model_id: str, prompt: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Find the recorded entry for a request.
+
+        Args:
+            model_id: Model ID
+            prompt: Prompt text
+            params: Generation parameters
+
+        Returns:
+            Recorded entry with 'response' and 'latency_ms'
+
+        Raises:
+            CassetteMissError: If the request was never recorded
+        """
+        key = cassette_key(model_id, prompt, params)
+
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                raise CassetteMissError(
+                    f"No recording for prompt {prompt[:60]!r} in cassette {self.path}"
+                )
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+
+        return entries[position % len(entries)]
+
+    def replay_stream(
+        self, model_id: str, prompt: str, params: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Serve a recorded generation as raw stream events, one per word.
+
+        Args:
+            model_id: Model ID
+            prompt: Prompt text
+            params: Generation parameters
+
+        Yields:
+            Stream events in the watsonx.ai raw response format
+        """
+        entry = self.lookup(model_id, prompt, params)
+        response = entry["response"]
+        words = response.get("text", "").split(" ")
+        delay = entry.get("latency_ms", 0) / 1000 / max(1, len(words))
+
+        for event in stream_events(response):
+            if self.simulate_latency:
+                time.sleep(delay)
+            yield event
+
+
+def get_cassette_from_env(mode: Optional[str] = None) -> Optional[Cassette]:
+    """
+    Build a cassette from WATSONX_CASSETTE_* environment variables.
+
+    Args:
+        mode: Cassette mode (defaults to WATSONX_CASSETTE_MODE env var)
+
+    Returns:
+        Cassette, or None when cassette mode is off
+    """
+    mode = (mode or os.getenv("WATSONX_CASSETTE_MODE", "off")).lower()
+    if mode not in CASSETTE_MODES:
+        raise ValueError(f"WATSONX_CASSETTE_MODE must be one of {CASSETTE_MODES}, got {mode!r}")
+    if mode == "off":
+        return None
+
+    return Cassette(
+        path=os.getenv("WATSONX_CASSETTE_PATH", "cassettes/watsonx.jsonl"),
+        mode=mode,
+        simulate_latency=os.getenv("WATSONX_CASSETTE_SIMULATE_LATENCY", "false").lower() == "true",
+    )
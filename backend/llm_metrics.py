@@ -0,0 +1,292 @@
+"""
+LLM Usage Metrics
+IBM Dev Day AI Demystified Hackathon 2026
+Team: AI Kings 👑
+
+Thread-safe accounting of watsonx.ai calls per call site: request and error
+counts, token totals, and latency and token histograms. Exposed as JSON and in
+the Prometheus text exposition format.
+"""
+
+import bisect
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Call site tag used when a caller does not provide one
+DEFAULT_CALL_SITE = "default"
+
+# Histogram bucket upper bounds
+LATENCY_BUCKETS_SECONDS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+TOKEN_BUCKETS = (16, 32, 64, 128, 256, 512, 1024, 2048, 4096, 8192)
+
+
+class Histogram:
+    """Fixed-bucket histogram. Not thread-safe on its own; guarded by LLMMetrics."""
+
+    def __init__(self, buckets: Sequence[float]):
+        """
+        Initialize histogram.
+
+        Args:
+            buckets: Sorted bucket upper bounds (+Inf is implicit)
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        """Record a value."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> List[int]:
+        """Counts of values <= each bucket bound, ending with the +Inf bucket."""
+        cumulative = []
+        running = 0
+        for count in self.counts:
+            running += count
+            cumulative.append(running)
+        return cumulative
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile as the upper bound of the bucket containing it.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Bucket upper bound, or None when no values were recorded
+        """
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        for bound, cumulative in zip(self.buckets, self.cumulative_counts()):
+            if cumulative >= rank:
+                return bound
+        return float("inf")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Histogram summary for the JSON API."""
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 4),
+            "avg": round(self.sum / self.count, 4) if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": {
+                str(bound): count
+                for bound, count in zip(self.buckets + ("+Inf",), self.cumulative_counts())
+            },
+        }
+
+
+class CallSiteStats:
+    """Usage of one call site."""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors: Dict[str, int] = {}
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.latency = Histogram(LATENCY_BUCKETS_SECONDS)
+        self.input_token_histogram = Histogram(TOKEN_BUCKETS)
+        self.output_token_histogram = Histogram(TOKEN_BUCKETS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Call site summary for the JSON API."""
+        return {
+            "requests": self.requests,
+            "errors": sum(self.errors.values()),
+            "errors_by_type": dict(self.errors),
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "latency_seconds": self.latency.to_dict(),
+            "input_tokens_per_request": self.input_token_histogram.to_dict(),
+            "output_tokens_per_request": self.output_token_histogram.to_dict(),
+        }
+
+
+class LLMMetrics:
+    """
+    Thread-safe LLM usage accounting, broken down by call site.
+
+    Call sites are short dotted tags naming the code path that made a call,
+    e.g. ``fusion.internal`` or ``routing.justification``.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sites: Dict[str, CallSiteStats] = {}
+
+    def _site(self, call_site: str) -> CallSiteStats:
+        """Get the stats of a call site, creating them. Caller holds the lock."""
+        stats = self._sites.get(call_site)
+        if stats is None:
+            stats = self._sites[call_site] = CallSiteStats()
+        return stats
+
+    def record_success(
+        self,
+        call_site: str,
+        latency: float,
+        input_tokens: int,
+        output_tokens: int,
+    ):
+        """
+        Record a successful call.
+
+        Args:
+            call_site: Call site tag
+            latency: Call latency in seconds
+            input_tokens: Input tokens used
+            output_tokens: Output tokens generated
+        """
+        with self._lock:
+            stats = self._site(call_site)
+            stats.requests += 1
+            stats.input_tokens += input_tokens
+            stats.output_tokens += output_tokens
+            stats.latency.observe(latency)
+            stats.input_token_histogram.observe(input_tokens)
+            stats.output_token_histogram.observe(output_tokens)
+
+    def record_error(self, call_site: str, latency: float, error: BaseException):
+        """
+        Record a failed call.
+
+        Args:
+            call_site: Call site tag
+            latency: Time until the call failed in seconds
+            error: Exception raised by the call
+        """
+        with self._lock:
+            stats = self._site(call_site)
+            stats.requests += 1
+            error_type = type(error).__name__
+            stats.errors[error_type] = stats.errors.get(error_type, 0) + 1
+            stats.latency.observe(latency)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get usage per call site and in total.
+
+        Returns:
+            Dict with 'call_sites' and 'totals'
+        """
+        with self._lock:
+            call_sites = {name: stats.to_dict() for name, stats in sorted(self._sites.items())}
+
+        totals = {
+            key: sum(site[key] for site in call_sites.values())
+            for key in ("requests", "errors", "input_tokens", "output_tokens")
+        }
+        totals["total_tokens"] = totals["input_tokens"] + totals["output_tokens"]
+        return {"call_sites": call_sites, "totals": totals}
+
+    def render_prometheus(self) -> str:
+        """
+        Render metrics in the Prometheus text exposition format.
+
+        Returns:
+            Metrics text
+        """
+        lines: List[str] = []
+
+        with self._lock:
+            sites = sorted(self._sites.items())
+
+            lines += [
+                "# HELP lexconductor_llm_requests_total LLM calls per call site",
+                "# TYPE lexconductor_llm_requests_total counter",
+            ]
+            for name, stats in sites:
+                lines.append(
+                    f'lexconductor_llm_requests_total{{call_site="{name}"}} {stats.requests}'
+                )
+
+            lines += [
+                "# HELP lexconductor_llm_errors_total Failed LLM calls per call site and error type",
+                "# TYPE lexconductor_llm_errors_total counter",
+            ]
+            for name, stats in sites:
+                for error_type, count in sorted(stats.errors.items()):
+                    lines.append(
+                        f'lexconductor_llm_errors_total{{call_site="{name}",'
+                        f'error_type="{error_type}"}} {count}'
+                    )
+
+            lines += [
+                "# HELP lexconductor_llm_tokens_total LLM tokens per call site and direction",
+                "# TYPE lexconductor_llm_tokens_total counter",
+            ]
+            for name, stats in sites:
+                lines.append(
+                    f'lexconductor_llm_tokens_total{{call_site="{name}",direction="input"}} '
+                    f"{stats.input_tokens}"
+                )
+                lines.append(
+                    f'lexconductor_llm_tokens_total{{call_site="{name}",direction="output"}} '
+                    f"{stats.output_tokens}"
+                )
+
+            histograms = [
+                ("lexconductor_llm_latency_seconds", "LLM call latency", "latency"),
+                (
+                    "lexconductor_llm_input_tokens",
+                    "Input tokens per LLM call",
+                    "input_token_histogram",
+                ),
+                (
+                    "lexconductor_llm_output_tokens",
+                    "Output tokens per LLM call",
+                    "output_token_histogram",
+                ),
+            ]
+            for metric, description, attribute in histograms:
+                lines += [f"# HELP {metric} {description}", f"# TYPE {metric} histogram"]
+                for name, stats in sites:
+                    histogram: Histogram = getattr(stats, attribute)
+                    for bound, count in zip(
+                        histogram.buckets + ("+Inf",), histogram.cumulative_counts()
+                    ):
+                        lines.append(f'{metric}_bucket{{call_site="{name}",le="{bound}"}} {count}')
+                    lines.append(f'{metric}_sum{{call_site="{name}"}} {histogram.sum}')
+                    lines.append(f'{metric}_count{{call_site="{name}"}} {histogram.count}')
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """Clear all recorded metrics."""
+        with self._lock:
+            self._sites.clear()
+
+
+# ============================================================================
+# Singleton instance
+# ============================================================================
+
+_llm_metrics: Optional[LLMMetrics] = None
+_llm_metrics_lock = threading.Lock()
+
+
+def get_llm_metrics() -> LLMMetrics:
+    """
+    Get singleton LLM metrics instance, shared by all clients in the process.
+
+    Returns:
+        LLMMetrics instance
+    """
+    global _llm_metrics
+    if _llm_metrics is None:
+        with _llm_metrics_lock:
+            if _llm_metrics is None:
+                _llm_metrics = LLMMetrics()
+    return _llm_metrics
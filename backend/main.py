@@ -4,12 +4,17 @@ FastAPI application for LexConductor external agents.
 This module provides the main FastAPI application with:
 - CORS middleware for cross-origin requests
 - Health check endpoint
+- LLM usage metrics endpoints (JSON and Prometheus)
+- Per-tenant quota enforcement (X-Tenant-ID header)
+- Per-request retry budget and backend circuit breaker state
 - Request/response logging middleware
 - Structured JSON logging
 - Routers for each agent endpoint
 """
 
+import asyncio
 import logging
+import os
 import time
 import json
 from typing import Callable
@@ -17,10 +22,51 @@ from datetime import datetime
 
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 import uvicorn
 
 from backend.routers import fusion, routing, memory, traceability, agent_connect
+from backend.async_cloudant_client import close_async_cloudant_client
+from backend.cloudant_client import get_cloudant_client
+from backend.cloudant_indexes import QueryPlanError, verify_query_plans
+from backend.cloudant_replica import (
+    get_cloudant_replica,
+    start_cloudant_replica,
+    stop_cloudant_replica,
+)
+from backend.health_monitor import get_health_monitor, start_health_monitor, stop_health_monitor
+from backend.iam_tokens import get_iam_token_stats, stop_iam_token_providers, warm_iam_tokens
+from backend.golden_clause_cache import get_golden_clause_cache, stop_golden_clause_cache
+from backend.precedent_writer import close_precedent_writer
+from backend.llm_metrics import get_llm_metrics
+from backend.prompt_templates import get_prompt_registry
+from backend.query_coalescer import get_query_coalescer_stats
+from backend.resilience import get_circuit_breaker_states, retry_budget
+from backend.watsonx_client import get_hedging_stats
+from backend.tenant_scheduler import (
+    TENANT_HEADER,
+    QuotaExceededError,
+    get_current_tenant,
+    get_tenant_scheduler,
+    reset_current_tenant,
+    set_current_tenant,
+)
+
+# Endpoints served regardless of tenant quotas
+QUOTA_EXEMPT_PATHS = {
+    "/",
+    "/health",
+    "/health/deep",
+    "/metrics",
+    "/metrics/llm",
+    "/metrics/hedging",
+    "/metrics/tenants",
+    "/metrics/prompts",
+    "/metrics/golden-clauses",
+    "/metrics/replica",
+    "/metrics/iam",
+    "/metrics/coalescing",
+}
 
 # Configure structured JSON logging
 logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -132,21 +178,252 @@ async def logging_middleware(request: Request, call_next: Callable) -> Response:
         )
 
 
+def _quota_exceeded_response(error: QuotaExceededError) -> JSONResponse:
+    """Build the 429 response for a tenant over quota."""
+    return JSONResponse(
+        status_code=429,
+        headers={"Retry-After": str(max(1, int(error.retry_after + 0.999)))},
+        content={
+            "error": {
+                "code": "TENANT_QUOTA_EXCEEDED",
+                "message": str(error),
+                "tenant": error.tenant,
+                "reason": error.reason,
+            }
+        },
+    )
+
+
+@app.middleware("http")
+async def tenant_middleware(request: Request, call_next: Callable) -> Response:
+    """
+    Middleware attributing requests to a tenant.
+
+    Sets the tenant from the X-Tenant-ID header for watsonx.ai call scheduling,
+    and rejects requests from tenants already over quota before any work is done.
+    """
+    token = set_current_tenant(request.headers.get(TENANT_HEADER))
+    try:
+        scheduler = get_tenant_scheduler()
+        if scheduler is not None and request.url.path not in QUOTA_EXEMPT_PATHS:
+            try:
+                scheduler.check(get_current_tenant())
+            except QuotaExceededError as e:
+                return _quota_exceeded_response(e)
+
+        # Retries of all backend calls made for this request share one budget
+        with retry_budget():
+            return await call_next(request)
+    finally:
+        reset_current_tenant(token)
+
+
+@app.exception_handler(QuotaExceededError)
+async def quota_exceeded_handler(request: Request, exc: QuotaExceededError) -> JSONResponse:
+    """Return 429 with Retry-After when a tenant runs out of quota mid-request."""
+    return _quota_exceeded_response(exc)
+
+
+@app.on_event("startup")
+async def warm_tokens():
+    """Fetch the shared IAM tokens before the first request needs them."""
+    await asyncio.to_thread(warm_iam_tokens)
+
+
+@app.on_event("startup")
+async def verify_cloudant_query_plans():
+    """Check with _explain that each Cloudant query is served by an index."""
+    if os.getenv("CLOUDANT_VERIFY_QUERY_PLANS", "true").lower() != "true":
+        return
+    try:
+        await asyncio.to_thread(verify_query_plans, get_cloudant_client())
+    except QueryPlanError:
+        raise
+    except Exception as e:
+        logger.warning(f"Skipped Cloudant query plan verification: {e}")
+
+
+@app.on_event("startup")
+async def start_replica():
+    """Start syncing the local Cloudant replica, when enabled."""
+    try:
+        await asyncio.to_thread(start_cloudant_replica)
+    except Exception as e:
+        logger.warning(f"Cloudant replica not started: {e}")
+
+
+@app.on_event("startup")
+async def start_health_checks():
+    """Start probing Cloudant, COS and watsonx.ai in the background."""
+    start_health_monitor()
+
+
+@app.on_event("shutdown")
+async def close_clients():
+    """Stop background feeds, flush buffered writes and close pooled connections."""
+    await stop_health_monitor()
+    await stop_golden_clause_cache()
+    await asyncio.to_thread(stop_cloudant_replica)
+    await asyncio.to_thread(close_precedent_writer, 30.0)
+    await close_async_cloudant_client()
+    await asyncio.to_thread(stop_iam_token_providers)
+
+
 @app.get("/health")
 async def health_check():
     """
     Health check endpoint.
 
+    Served from the health monitor's cached results: no dependency is called.
+
     Returns:
-        dict: Health status and timestamp
+        dict: Health status, timestamp, backend circuit breaker states and the
+            latest status and latency of each dependency
     """
+    breakers = get_circuit_breaker_states()
+    monitor = get_health_monitor()
+    degraded = any(breaker["state"] != "closed" for breaker in breakers.values()) or (
+        monitor is not None and monitor.status == "degraded"
+    )
     return {
-        "status": "healthy",
+        "status": "degraded" if degraded else "healthy",
         "timestamp": datetime.utcnow().isoformat(),
         "service": "lexconductor-agents",
+        "circuit_breakers": breakers,
+        "dependencies": monitor.summary() if monitor is not None else {},
     }
 
 
+@app.get("/health/deep")
+async def deep_health_check():
+    """
+    Detailed dependency health endpoint.
+
+    Served from the health monitor's cached results: no dependency is called.
+
+    Returns:
+        dict: Overall status and, per dependency, the latest probe result,
+            latency, age, errors and probe details
+    """
+    monitor = get_health_monitor()
+    if monitor is None:
+        return {"status": "unknown", "monitor": {"enabled": False}, "dependencies": {}}
+    return {
+        "status": monitor.status,
+        "timestamp": datetime.utcnow().isoformat(),
+        "dependencies": monitor.snapshot(),
+    }
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """
+    Prometheus metrics endpoint.
+
+    Returns:
+        str: LLM usage, latency and error metrics per call site
+    """
+    return PlainTextResponse(
+        get_llm_metrics().render_prometheus(),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+@app.get("/metrics/llm")
+async def llm_metrics():
+    """
+    LLM usage metrics endpoint.
+
+    Returns:
+        dict: Requests, errors, tokens and latency histograms per call site
+    """
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        **get_llm_metrics().snapshot(),
+    }
+
+
+@app.get("/metrics/hedging")
+async def hedging_metrics():
+    """
+    watsonx.ai request hedging and micro-batching metrics endpoint.
+
+    Returns:
+        dict: Hedge rate and wins, and batch counts and sizes, of the shared client
+            (disabled until the client is first used)
+    """
+    return get_hedging_stats()
+
+
+@app.get("/metrics/tenants")
+async def tenant_metrics():
+    """
+    Tenant quota usage endpoint.
+
+    Returns:
+        dict: Window usage, limits and queue state per tenant
+    """
+    scheduler = get_tenant_scheduler()
+    return scheduler.get_stats() if scheduler is not None else {"enabled": False}
+
+
+@app.get("/metrics/prompts")
+async def prompt_metrics():
+    """
+    Prompt template metrics endpoint.
+
+    Returns:
+        dict: Token estimates and traffic per prompt template version
+    """
+    return get_prompt_registry().get_stats()
+
+
+@app.get("/metrics/golden-clauses")
+async def golden_clause_cache_metrics():
+    """
+    Golden Clause cache metrics endpoint.
+
+    Returns:
+        dict: Cache size, staleness and hit counts
+    """
+    cache = get_golden_clause_cache()
+    return cache.get_stats() if cache is not None else {"enabled": False}
+
+
+@app.get("/metrics/replica")
+async def replica_metrics():
+    """
+    Local Cloudant replica metrics endpoint.
+
+    Returns:
+        dict: Documents, sequence ID and staleness per replicated database
+    """
+    replica = get_cloudant_replica()
+    return replica.get_stats() if replica is not None else {"enabled": False}
+
+
+@app.get("/metrics/iam")
+async def iam_metrics():
+    """
+    Shared IAM token metrics endpoint.
+
+    Returns:
+        dict: Token freshness and refresh counts per API key (keys not included)
+    """
+    return {"providers": get_iam_token_stats()}
+
+
+@app.get("/metrics/coalescing")
+async def coalescing_metrics():
+    """
+    Cloudant query coalescing metrics endpoint.
+
+    Returns:
+        dict: Lookups received and queries sent per async Cloudant client
+    """
+    return {"coalescers": get_query_coalescer_stats()}
+
+
 @app.get("/")
 async def root():
     """
@@ -160,9 +437,21 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "health": "/health",
+            "deep_health": "/health/deep",
+            "metrics": "/metrics",
+            "llm_metrics": "/metrics/llm",
+            "hedging_metrics": "/metrics/hedging",
+            "tenant_metrics": "/metrics/tenants",
+            "prompt_metrics": "/metrics/prompts",
+            "golden_clause_cache_metrics": "/metrics/golden-clauses",
+            "replica_metrics": "/metrics/replica",
+            "iam_metrics": "/metrics/iam",
+            "coalescing_metrics": "/metrics/coalescing",
             "fusion": "/fusion/analyze",
             "routing": "/routing/classify",
             "memory": "/memory/query",
+            "memory_statistics": "/memory/statistics",
+            "memory_bulk_import": "/memory/precedents/bulk",
             "traceability": "/traceability/generate",
         },
     }
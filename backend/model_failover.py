@@ -0,0 +1,216 @@
+"""
+Model Failover
+IBM Dev Day AI Demystified Hackathon 2026
+Team: AI Kings 👑
+
+Per-model health tracking for watsonx.ai calls, with failover to a fallback
+model when the primary model's error rate or latency degrades, and periodic
+probing of the primary to fail back once it recovers.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ModelHealth:
+    """Sliding window of recent call outcomes for one model."""
+
+    def __init__(self, window_size: int = 20):
+        """
+        Initialize model health.
+
+        Args:
+            window_size: Number of recent calls to keep
+        """
+        self._calls: Deque[Tuple[bool, float]] = deque(maxlen=window_size)
+        self.total_calls = 0
+        self.total_errors = 0
+
+    def record(self, success: bool, latency: float):
+        """Record a call outcome and its latency in seconds."""
+        self._calls.append((success, latency))
+        self.total_calls += 1
+        if not success:
+            self.total_errors += 1
+
+    def reset(self):
+        """Forget recent calls (totals are kept)."""
+        self._calls.clear()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of recent calls that failed."""
+        if not self._calls:
+            return 0.0
+        return sum(1 for success, _ in self._calls if not success) / len(self._calls)
+
+    @property
+    def avg_latency(self) -> float:
+        """Average latency of recent successful calls, in seconds."""
+        latencies = [latency for success, latency in self._calls if success]
+        return sum(latencies) / len(latencies) if latencies else 0.0
+
+
+class ModelFailover:
+    """
+    Choose between a primary and a fallback model based on primary health.
+
+    The primary is used until, over at least ``min_samples`` recent calls, its
+    error rate reaches ``error_rate_threshold`` or its average latency reaches
+    ``latency_threshold``. Calls then go to the fallback model, except for one
+    probe call to the primary every ``probe_interval`` seconds; a successful,
+    fast probe fails back to the primary. Only the probe decides: primary
+    calls that were already running when failover happened are ignored.
+    """
+
+    def __init__(
+        self,
+        primary_model_id: str,
+        fallback_model_id: str,
+        error_rate_threshold: float = 0.5,
+        latency_threshold: float = 10.0,
+        min_samples: int = 5,
+        window_size: int = 20,
+        probe_interval: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize model failover.
+
+        Args:
+            primary_model_id: Model used while healthy
+            fallback_model_id: Model used while the primary is degraded
+            error_rate_threshold: Recent error rate that triggers failover
+            latency_threshold: Recent average latency in seconds that triggers failover
+            min_samples: Recent calls required before failing over
+            window_size: Recent calls considered per model
+            probe_interval: Seconds between probes of a failed primary
+            clock: Time source (for tests)
+        """
+        self.primary_model_id = primary_model_id
+        self.fallback_model_id = fallback_model_id
+        self.error_rate_threshold = error_rate_threshold
+        self.latency_threshold = latency_threshold
+        self.min_samples = min_samples
+        self.probe_interval = probe_interval
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._health: Dict[str, ModelHealth] = {
+            primary_model_id: ModelHealth(window_size),
+            fallback_model_id: ModelHealth(window_size),
+        }
+        self._failed_over = False
+        self._failed_over_at = 0.0
+        self._next_probe_at = 0.0
+        self._probe_in_flight = False
+
+        # Failover statistics
+        self.failovers = 0
+        self.failbacks = 0
+
+    @property
+    def active_model_id(self) -> str:
+        """Model currently serving traffic."""
+        return self.fallback_model_id if self._failed_over else self.primary_model_id
+
+    def select_model(self) -> Tuple[str, bool]:
+        """
+        Choose the model for the next call.
+
+        Returns:
+            Tuple of (model ID, whether the call is a probe of the failed primary)
+        """
+        with self._lock:
+            if not self._failed_over:
+                return self.primary_model_id, False
+
+            now = self.clock()
+            if not self._probe_in_flight and now >= self._next_probe_at:
+                self._probe_in_flight = True
+                self._next_probe_at = now + self.probe_interval
+                logger.info(f"Probing primary model {self.primary_model_id}")
+                return self.primary_model_id, True
+
+            return self.fallback_model_id, False
+
+    def record(self, model_id: str, success: bool, latency: float, probe: bool = False):
+        """
+        Record a call outcome, failing over or back when thresholds are crossed.
+
+        Args:
+            model_id: Model that served the call
+            success: Whether the call succeeded
+            latency: Call latency in seconds
+            probe: Whether select_model handed the call out as a probe
+        """
+        with self._lock:
+            health = self._health.get(model_id)
+            if health is None:
+                return
+            health.record(success, latency)
+
+            if model_id != self.primary_model_id:
+                return
+
+            if self._failed_over:
+                if not probe:
+                    return
+                self._probe_in_flight = False
+                if success and latency < self.latency_threshold:
+                    self._failed_over = False
+                    health.reset()
+                    self.failbacks += 1
+                    logger.warning(
+                        f"Primary model {self.primary_model_id} recovered, failing back "
+                        f"after {self.clock() - self._failed_over_at:.0f}s"
+                    )
+                return
+
+            if len(health) >= self.min_samples and (
+                health.error_rate >= self.error_rate_threshold
+                or health.avg_latency >= self.latency_threshold
+            ):
+                self._failed_over = True
+                self._failed_over_at = self.clock()
+                self._next_probe_at = self._failed_over_at + self.probe_interval
+                self.failovers += 1
+                logger.warning(
+                    f"Primary model {self.primary_model_id} degraded "
+                    f"(error rate {health.error_rate:.0%}, "
+                    f"avg latency {health.avg_latency:.2f}s), "
+                    f"failing over to {self.fallback_model_id}"
+                )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get failover state and per-model health.
+
+        Returns:
+            Dict with the active model, failover counts and model health
+        """
+        with self._lock:
+            return {
+                "enabled": True,
+                "active_model_id": self.active_model_id,
+                "failed_over": self._failed_over,
+                "failovers": self.failovers,
+                "failbacks": self.failbacks,
+                "models": {
+                    model_id: {
+                        "recent_error_rate": round(health.error_rate, 4),
+                        "recent_avg_latency_ms": round(health.avg_latency * 1000, 2),
+                        "total_calls": health.total_calls,
+                        "total_errors": health.total_errors,
+                    }
+                    for model_id, health in self._health.items()
+                },
+            }
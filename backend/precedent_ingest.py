@@ -0,0 +1,232 @@
+"""
+Precedent Ingestion
+IBM Dev Day AI Demystified Hackathon 2026
+Team: AI Kings 👑
+
+Streaming import of historical decisions from NDJSON (one HistoricalDecision
+per line). Records are validated as they are read and written through
+_bulk_docs in chunks, with a bounded number of chunks in flight, so memory use
+does not depend on the size of the import; one result per record is yielded
+as soon as it is known.
+"""
+
+import asyncio
+import json
+import os
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+import logging
+
+from pydantic import ValidationError
+
+from backend.async_cloudant_client import AsyncCloudantClient
+from backend.models import HistoricalDecision
+
+logger = logging.getLogger(__name__)
+
+
+async def iter_ndjson_lines(
+    body: AsyncIterator[bytes], max_line_bytes: int
+) -> AsyncIterator[Tuple[int, Optional[bytes]]]:
+    """
+    Split a streamed body into NDJSON lines.
+
+    Args:
+        body: Body chunks
+        max_line_bytes: Longest line kept; longer lines are skipped without being buffered
+
+    Yields:
+        (line number, line) for each non-blank line, with None as the line when it
+        was longer than max_line_bytes
+    """
+    buffer = bytearray()
+    line_number = 0
+    oversized = False
+
+    async for chunk in body:
+        start = 0
+        while True:
+            end = chunk.find(b"\n", start)
+            if end == -1:
+                if not oversized:
+                    buffer += chunk[start:]
+                    if len(buffer) > max_line_bytes:
+                        oversized = True
+                        buffer.clear()
+                break
+
+            line_number += 1
+            if oversized:
+                yield line_number, None
+            else:
+                buffer += chunk[start:end]
+                if len(buffer) > max_line_bytes:
+                    yield line_number, None
+                elif buffer.strip():
+                    yield line_number, bytes(buffer)
+            buffer.clear()
+            oversized = False
+            start = end + 1
+
+    if oversized or buffer.strip():
+        line_number += 1
+        yield line_number, None if oversized else bytes(buffer)
+
+
+def parse_precedent_line(line: bytes) -> HistoricalDecision:
+    """
+    Validate one NDJSON record as a historical decision.
+
+    Args:
+        line: JSON object
+
+    Returns:
+        HistoricalDecision object
+
+    Raises:
+        ValueError: If the line is not valid JSON or not a valid decision
+    """
+    try:
+        return HistoricalDecision.model_validate_json(line)
+    except ValidationError as e:
+        errors = "; ".join(
+            f"{'.'.join(str(part) for part in error['loc']) or 'record'}: {error['msg']}"
+            for error in e.errors()
+        )
+        raise ValueError(errors) from None
+
+
+def _record_result(line: int, decision_id: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    if result.get("error"):
+        return {
+            "line": line,
+            "decision_id": decision_id,
+            "ok": False,
+            "error": result["error"],
+            "reason": result.get("reason", ""),
+        }
+    return {"line": line, "decision_id": decision_id, "ok": True, "id": result["id"]}
+
+
+async def ingest_precedents(
+    client: AsyncCloudantClient,
+    body: AsyncIterator[bytes],
+    db_name: Optional[str] = None,
+    chunk_docs: Optional[int] = None,
+    chunk_bytes: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    max_line_bytes: Optional[int] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Import historical decisions from a streamed NDJSON body.
+
+    Decisions without an _id are stored under their decision_id, so that
+    re-running an import reports conflicts instead of storing duplicates.
+    Invalid records are reported as soon as they are read and stored ones
+    when their chunk commits, so results carry their line number.
+
+    Args:
+        client: Async Cloudant client
+        body: NDJSON body chunks
+        db_name: Database name (defaults to the client's historical decisions database)
+        chunk_docs: Documents per _bulk_docs request
+            (defaults to PRECEDENT_INGEST_CHUNK_DOCS env var or 500)
+        chunk_bytes: JSON bytes per _bulk_docs request
+            (defaults to PRECEDENT_INGEST_CHUNK_BYTES env var or 5000000)
+        max_in_flight: _bulk_docs requests sent concurrently
+            (defaults to PRECEDENT_INGEST_MAX_IN_FLIGHT env var or 4)
+        max_line_bytes: Longest accepted record
+            (defaults to PRECEDENT_INGEST_MAX_LINE_BYTES env var or 1000000)
+
+    Yields:
+        One result per record ({'line', 'decision_id', 'ok', 'id'} or
+        {'line', 'ok', 'error', 'reason'}), then {'summary': counts}
+    """
+    db_name = db_name or client.db_historical_decisions
+    chunk_docs = chunk_docs or int(os.getenv("PRECEDENT_INGEST_CHUNK_DOCS", "500"))
+    chunk_bytes = chunk_bytes or int(os.getenv("PRECEDENT_INGEST_CHUNK_BYTES", "5000000"))
+    max_in_flight = max_in_flight or int(os.getenv("PRECEDENT_INGEST_MAX_IN_FLIGHT", "4"))
+    max_line_bytes = max_line_bytes or int(os.getenv("PRECEDENT_INGEST_MAX_LINE_BYTES", "1000000"))
+
+    summary = {"received": 0, "stored": 0, "conflicts": 0, "invalid": 0, "errors": 0}
+    chunk: List[Tuple[int, Dict[str, Any]]] = []
+    chunk_size = 0
+    in_flight: Deque[Tuple[List[Tuple[int, Dict[str, Any]]], asyncio.Task]] = deque()
+
+    def send(records: List[Tuple[int, Dict[str, Any]]]):
+        documents = [doc for _, doc in records]
+        in_flight.append(
+            (records, asyncio.create_task(client.bulk_store_documents(db_name, documents)))
+        )
+
+    async def collect() -> List[Dict[str, Any]]:
+        """Wait for the oldest chunk and build its record results."""
+        records, task = in_flight.popleft()
+        try:
+            results = await task
+        except Exception as e:
+            logger.error(f"Failed to store chunk of {len(records)} precedents: {e}")
+            results = [{"error": "bulk_failed", "reason": str(e)}] * len(records)
+
+        # Every record gets a result, even from a short response
+        missing = {"error": "missing_result", "reason": "No result in the _bulk_docs response"}
+        results = list(results) + [missing] * (len(records) - len(results))
+
+        outcomes = []
+        for (line, doc), result in zip(records, results):
+            outcome = _record_result(line, doc["decision_id"], result)
+            if outcome["ok"]:
+                summary["stored"] += 1
+            elif outcome["error"] == "conflict":
+                summary["conflicts"] += 1
+            else:
+                summary["errors"] += 1
+            outcomes.append(outcome)
+        return outcomes
+
+    try:
+        async for line_number, line in iter_ndjson_lines(body, max_line_bytes):
+            summary["received"] += 1
+            if line is None:
+                summary["invalid"] += 1
+                yield {
+                    "line": line_number,
+                    "ok": False,
+                    "error": "invalid",
+                    "reason": f"Record longer than {max_line_bytes} bytes",
+                }
+                continue
+
+            try:
+                decision = parse_precedent_line(line)
+            except ValueError as e:
+                summary["invalid"] += 1
+                yield {"line": line_number, "ok": False, "error": "invalid", "reason": str(e)}
+                continue
+
+            doc = decision.model_dump(by_alias=True, exclude_none=True)
+            doc.pop("_rev", None)
+            doc.setdefault("_id", decision.decision_id)
+            doc = client.partitioning.precedent_document(doc)
+
+            if chunk and (len(chunk) >= chunk_docs or chunk_size + len(line) > chunk_bytes):
+                send(chunk)
+                chunk, chunk_size = [], 0
+                # Bounded memory: wait for the oldest chunk before reading further
+                while in_flight and (len(in_flight) >= max_in_flight or in_flight[0][1].done()):
+                    for outcome in await collect():
+                        yield outcome
+            chunk.append((line_number, doc))
+            chunk_size += len(line)
+
+        if chunk:
+            send(chunk)
+        while in_flight:
+            for outcome in await collect():
+                yield outcome
+    finally:
+        for _, task in in_flight:
+            task.cancel()
+
+    logger.info(f"Ingested precedents: {json.dumps(summary)}")
+    yield {"summary": summary}
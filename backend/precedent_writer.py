@@ -0,0 +1,352 @@
+"""
+Precedent Writer
+IBM Dev Day AI Demystified Hackathon 2026
+Team: AI Kings 👑
+
+Write-behind batching of historical decisions. Decisions are buffered and
+written to Cloudant through _bulk_docs once a batch is full (by count or
+size) or its time window ends; each caller gets a future resolving to the
+stored document ID.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, wait
+from typing import Any, Deque, Dict, List, Optional, Tuple
+import logging
+
+from backend.cloudant_client import CloudantClient, CloudantPartitioning, get_cloudant_client
+from backend.models import HistoricalDecision
+
+logger = logging.getLogger(__name__)
+
+
+class PrecedentWriteError(Exception):
+    """Raised through a future when Cloudant rejected one document of a batch."""
+
+    def __init__(self, doc_id: Optional[str], error: str, reason: str = ""):
+        self.doc_id = doc_id
+        self.error = error
+        self.reason = reason
+        super().__init__(f"Failed to store precedent {doc_id}: {error} {reason}".strip())
+
+    @property
+    def is_conflict(self) -> bool:
+        """Whether a document with the same ID already exists."""
+        return self.error == "conflict"
+
+
+class PrecedentWriter:
+    """
+    Buffer historical decisions and store them in _bulk_docs batches.
+
+    A background thread sends a batch when it reaches ``max_batch_docs``
+    documents or ``max_batch_bytes`` of JSON, or ``flush_interval`` seconds
+    after its first document was submitted. Decisions carrying an ID keep it,
+    so that re-running a batch job reports conflicts instead of storing
+    duplicates.
+    """
+
+    def __init__(
+        self,
+        client: CloudantClient,
+        db_name: Optional[str] = None,
+        max_batch_docs: Optional[int] = None,
+        max_batch_bytes: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        partitioning: Optional[CloudantPartitioning] = None,
+    ):
+        """
+        Initialize precedent writer.
+
+        Args:
+            client: Cloudant client
+            db_name: Database name (defaults to the client's historical decisions database)
+            max_batch_docs: Documents per batch
+                (defaults to PRECEDENT_WRITER_BATCH_DOCS env var or 100)
+            max_batch_bytes: JSON bytes per batch
+                (defaults to PRECEDENT_WRITER_BATCH_BYTES env var or 1000000)
+            flush_interval: Seconds a batch waits for more documents
+                (defaults to PRECEDENT_WRITER_FLUSH_MS env var or 500, in milliseconds)
+            partitioning: Partitioning assigning document IDs
+                (defaults to the CLOUDANT_PARTITIONED settings)
+        """
+        self.client = client
+        self.db_name = db_name or client.db_historical_decisions
+        self.max_batch_docs = max_batch_docs or int(os.getenv("PRECEDENT_WRITER_BATCH_DOCS", "100"))
+        self.max_batch_bytes = max_batch_bytes or int(
+            os.getenv("PRECEDENT_WRITER_BATCH_BYTES", "1000000")
+        )
+        self.flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else float(os.getenv("PRECEDENT_WRITER_FLUSH_MS", "500")) / 1000
+        )
+        self.partitioning = partitioning or CloudantPartitioning()
+
+        self._condition = threading.Condition()
+        self._pending: Deque[Tuple[Dict[str, Any], int, Future]] = deque()
+        self._pending_bytes = 0
+        self._batch_started_at = 0.0
+        self._outstanding: set = set()
+        self._flush_requested = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Writer statistics
+        self.total_batches = 0
+        self.total_stored = 0
+        self.total_conflicts = 0
+        self.total_errors = 0
+
+    def _to_document(self, decision: HistoricalDecision) -> Dict[str, Any]:
+        """Convert a decision to a new Cloudant document."""
+        doc = decision.model_dump(by_alias=True, exclude_none=True)
+        doc.pop("_rev", None)
+        return self.partitioning.precedent_document(doc)
+
+    def submit(self, decision: HistoricalDecision) -> "Future[str]":
+        """
+        Buffer a decision for the next batch.
+
+        Args:
+            decision: HistoricalDecision object to store
+
+        Returns:
+            Future resolving to the document ID once its batch commits, or raising
+            PrecedentWriteError if Cloudant rejected the document
+
+        Raises:
+            RuntimeError: If the writer is closed
+        """
+        doc = self._to_document(decision)
+        size = len(json.dumps(doc, default=str))
+        future: Future = Future()
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Precedent writer is closed")
+
+            if not self._pending:
+                self._batch_started_at = time.monotonic()
+            self._pending.append((doc, size, future))
+            self._pending_bytes += size
+            self._outstanding.add(future)
+            future.add_done_callback(self._forget)
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="precedent-writer", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+
+        return future
+
+    def store_precedent(self, decision: HistoricalDecision, timeout: Optional[float] = None) -> str:
+        """
+        Store a decision through the next batch and wait for its document ID.
+
+        Args:
+            decision: HistoricalDecision object to store
+            timeout: Seconds to wait for the batch to commit
+
+        Returns:
+            Document ID of stored decision
+        """
+        return self.submit(decision).result(timeout=timeout)
+
+    def _forget(self, future: Future):
+        with self._condition:
+            self._outstanding.discard(future)
+
+    def _batch_is_ready(self) -> bool:
+        """Whether the pending documents should be sent now. Caller holds the lock."""
+        return (
+            self._closed
+            or self._flush_requested
+            or len(self._pending) >= self.max_batch_docs
+            or self._pending_bytes >= self.max_batch_bytes
+            or time.monotonic() - self._batch_started_at >= self.flush_interval
+        )
+
+    def _take_batch(self) -> List[Tuple[Dict[str, Any], int, Future]]:
+        """Remove the next batch from the pending documents. Caller holds the lock."""
+        batch = []
+        batch_bytes = 0
+        while self._pending and len(batch) < self.max_batch_docs:
+            size = self._pending[0][1]
+            if batch and batch_bytes + size > self.max_batch_bytes:
+                break
+            batch.append(self._pending.popleft())
+            batch_bytes += size
+
+        self._pending_bytes -= batch_bytes
+        if self._pending:
+            self._batch_started_at = time.monotonic()
+        else:
+            self._flush_requested = False
+        return batch
+
+    def _run(self):
+        """Send batches until the writer is closed and drained."""
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+
+                while not self._batch_is_ready():
+                    remaining = self._batch_started_at + self.flush_interval - time.monotonic()
+                    self._condition.wait(timeout=max(remaining, 0.001))
+
+                batch = self._take_batch()
+
+            self._write(batch)
+
+    def _write(self, batch: List[Tuple[Dict[str, Any], int, Future]]):
+        """Send one batch and resolve the futures of its documents."""
+        self.total_batches += 1
+        try:
+            results = self.client.bulk_store_documents(self.db_name, [doc for doc, _, _ in batch])
+        except Exception as e:
+            logger.error(f"Failed to store batch of {len(batch)} precedents: {e}")
+            self.total_errors += len(batch)
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+
+        for (doc, _, future), result in zip(batch, results):
+            if not result.get("error"):
+                self.total_stored += 1
+                future.set_result(result["id"])
+                continue
+
+            error = PrecedentWriteError(
+                result.get("id", doc.get("_id")),
+                result.get("error", "unknown"),
+                result.get("reason", ""),
+            )
+            if error.is_conflict:
+                self.total_conflicts += 1
+            else:
+                self.total_errors += 1
+            logger.warning(str(error))
+            future.set_exception(error)
+
+        # A short response must not leave callers waiting forever
+        for doc, _, future in batch[len(results) :]:
+            self.total_errors += 1
+            future.set_exception(
+                PrecedentWriteError(
+                    doc.get("_id"), "missing_result", "No result in the _bulk_docs response"
+                )
+            )
+
+        logger.info(f"Stored batch of {len(batch)} precedents")
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Send every buffered decision now and wait for the batches to commit.
+
+        Args:
+            timeout: Seconds to wait
+
+        Returns:
+            True if every submitted decision has been committed or has failed
+        """
+        with self._condition:
+            outstanding = list(self._outstanding)
+            if self._pending:
+                self._flush_requested = True
+                self._condition.notify_all()
+
+        _, not_done = wait(outstanding, timeout=timeout)
+        return not not_done
+
+    def close(self, timeout: Optional[float] = None):
+        """
+        Flush buffered decisions and stop the writer thread.
+
+        Args:
+            timeout: Seconds to wait for the final batches
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+
+        if thread is not None:
+            thread.join(timeout=timeout)
+        logger.info("Precedent writer closed")
+
+    def __enter__(self) -> "PrecedentWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get writer counts and buffer state.
+
+        Returns:
+            Dict with batch counts, outcomes and pending documents
+        """
+        with self._condition:
+            pending = len(self._pending)
+            pending_bytes = self._pending_bytes
+        return {
+            "pending": pending,
+            "pending_bytes": pending_bytes,
+            "total_batches": self.total_batches,
+            "total_stored": self.total_stored,
+            "total_conflicts": self.total_conflicts,
+            "total_errors": self.total_errors,
+            "avg_batch_size": (
+                round(
+                    (self.total_stored + self.total_conflicts + self.total_errors)
+                    / self.total_batches,
+                    2,
+                )
+                if self.total_batches
+                else 0.0
+            ),
+        }
+
+
+# ============================================================================
+# Singleton instance
+# ============================================================================
+
+_precedent_writer: Optional[PrecedentWriter] = None
+_precedent_writer_lock = threading.Lock()
+
+
+def get_precedent_writer() -> PrecedentWriter:
+    """
+    Get singleton precedent writer instance, on the shared Cloudant client.
+
+    Returns:
+        PrecedentWriter instance
+    """
+    global _precedent_writer
+    if _precedent_writer is None:
+        with _precedent_writer_lock:
+            if _precedent_writer is None:
+                client = get_cloudant_client()
+                _precedent_writer = PrecedentWriter(client, partitioning=client.partitioning)
+    return _precedent_writer
+
+
+def close_precedent_writer(timeout: Optional[float] = None):
+    """Flush and close the singleton writer, if it was created."""
+    global _precedent_writer
+    with _precedent_writer_lock:
+        writer, _precedent_writer = _precedent_writer, None
+    if writer is not None:
+        writer.close(timeout=timeout)
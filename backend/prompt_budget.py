@@ -0,0 +1,309 @@
+"""
+Prompt Token Budgeting
+IBM Dev Day AI Demystified Hackathon 2026
+Team: AI Kings 👑
+
+Token-accurate prompt budgeting for watsonx.ai Granite models. Prompt sections
+are trimmed by priority so that a prompt fits a per-call input token budget.
+"""
+
+import math
+import os
+import re
+from dataclasses import dataclass, field
+from string import Formatter
+from typing import Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Marker appended to sections that were trimmed to fit the budget
+TRUNCATION_MARKER = "..."
+
+# Pre-tokenization pattern modelled on the Granite (StarCoder-style BPE)
+# tokenizer: contractions, words with an optional leading space, single
+# digits, punctuation runs and whitespace.
+_PRETOKEN_PATTERN = re.compile(r"'(?:s|t|re|ve|m|ll|d)| ?[^\W\d_]+| ?\d| ?[^\s\w]+|\s+(?!\S)|\s+")
+
+# Average characters per BPE token for alphabetic words. Conservative, so that
+# estimates err on the side of over-counting.
+_CHARS_PER_WORD_TOKEN = 5
+
+
+class TokenCounter:
+    """
+    Offline token counter for Granite models.
+
+    Uses a locally cached Hugging Face ``tokenizer.json`` when one is
+    configured and the optional ``tokenizers`` package is installed. Otherwise
+    falls back to a conservative BPE approximation that needs no network or
+    model files, so it can run in tests and at startup.
+    """
+
+    def __init__(self, tokenizer_path: Optional[str] = None):
+        """
+        Initialize token counter.
+
+        Args:
+            tokenizer_path: Path to a Granite tokenizer.json
+                (defaults to WATSONX_TOKENIZER_PATH env var)
+        """
+        self.tokenizer_path = tokenizer_path or os.getenv("WATSONX_TOKENIZER_PATH")
+        self._tokenizer = None
+
+        if self.tokenizer_path:
+            try:
+                from tokenizers import Tokenizer
+
+                self._tokenizer = Tokenizer.from_file(self.tokenizer_path)
+                logger.info(f"Loaded local tokenizer: {self.tokenizer_path}")
+            except ImportError:
+                logger.warning(
+                    "tokenizers not installed, using approximate token counts. "
+                    "Install with: pip install tokenizers"
+                )
+            except Exception as e:
+                logger.warning(f"Could not load tokenizer {self.tokenizer_path}: {e}")
+
+    @property
+    def is_exact(self) -> bool:
+        """Whether counts come from the real Granite tokenizer."""
+        return self._tokenizer is not None
+
+    def _token_spans(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Split text into token spans.
+
+        Args:
+            text: Input text
+
+        Returns:
+            List of (start, end) character offsets, one per token
+        """
+        if self._tokenizer is not None:
+            encoding = self._tokenizer.encode(text, add_special_tokens=False)
+            return [span for span in encoding.offsets if span[1] > span[0]]
+
+        spans = []
+        for match in _PRETOKEN_PATTERN.finditer(text):
+            start, end = match.span()
+            piece = match.group()
+            word = piece.lstrip(" ")
+
+            if word and word[0].isalpha() and len(word) > _CHARS_PER_WORD_TOKEN:
+                # Long words are split into several sub-word tokens
+                offset = start + (len(piece) - len(word))
+                pieces = math.ceil(len(word) / _CHARS_PER_WORD_TOKEN)
+                for i in range(pieces):
+                    piece_start = start if i == 0 else offset + i * _CHARS_PER_WORD_TOKEN
+                    piece_end = min(end, offset + (i + 1) * _CHARS_PER_WORD_TOKEN)
+                    spans.append((piece_start, piece_end))
+            else:
+                spans.append((start, end))
+
+        return spans
+
+    def count(self, text: str) -> int:
+        """
+        Count tokens in text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Number of tokens
+        """
+        if not text:
+            return 0
+        return len(self._token_spans(text))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """
+        Truncate text to at most max_tokens tokens.
+
+        Args:
+            text: Input text
+            max_tokens: Maximum number of tokens to keep
+
+        Returns:
+            Truncated text (unchanged if already within budget)
+        """
+        if max_tokens <= 0:
+            return ""
+
+        spans = self._token_spans(text)
+        if len(spans) <= max_tokens:
+            return text
+
+        return text[: spans[max_tokens - 1][1]]
+
+
+@dataclass
+class PromptSection:
+    """A named, trimmable section of a prompt."""
+
+    name: str
+    text: str
+    priority: int = 0  # Lower priority sections are trimmed first
+    min_tokens: int = 0  # Tokens that are never trimmed away
+
+
+@dataclass
+class BudgetedPrompt:
+    """Prompt rendered within a token budget."""
+
+    text: str
+    estimated_input_tokens: int
+    max_input_tokens: int
+    section_tokens: Dict[str, int] = field(default_factory=dict)
+    trimmed_sections: List[str] = field(default_factory=list)
+
+    @property
+    def was_trimmed(self) -> bool:
+        """Whether any section had to be trimmed."""
+        return bool(self.trimmed_sections)
+
+
+class PromptBudget:
+    """
+    Fit prompt templates into a per-call input token budget.
+
+    Templates use ``str.format`` placeholders. Each placeholder is filled with
+    a section; when the rendered prompt exceeds the budget, sections are
+    trimmed starting with the lowest priority until the prompt fits.
+    """
+
+    def __init__(self, counter: Optional[TokenCounter] = None):
+        """
+        Initialize prompt budget.
+
+        Args:
+            counter: Token counter (defaults to the shared offline counter)
+        """
+        self.counter = counter or get_token_counter()
+
+    def fit(
+        self,
+        template: str,
+        sections: List[PromptSection],
+        max_input_tokens: int,
+    ) -> BudgetedPrompt:
+        """
+        Render template with sections trimmed to fit max_input_tokens.
+
+        Args:
+            template: Prompt template with placeholders for the sections
+            sections: Sections to substitute into the template
+            max_input_tokens: Token budget for the whole prompt
+
+        Returns:
+            BudgetedPrompt with the rendered text and token estimates
+        """
+        # How many times each placeholder appears in the template
+        occurrences: Dict[str, int] = {}
+        for _, field_name, _, _ in Formatter().parse(template):
+            if field_name:
+                occurrences[field_name] = occurrences.get(field_name, 0) + 1
+
+        texts = {section.name: section.text for section in sections}
+        kept = {section.name: self.counter.count(section.text) for section in sections}
+        floors = {section.name: min(section.min_tokens, kept[section.name]) for section in sections}
+        marker_tokens = self.counter.count(TRUNCATION_MARKER)
+        trimmed: List[str] = []
+
+        text = template.format(**texts)
+        estimated = self.counter.count(text)
+
+        # Token boundaries shift when sections are joined with the template, so
+        # the rendered prompt is re-measured after every trim
+        while estimated > max_input_tokens:
+            section = next(
+                (
+                    s
+                    for s in sorted(sections, key=lambda s: s.priority)
+                    if occurrences.get(s.name) and kept[s.name] > floors[s.name]
+                ),
+                None,
+            )
+            if section is None:
+                logger.warning(
+                    f"Prompt exceeds token budget by {estimated - max_input_tokens} tokens "
+                    f"after trimming (budget: {max_input_tokens})"
+                )
+                break
+
+            overflow = math.ceil((estimated - max_input_tokens) / occurrences[section.name])
+            if section.name not in trimmed:
+                overflow += marker_tokens
+                trimmed.append(section.name)
+
+            keep = min(
+                kept[section.name] - 1, max(floors[section.name], kept[section.name] - overflow)
+            )
+            kept[section.name] = keep
+            texts[section.name] = (
+                self.counter.truncate(section.text, keep) + TRUNCATION_MARKER if keep > 0 else ""
+            )
+
+            text = template.format(**texts)
+            estimated = self.counter.count(text)
+
+        if trimmed:
+            logger.info(f"Trimmed prompt sections {trimmed} to fit {max_input_tokens} tokens")
+
+        return BudgetedPrompt(
+            text=text,
+            estimated_input_tokens=estimated,
+            max_input_tokens=max_input_tokens,
+            section_tokens={name: self.counter.count(value) for name, value in texts.items()},
+            trimmed_sections=trimmed,
+        )
+
+
+# ============================================================================
+# Singleton instance
+# ============================================================================
+
+_token_counter: Optional[TokenCounter] = None
+
+
+def get_token_counter() -> TokenCounter:
+    """
+    Get singleton token counter instance.
+
+    Returns:
+        TokenCounter instance
+    """
+    global _token_counter
+    if _token_counter is None:
+        _token_counter = TokenCounter()
+    return _token_counter
+
+
+def fit_prompt(
+    template: str,
+    max_input_tokens: int,
+    priorities: Optional[Dict[str, int]] = None,
+    **sections: str,
+) -> BudgetedPrompt:
+    """
+    Render a prompt template within a token budget.
+
+    Args:
+        template: Prompt template with ``str.format`` placeholders
+        max_input_tokens: Token budget for the whole prompt
+        priorities: Optional priority per section (lower is trimmed first)
+        **sections: Text for each placeholder
+
+    Returns:
+        BudgetedPrompt with the rendered text and token estimates
+    """
+    priorities = priorities or {}
+    return PromptBudget().fit(
+        template,
+        [
+            PromptSection(name=name, text=text, priority=priorities.get(name, 0))
+            for name, text in sections.items()
+        ],
+        max_input_tokens,
+    )
@@ -0,0 +1,522 @@
+"""
+Prompt Template Registry
+IBM Dev Day AI Demystified Hackathon 2026
+Team: AI Kings 👑
+
+Central registry of the watsonx.ai prompts used by the agents. Templates are
+compiled once, versioned and token-estimated. Each one is split into a static
+instruction prefix and a dynamic body, so that every prompt built from the
+same template starts with identical text (friendly to server-side prefix
+caching). Token usage and latency are tracked per template version from real
+traffic.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from string import Formatter
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from backend.prompt_budget import PromptBudget, PromptSection, TokenCounter, get_token_counter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """
+    Versioned prompt template.
+
+    The prefix holds static instructions and is used verbatim (braces in it
+    are literal); the body holds the dynamic content as ``str.format``
+    placeholders.
+    """
+
+    name: str
+    version: str
+    prefix: str
+    body: str
+    call_site: str
+    max_output_tokens: int = 200
+    temperature: float = 0.1
+    max_input_tokens: Optional[int] = None  # None renders without trimming
+    priorities: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def template_id(self) -> str:
+        """Unique ID of this template version."""
+        return f"{self.name}@{self.version}"
+
+
+@dataclass
+class CompiledTemplate:
+    """Template validated and token-estimated at registration."""
+
+    template: PromptTemplate
+    format_string: str  # Prefix (braces escaped) followed by the body
+    fields: Tuple[str, ...]
+    prefix_tokens: int
+    fixed_tokens: int  # Tokens of the template with empty fields
+    fingerprint: str  # Hash of the template text
+
+    @property
+    def template_id(self) -> str:
+        return self.template.template_id
+
+
+@dataclass
+class RenderedPrompt:
+    """Prompt rendered from a template."""
+
+    template_id: str
+    text: str
+    estimated_input_tokens: int
+    prefix_tokens: int
+    trimmed_sections: List[str]
+
+
+class _TemplateStats:
+    """Traffic of one template version. Guarded by the registry lock."""
+
+    def __init__(self):
+        self.renders = 0
+        self.trimmed = 0
+        self.estimated_input_tokens = 0
+        self.requests = 0
+        self.errors = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.latency_seconds = 0.0
+
+
+class PromptRegistry:
+    """Registry of compiled prompt templates with per-template traffic stats."""
+
+    def __init__(self, counter: Optional[TokenCounter] = None):
+        """
+        Initialize prompt registry.
+
+        Args:
+            counter: Token counter (defaults to the shared offline counter)
+        """
+        self.counter = counter or get_token_counter()
+        self.budget = PromptBudget(self.counter)
+        self._templates: Dict[str, CompiledTemplate] = {}
+        self._latest: Dict[str, str] = {}
+        self._stats: Dict[str, _TemplateStats] = {}
+        self._lock = threading.Lock()
+
+    def register(self, template: PromptTemplate) -> CompiledTemplate:
+        """
+        Compile and register a template version.
+
+        The most recently registered version of a name is the one used by default.
+
+        Args:
+            template: Template to register
+
+        Returns:
+            Compiled template
+
+        Raises:
+            ValueError: If the version is already registered
+        """
+        format_string = template.prefix.replace("{", "{{").replace("}", "}}") + template.body
+        fields = tuple(
+            dict.fromkeys(
+                field_name for _, field_name, _, _ in Formatter().parse(template.body) if field_name
+            )
+        )
+
+        compiled = CompiledTemplate(
+            template=template,
+            format_string=format_string,
+            fields=fields,
+            prefix_tokens=self.counter.count(template.prefix),
+            fixed_tokens=self.counter.count(format_string.format(**{name: "" for name in fields})),
+            fingerprint=hashlib.sha256(format_string.encode("utf-8")).hexdigest()[:12],
+        )
+
+        with self._lock:
+            if template.template_id in self._templates:
+                raise ValueError(f"Template {template.template_id} already registered")
+            self._templates[template.template_id] = compiled
+            self._latest[template.name] = template.template_id
+            self._stats[template.template_id] = _TemplateStats()
+
+        return compiled
+
+    def get(self, name: str, version: Optional[str] = None) -> CompiledTemplate:
+        """
+        Get a compiled template.
+
+        Args:
+            name: Template name
+            version: Template version (defaults to the latest registered)
+
+        Returns:
+            Compiled template
+
+        Raises:
+            KeyError: If the template is not registered
+        """
+        template_id = f"{name}@{version}" if version else self._latest.get(name)
+        if template_id not in self._templates:
+            raise KeyError(f"Prompt template not registered: {template_id or name}")
+        return self._templates[template_id]
+
+    def render(self, name: str, version: Optional[str] = None, **values: Any) -> RenderedPrompt:
+        """
+        Render a template, fitting it to its input token budget.
+
+        Args:
+            name: Template name
+            version: Template version (defaults to the latest registered)
+            **values: Value for each template field
+
+        Returns:
+            Rendered prompt
+        """
+        compiled = self.get(name, version)
+        template = compiled.template
+        texts = {name: str(values.get(name, "")) for name in compiled.fields}
+
+        if template.max_input_tokens is None:
+            text = compiled.format_string.format(**texts)
+            estimated = self.counter.count(text)
+            trimmed: List[str] = []
+        else:
+            budgeted = self.budget.fit(
+                compiled.format_string,
+                [
+                    PromptSection(name, value, priority=template.priorities.get(name, 0))
+                    for name, value in texts.items()
+                ],
+                template.max_input_tokens,
+            )
+            text = budgeted.text
+            estimated = budgeted.estimated_input_tokens
+            trimmed = budgeted.trimmed_sections
+
+        with self._lock:
+            stats = self._stats[compiled.template_id]
+            stats.renders += 1
+            stats.estimated_input_tokens += estimated
+            if trimmed:
+                stats.trimmed += 1
+
+        return RenderedPrompt(
+            template_id=compiled.template_id,
+            text=text,
+            estimated_input_tokens=estimated,
+            prefix_tokens=compiled.prefix_tokens,
+            trimmed_sections=trimmed,
+        )
+
+    def record_call(
+        self,
+        template_id: str,
+        latency: float,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        error: bool = False,
+    ):
+        """
+        Record a watsonx.ai call made with a rendered template.
+
+        Args:
+            template_id: Template version used
+            latency: Call latency in seconds
+            input_tokens: Input tokens reported by watsonx.ai
+            output_tokens: Output tokens generated
+            error: Whether the call failed
+        """
+        with self._lock:
+            stats = self._stats[template_id]
+            stats.requests += 1
+            stats.latency_seconds += latency
+            if error:
+                stats.errors += 1
+            else:
+                stats.input_tokens += input_tokens
+                stats.output_tokens += output_tokens
+
+    def generate(
+        self,
+        client: Any,
+        name: str,
+        version: Optional[str] = None,
+        **values: Any,
+    ) -> Dict[str, Any]:
+        """
+        Render a template and generate with it, recording the call.
+
+        Args:
+            client: WatsonxClient instance
+            name: Template name
+            version: Template version (defaults to the latest registered)
+            **values: Value for each template field
+
+        Returns:
+            Generation result dict, with the 'template_id' used
+        """
+        prompt, options = self._prepare_call(name, version, values)
+
+        start = time.monotonic()
+        try:
+            result = client.generate(prompt=prompt.text, **options)
+        except Exception:
+            self.record_call(prompt.template_id, time.monotonic() - start, error=True)
+            raise
+        return self._finish_call(prompt, start, result)
+
+    async def agenerate(
+        self,
+        client: Any,
+        name: str,
+        version: Optional[str] = None,
+        **values: Any,
+    ) -> Dict[str, Any]:
+        """
+        Render a template and generate with it off the event loop, recording the call.
+
+        Args:
+            client: WatsonxClient instance
+            name: Template name
+            version: Template version (defaults to the latest registered)
+            **values: Value for each template field
+
+        Returns:
+            Generation result dict, with the 'template_id' used
+        """
+        prompt, options = self._prepare_call(name, version, values)
+
+        start = time.monotonic()
+        try:
+            result = await client.agenerate(prompt=prompt.text, **options)
+        except Exception:
+            self.record_call(prompt.template_id, time.monotonic() - start, error=True)
+            raise
+        return self._finish_call(prompt, start, result)
+
+    def _prepare_call(
+        self, name: str, version: Optional[str], values: Dict[str, Any]
+    ) -> Tuple[RenderedPrompt, Dict[str, Any]]:
+        """Render a template and get its generation options."""
+        prompt = self.render(name, version, **values)
+        template = self.get(name, version).template
+        return prompt, {
+            "max_tokens": template.max_output_tokens,
+            "temperature": template.temperature,
+            "call_site": template.call_site,
+        }
+
+    def _finish_call(
+        self, prompt: RenderedPrompt, start: float, result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Record a successful call and tag its result with the template used."""
+        self.record_call(
+            prompt.template_id,
+            time.monotonic() - start,
+            input_tokens=result.get("input_tokens", 0),
+            output_tokens=result.get("output_tokens", 0),
+        )
+        return {**result, "template_id": prompt.template_id}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get compile-time estimates and traffic per template version.
+
+        Returns:
+            Dict keyed by template ID
+        """
+        report = {}
+        with self._lock:
+            for template_id, compiled in sorted(self._templates.items()):
+                stats = self._stats[template_id]
+                successes = stats.requests - stats.errors
+                report[template_id] = {
+                    "call_site": compiled.template.call_site,
+                    "fingerprint": compiled.fingerprint,
+                    "prefix_tokens": compiled.prefix_tokens,
+                    "fixed_tokens": compiled.fixed_tokens,
+                    "max_input_tokens": compiled.template.max_input_tokens,
+                    "renders": stats.renders,
+                    "trimmed_renders": stats.trimmed,
+                    "avg_estimated_input_tokens": (
+                        round(stats.estimated_input_tokens / stats.renders, 1)
+                        if stats.renders
+                        else 0.0
+                    ),
+                    "requests": stats.requests,
+                    "errors": stats.errors,
+                    "input_tokens": stats.input_tokens,
+                    "output_tokens": stats.output_tokens,
+                    "avg_input_tokens": (
+                        round(stats.input_tokens / successes, 1) if successes else 0.0
+                    ),
+                    "avg_output_tokens": (
+                        round(stats.output_tokens / successes, 1) if successes else 0.0
+                    ),
+                    "avg_latency_ms": (
+                        round(stats.latency_seconds / stats.requests * 1000, 2)
+                        if stats.requests
+                        else 0.0
+                    ),
+                }
+        return report
+
+
+# ============================================================================
+# Templates
+# ============================================================================
+
+REGULATION_EXTRACTION = PromptTemplate(
+    name="fusion.regulation_extraction",
+    version="v1",
+    call_site="fusion.external",
+    max_output_tokens=500,
+    max_input_tokens=int(os.getenv("FUSION_REGULATION_TOKEN_BUDGET", "1024")),
+    priorities={"contract_type": 10},
+    prefix="""Analyze a regulatory document and identify the sections relevant to a contract type.
+
+Extract the most relevant regulatory requirements (max 3 sections). For each section, provide:
+1. Section reference
+2. Requirement text
+3. Relevance explanation
+
+Format as JSON array.
+
+""",
+    body="""Contract Type: {contract_type}
+
+Regulatory Document: {regulation}""",
+)
+
+GOLDEN_CLAUSE_ALIGNMENT = PromptTemplate(
+    name="fusion.golden_clause_alignment",
+    version="v1",
+    call_site="fusion.internal",
+    max_output_tokens=200,
+    max_input_tokens=int(os.getenv("FUSION_SIGNAL_TOKEN_BUDGET", "768")),
+    priorities={"clause_type": 10, "clause_text": 5},
+    prefix="""Compare a Golden Clause with the contract text and determine alignment.
+
+Determine:
+1. Alignment: MATCH, CONFLICT, PARTIAL, or UNKNOWN
+2. Confidence score (0.0-1.0)
+3. Brief explanation
+
+Format as JSON: {"alignment": "...", "confidence": 0.0, "explanation": "..."}
+
+""",
+    body="""Golden Clause ({clause_type}):
+{clause_text}
+
+Contract Text (excerpt):
+{contract_text}""",
+)
+
+REGULATORY_ALIGNMENT = PromptTemplate(
+    name="fusion.regulatory_alignment",
+    version="v1",
+    call_site="fusion.external",
+    max_output_tokens=200,
+    max_input_tokens=int(os.getenv("FUSION_SIGNAL_TOKEN_BUDGET", "768")),
+    priorities={"requirement": 5},
+    prefix="""Analyze if the contract complies with the regulatory requirement.
+
+Determine:
+1. Alignment: MATCH, CONFLICT, PARTIAL, or UNKNOWN
+2. Confidence score (0.0-1.0)
+3. Specific requirement text
+
+Format as JSON: {"alignment": "...", "confidence": 0.0, "requirement": "..."}
+
+""",
+    body="""Regulatory Requirement:
+{requirement}
+
+Contract Text (excerpt):
+{contract_text}""",
+)
+
+GAP_RECOMMENDATION = PromptTemplate(
+    name="fusion.gap_recommendation",
+    version="v1",
+    call_site="fusion.gaps",
+    max_output_tokens=150,
+    prefix="""Generate a specific recommendation to resolve a compliance conflict.
+
+Provide:
+1. Specific clause to modify
+2. Recommended action
+3. Regulatory basis
+
+Keep response concise (max 100 words).
+
+""",
+    body="""Conflict: {source} conflicts with contract
+Confidence: {confidence}""",
+)
+
+ROUTING_JUSTIFICATION = PromptTemplate(
+    name="routing.justification",
+    version="v1",
+    call_site="routing.justification",
+    max_output_tokens=150,
+    prefix="""Generate a concise justification for a contract routing decision.
+
+Provide a 2-3 sentence justification explaining:
+1. Why this complexity level was assigned
+2. Key risk factors
+3. Why this workflow path is appropriate
+
+Keep response professional and concise.
+
+""",
+    body="""Contract Type: {contract_type}
+Jurisdiction: {jurisdiction}
+Compliance Gaps: {gap_count}
+Overall Confidence: {confidence}
+Risk Score: {risk_score}
+Complexity: {complexity}
+Workflow Path: {workflow_path}""",
+)
+
+DEFAULT_TEMPLATES = (
+    REGULATION_EXTRACTION,
+    GOLDEN_CLAUSE_ALIGNMENT,
+    REGULATORY_ALIGNMENT,
+    GAP_RECOMMENDATION,
+    ROUTING_JUSTIFICATION,
+)
+
+
+# ============================================================================
+# Singleton instance
+# ============================================================================
+
+_prompt_registry: Optional[PromptRegistry] = None
+_prompt_registry_lock = threading.Lock()
+
+
+def get_prompt_registry() -> PromptRegistry:
+    """
+    Get singleton prompt registry with the default templates registered.
+
+    Returns:
+        PromptRegistry instance
+    """
+    global _prompt_registry
+    if _prompt_registry is None:
+        with _prompt_registry_lock:
+            if _prompt_registry is None:
+                registry = PromptRegistry()
+                for template in DEFAULT_TEMPLATES:
+                    registry.register(template)
+                _prompt_registry = registry
+    return _prompt_registry
@@ -0,0 +1,398 @@
+"""
+Cloudant Query Coalescer
+IBM Dev Day AI Demystified Hackathon 2026
+Team: AI Kings 👑
+
+DataLoader-style batching of concurrent Cloudant lookups. Golden Clause and
+precedent queries issued within the same short window are collected, identical
+ones are deduplicated, and compatible ones are merged into a single Mango
+query using $in over contract types and jurisdictions. Results are split back
+to each caller, so under load the number of Cloudant queries grows with the
+number of distinct query shapes rather than with the number of requests.
+"""
+
+import asyncio
+import os
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+import logging
+
+from backend.async_cloudant_client import AsyncCloudantClient
+from backend.cloudant_client import (
+    coalesced_golden_clause_selector,
+    coalesced_precedent_selector,
+    parse_document,
+    project,
+)
+from backend.models import GoldenClause, HistoricalDecision
+
+logger = logging.getLogger(__name__)
+
+GOLDEN_CLAUSES = "golden_clauses"
+PRECEDENTS = "precedents"
+
+# Fields the coalescer needs in merged results to route documents to callers
+ROUTING_FIELDS = {
+    GOLDEN_CLAUSES: ("_id", "contract_types", "jurisdiction"),
+    PRECEDENTS: ("_id", "contract_type", "jurisdiction", "confidence"),
+}
+
+
+@dataclass(frozen=True)
+class CoalescedQuery:
+    """One distinct lookup of a batch."""
+
+    contract_type: str
+    jurisdiction: Optional[str]
+    limit: int
+    min_confidence: float = 0.0
+
+    def matches(self, kind: str, doc: Dict[str, Any]) -> bool:
+        """Whether a document of a merged query answers this lookup."""
+        if self.jurisdiction and doc.get("jurisdiction") != self.jurisdiction:
+            return False
+        if kind == GOLDEN_CLAUSES:
+            return self.contract_type in (doc.get("contract_types") or [])
+        return (
+            doc.get("contract_type") == self.contract_type
+            and (doc.get("confidence") or 0.0) >= self.min_confidence
+        )
+
+
+@dataclass
+class _Batch:
+    """Lookups of one kind and partition collected during the batching window."""
+
+    kind: str
+    partition: Optional[str]
+    fields: Optional[Tuple[str, ...]]
+    mandatory_only: bool
+    waiters: Dict[CoalescedQuery, asyncio.Future] = field(default_factory=dict)
+
+
+class CloudantQueryCoalescer:
+    """
+    Batches concurrent query_golden_clauses and get_precedents calls of an
+    async Cloudant client.
+
+    Lookups are grouped by kind, partition, projection and (for Golden
+    Clauses) the mandatory filter. A group with one distinct lookup is sent
+    as is; a larger group becomes one query over the union of its contract
+    types and jurisdictions, read page by page (precedents in confidence
+    order) until every lookup has its limit or the results run out, so each
+    caller gets the same documents its own query would have returned. The
+    merged read stops after as many documents as the lookups' limits add up
+    to; lookups still short of their limit then are sent on their own, so a
+    rare lookup never turns a batch into a scan of the others' documents.
+    """
+
+    def __init__(
+        self,
+        client: AsyncCloudantClient,
+        window_ms: Optional[float] = None,
+    ):
+        """
+        Initialize query coalescer.
+
+        Args:
+            client: Async Cloudant client sending the queries
+            window_ms: Milliseconds lookups are collected before a batch is sent;
+                0 batches the lookups of one event loop iteration
+                (defaults to CLOUDANT_COALESCE_WINDOW_MS env var or 2)
+        """
+        self.client = client
+        self.window_ms = (
+            window_ms
+            if window_ms is not None
+            else float(os.getenv("CLOUDANT_COALESCE_WINDOW_MS", "2"))
+        )
+
+        self._batches: Dict[Tuple[Any, ...], _Batch] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+        # Statistics
+        self.lookups = 0
+        self.deduplicated = 0
+        self.queries = 0
+        self.merged_queries = 0
+        self.split_lookups = 0
+
+    async def query_golden_clauses(
+        self,
+        contract_type: str,
+        jurisdiction: Optional[str] = None,
+        mandatory_only: bool = False,
+        limit: int = 100,
+        fields: Optional[List[str]] = None,
+    ) -> List[Union[GoldenClause, Dict[str, Any]]]:
+        """
+        Query Golden Clauses by contract type, batched with concurrent lookups.
+
+        Args:
+            contract_type: Contract type to filter by
+            jurisdiction: Optional jurisdiction filter
+            mandatory_only: If True, return only mandatory clauses
+            limit: Maximum number of results
+            fields: Optional projection (e.g. GOLDEN_CLAUSE_SUMMARY_FIELDS)
+
+        Returns:
+            List of GoldenClause objects, or the projected documents when fields is given
+        """
+        if self.client.has_replica(self.client.db_golden_clauses):
+            # Local reads cost no Cloudant query, so there is nothing to batch
+            return await self.client.query_golden_clauses(
+                contract_type, jurisdiction, mandatory_only, limit, fields
+            )
+        query = CoalescedQuery(contract_type, jurisdiction, limit)
+        return await self._load(GOLDEN_CLAUSES, query, fields, mandatory_only)
+
+    async def get_precedents(
+        self,
+        contract_type: str,
+        jurisdiction: Optional[str] = None,
+        min_confidence: float = 0.0,
+        limit: int = 10,
+        fields: Optional[List[str]] = None,
+    ) -> List[Union[HistoricalDecision, Dict[str, Any]]]:
+        """
+        Get historical precedents for a contract type, batched with concurrent lookups.
+
+        Args:
+            contract_type: Contract type to filter by
+            jurisdiction: Optional jurisdiction filter
+            min_confidence: Minimum confidence score
+            limit: Maximum number of results
+            fields: Optional projection (e.g. PRECEDENT_SCORING_FIELDS)
+
+        Returns:
+            List of HistoricalDecision objects sorted by confidence (descending),
+            or the projected documents when fields is given
+        """
+        if self.client.has_replica(self.client.db_historical_decisions):
+            return await self.client.get_precedents(
+                contract_type, jurisdiction, min_confidence, limit, fields
+            )
+        query = CoalescedQuery(contract_type, jurisdiction, limit, min_confidence)
+        return await self._load(PRECEDENTS, query, fields)
+
+    async def _load(
+        self,
+        kind: str,
+        query: CoalescedQuery,
+        fields: Optional[List[str]],
+        mandatory_only: bool = False,
+    ) -> List[Any]:
+        """Add a lookup to the current batch of its group and wait for its results."""
+        partition = self.client.partitioning.key_for(query.contract_type, query.jurisdiction)
+        fields_key = tuple(fields) if fields else None
+        key = (kind, partition, fields_key, mandatory_only)
+        self.lookups += 1
+
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = _Batch(kind, partition, fields_key, mandatory_only)
+            loop = asyncio.get_running_loop()
+            if self.window_ms > 0:
+                loop.call_later(self.window_ms / 1000, self._dispatch, key)
+            else:
+                loop.call_soon(self._dispatch, key)
+
+        waiter = batch.waiters.get(query)
+        if waiter is None:
+            waiter = batch.waiters[query] = asyncio.get_running_loop().create_future()
+        else:
+            self.deduplicated += 1
+
+        # Callers share the results of identical lookups
+        return list(await asyncio.shield(waiter))
+
+    def _dispatch(self, key: Tuple[Any, ...]):
+        """Close a batch and send it."""
+        batch = self._batches.pop(key, None)
+        if batch is None:
+            return
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: _Batch):
+        """Send a batch and resolve the futures of its lookups."""
+        try:
+            if len(batch.waiters) == 1:
+                results = {query: await self._send_one(batch, query) for query in batch.waiters}
+            else:
+                results = await self._send_merged(batch)
+        except Exception as e:
+            for waiter in batch.waiters.values():
+                if not waiter.done():
+                    waiter.set_exception(e)
+            return
+
+        for query, waiter in batch.waiters.items():
+            if not waiter.done():
+                waiter.set_result(results[query])
+
+    async def _send_one(self, batch: _Batch, query: CoalescedQuery) -> List[Any]:
+        """Send a lookup alone, with the client's own query."""
+        self.queries += 1
+        fields = list(batch.fields) if batch.fields else None
+        if batch.kind == GOLDEN_CLAUSES:
+            return await self.client.query_golden_clauses(
+                query.contract_type,
+                query.jurisdiction,
+                batch.mandatory_only,
+                query.limit,
+                fields,
+            )
+        return await self.client.get_precedents(
+            query.contract_type, query.jurisdiction, query.min_confidence, query.limit, fields
+        )
+
+    async def _send_merged(self, batch: _Batch) -> Dict[CoalescedQuery, List[Any]]:
+        """Send the lookups of a batch as one query and split its results."""
+        queries = list(batch.waiters)
+        contract_types = {query.contract_type for query in queries}
+        # Any lookup without a jurisdiction needs every jurisdiction
+        jurisdictions = (
+            {query.jurisdiction for query in queries}
+            if all(query.jurisdiction for query in queries)
+            else None
+        )
+
+        if batch.kind == GOLDEN_CLAUSES:
+            db_name = self.client.db_golden_clauses
+            selector = coalesced_golden_clause_selector(
+                contract_types, jurisdictions, batch.mandatory_only
+            )
+            sort = None
+            model: Callable[..., Any] = GoldenClause
+        else:
+            db_name = self.client.db_historical_decisions
+            selector = coalesced_precedent_selector(
+                contract_types,
+                jurisdictions,
+                min(query.min_confidence for query in queries),
+            )
+            sort = [{"confidence": "desc"}]
+            model = HistoricalDecision
+
+        fields = None
+        if batch.fields:
+            fields = list(dict.fromkeys(batch.fields + ROUTING_FIELDS[batch.kind]))
+
+        self.queries += 1
+        self.merged_queries += 1
+        scan_limit = sum(query.limit for query in queries)
+        docs: Dict[CoalescedQuery, List[Dict[str, Any]]] = {query: [] for query in queries}
+        pending = {query for query in queries if query.limit > 0}
+        scanned = 0
+
+        if pending:
+            async for doc in self.client.aiter_find(
+                db_name,
+                selector,
+                sort=sort,
+                fields=fields,
+                partition=batch.partition,
+                limit=scan_limit,
+            ):
+                scanned += 1
+                for query in [query for query in pending if query.matches(batch.kind, doc)]:
+                    docs[query].append(doc)
+                    if len(docs[query]) >= query.limit:
+                        pending.discard(query)
+                if not pending:
+                    break
+
+        # Lookups the bounded read left short are sent on their own
+        unsatisfied = (
+            [query for query in queries if query in pending] if scanned >= scan_limit else []
+        )
+        self.split_lookups += len(unsatisfied)
+
+        logger.info(
+            f"Coalesced {len(queries)} {batch.kind} lookups into one query "
+            f"({len(contract_types)} contract types, {len(unsatisfied)} sent on their own)"
+        )
+
+        results: Dict[CoalescedQuery, List[Any]] = dict(
+            zip(
+                unsatisfied,
+                await asyncio.gather(*(self._send_one(batch, query) for query in unsatisfied)),
+            )
+        )
+
+        if batch.fields:
+            requested = list(batch.fields)
+            for query in queries:
+                if query not in results:
+                    results[query] = [project(doc, requested) for doc in docs[query]]
+            return results
+
+        parsed: Dict[str, Any] = {}
+        for query in queries:
+            if query in results:
+                continue
+            objects = []
+            for doc in docs[query]:
+                if doc["_id"] not in parsed:
+                    parsed[doc["_id"]] = parse_document(doc, model)
+                if parsed[doc["_id"]] is not None:
+                    objects.append(parsed[doc["_id"]])
+            results[query] = objects
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            Dict with lookups received and Cloudant queries sent
+        """
+        return {
+            "enabled": True,
+            "window_ms": self.window_ms,
+            "lookups": self.lookups,
+            "deduplicated": self.deduplicated,
+            "queries": self.queries,
+            "merged_queries": self.merged_queries,
+            "split_lookups": self.split_lookups,
+        }
+
+
+# ============================================================================
+# One coalescer per client
+# ============================================================================
+
+_coalescers: "weakref.WeakKeyDictionary[AsyncCloudantClient, CloudantQueryCoalescer]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_query_coalescer(client: AsyncCloudantClient) -> Optional[CloudantQueryCoalescer]:
+    """
+    Get the query coalescer of an async Cloudant client.
+
+    Args:
+        client: Async Cloudant client
+
+    Returns:
+        CloudantQueryCoalescer instance, or None when CLOUDANT_COALESCE_ENABLED is false
+    """
+    if os.getenv("CLOUDANT_COALESCE_ENABLED", "true").lower() != "true":
+        return None
+    coalescer = _coalescers.get(client)
+    if coalescer is None:
+        coalescer = _coalescers[client] = CloudantQueryCoalescer(client)
+    return coalescer
+
+
+def get_query_coalescer_stats() -> List[Dict[str, Any]]:
+    """
+    Get the statistics of every client's coalescer.
+
+    Returns:
+        One dict per coalescer
+    """
+    return [coalescer.get_stats() for coalescer in list(_coalescers.values())]
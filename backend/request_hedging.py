@@ -0,0 +1,246 @@
+"""
+Request Hedging
+IBM Dev Day AI Demystified Hackathon 2026
+Team: AI Kings 👑
+
+Hedged requests for cutting tail latency: when a call is slower than a
+percentile of recent latencies, a duplicate is sent and the first to finish wins.
+"""
+
+import contextvars
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyTracker:
+    """Sliding window of recent call latencies."""
+
+    def __init__(self, window_size: int = 500):
+        """
+        Initialize latency tracker.
+
+        Args:
+            window_size: Number of recent latencies to keep
+        """
+        self._latencies: deque = deque(maxlen=window_size)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float):
+        """Record a latency in seconds."""
+        with self._lock:
+            self._latencies.append(latency)
+
+    def __len__(self) -> int:
+        return len(self._latencies)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """
+        Get a percentile of recent latencies.
+
+        Args:
+            percentile: Percentile between 0 and 100
+
+        Returns:
+            Latency in seconds, or None when no latencies were recorded
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+
+        if not latencies:
+            return None
+
+        index = min(len(latencies) - 1, max(0, math.ceil(percentile / 100 * len(latencies)) - 1))
+        return latencies[index]
+
+
+class HedgeBudget:
+    """
+    Token bucket capping hedges to a fraction of requests.
+
+    Every request earns ``ratio`` tokens (up to ``burst``); every hedge spends
+    one, so hedges never exceed roughly ``ratio`` of traffic.
+    """
+
+    def __init__(self, ratio: float, burst: float = 10.0):
+        """
+        Initialize hedge budget.
+
+        Args:
+            ratio: Maximum fraction of requests that may be hedged
+            burst: Maximum number of hedges that can accumulate
+        """
+        self.ratio = ratio
+        self.burst = burst
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+
+    def earn(self):
+        """Credit the budget for one request."""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """
+        Spend one hedge from the budget.
+
+        Returns:
+            True if a hedge may be sent
+        """
+        with self._lock:
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
+
+
+class RequestHedger:
+    """
+    Run calls with hedging against slow responses.
+
+    A call that has not finished after the configured percentile of recent
+    latency gets a duplicate, provided the hedge budget allows it. Whichever
+    attempt finishes first successfully wins; the other is cancelled if it has
+    not started yet and otherwise its result is discarded.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        budget_ratio: float = 0.05,
+        min_samples: int = 20,
+        max_workers: int = 32,
+    ):
+        """
+        Initialize request hedger.
+
+        Args:
+            percentile: Latency percentile after which a hedge is sent
+            budget_ratio: Maximum fraction of requests that may be hedged
+            min_samples: Latencies required before hedging starts
+            max_workers: Maximum concurrent attempts
+        """
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.latencies = LatencyTracker()
+        self.budget = HedgeBudget(budget_ratio)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="watsonx-hedge"
+        )
+
+        # Hedging statistics
+        self._stats_lock = threading.Lock()
+        self.total_requests = 0
+        self.total_hedges = 0
+        self.hedge_wins = 0
+
+    def hedge_delay(self) -> Optional[float]:
+        """
+        Get the current delay before a hedge is sent.
+
+        Returns:
+            Delay in seconds, or None while too few latencies are known
+        """
+        if len(self.latencies) < self.min_samples:
+            return None
+        return self.latencies.percentile(self.percentile)
+
+    def _submit(self, operation: Callable[[], Any]) -> Future:
+        """Submit an attempt, carrying the caller's context into the worker."""
+        context = contextvars.copy_context()
+        return self._executor.submit(context.run, operation)
+
+    def run(
+        self, operation: Callable[[], Any], on_hedge: Optional[Callable[[], None]] = None
+    ) -> Any:
+        """
+        Run operation with hedging.
+
+        Args:
+            operation: Function performing one attempt
+            on_hedge: Called when a duplicate attempt is sent (e.g. to charge its cost)
+
+        Returns:
+            Result of the first successful attempt
+
+        Raises:
+            Exception: If every attempt fails
+        """
+        with self._stats_lock:
+            self.total_requests += 1
+        self.budget.earn()
+
+        start = time.monotonic()
+        delay = self.hedge_delay()
+
+        if delay is None:
+            result = operation()
+            self.latencies.record(time.monotonic() - start)
+            return result
+
+        primary = self._submit(operation)
+        done, _ = wait([primary], timeout=delay)
+
+        if done or not self.budget.try_spend():
+            result = primary.result()
+            self.latencies.record(time.monotonic() - start)
+            return result
+
+        if on_hedge is not None:
+            on_hedge()
+        hedge = self._submit(operation)
+        with self._stats_lock:
+            self.total_hedges += 1
+        logger.info(f"Hedging slow watsonx.ai request after {delay * 1000:.0f}ms")
+
+        pending = {primary, hedge}
+        last_exception: Optional[BaseException] = None
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for winner in done:
+                if winner.exception() is not None:
+                    last_exception = winner.exception()
+                    continue
+
+                for loser in pending:
+                    loser.cancel()
+
+                if winner is hedge:
+                    with self._stats_lock:
+                        self.hedge_wins += 1
+
+                self.latencies.record(time.monotonic() - start)
+                return winner.result()
+
+        raise last_exception
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hedging statistics.
+
+        Returns:
+            Dict with hedge rate, wins and the current hedge delay
+        """
+        with self._stats_lock:
+            requests = self.total_requests
+            hedges = self.total_hedges
+            wins = self.hedge_wins
+
+        delay = self.hedge_delay()
+        return {
+            "enabled": True,
+            "percentile": self.percentile,
+            "total_requests": requests,
+            "total_hedges": hedges,
+            "hedge_wins": wins,
+            "hedge_rate": round(hedges / requests, 4) if requests else 0.0,
+            "hedge_win_rate": round(wins / hedges, 4) if hedges else 0.0,
+            "hedge_delay_ms": round(delay * 1000, 2) if delay is not None else None,
+        }
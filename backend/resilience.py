@@ -0,0 +1,578 @@
+"""
+Resilience Primitives
+IBM Dev Day AI Demystified Hackathon 2026
+Team: AI Kings 👑
+
+Shared retry logic for the Cloudant, COS and watsonx.ai clients: typed
+classification of retryable errors, full-jitter exponential backoff (with
+sync and async sleeps), a circuit breaker per backend, and a retry budget per
+API request so that retries cannot multiply load during an outage.
+"""
+
+import asyncio
+import contextvars
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying: timeouts, rate limiting and server errors
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# S3 error codes that will not succeed on retry
+NON_RETRYABLE_S3_CODES = frozenset(
+    {"NoSuchKey", "NoSuchBucket", "InvalidArgument", "AccessDenied", "InvalidAccessKeyId"}
+)
+
+# Breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class NonRetryableError(Exception):
+    """Base class for errors that must never be retried."""
+
+
+class CircuitOpenError(NonRetryableError):
+    """Raised instead of calling a backend whose circuit breaker is open."""
+
+    def __init__(self, backend: str, retry_after: float):
+        self.backend = backend
+        self.retry_after = retry_after
+        super().__init__(f"Circuit breaker for {backend} is open, retry in {retry_after:.1f}s")
+
+
+# ============================================================================
+# Error classification
+# ============================================================================
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    """Extract the HTTP status of an SDK error, if it carries one."""
+    # ibm_cloud_sdk_core.ApiException
+    status = getattr(error, "status_code", None)
+    if isinstance(status, int):
+        return status
+
+    # ibm_watsonx_ai ApiRequestFailure and httpx.HTTPStatusError
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    if isinstance(status, int):
+        return status
+
+    # ibm_botocore ClientError
+    if isinstance(response, dict):
+        status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        if isinstance(status, int):
+            return status
+
+    return None
+
+
+def is_not_found(error: BaseException) -> bool:
+    """
+    Decide whether an error reports a missing resource (HTTP 404).
+
+    Args:
+        error: Exception raised by an operation
+
+    Returns:
+        True if the backend answered 404
+    """
+    return _status_code(error) == 404
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Decide whether an error is transient and worth retrying.
+
+    Errors carrying an HTTP status are retried only for timeouts, rate
+    limiting and server errors. Connection failures and timeouts are retried.
+    Programming errors (ValueError, TypeError, KeyError, ...) and errors
+    marked NonRetryableError are not. Other errors are assumed transient.
+
+    Args:
+        error: Exception raised by an operation
+
+    Returns:
+        True if the operation should be retried
+    """
+    if isinstance(error, NonRetryableError):
+        return False
+
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        error_code = response.get("Error", {}).get("Code", "")
+        if error_code in NON_RETRYABLE_S3_CODES:
+            return False
+
+    status = _status_code(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS_CODES
+
+    if isinstance(error, (ConnectionError, TimeoutError, asyncio.TimeoutError)):
+        return True
+
+    if isinstance(error, (ValueError, TypeError, KeyError, AttributeError, NotImplementedError)):
+        return False
+
+    return True
+
+
+def full_jitter_delay(
+    attempt: int,
+    base_delay: float,
+    max_delay: float,
+    rng: Optional[random.Random] = None,
+) -> float:
+    """
+    Compute a full-jitter backoff delay.
+
+    Args:
+        attempt: Zero-based attempt that just failed
+        base_delay: Delay ceiling of the first retry in seconds
+        max_delay: Cap of the delay ceiling in seconds
+        rng: Random source (for tests)
+
+    Returns:
+        Delay drawn uniformly from [0, min(max_delay, base_delay * 2**attempt)]
+    """
+    ceiling = min(max_delay, base_delay * (2**attempt))
+    return (rng or random).uniform(0, ceiling)
+
+
+# ============================================================================
+# Circuit breaker
+# ============================================================================
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one backend.
+
+    Opens after ``failure_threshold`` consecutive transient failures and
+    rejects calls for ``reset_timeout`` seconds. It then lets one trial call
+    through (half-open); success closes it, failure opens it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            name: Backend name
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds the breaker stays open before a trial call
+            clock: Time source (for tests)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+        # Breaker statistics
+        self.times_opened = 0
+        self.rejected_calls = 0
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open."""
+        with self._lock:
+            if self._state == OPEN and self.clock() - self._opened_at >= self.reset_timeout:
+                return HALF_OPEN
+            return self._state
+
+    def before_call(self):
+        """
+        Admit a call or reject it while the breaker is open.
+
+        Raises:
+            CircuitOpenError: If the backend is not accepting calls
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return
+
+            elapsed = self.clock() - self._opened_at
+            if self._state == OPEN and elapsed >= self.reset_timeout:
+                self._state = HALF_OPEN
+                self._trial_in_flight = False
+
+            if self._state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+
+            self.rejected_calls += 1
+            raise CircuitOpenError(self.name, max(0.0, self.reset_timeout - elapsed))
+
+    def record_success(self):
+        """Record a successful call, closing the breaker."""
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info(f"Circuit breaker for {self.name} closed")
+            self._state = CLOSED
+            self._consecutive_failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """Record a transient failure, opening the breaker at the threshold."""
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state == HALF_OPEN or (
+                self._state == CLOSED and self._consecutive_failures >= self.failure_threshold
+            ):
+                self._state = OPEN
+                self._opened_at = self.clock()
+                self._trial_in_flight = False
+                self.times_opened += 1
+                logger.warning(
+                    f"Circuit breaker for {self.name} opened after "
+                    f"{self._consecutive_failures} consecutive failures"
+                )
+
+    def record_ignored(self):
+        """Record a call that neither proves nor disproves backend health."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    @contextmanager
+    def guard(self, classify: Callable[[BaseException], bool] = is_retryable) -> Iterator[None]:
+        """
+        Admit one call and record its outcome.
+
+        Transient failures count against the backend; other errors and
+        cancellation neither prove nor disprove its health.
+
+        Args:
+            classify: Decides whether an error is transient
+
+        Raises:
+            CircuitOpenError: If the backend is not accepting calls
+        """
+        self.before_call()
+        try:
+            yield
+        except Exception as e:
+            if classify(e):
+                self.record_failure()
+            else:
+                self.record_ignored()
+            raise
+        except BaseException:
+            self.record_ignored()
+            raise
+        self.record_success()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get breaker state.
+
+        Returns:
+            Dict with state, consecutive failures and counts
+        """
+        state = self.state
+        with self._lock:
+            return {
+                "state": state,
+                "consecutive_failures": self._consecutive_failures,
+                "times_opened": self.times_opened,
+                "rejected_calls": self.rejected_calls,
+            }
+
+
+# ============================================================================
+# Retry budget
+# ============================================================================
+
+
+class RetryBudget:
+    """Number of retries one API request may spend across all backend calls."""
+
+    def __init__(self, max_retries: int):
+        """
+        Initialize retry budget.
+
+        Args:
+            max_retries: Retries allowed in total
+        """
+        self.max_retries = max_retries
+        self._lock = threading.Lock()
+        self.spent = 0
+
+    def try_spend(self) -> bool:
+        """
+        Spend one retry if any remain.
+
+        Returns:
+            True if the retry may proceed
+        """
+        with self._lock:
+            if self.spent >= self.max_retries:
+                return False
+            self.spent += 1
+            return True
+
+    @property
+    def remaining(self) -> int:
+        """Retries left."""
+        with self._lock:
+            return self.max_retries - self.spent
+
+
+_retry_budget: contextvars.ContextVar[Optional[RetryBudget]] = contextvars.ContextVar(
+    "retry_budget", default=None
+)
+
+
+def get_retry_budget() -> Optional[RetryBudget]:
+    """Get the retry budget of the current request, or None outside a request."""
+    return _retry_budget.get()
+
+
+@contextmanager
+def retry_budget(max_retries: Optional[int] = None) -> Iterator[RetryBudget]:
+    """
+    Install a retry budget for the calls made in this context.
+
+    Args:
+        max_retries: Retries allowed (defaults to RETRY_BUDGET_PER_REQUEST env var or 10)
+
+    Yields:
+        The installed budget
+    """
+    if max_retries is None:
+        max_retries = int(os.getenv("RETRY_BUDGET_PER_REQUEST", "10"))
+    budget = RetryBudget(max_retries)
+    token = _retry_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _retry_budget.reset(token)
+
+
+# ============================================================================
+# Retry policy
+# ============================================================================
+
+
+class RetryPolicy:
+    """
+    Retry an operation with full-jitter backoff behind a circuit breaker.
+
+    Each attempt must be admitted by the breaker, and each retry must be
+    paid for from the current request's retry budget, if there is one.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: Optional[float] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        classify: Callable[[BaseException], bool] = is_retryable,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Initialize retry policy.
+
+        Args:
+            name: Backend name used in logs
+            max_retries: Maximum number of attempts
+            base_delay: Delay ceiling of the first retry in seconds
+            max_delay: Cap of the delay ceiling (defaults to RETRY_MAX_DELAY_SECONDS or 30)
+            breaker: Circuit breaker guarding the backend
+            classify: Decides whether an error is retryable
+            rng: Random source for jitter (for tests)
+        """
+        self.name = name
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = (
+            max_delay
+            if max_delay is not None
+            else float(os.getenv("RETRY_MAX_DELAY_SECONDS", "30"))
+        )
+        self.breaker = breaker
+        self.classify = classify
+        self.rng = rng
+
+    def _on_failure(self, error: Exception, attempt: int) -> Optional[float]:
+        """
+        Account for a failed attempt and decide whether to retry.
+
+        Args:
+            error: Exception raised by the attempt
+            attempt: Zero-based attempt number
+
+        Returns:
+            Delay before the next attempt, or None to give up
+        """
+        retryable = self.classify(error)
+        if self.breaker is not None:
+            if retryable:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_ignored()
+
+        if not retryable:
+            logger.error(f"{self.name} operation failed with non-retryable error: {error}")
+            return None
+
+        if attempt >= self.max_retries - 1:
+            logger.error(f"{self.name} operation failed after {self.max_retries} attempts: {error}")
+            return None
+
+        budget = get_retry_budget()
+        if budget is not None and not budget.try_spend():
+            logger.error(f"{self.name} operation failed, request retry budget exhausted: {error}")
+            return None
+
+        delay = full_jitter_delay(attempt, self.base_delay, self.max_delay, self.rng)
+        logger.warning(
+            f"{self.name} operation failed (attempt {attempt + 1}/{self.max_retries}): {error}. "
+            f"Retrying in {delay:.2f}s..."
+        )
+        return delay
+
+    def _on_success(self):
+        if self.breaker is not None:
+            self.breaker.record_success()
+
+    def call(self, operation: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Execute a blocking operation, sleeping the calling thread between attempts.
+
+        Args:
+            operation: Function to execute
+            *args: Positional arguments for operation
+            **kwargs: Keyword arguments for operation
+
+        Returns:
+            Result of operation
+
+        Raises:
+            CircuitOpenError: If the breaker is open
+            Exception: The last error once retries are exhausted or not allowed
+        """
+        for attempt in range(self.max_retries):
+            if self.breaker is not None:
+                self.breaker.before_call()
+            try:
+                result = operation(*args, **kwargs)
+            except Exception as e:
+                delay = self._on_failure(e, attempt)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+            except BaseException:
+                # Cancellation says nothing about backend health, but must
+                # release a half-open trial or the breaker stays shut
+                if self.breaker is not None:
+                    self.breaker.record_ignored()
+                raise
+            else:
+                self._on_success()
+                return result
+
+        raise RuntimeError("max_retries must be at least 1")
+
+    async def acall(self, operation: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        Execute a coroutine function, awaiting between attempts.
+
+        Args:
+            operation: Coroutine function to execute
+            *args: Positional arguments for operation
+            **kwargs: Keyword arguments for operation
+
+        Returns:
+            Result of operation
+
+        Raises:
+            CircuitOpenError: If the breaker is open
+            Exception: The last error once retries are exhausted or not allowed
+        """
+        for attempt in range(self.max_retries):
+            if self.breaker is not None:
+                self.breaker.before_call()
+            try:
+                result = await operation(*args, **kwargs)
+            except Exception as e:
+                delay = self._on_failure(e, attempt)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+            except BaseException:
+                # Cancellation says nothing about backend health, but must
+                # release a half-open trial or the breaker stays shut
+                if self.breaker is not None:
+                    self.breaker.record_ignored()
+                raise
+            else:
+                self._on_success()
+                return result
+
+        raise RuntimeError("max_retries must be at least 1")
+
+
+# ============================================================================
+# Breaker registry
+# ============================================================================
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def create_circuit_breaker(name: str) -> CircuitBreaker:
+    """
+    Create the circuit breaker of a backend client and register it for health reporting.
+
+    Thresholds come from CIRCUIT_BREAKER_FAILURE_THRESHOLD (default 5) and
+    CIRCUIT_BREAKER_RESET_SECONDS (default 30). Clients are process-wide
+    singletons, so the most recently created breaker of a backend is reported.
+
+    Args:
+        name: Backend name (cloudant, cos or watsonx)
+
+    Returns:
+        CircuitBreaker instance
+    """
+    breaker = CircuitBreaker(
+        name,
+        failure_threshold=int(os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5")),
+        reset_timeout=float(os.getenv("CIRCUIT_BREAKER_RESET_SECONDS", "30")),
+    )
+    with _breakers_lock:
+        _breakers[name] = breaker
+    return breaker
+
+
+def get_circuit_breaker_states() -> Dict[str, Dict[str, Any]]:
+    """
+    Get the state of every backend circuit breaker.
+
+    Returns:
+        Dict of breaker stats by backend name
+    """
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {name: breaker.get_stats() for name, breaker in sorted(breakers.items())}
@@ -10,7 +10,6 @@ The Fusion Agent identifies compliance gaps and conflicts, generating
 clause-level recommendations with source attribution.
 """
 
-import os
 from typing import List
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
@@ -25,51 +24,16 @@ from backend.models import (
     FusionAnalysis,
     SignalAlignment,
 )
-from backend.cloudant_client import CloudantClient
-from backend.cos_client import COSClient
-from backend.watsonx_client import WatsonxClient
+from backend.async_cloudant_client import get_async_cloudant_client
+from backend.golden_clause_cache import get_golden_clause_cache
+from backend.query_coalescer import get_query_coalescer
+from backend.cos_client import get_cos_client
+from backend.watsonx_client import get_watsonx_client
+from backend.prompt_templates import get_prompt_registry
+from backend.tenant_scheduler import QuotaExceededError
 
 router = APIRouter()
 
-# Client instances (initialized lazily)
-_cloudant_client = None
-_cos_client = None
-_watsonx_client = None
-
-
-def get_cloudant_client() -> CloudantClient:
-    """Get or create Cloudant client instance."""
-    global _cloudant_client
-    if _cloudant_client is None:
-        _cloudant_client = CloudantClient(
-            url=os.getenv("CLOUDANT_URL"), api_key=os.getenv("CLOUDANT_API_KEY")
-        )
-    return _cloudant_client
-
-
-def get_cos_client() -> COSClient:
-    """Get or create COS client instance."""
-    global _cos_client
-    if _cos_client is None:
-        _cos_client = COSClient(
-            endpoint=os.getenv("COS_ENDPOINT"),
-            api_key=os.getenv("COS_API_KEY"),
-            instance_id=os.getenv("COS_INSTANCE_ID"),
-        )
-    return _cos_client
-
-
-def get_watsonx_client() -> WatsonxClient:
-    """Get or create Watsonx client instance."""
-    global _watsonx_client
-    if _watsonx_client is None:
-        _watsonx_client = WatsonxClient(
-            api_key=os.getenv("WATSONX_API_KEY"),
-            project_id=os.getenv("WATSONX_PROJECT_ID"),
-            url=os.getenv("WATSONX_URL", "https://us-south.ml.cloud.ibm.com"),
-        )
-    return _watsonx_client
-
 
 class ContractAnalysisRequest(BaseModel):
     """Request model for contract analysis."""
@@ -142,6 +106,8 @@ async def analyze_contract(request: ContractAnalysisRequest):
             overall_confidence=overall_confidence,
         )
 
+    except QuotaExceededError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -163,8 +129,11 @@ async def _get_golden_clauses(contract_type: ContractType) -> List[dict]:
         List of Golden Clause documents
     """
     try:
-        cloudant_client = get_cloudant_client()
-        clauses = cloudant_client.query_golden_clauses(contract_type.value)
+        # Served from memory when the Golden Clause cache is enabled, otherwise
+        # batched with the concurrent lookups of other requests
+        client = get_async_cloudant_client()
+        source = get_golden_clause_cache() or get_query_coalescer(client) or client
+        clauses = await source.query_golden_clauses(contract_type.value)
         return clauses if clauses else []
     except Exception as e:
         # Log warning but don't fail - graceful degradation
@@ -225,20 +194,14 @@ async def _extract_regulatory_sections(
                 continue
 
             # Use watsonx.ai to identify relevant sections
-            prompt = f"""Analyze this regulatory document and identify sections relevant to a {contract_type.value} contract.
-
-Regulatory Document: {reg_content[:2000]}...
-
-Contract Type: {contract_type.value}
-
-Extract the most relevant regulatory requirements (max 3 sections). For each section, provide:
-1. Section reference
-2. Requirement text
-3. Relevance explanation
-
-Format as JSON array."""
-
-            response = watsonx_client.generate(prompt=prompt, max_tokens=500, temperature=0.1)
+            response = (
+                await get_prompt_registry().agenerate(
+                    watsonx_client,
+                    "fusion.regulation_extraction",
+                    contract_type=contract_type.value,
+                    regulation=reg_content,
+                )
+            )["text"]
 
             # Parse response and add to sections
             sections.append(
@@ -250,6 +213,8 @@ Format as JSON array."""
                 }
             )
 
+        except QuotaExceededError:
+            raise
         except Exception as e:
             print(f"Warning: Failed to extract sections from {reg.get('name')}: {e}")
             continue
@@ -290,22 +255,15 @@ async def _analyze_internal_signals(
                 clause_text = getattr(golden, "text", "")
 
             # Use watsonx.ai to compare Golden Clause with contract
-            prompt = f"""Compare this Golden Clause with the contract text and determine alignment.
-
-Golden Clause ({clause_type}):
-{clause_text}
-
-Contract Text (excerpt):
-{contract_text[:1000]}...
-
-Determine:
-1. Alignment: MATCH, CONFLICT, PARTIAL, or UNKNOWN
-2. Confidence score (0.0-1.0)
-3. Brief explanation
-
-Format as JSON: {{"alignment": "...", "confidence": 0.0, "explanation": "..."}}"""
-
-            response = watsonx_client.generate(prompt=prompt, max_tokens=200, temperature=0.1)
+            response = (
+                await get_prompt_registry().agenerate(
+                    watsonx_client,
+                    "fusion.golden_clause_alignment",
+                    clause_type=clause_type,
+                    clause_text=clause_text,
+                    contract_text=contract_text,
+                )
+            )["text"]
 
             # Parse response (simplified - in production, use proper JSON parsing)
             alignment = SignalAlignment.UNKNOWN
@@ -331,6 +289,8 @@ Format as JSON: {{"alignment": "...", "confidence": 0.0, "explanation": "..."}}"
                 )
             )
 
+        except QuotaExceededError:
+            raise
         except Exception as e:
             print(f"Warning: Failed to analyze Golden Clause: {e}")
             continue
@@ -361,22 +321,14 @@ async def _analyze_external_signals(
     for section in regulatory_sections[:5]:  # Limit to 5 sections
         try:
             # Use watsonx.ai to analyze regulatory compliance
-            prompt = f"""Analyze if this contract complies with the regulatory requirement.
-
-Regulatory Requirement:
-{section.get('content', '')[:500]}
-
-Contract Text (excerpt):
-{contract_text[:1000]}...
-
-Determine:
-1. Alignment: MATCH, CONFLICT, PARTIAL, or UNKNOWN
-2. Confidence score (0.0-1.0)
-3. Specific requirement text
-
-Format as JSON: {{"alignment": "...", "confidence": 0.0, "requirement": "..."}}"""
-
-            response = watsonx_client.generate(prompt=prompt, max_tokens=200, temperature=0.1)
+            response = (
+                await get_prompt_registry().agenerate(
+                    watsonx_client,
+                    "fusion.regulatory_alignment",
+                    requirement=section.get("content", ""),
+                    contract_text=contract_text,
+                )
+            )["text"]
 
             # Parse response (simplified)
             alignment = SignalAlignment.UNKNOWN
@@ -403,6 +355,8 @@ Format as JSON: {{"alignment": "...", "confidence": 0.0, "requirement": "..."}}"
                 )
             )
 
+        except QuotaExceededError:
+            raise
         except Exception as e:
             print(f"Warning: Failed to analyze regulatory section: {e}")
             continue
@@ -437,23 +391,16 @@ async def _identify_compliance_gaps(
             # Determine severity based on confidence
             severity = "HIGH" if signal.confidence > 0.8 else "MEDIUM"
 
-            # Generate recommendation using watsonx.ai
-            prompt = f"""Generate a specific recommendation to resolve this compliance conflict.
-
-Conflict: {signal.source} conflicts with contract
-Confidence: {signal.confidence}
-
-Provide:
-1. Specific clause to modify
-2. Recommended action
-3. Regulatory basis
-
-Keep response concise (max 100 words)."""
-
             try:
-                recommendation = watsonx_client.generate(
-                    prompt=prompt, max_tokens=150, temperature=0.1
-                )
+                # Generate recommendation using watsonx.ai
+                recommendation = (
+                    await get_prompt_registry().agenerate(
+                        watsonx_client,
+                        "fusion.gap_recommendation",
+                        source=signal.source,
+                        confidence=signal.confidence,
+                    )
+                )["text"]
 
                 gaps.append(
                     ComplianceGap(
@@ -465,6 +412,8 @@ Keep response concise (max 100 words)."""
                         regulatory_basis=[signal.source],
                     )
                 )
+            except QuotaExceededError:
+                raise
             except Exception as e:
                 print(f"Warning: Failed to generate recommendation: {e}")
                 continue
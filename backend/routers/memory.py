@@ -5,28 +5,26 @@ This module provides the endpoint for querying historical contract decisions
 and retrieving similar past cases to inform current analysis.
 """
 
+import asyncio
+import json
 import os
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import anyio
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from backend.models import ContractType, Jurisdiction, HistoricalSignal
-from backend.cloudant_client import CloudantClient
+from backend.async_cloudant_client import get_async_cloudant_client
+from backend.precedent_ingest import ingest_precedents
+from backend.query_coalescer import get_query_coalescer
+from backend.cloudant_client import PRECEDENT_SCORING_FIELDS
 
 router = APIRouter()
 
-# Client instance (initialized lazily)
-_cloudant_client = None
-
-
-def get_cloudant_client() -> CloudantClient:
-    """Get or create Cloudant client instance."""
-    global _cloudant_client
-    if _cloudant_client is None:
-        _cloudant_client = CloudantClient(
-            url=os.getenv("CLOUDANT_URL"), api_key=os.getenv("CLOUDANT_API_KEY")
-        )
-    return _cloudant_client
+# Candidates ranked on their scoring fields before the top results are fetched in full
+CANDIDATE_POOL_SIZE = int(os.getenv("MEMORY_CANDIDATE_POOL_SIZE", "50"))
 
 
 class MemoryQueryRequest(BaseModel):
@@ -48,16 +46,39 @@ class MemoryQueryResponse(BaseModel):
     avg_confidence: float = Field(..., description="Average confidence score of precedents")
 
 
+class MemoryStatisticsResponse(BaseModel):
+    """Response model for precedent statistics."""
+
+    confidence_by_contract_type: Dict[str, Dict[str, Any]] = Field(
+        ..., description="Precedent count and confidence statistics per contract type"
+    )
+    decisions_by_jurisdiction: Dict[str, int] = Field(
+        ..., description="Number of precedents per jurisdiction"
+    )
+    golden_clauses_by_contract_type: Dict[str, int] = Field(
+        ..., description="Number of Golden Clauses per contract type"
+    )
+    contract_type: Optional[ContractType] = Field(
+        None, description="Contract type of the per-type breakdowns"
+    )
+    confidence_by_jurisdiction: Optional[Dict[str, Dict[str, Any]]] = Field(
+        None, description="Confidence statistics of the contract type per jurisdiction"
+    )
+    modification_acceptance_rates: Optional[Dict[str, Dict[str, Any]]] = Field(
+        None, description="Decision count and acceptance rate per modified clause"
+    )
+
+
 @router.post("/query", response_model=MemoryQueryResponse)
 async def query_precedents(request: MemoryQueryRequest):
     """
     Query historical precedents from Cloudant.
 
     This endpoint:
-    1. Queries Cloudant historical_decisions database
+    1. Queries Cloudant historical_decisions database for scoring fields only
     2. Filters by contract type and jurisdiction
-    3. Optionally filters by clause type
-    4. Calculates similarity scores (simplified for MVP)
+    3. Calculates similarity scores (simplified for MVP), boosting the clause type
+    4. Fetches the full documents of the top-ranked precedents
     5. Returns list of HistoricalSignal objects with precedents
 
     Args:
@@ -70,36 +91,44 @@ async def query_precedents(request: MemoryQueryRequest):
         HTTPException: If query fails
     """
     try:
-        cloudant_client = get_cloudant_client()
+        cloudant_client = get_async_cloudant_client()
 
-        # Query Cloudant for historical decisions
-        precedents_data = cloudant_client.get_precedents(
+        # Query Cloudant for candidate decisions (projected, not validated),
+        # batched with the concurrent lookups of other requests
+        lookups = get_query_coalescer(cloudant_client) or cloudant_client
+        candidates = await lookups.get_precedents(
             contract_type=request.contract_type.value,
             jurisdiction=request.jurisdiction.value,
-            limit=request.limit,
+            limit=max(request.limit, CANDIDATE_POOL_SIZE),
+            fields=PRECEDENT_SCORING_FIELDS,
         )
 
+        # Rank candidates by similarity (ties keep Cloudant's confidence order)
+        scores = {
+            candidate["_id"]: _calculate_similarity_score(candidate, request.clause_type)
+            for candidate in candidates
+        }
+        top_ids = sorted(scores, key=scores.get, reverse=True)[: request.limit]
+
+        # Fetch full documents for the top-ranked precedents only
+        decisions = await cloudant_client.get_precedents_by_ids(top_ids)
+
         # Convert to HistoricalSignal objects
         precedents = []
-        for prec in precedents_data:
+        for decision in decisions:
             try:
-                # Calculate similarity score (simplified - in production, use embeddings)
-                similarity_score = _calculate_similarity_score(prec, request.clause_type)
-
                 historical_signal = HistoricalSignal(
-                    decision_id=prec.get("decision_id", "unknown"),
-                    contract_type=ContractType(
-                        prec.get("contract_type", request.contract_type.value)
-                    ),
-                    modification=prec.get("modified_text", ""),
-                    rationale=prec.get("rationale", ""),
-                    confidence=prec.get("confidence", 0.7),
-                    similarity_score=similarity_score,
-                    date=prec.get("date", "2025-01-01"),
+                    decision_id=decision.decision_id,
+                    contract_type=ContractType(decision.contract_type),
+                    modification=decision.modified_text,
+                    rationale=decision.rationale,
+                    confidence=decision.confidence,
+                    similarity_score=scores[decision.id],
+                    date=decision.date,
                 )
                 precedents.append(historical_signal)
             except Exception as e:
-                print(f"Warning: Failed to parse precedent {prec.get('decision_id')}: {e}")
+                print(f"Warning: Failed to parse precedent {decision.decision_id}: {e}")
                 continue
 
         # Calculate average confidence
@@ -123,6 +152,98 @@ async def query_precedents(request: MemoryQueryRequest):
         )
 
 
+@router.get("/statistics", response_model=MemoryStatisticsResponse)
+async def get_statistics(contract_type: Optional[ContractType] = None):
+    """
+    Get precedent and Golden Clause statistics.
+
+    The statistics are read from reduced MapReduce views, so each one is a
+    single small request however many precedents are stored.
+
+    Args:
+        contract_type: Optional contract type for per-jurisdiction and
+            per-clause breakdowns
+
+    Returns:
+        MemoryStatisticsResponse: Aggregated statistics
+
+    Raises:
+        HTTPException: If a view query fails
+    """
+    try:
+        cloudant_client = get_async_cloudant_client()
+
+        queries = [
+            cloudant_client.get_confidence_stats_by_contract_type(),
+            cloudant_client.get_decision_counts_by_jurisdiction(),
+            cloudant_client.get_golden_clause_counts_by_contract_type(),
+        ]
+        if contract_type:
+            queries += [
+                cloudant_client.get_confidence_stats_by_jurisdiction(contract_type.value),
+                cloudant_client.get_modification_acceptance_rates(contract_type.value),
+            ]
+        results = await asyncio.gather(*queries)
+
+        return MemoryStatisticsResponse(
+            confidence_by_contract_type=results[0],
+            decisions_by_jurisdiction=results[1],
+            golden_clauses_by_contract_type=results[2],
+            contract_type=contract_type,
+            confidence_by_jurisdiction=results[3] if contract_type else None,
+            modification_acceptance_rates=results[4] if contract_type else None,
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "code": "MEMORY_STATISTICS_FAILED",
+                "message": f"Failed to query statistics: {str(e)}",
+            },
+        )
+
+
+class _RequestStreamingResponse(StreamingResponse):
+    """
+    Streaming response whose body is produced while the request body is read.
+
+    StreamingResponse otherwise listens on the ASGI receive channel for a
+    disconnect, which would consume request body messages; here the body
+    generator is the only reader, and a disconnect ends the request stream.
+    """
+
+    async def listen_for_disconnect(self, receive):
+        await anyio.sleep_forever()
+
+
+@router.post("/precedents/bulk")
+async def bulk_ingest_precedents(request: Request):
+    """
+    Import historical decisions from a streamed NDJSON body.
+
+    Each line is one HistoricalDecision. Records are validated as they
+    arrive and written through _bulk_docs in chunks with bounded memory;
+    decisions without an _id are stored under their decision_id, so a
+    re-run import reports conflicts rather than duplicates.
+
+    Args:
+        request: Request with an application/x-ndjson body
+
+    Returns:
+        StreamingResponse: NDJSON with one result per record
+            ({"line", "decision_id", "ok", "id"} or {"line", "ok", "error", "reason"}),
+            then a {"summary": {...}} line with the counts
+    """
+    cloudant_client = get_async_cloudant_client()
+
+    async def results() -> AsyncIterator[bytes]:
+        async for result in ingest_precedents(cloudant_client, request.stream()):
+            yield json.dumps(result).encode() + b"\n"
+
+    return _RequestStreamingResponse(results(), media_type="application/x-ndjson")
+
+
 def _calculate_similarity_score(precedent: dict, clause_type: Optional[str]) -> float:
     """
     Calculate similarity score for a precedent.
@@ -133,7 +254,7 @@ def _calculate_similarity_score(precedent: dict, clause_type: Optional[str]) ->
     - Keyword matching with TF-IDF
 
     Args:
-        precedent: Precedent data from Cloudant
+        precedent: Precedent document from Cloudant (scoring fields suffice)
         clause_type: Optional clause type to match
 
     Returns:
@@ -5,7 +5,6 @@ This module provides the endpoint for classifying contract complexity and
 determining the appropriate workflow path based on risk assessment.
 """
 
-import os
 from typing import Optional
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
@@ -17,25 +16,12 @@ from backend.models import (
     RiskLevel,
     WorkflowPath,
 )
-from backend.watsonx_client import WatsonxClient
+from backend.watsonx_client import get_watsonx_client
+from backend.tenant_scheduler import QuotaExceededError
+from backend.prompt_templates import get_prompt_registry
 
 router = APIRouter()
 
-# Client instance (initialized lazily)
-_watsonx_client = None
-
-
-def get_watsonx_client() -> WatsonxClient:
-    """Get or create Watsonx client instance."""
-    global _watsonx_client
-    if _watsonx_client is None:
-        _watsonx_client = WatsonxClient(
-            api_key=os.getenv("WATSONX_API_KEY"),
-            project_id=os.getenv("WATSONX_PROJECT_ID"),
-            url=os.getenv("WATSONX_URL", "https://us-south.ml.cloud.ibm.com"),
-        )
-    return _watsonx_client
-
 
 class ContractMetadata(BaseModel):
     """Metadata about the contract."""
@@ -111,6 +97,8 @@ async def classify_contract(request: RoutingRequest):
             escalation_level=escalation_level,
         )
 
+    except QuotaExceededError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -258,28 +246,25 @@ async def _generate_justification(
         gap_count = len(fusion_analysis.gaps)
         confidence = fusion_analysis.overall_confidence
 
-        # Create prompt for justification
-        prompt = f"""Generate a concise justification for this contract routing decision.
-
-Contract Type: {contract_metadata.type}
-Jurisdiction: {contract_metadata.jurisdiction}
-Compliance Gaps: {gap_count}
-Overall Confidence: {confidence:.2f}
-Risk Score: {risk_score:.2f}
-Complexity: {complexity.value}
-Workflow Path: {workflow_path.value}
-
-Provide a 2-3 sentence justification explaining:
-1. Why this complexity level was assigned
-2. Key risk factors
-3. Why this workflow path is appropriate
-
-Keep response professional and concise."""
-
-        justification = watsonx_client.generate(prompt=prompt, max_tokens=150, temperature=0.1)
+        # Generate justification from the registered template
+        justification = (
+            await get_prompt_registry().agenerate(
+                watsonx_client,
+                "routing.justification",
+                contract_type=contract_metadata.type,
+                jurisdiction=contract_metadata.jurisdiction,
+                gap_count=gap_count,
+                confidence=f"{confidence:.2f}",
+                risk_score=f"{risk_score:.2f}",
+                complexity=complexity.value,
+                workflow_path=workflow_path.value,
+            )
+        )["text"]
 
         return justification.strip()
 
+    except QuotaExceededError:
+        raise
     except Exception as e:
         # Fallback to template-based justification
         print(f"Warning: Failed to generate AI justification: {e}")
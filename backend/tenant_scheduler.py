@@ -0,0 +1,413 @@
+"""
+Tenant Scheduling
+IBM Dev Day AI Demystified Hackathon 2026
+Team: AI Kings 👑
+
+Per-tenant token and request quotas over sliding windows, and weighted fair
+queuing of watsonx.ai calls, so that one business unit's bulk traffic cannot
+starve the others sharing a deployment and watsonx.ai project.
+"""
+
+import heapq
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# HTTP header identifying the calling tenant
+TENANT_HEADER = "X-Tenant-ID"
+DEFAULT_TENANT = "default"
+
+# Tenant of the request being handled
+_current_tenant: ContextVar[str] = ContextVar("current_tenant", default=DEFAULT_TENANT)
+
+
+def get_current_tenant() -> str:
+    """Get the tenant of the request being handled."""
+    return _current_tenant.get()
+
+
+def set_current_tenant(tenant: Optional[str]):
+    """
+    Set the tenant of the request being handled.
+
+    Args:
+        tenant: Tenant ID (the default tenant when empty)
+
+    Returns:
+        Token for resetting the previous tenant
+    """
+    return _current_tenant.set((tenant or "").strip() or DEFAULT_TENANT)
+
+
+def reset_current_tenant(token):
+    """
+    Restore the tenant that was current before set_current_tenant.
+
+    Args:
+        token: Token returned by set_current_tenant
+    """
+    _current_tenant.reset(token)
+
+
+class QuotaExceededError(Exception):
+    """Raised when a tenant is over quota; maps to HTTP 429."""
+
+    def __init__(self, tenant: str, reason: str, retry_after: float):
+        self.tenant = tenant
+        self.reason = reason
+        self.retry_after = retry_after
+        super().__init__(f"Tenant {tenant!r} over quota ({reason}), retry after {retry_after:.1f}s")
+
+
+@dataclass
+class TenantQuota:
+    """Limits of one tenant. A limit of 0 means unlimited."""
+
+    tokens_per_window: int = 0
+    requests_per_window: int = 0
+    weight: float = 1.0  # Share of watsonx.ai capacity under contention
+
+
+class _SlidingWindow:
+    """Amounts recorded over a sliding time window. Guarded by the scheduler lock."""
+
+    def __init__(self, window_seconds: float):
+        self.window_seconds = window_seconds
+        self.entries: Deque[List[float]] = deque()  # [timestamp, amount]
+
+    def _expire(self, now: float):
+        while self.entries and self.entries[0][0] <= now - self.window_seconds:
+            self.entries.popleft()
+
+    def total(self, now: float) -> float:
+        self._expire(now)
+        return sum(amount for _, amount in self.entries)
+
+    def add(self, now: float, amount: float) -> List[float]:
+        entry = [now, amount]
+        self.entries.append(entry)
+        return entry
+
+    def retry_after(self, now: float, amount: float, limit: float) -> float:
+        """Seconds until amount more fits under limit."""
+        excess = self.total(now) + amount - limit
+        for timestamp, recorded in self.entries:
+            excess -= recorded
+            if excess <= 0:
+                return min(self.window_seconds, max(0.0, timestamp + self.window_seconds - now))
+        return self.window_seconds
+
+
+class _TenantState:
+    """Usage and queue state of one tenant."""
+
+    def __init__(self, window_seconds: float):
+        self.tokens = _SlidingWindow(window_seconds)
+        self.requests = _SlidingWindow(window_seconds)
+        self.last_finish = 0.0
+        self.queued = 0
+        self.active = 0
+        self.rejected = 0
+
+
+class TenantReservation:
+    """A scheduled call; settles its token estimate once actual usage is known."""
+
+    def __init__(self, scheduler: "TenantScheduler", tenant: str, token_entry: List[float]):
+        self.scheduler = scheduler
+        self.tenant = tenant
+        self._token_entries = [token_entry]
+
+    def add_duplicate(self):
+        """Charge a duplicate of the call (a hedged request) to the tenant's token quota."""
+        with self.scheduler._lock:
+            tokens = self.scheduler._state(self.tenant).tokens
+            self._token_entries.append(
+                tokens.add(self.scheduler.clock(), self._token_entries[0][1])
+            )
+
+    def settle(self, actual_tokens: int):
+        """
+        Replace the reserved token estimate with the tokens actually used.
+
+        Args:
+            actual_tokens: Input plus output tokens of the call (charged again
+                for each duplicate sent)
+        """
+        with self.scheduler._lock:
+            for entry in self._token_entries:
+                entry[1] = actual_tokens
+
+    def release(self):
+        """Free the call slot."""
+        self.scheduler.release(self.tenant)
+
+
+class TenantScheduler:
+    """
+    Admission control and weighted fair queuing for LLM calls.
+
+    Each call is first checked against its tenant's sliding-window token and
+    request quotas; a tenant over quota is rejected immediately with a
+    QuotaExceededError carrying a retry-after hint. Admitted calls run when
+    one of ``max_concurrency`` slots is free; under contention, queued calls
+    are served in weighted fair queuing order (lowest virtual finish time
+    first), so each tenant gets capacity in proportion to its weight.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        window_seconds: float = 60.0,
+        default_quota: Optional[TenantQuota] = None,
+        quotas: Optional[Dict[str, TenantQuota]] = None,
+        max_queued_per_tenant: int = 32,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize tenant scheduler.
+
+        Args:
+            max_concurrency: Maximum concurrent watsonx.ai calls
+            window_seconds: Length of the quota sliding window
+            default_quota: Quota of tenants without their own (unlimited by default)
+            quotas: Quota per tenant ID
+            max_queued_per_tenant: Calls a tenant may have waiting before it is rejected
+            clock: Time source (for tests)
+        """
+        self.max_concurrency = max_concurrency
+        self.window_seconds = window_seconds
+        self.default_quota = default_quota or TenantQuota()
+        self.quotas = quotas or {}
+        self.max_queued_per_tenant = max_queued_per_tenant
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._tenants: Dict[str, _TenantState] = {}
+        self._queue: List[Any] = []  # Heap of (finish tag, sequence, start tag, tenant, event)
+        self._sequence = itertools.count()
+        self._virtual_time = 0.0
+        self._active = 0
+
+    def quota_for(self, tenant: str) -> TenantQuota:
+        """Get the quota of a tenant."""
+        return self.quotas.get(tenant, self.default_quota)
+
+    def _state(self, tenant: str) -> _TenantState:
+        """Get the state of a tenant, creating it. Caller holds the lock."""
+        state = self._tenants.get(tenant)
+        if state is None:
+            state = self._tenants[tenant] = _TenantState(self.window_seconds)
+        return state
+
+    def _check_quota(self, tenant: str, state: _TenantState, tokens: int, now: float):
+        """Raise QuotaExceededError if the call does not fit. Caller holds the lock."""
+        quota = self.quota_for(tenant)
+
+        if quota.requests_per_window and (
+            state.requests.total(now) + 1 > quota.requests_per_window
+        ):
+            state.rejected += 1
+            raise QuotaExceededError(
+                tenant,
+                "request quota",
+                state.requests.retry_after(now, 1, quota.requests_per_window),
+            )
+
+        if quota.tokens_per_window and state.tokens.total(now) + tokens > quota.tokens_per_window:
+            state.rejected += 1
+            raise QuotaExceededError(
+                tenant,
+                "token quota",
+                state.tokens.retry_after(now, tokens, quota.tokens_per_window),
+            )
+
+    def check(self, tenant: str, estimated_tokens: int = 0):
+        """
+        Check that a tenant has quota left, without reserving any.
+
+        Args:
+            tenant: Tenant ID
+            estimated_tokens: Tokens the call is expected to use
+
+        Raises:
+            QuotaExceededError: If the tenant is over quota
+        """
+        with self._lock:
+            self._check_quota(tenant, self._state(tenant), estimated_tokens, self.clock())
+
+    def acquire(self, tenant: str, estimated_tokens: int) -> TenantReservation:
+        """
+        Reserve quota and wait for a call slot.
+
+        Args:
+            tenant: Tenant ID
+            estimated_tokens: Tokens the call is expected to use (input plus max output)
+
+        Returns:
+            Reservation to settle with the actual usage
+
+        Raises:
+            QuotaExceededError: If the tenant is over quota or has too many queued calls
+        """
+        with self._lock:
+            now = self.clock()
+            state = self._state(tenant)
+            self._check_quota(tenant, state, estimated_tokens, now)
+
+            if self._active >= self.max_concurrency and state.queued >= self.max_queued_per_tenant:
+                state.rejected += 1
+                raise QuotaExceededError(tenant, "too many queued calls", 1.0)
+
+            state.requests.add(now, 1)
+            reservation = TenantReservation(self, tenant, state.tokens.add(now, estimated_tokens))
+
+            # Weighted fair queuing tags: heavier tenants advance more slowly
+            start_tag = max(self._virtual_time, state.last_finish)
+            state.last_finish = start_tag + max(1, estimated_tokens) / self.quota_for(tenant).weight
+
+            if self._active < self.max_concurrency and not self._queue:
+                self._active += 1
+                state.active += 1
+                self._virtual_time = start_tag
+                return reservation
+
+            event = threading.Event()
+            heapq.heappush(
+                self._queue, (state.last_finish, next(self._sequence), start_tag, tenant, event)
+            )
+            state.queued += 1
+
+        event.wait()
+        return reservation
+
+    def release(self, tenant: str):
+        """
+        Free a call slot, handing it to the next queued call in fair order.
+
+        Args:
+            tenant: Tenant ID of the finished call
+        """
+        with self._lock:
+            self._state(tenant).active -= 1
+
+            if self._queue:
+                _, _, start_tag, next_tenant, event = heapq.heappop(self._queue)
+                next_state = self._state(next_tenant)
+                next_state.queued -= 1
+                next_state.active += 1
+                self._virtual_time = start_tag
+                event.set()
+            else:
+                self._active -= 1
+
+    @contextmanager
+    def slot(self, tenant: str, estimated_tokens: int) -> Iterator[TenantReservation]:
+        """
+        Run a call within a tenant's quota and fair share.
+
+        Args:
+            tenant: Tenant ID
+            estimated_tokens: Tokens the call is expected to use
+
+        Yields:
+            Reservation to settle with the actual usage
+        """
+        reservation = self.acquire(tenant, estimated_tokens)
+        try:
+            yield reservation
+        finally:
+            reservation.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get usage and queue state per tenant.
+
+        Returns:
+            Dict with scheduler configuration and per-tenant usage
+        """
+        with self._lock:
+            now = self.clock()
+            tenants = {}
+            for tenant, state in sorted(self._tenants.items()):
+                quota = self.quota_for(tenant)
+                tenants[tenant] = {
+                    "window_tokens": int(state.tokens.total(now)),
+                    "window_requests": int(state.requests.total(now)),
+                    "tokens_per_window": quota.tokens_per_window,
+                    "requests_per_window": quota.requests_per_window,
+                    "weight": quota.weight,
+                    "active": state.active,
+                    "queued": state.queued,
+                    "rejected": state.rejected,
+                }
+
+            return {
+                "enabled": True,
+                "max_concurrency": self.max_concurrency,
+                "window_seconds": self.window_seconds,
+                "active": self._active,
+                "queued": len(self._queue),
+                "tenants": tenants,
+            }
+
+
+# ============================================================================
+# Singleton instance
+# ============================================================================
+
+_tenant_scheduler: Optional[TenantScheduler] = None
+_tenant_scheduler_lock = threading.Lock()
+
+
+def _quota_from_dict(values: Dict[str, Any]) -> TenantQuota:
+    """Build a quota from a TENANT_QUOTAS entry."""
+    return TenantQuota(
+        tokens_per_window=int(values.get("tokens_per_window", 0)),
+        requests_per_window=int(values.get("requests_per_window", 0)),
+        weight=float(values.get("weight", 1.0)),
+    )
+
+
+def get_tenant_scheduler() -> Optional[TenantScheduler]:
+    """
+    Get singleton tenant scheduler, configured from TENANT_* environment variables.
+
+    Returns:
+        TenantScheduler, or None when TENANT_SCHEDULER_ENABLED is not true
+    """
+    global _tenant_scheduler
+    if os.getenv("TENANT_SCHEDULER_ENABLED", "false").lower() != "true":
+        return None
+
+    if _tenant_scheduler is None:
+        with _tenant_scheduler_lock:
+            if _tenant_scheduler is None:
+                quotas = json.loads(os.getenv("TENANT_QUOTAS", "{}") or "{}")
+                _tenant_scheduler = TenantScheduler(
+                    max_concurrency=int(os.getenv("TENANT_MAX_CONCURRENT_CALLS", "8")),
+                    window_seconds=float(os.getenv("TENANT_QUOTA_WINDOW_SECONDS", "60")),
+                    default_quota=TenantQuota(
+                        tokens_per_window=int(os.getenv("TENANT_DEFAULT_TOKENS_PER_WINDOW", "0")),
+                        requests_per_window=int(
+                            os.getenv("TENANT_DEFAULT_REQUESTS_PER_WINDOW", "0")
+                        ),
+                    ),
+                    quotas={tenant: _quota_from_dict(values) for tenant, values in quotas.items()},
+                    max_queued_per_tenant=int(os.getenv("TENANT_MAX_QUEUED_CALLS", "32")),
+                )
+                logger.info(
+                    f"Tenant scheduler enabled: {len(quotas)} tenant quotas, "
+                    f"{_tenant_scheduler.max_concurrency} concurrent calls"
+                )
+    return _tenant_scheduler
@@ -6,17 +6,318 @@ Team: AI Kings 👑
 Wrapper for IBM watsonx.ai foundation model inference with retry logic and token tracking.
 """
 
+import asyncio
+import contextvars
+import json
 import os
+import threading
 import time
-from typing import Optional, Dict, Any, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Iterator, Optional, Dict, Any, List, Tuple
 from ibm_watsonx_ai import APIClient, Credentials
 from ibm_watsonx_ai.foundation_models import ModelInference
 from ibm_watsonx_ai.metanames import GenTextParamsMetaNames as GenParams
+from backend.iam_tokens import get_iam_token_provider
+from backend.prompt_budget import TokenCounter, get_token_counter
+from backend.request_hedging import RequestHedger
+from backend.model_failover import ModelFailover
+from backend.resilience import CircuitBreaker, RetryPolicy, create_circuit_breaker
+from backend.llm_cassette import Cassette, get_cassette_from_env
+from backend.llm_metrics import DEFAULT_CALL_SITE, LLMMetrics, get_llm_metrics
+from backend.tenant_scheduler import (
+    TenantReservation,
+    TenantScheduler,
+    get_current_tenant,
+    get_tenant_scheduler,
+)
+from backend.llm_backends import (
+    LLMBackend,
+    RecordingBackend,
+    ReplayBackend,
+    get_local_backend_from_env,
+)
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _on_event_loop() -> bool:
+    """Whether the current thread is running an asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class _PendingBatch:
+    """Requests with identical parameters waiting to be sent together."""
+
+    def __init__(self, params: Dict[str, Any]):
+        self.params = params
+        self.items: List[Tuple[str, Future]] = []
+        self.ready = threading.Event()
+
+
+class _MicroBatcher:
+    """
+    Collect concurrent generation requests into multi-prompt generate calls.
+
+    The first request for a given set of parameters opens a batch and waits
+    for the batching window (or until the batch is full); it then sends every
+    collected prompt in one generate call and hands each caller its own
+    result. The SDK still sends one HTTP request per prompt, concurrently over
+    the model's shared session, so batching saves per-call overhead (retry
+    policy, circuit breaker, model selection), not inference requests.
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[List[str], Dict[str, Any]], List[Dict[str, Any]]],
+        window_seconds: float,
+        max_size: int,
+    ):
+        """
+        Initialize micro-batcher.
+
+        Args:
+            send_batch: Function sending a list of prompts with shared parameters
+            window_seconds: How long the first request waits for companions
+            max_size: Maximum prompts per batch
+        """
+        self.send_batch = send_batch
+        self.window_seconds = window_seconds
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._pending: Dict[str, _PendingBatch] = {}
+
+        # Batching statistics
+        self.total_batches = 0
+        self.total_batched_prompts = 0
+
+    def submit(self, prompt: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Submit a prompt and wait for its result.
+
+        Args:
+            prompt: Prompt text
+            params: Generation parameters
+
+        Returns:
+            Generation result for this prompt
+
+        Raises:
+            Exception: If the batched request fails
+        """
+        key = json.dumps(params, sort_keys=True, default=str)
+        future: Future = Future()
+
+        with self._lock:
+            batch = self._pending.get(key)
+            is_leader = batch is None
+            if is_leader:
+                batch = _PendingBatch(params)
+                self._pending[key] = batch
+
+            batch.items.append((prompt, future))
+
+            if len(batch.items) >= self.max_size:
+                # Batch is full: close it and wake the leader
+                del self._pending[key]
+                batch.ready.set()
+
+        if is_leader:
+            # Never hold an event loop for the window: async callers use agenerate,
+            # which runs on worker threads where waiting for companions is harmless
+            if not _on_event_loop():
+                batch.ready.wait(timeout=self.window_seconds)
+            with self._lock:
+                if self._pending.get(key) is batch:
+                    del self._pending[key]
+            self._send(batch)
+
+        return future.result()
+
+    def _send(self, batch: _PendingBatch):
+        """Send a closed batch and resolve its futures."""
+        prompts = [prompt for prompt, _ in batch.items]
+        with self._lock:
+            self.total_batches += 1
+            self.total_batched_prompts += len(prompts)
+
+        try:
+            results = self.send_batch(prompts, batch.params)
+        except Exception as e:
+            for _, future in batch.items:
+                future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch.items, results):
+            future.set_result(result)
+
+        # A short response must not leave callers waiting forever
+        for _, future in batch.items[len(results) :]:
+            future.set_exception(
+                RuntimeError(f"Batched request returned {len(results)} of {len(prompts)} results")
+            )
+
+        logger.debug(f"Sent batch of {len(prompts)} prompts")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get batching configuration and counts.
+
+        Returns:
+            Dict with window, size limit and batch counts
+        """
+        with self._lock:
+            batches = self.total_batches
+            prompts = self.total_batched_prompts
+        return {
+            "enabled": True,
+            "window_ms": self.window_seconds * 1000,
+            "max_size": self.max_size,
+            "total_batches": batches,
+            "total_batched_prompts": prompts,
+            "avg_batch_size": round(prompts / batches, 2) if batches else 0.0,
+        }
+
+
+class _StreamError:
+    """Error raised by a stream producer, passed to the consuming coroutine."""
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+LLM_BACKENDS = ("watsonx", "local", "replay")
+
+
+class WatsonxBackend:
+    """LLM backend calling watsonx.ai foundation model inference."""
+
+    name = "watsonx"
+
+    def __init__(self, api_key: Optional[str], project_id: Optional[str], url: str):
+        """
+        Initialize watsonx.ai backend.
+
+        Args:
+            api_key: IBM Cloud API key
+            project_id: watsonx.ai project ID
+            url: watsonx.ai URL
+        """
+        if not all([api_key, project_id]):
+            raise ValueError(
+                "watsonx.ai credentials required. Set WATSONX_API_KEY and "
+                "WATSONX_PROJECT_ID environment variables."
+            )
+
+        self.project_id = project_id
+
+        # Sign with the process-wide IAM token when one is warm (the client then
+        # takes the provider's current token before each call); otherwise the
+        # SDK signs and refreshes with the API key itself
+        self.token_provider = get_iam_token_provider(api_key)
+        self._token = self.token_provider.cached_token()
+        self._token_lock = threading.Lock()
+        if self._token:
+            credentials = Credentials(token=self._token, url=url)
+        else:
+            credentials = Credentials(api_key=api_key, url=url)
+        self.api_client = APIClient(credentials)
+        self.api_client.set.default_project(project_id)
+
+        # Model inference objects, created on first use
+        self._models: Dict[str, ModelInference] = {}
+        self._models_lock = threading.Lock()
+
+    def get_model(self, model_id: str) -> ModelInference:
+        """
+        Get the cached model inference object for a model.
+
+        The object is reused across calls so that the underlying HTTP session
+        and model lookup are not repeated for every generation.
+
+        Args:
+            model_id: Model ID
+
+        Returns:
+            ModelInference instance
+        """
+        self._sync_token()
+        model = self._models.get(model_id)
+        if model is None:
+            with self._models_lock:
+                model = self._models.get(model_id)
+                if model is None:
+                    model = ModelInference(
+                        model_id=model_id,
+                        api_client=self.api_client,
+                        project_id=self.project_id,
+                    )
+                    self._models[model_id] = model
+        return model
+
+    def _sync_token(self):
+        """
+        Hand the provider's current token to the SDK client before a call.
+
+        Works without background refresh: an expired token is fetched here.
+        A client signing with the API key refreshes on its own and is left as is.
+        """
+        if self._token is None:
+            return
+        token = self.token_provider.get_token()
+        if token != self._token:
+            with self._token_lock:
+                if token != self._token:
+                    self.api_client.set_token(token)
+                    self._token = token
+
+    def generate(
+        self, model_id: str, prompts: List[str], params: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate text for several prompts in one multi-prompt generate call.
+
+        ModelInference sends one HTTP request per prompt, at most
+        concurrency_limit at a time, over its shared session.
+        """
+        responses = self.get_model(model_id).generate(
+            prompt=prompts if len(prompts) > 1 else prompts[0],
+            params=params,
+            concurrency_limit=max(1, len(prompts)),
+        )
+        if isinstance(responses, dict):
+            responses = [responses]
+
+        results = []
+        for response in responses:
+            result_details = (response.get("results") or [{}])[0]
+            results.append(
+                {
+                    "text": result_details.get("generated_text", ""),
+                    "input_tokens": result_details.get("input_token_count", 0),
+                    "output_tokens": result_details.get("generated_token_count", 0),
+                    "stop_reason": result_details.get("stop_reason", "unknown"),
+                }
+            )
+        return results
+
+    def generate_stream(
+        self, model_id: str, prompt: str, params: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream raw generation events from watsonx.ai."""
+        return self.get_model(model_id).generate_text_stream(
+            prompt=prompt, params=params, raw_response=True
+        )
+
+    def health_check(self) -> Dict[str, Any]:
+        """Report the configured project; generation is checked by the client."""
+        return {"status": "healthy", "backend": self.name, "project_id": self.project_id}
+
+
 class WatsonxClient:
     """
     watsonx.ai client for Granite model inference.
@@ -31,8 +332,17 @@ class WatsonxClient:
         project_id: Optional[str] = None,
         url: Optional[str] = None,
         model_id: Optional[str] = None,
+        fallback_model_id: Optional[str] = None,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        token_counter: Optional[TokenCounter] = None,
+        batch_window_ms: Optional[float] = None,
+        batch_max_size: Optional[int] = None,
+        hedge_percentile: Optional[float] = None,
+        cassette: Optional[Cassette] = None,
+        backend: Optional[LLMBackend] = None,
+        metrics: Optional[LLMMetrics] = None,
+        scheduler: Optional[TenantScheduler] = None,
     ):
         """
         Initialize watsonx.ai client.
@@ -42,8 +352,23 @@ class WatsonxClient:
             project_id: watsonx.ai project ID (defaults to WATSONX_PROJECT_ID env var)
             url: watsonx.ai URL (defaults to WATSONX_URL env var)
             model_id: Model ID (defaults to WATSONX_MODEL_ID env var or granite-3-8b-instruct)
+            fallback_model_id: Model used while the primary model is degraded
+                (defaults to WATSONX_FALLBACK_MODEL_ID env var, unset disables failover)
             max_retries: Maximum number of retry attempts
             retry_delay: Initial delay between retries in seconds
+            token_counter: Offline token counter (defaults to the shared counter)
+            batch_window_ms: Micro-batching window in milliseconds
+                (defaults to WATSONX_BATCH_WINDOW_MS env var, 0 disables batching)
+            batch_max_size: Maximum prompts per batched generate call
+                (defaults to WATSONX_BATCH_MAX_SIZE env var or 8)
+            hedge_percentile: Latency percentile after which a slow request is hedged
+                (defaults to WATSONX_HEDGE_PERCENTILE env var, 0 disables hedging)
+            cassette: Record/replay cassette (defaults to WATSONX_CASSETTE_* env vars)
+            backend: LLM backend performing generations (defaults to the LLM_BACKEND
+                env var: watsonx, local or replay)
+            metrics: Per-call-site usage metrics (defaults to the process-wide metrics)
+            scheduler: Per-tenant quota scheduler (defaults to the process-wide
+                scheduler when TENANT_SCHEDULER_ENABLED is true)
         """
         self.api_key = api_key or os.getenv("WATSONX_API_KEY")
         self.project_id = project_id or os.getenv("WATSONX_PROJECT_ID")
@@ -51,30 +376,145 @@ class WatsonxClient:
         self.model_id = model_id or os.getenv("WATSONX_MODEL_ID", "ibm/granite-3-8b-instruct")
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.context_window = int(os.getenv("WATSONX_CONTEXT_WINDOW", "8192"))
+        self.token_counter = token_counter or get_token_counter()
 
-        if not all([self.api_key, self.project_id]):
-            raise ValueError(
-                "watsonx.ai credentials required. Set WATSONX_API_KEY and "
-                "WATSONX_PROJECT_ID environment variables."
+        # Shared retry policy; each attempt passes the circuit breaker of the
+        # model it selects (see _generate_batch)
+        self.breaker = create_circuit_breaker("watsonx")
+        self.retry_policy = RetryPolicy(
+            "watsonx.ai",
+            max_retries=self.max_retries,
+            base_delay=self.retry_delay,
+        )
+
+        # Record/replay cassette (replay mode needs no credentials or network)
+        self.cassette = cassette if cassette is not None else get_cassette_from_env()
+
+        # Backend performing generations
+        self.backend = backend if backend is not None else self._create_backend()
+        self.replaying = self.backend.name == "replay"
+        self.api_client: Optional[APIClient] = getattr(self.backend, "api_client", None)
+
+        # Micro-batching of concurrent requests (disabled when window is 0)
+        batch_window_ms = (
+            batch_window_ms
+            if batch_window_ms is not None
+            else float(os.getenv("WATSONX_BATCH_WINDOW_MS", "0"))
+        )
+        batch_max_size = batch_max_size or int(os.getenv("WATSONX_BATCH_MAX_SIZE", "8"))
+        self._batcher: Optional[_MicroBatcher] = None
+        if batch_window_ms > 0 and batch_max_size > 1:
+            self._batcher = _MicroBatcher(
+                lambda prompts, params: self._retry_operation(
+                    self._generate_batch, prompts, params
+                ),
+                window_seconds=batch_window_ms / 1000,
+                max_size=batch_max_size,
+            )
+
+        # Hedging of slow requests (disabled when percentile is 0)
+        hedge_percentile = (
+            hedge_percentile
+            if hedge_percentile is not None
+            else float(os.getenv("WATSONX_HEDGE_PERCENTILE", "0"))
+        )
+        self._hedger: Optional[RequestHedger] = None
+        if hedge_percentile > 0:
+            self._hedger = RequestHedger(
+                percentile=hedge_percentile,
+                budget_ratio=float(os.getenv("WATSONX_HEDGE_BUDGET_RATIO", "0.05")),
+                min_samples=int(os.getenv("WATSONX_HEDGE_MIN_SAMPLES", "20")),
             )
 
-        # Initialize API client
-        credentials = Credentials(api_key=self.api_key, url=self.url)
+        # Failover to a fallback model while the primary degrades
+        self.fallback_model_id = fallback_model_id or os.getenv("WATSONX_FALLBACK_MODEL_ID")
+        self._failover: Optional[ModelFailover] = None
+        if self.fallback_model_id and self.fallback_model_id != self.model_id:
+            self._failover = ModelFailover(
+                primary_model_id=self.model_id,
+                fallback_model_id=self.fallback_model_id,
+                error_rate_threshold=float(os.getenv("WATSONX_FAILOVER_ERROR_RATE", "0.5")),
+                latency_threshold=float(os.getenv("WATSONX_FAILOVER_LATENCY_MS", "10000")) / 1000,
+                min_samples=int(os.getenv("WATSONX_FAILOVER_MIN_SAMPLES", "5")),
+                probe_interval=float(os.getenv("WATSONX_FAILOVER_PROBE_INTERVAL_SECONDS", "30")),
+            )
 
-        self.api_client = APIClient(credentials)
-        self.api_client.set.default_project(self.project_id)
+        # Circuit breaker per model: the failures that fail the primary over
+        # also open its breaker, which must not shut out the fallback model
+        self._breakers: Dict[str, CircuitBreaker] = {self.model_id: self.breaker}
+        if self._failover is not None:
+            self._breakers[self.fallback_model_id] = create_circuit_breaker("watsonx_fallback")
+
+        # Per-tenant quotas and fair scheduling (disabled unless configured)
+        self.scheduler = scheduler if scheduler is not None else get_tenant_scheduler()
+
+        # Worker threads running calls for async callers; a call waiting for its
+        # batch or its tenant's fair share blocks one of these, not the event loop
+        self._call_executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("WATSONX_CALL_THREADS", "32")),
+            thread_name_prefix="watsonx-call",
+        )
 
-        # Token usage tracking
+        # Token usage tracking (calls may run concurrently from worker threads)
+        self.metrics = metrics or get_llm_metrics()
+        self._usage_lock = threading.Lock()
         self.total_input_tokens = 0
         self.total_output_tokens = 0
         self.total_requests = 0
 
-        logger.info(f"watsonx.ai client initialized: {self.model_id}")
+        logger.info(f"watsonx.ai client initialized: {self.model_id} ({self.backend.name} backend)")
+
+    def _create_backend(self) -> LLMBackend:
+        """
+        Create the backend selected by configuration.
+
+        LLM_BACKEND selects watsonx (default), local or replay. A replay
+        cassette always selects the replay backend; a record cassette wraps
+        the selected backend so that its generations are recorded.
+
+        Returns:
+            LLM backend
+        """
+        name = os.getenv("LLM_BACKEND", "watsonx").lower()
+        if name not in LLM_BACKENDS:
+            raise ValueError(f"LLM_BACKEND must be one of {LLM_BACKENDS}, got {name!r}")
+
+        if name == "replay" and (self.cassette is None or self.cassette.mode != "replay"):
+            self.cassette = get_cassette_from_env(mode="replay")
+
+        if self.cassette is not None and self.cassette.mode == "replay":
+            return ReplayBackend(self.cassette)
+
+        if name == "local":
+            backend: LLMBackend = get_local_backend_from_env()
+        else:
+            backend = WatsonxBackend(self.api_key, self.project_id, self.url)
+
+        if self.cassette is not None:
+            backend = RecordingBackend(backend, self.cassette)
+        return backend
+
+    def estimate_tokens(self, text: str) -> int:
+        """
+        Estimate the number of input tokens for text without calling watsonx.ai.
+
+        Args:
+            text: Prompt text
+
+        Returns:
+            Estimated token count
+        """
+        return self.token_counter.count(text)
 
     def _retry_operation(self, operation, *args, **kwargs):
         """
         Execute operation with retry logic.
 
+        Transient errors are retried with full-jitter exponential backoff,
+        within the request retry budget. Each attempt passes the circuit
+        breaker of the model it is sent to.
+
         Args:
             operation: Function to execute
             *args: Positional arguments for operation
@@ -84,40 +524,87 @@ class WatsonxClient:
             Result of operation
 
         Raises:
-            Exception: If all retries fail
+            CircuitOpenError: If the selected model's circuit breaker is open
+            Exception: If all retries fail or the error is not retryable
         """
-        last_exception = None
+        return self.retry_policy.call(operation, *args, **kwargs)
 
-        for attempt in range(self.max_retries):
-            try:
-                return operation(*args, **kwargs)
-            except Exception as e:
-                last_exception = e
-                error_msg = str(e).lower()
-
-                # Don't retry on certain errors
-                if (
-                    "invalid" in error_msg
-                    or "unauthorized" in error_msg
-                    or "forbidden" in error_msg
-                ):
-                    logger.error(f"Non-retryable error: {e}")
-                    raise
-
-                # Retry on rate limiting or temporary errors
-                if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (2**attempt)  # Exponential backoff
-                    logger.warning(
-                        f"watsonx.ai operation failed (attempt {attempt + 1}/{self.max_retries}): {e}. "
-                        f"Retrying in {delay}s..."
-                    )
-                    time.sleep(delay)
-                else:
-                    logger.error(
-                        f"watsonx.ai operation failed after {self.max_retries} attempts: {e}"
-                    )
+    def _build_params(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+        top_k: Optional[int] = None,
+        repetition_penalty: Optional[float] = None,
+        stop_sequences: Optional[List[str]] = None,
+        return_options: Optional[Dict[str, bool]] = None,
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Build generation parameters and estimate input tokens before sending.
 
-        raise last_exception
+        Args:
+            prompt: Input prompt text
+            max_tokens: Maximum tokens to generate (default from env or 2000)
+            temperature: Sampling temperature (default from env or 0.1)
+            top_p: Nucleus sampling parameter
+            top_k: Top-k sampling parameter
+            repetition_penalty: Repetition penalty
+            stop_sequences: List of stop sequences
+            return_options: Options for what to return (input_text, generated_tokens, etc.)
+
+        Returns:
+            Tuple of (generation parameters, estimated input tokens)
+        """
+        # Set defaults from environment or hardcoded
+        max_tokens = max_tokens or int(os.getenv("WATSONX_MAX_TOKENS", "2000"))
+        temperature = (
+            temperature
+            if temperature is not None
+            else float(os.getenv("WATSONX_TEMPERATURE", "0.1"))
+        )
+
+        # Estimate input tokens before sending
+        estimated_input_tokens = self.estimate_tokens(prompt)
+        if estimated_input_tokens + max_tokens > self.context_window:
+            logger.warning(
+                f"Prompt may exceed context window: ~{estimated_input_tokens} input + "
+                f"{max_tokens} output tokens > {self.context_window}"
+            )
+        logger.debug(f"Sending prompt with ~{estimated_input_tokens} estimated input tokens")
+
+        # Build parameters
+        params = {
+            GenParams.MAX_NEW_TOKENS: max_tokens,
+            GenParams.TEMPERATURE: temperature,
+        }
+
+        if top_p is not None:
+            params[GenParams.TOP_P] = top_p
+
+        if top_k is not None:
+            params[GenParams.TOP_K] = top_k
+
+        if repetition_penalty is not None:
+            params[GenParams.REPETITION_PENALTY] = repetition_penalty
+
+        if stop_sequences:
+            params[GenParams.STOP_SEQUENCES] = stop_sequences
+
+        if return_options:
+            params[GenParams.RETURN_OPTIONS] = return_options
+        else:
+            # Default return options
+            params[GenParams.RETURN_OPTIONS] = {
+                "input_text": False,
+                "generated_tokens": True,
+                "input_tokens": True,
+                "token_logprobs": False,
+                "token_ranks": False,
+                "top_n_tokens": False,
+            }
+
+        return params, estimated_input_tokens
 
     def generate(
         self,
@@ -129,6 +616,7 @@ class WatsonxClient:
         repetition_penalty: Optional[float] = None,
         stop_sequences: Optional[List[str]] = None,
         return_options: Optional[Dict[str, bool]] = None,
+        call_site: str = DEFAULT_CALL_SITE,
     ) -> Dict[str, Any]:
         """
         Generate text using watsonx.ai foundation model.
@@ -142,6 +630,8 @@ class WatsonxClient:
             repetition_penalty: Repetition penalty
             stop_sequences: List of stop sequences
             return_options: Options for what to return (input_text, generated_tokens, etc.)
+            call_site: Tag of the calling code path for usage metrics
+                (e.g. 'fusion.internal')
 
         Returns:
             Dict with generated text and metadata:
@@ -149,98 +639,331 @@ class WatsonxClient:
                 'text': str,  # Generated text
                 'input_tokens': int,  # Number of input tokens
                 'output_tokens': int,  # Number of output tokens
+                'estimated_input_tokens': int,  # Local estimate made before sending
                 'stop_reason': str,  # Why generation stopped
-                'model_id': str  # Model used
+                'model_id': str  # Model used (the fallback model while failed over)
             }
         """
-        # Set defaults from environment or hardcoded
-        max_tokens = max_tokens or int(os.getenv("WATSONX_MAX_TOKENS", "2000"))
-        temperature = (
-            temperature
-            if temperature is not None
-            else float(os.getenv("WATSONX_TEMPERATURE", "0.1"))
+        params, estimated_input_tokens = self._build_params(
+            prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            top_k=top_k,
+            repetition_penalty=repetition_penalty,
+            stop_sequences=stop_sequences,
+            return_options=return_options,
         )
 
-        def _generate():
-            # Build parameters
-            params = {
-                GenParams.MAX_NEW_TOKENS: max_tokens,
-                GenParams.TEMPERATURE: temperature,
-            }
+        start = time.monotonic()
+        try:
+            reservation = self._reserve(estimated_input_tokens, params)
+            try:
+                # Generate, hedged against slow responses when enabled
+                if self._hedger is not None:
+                    metadata = self._hedger.run(
+                        lambda: self._send(prompt, params),
+                        on_hedge=reservation.add_duplicate if reservation is not None else None,
+                    )
+                else:
+                    metadata = self._send(prompt, params)
+            finally:
+                if reservation is not None:
+                    reservation.release()
+        except Exception as e:
+            self.metrics.record_error(call_site, time.monotonic() - start, e)
+            raise
+
+        # Update token tracking
+        input_tokens = metadata["input_tokens"]
+        output_tokens = metadata["output_tokens"]
+        if reservation is not None:
+            reservation.settle(input_tokens + output_tokens)
+        total_requests = self._add_usage(input_tokens, output_tokens)
+        self.metrics.record_success(
+            call_site, time.monotonic() - start, input_tokens, output_tokens
+        )
 
-            if top_p is not None:
-                params[GenParams.TOP_P] = top_p
+        logger.info(
+            f"Generated {output_tokens} tokens for {call_site} (input: {input_tokens}, "
+            f"total requests: {total_requests})"
+        )
 
-            if top_k is not None:
-                params[GenParams.TOP_K] = top_k
+        return {
+            "text": metadata["text"],
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "estimated_input_tokens": estimated_input_tokens,
+            "stop_reason": metadata["stop_reason"],
+            "model_id": metadata.get("model_id", self.model_id),
+        }
 
-            if repetition_penalty is not None:
-                params[GenParams.REPETITION_PENALTY] = repetition_penalty
+    async def agenerate(self, prompt: str, **kwargs) -> Dict[str, Any]:
+        """
+        Generate text without blocking the event loop.
 
-            if stop_sequences:
-                params[GenParams.STOP_SEQUENCES] = stop_sequences
+        The call runs on one of the client's worker threads, in the caller's
+        context (so it is charged to the current tenant).
 
-            if return_options:
-                params[GenParams.RETURN_OPTIONS] = return_options
-            else:
-                # Default return options
-                params[GenParams.RETURN_OPTIONS] = {
-                    "input_text": False,
-                    "generated_tokens": True,
-                    "input_tokens": True,
-                    "token_logprobs": False,
-                    "token_ranks": False,
-                    "top_n_tokens": False,
-                }
+        Args:
+            prompt: Input prompt text
+            **kwargs: Generation parameters (same as generate)
 
-            # Create model inference
-            model = ModelInference(
-                model_id=self.model_id,
-                api_client=self.api_client,
-                params=params,
-                project_id=self.project_id,
-            )
+        Returns:
+            Generation result dict (same as generate)
+        """
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            self._call_executor, lambda: context.run(self.generate, prompt, **kwargs)
+        )
+
+    def _reserve(
+        self, estimated_input_tokens: int, params: Dict[str, Any]
+    ) -> Optional[TenantReservation]:
+        """
+        Reserve the current tenant's quota and wait for its fair share of capacity.
+
+        Args:
+            estimated_input_tokens: Local estimate of the prompt tokens
+            params: Generation parameters
+
+        Returns:
+            Reservation to settle and release, or None when scheduling is disabled
+
+        Raises:
+            QuotaExceededError: If the tenant is over quota
+        """
+        if self.scheduler is None:
+            return None
 
-            # Generate
-            result = model.generate_text(prompt=prompt)
-
-            # Extract metadata if available
-            metadata = {}
-            if hasattr(model, "get_details") and callable(model.get_details):
-                try:
-                    details = model.get_details()
-                    if details and "results" in details:
-                        result_details = details["results"][0] if details["results"] else {}
-                        metadata = {
-                            "input_tokens": result_details.get("input_token_count", 0),
-                            "output_tokens": result_details.get("generated_token_count", 0),
-                            "stop_reason": result_details.get("stop_reason", "unknown"),
-                        }
-                except Exception as e:
-                    logger.warning(f"Could not extract metadata: {e}")
-
-            # Update token tracking
-            input_tokens = metadata.get("input_tokens", 0)
-            output_tokens = metadata.get("output_tokens", 0)
+        # Reserve the worst case; settled with the actual usage afterwards
+        estimated_tokens = estimated_input_tokens + params.get(GenParams.MAX_NEW_TOKENS, 0)
+        return self.scheduler.acquire(get_current_tenant(), estimated_tokens)
 
+    def _add_usage(self, input_tokens: int, output_tokens: int) -> int:
+        """
+        Add a call to the client token totals.
+
+        Args:
+            input_tokens: Input tokens used
+            output_tokens: Output tokens generated
+
+        Returns:
+            Total requests made by this client
+        """
+        with self._usage_lock:
             self.total_input_tokens += input_tokens
             self.total_output_tokens += output_tokens
             self.total_requests += 1
+            return self.total_requests
+
+    def generate_stream(
+        self, prompt: str, call_site: str = DEFAULT_CALL_SITE, **kwargs
+    ) -> Iterator[str]:
+        """
+        Generate text, yielding chunks as they arrive.
+
+        Retries apply until the first chunk is received; errors after that are
+        raised to the caller. Token usage is tracked once the stream ends.
+
+        Args:
+            prompt: Input prompt text
+            call_site: Tag of the calling code path for usage metrics
+            **kwargs: Generation parameters (same as generate)
+
+        Yields:
+            Generated text chunks
+        """
+        params, estimated_input_tokens = self._build_params(prompt, **kwargs)
+
+        start = time.monotonic()
+        reservation = None
+        try:
+            reservation = self._reserve(estimated_input_tokens, params)
+            first_event, events = self._retry_operation(self._open_stream, prompt, params)
+        except Exception as e:
+            if reservation is not None:
+                reservation.release()
+            self.metrics.record_error(call_site, time.monotonic() - start, e)
+            raise
+
+        input_tokens = 0
+        output_tokens = 0
+        stop_reason = "unknown"
+        error: Optional[Exception] = None
+
+        try:
+            event = first_event
+            while event is not None:
+                result_details = (event.get("results") or [{}])[0]
+                input_tokens = max(input_tokens, result_details.get("input_token_count", 0))
+                output_tokens = max(output_tokens, result_details.get("generated_token_count", 0))
+                stop_reason = result_details.get("stop_reason", stop_reason)
+
+                chunk = result_details.get("generated_text", "")
+                if chunk:
+                    yield chunk
+
+                event = next(events, None)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            events.close()
+            if reservation is not None:
+                reservation.settle(input_tokens + output_tokens)
+                reservation.release()
+
+            # Update token tracking (tokens streamed before an error were still spent)
+            self._add_usage(input_tokens, output_tokens)
+            if error is not None:
+                self.metrics.record_error(call_site, time.monotonic() - start, error)
+            else:
+                self.metrics.record_success(
+                    call_site, time.monotonic() - start, input_tokens, output_tokens
+                )
 
             logger.info(
-                f"Generated {output_tokens} tokens (input: {input_tokens}, "
-                f"total requests: {self.total_requests})"
+                f"Streamed {output_tokens} tokens (input: {input_tokens}, "
+                f"estimated: {estimated_input_tokens}, stop reason: {stop_reason})"
             )
 
-            return {
-                "text": result,
-                "input_tokens": input_tokens,
-                "output_tokens": output_tokens,
-                "stop_reason": metadata.get("stop_reason", "unknown"),
-                "model_id": self.model_id,
-            }
+    def _open_stream(
+        self, prompt: str, params: Dict[str, Any]
+    ) -> Tuple[Optional[Dict[str, Any]], Iterator[Dict[str, Any]]]:
+        """
+        Open a generation stream and wait for its first event.
+
+        Args:
+            prompt: Prompt text
+            params: Generation parameters
+
+        Returns:
+            Tuple of (first event or None for an empty stream, remaining events)
+        """
+        model_id, probe = self._select_model()
+        start = time.monotonic()
+        try:
+            with self._breakers[model_id].guard():
+                events = iter(self.backend.generate_stream(model_id, prompt, params))
+                first_event = next(events, None)
+        except Exception:
+            self._record_model_call(model_id, probe, False, start)
+            raise
+
+        self._record_model_call(model_id, probe, True, start)
+        return first_event, events
+
+    async def agenerate_stream(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """
+        Generate text asynchronously, yielding chunks as they arrive.
+
+        The blocking stream runs on a worker thread so that the event loop is
+        never blocked while waiting for tokens.
+
+        Args:
+            prompt: Input prompt text
+            **kwargs: Generation parameters (same as generate)
+
+        Yields:
+            Generated text chunks
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stopped = threading.Event()
+        end_of_stream = object()
+
+        def produce():
+            try:
+                for chunk in self.generate_stream(prompt, **kwargs):
+                    if stopped.is_set():
+                        break
+                    loop.call_soon_threadsafe(queue.put_nowait, chunk)
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, _StreamError(e))
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, end_of_stream)
+
+        producer = loop.run_in_executor(
+            self._call_executor, contextvars.copy_context().run, produce
+        )
+
+        try:
+            while True:
+                item = await queue.get()
+                if item is end_of_stream:
+                    break
+                if isinstance(item, _StreamError):
+                    raise item.error
+                yield item
+        finally:
+            # Stop the producer early if the consumer stops iterating
+            stopped.set()
+
+        await producer
+
+    def _send(self, prompt: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send one prompt, batched with concurrent compatible requests when enabled.
+
+        Args:
+            prompt: Prompt text
+            params: Generation parameters
+
+        Returns:
+            Generation result for the prompt
+        """
+        if self._batcher is not None:
+            return self._batcher.submit(prompt, params)
+        return self._retry_operation(self._generate_batch, [prompt], params)[0]
+
+    def _generate_batch(self, prompts: List[str], params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Generate text for several prompts in one multi-prompt backend call.
+
+        Args:
+            prompts: Prompt texts sharing the same parameters
+            params: Generation parameters
+
+        Returns:
+            List of dicts with 'text', 'input_tokens', 'output_tokens', 'stop_reason'
+            and the serving 'model_id', in the same order as prompts
+        """
+        model_id, probe = self._select_model()
+        start = time.monotonic()
+        try:
+            with self._breakers[model_id].guard():
+                results = self.backend.generate(model_id, prompts, params)
+        except Exception:
+            self._record_model_call(model_id, probe, False, start)
+            raise
 
-        return self._retry_operation(_generate)
+        self._record_model_call(model_id, probe, True, start)
+        return [{**result, "model_id": model_id} for result in results]
+
+    def _select_model(self) -> Tuple[str, bool]:
+        """
+        Choose the model for the next call.
+
+        Returns:
+            Tuple of (model ID, whether the call probes a failed-over primary)
+        """
+        if self._failover is None:
+            return self.model_id, False
+        return self._failover.select_model()
+
+    def _record_model_call(self, model_id: str, probe: bool, success: bool, start: float):
+        """
+        Record a call outcome in the model health used for failover.
+
+        Args:
+            model_id: Model that served the call
+            probe: Whether the call was handed out as a probe
+            success: Whether the call succeeded
+            start: Monotonic time the call started
+        """
+        if self._failover is not None:
+            self._failover.record(model_id, success, time.monotonic() - start, probe=probe)
 
     def generate_with_system_prompt(
         self, system_prompt: str, user_prompt: str, **kwargs
@@ -280,24 +1003,71 @@ class WatsonxClient:
                 'estimated_cost_usd': float  # Based on $0.0001 per 1000 tokens
             }
         """
-        total_tokens = self.total_input_tokens + self.total_output_tokens
+        with self._usage_lock:
+            total_input_tokens = self.total_input_tokens
+            total_output_tokens = self.total_output_tokens
+            total_requests = self.total_requests
+        total_tokens = total_input_tokens + total_output_tokens
 
         # Calculate estimated cost (1000 tokens = 1 RU = $0.0001 USD)
         estimated_cost = (total_tokens / 1000) * 0.0001
 
         return {
-            "total_input_tokens": self.total_input_tokens,
-            "total_output_tokens": self.total_output_tokens,
+            "total_input_tokens": total_input_tokens,
+            "total_output_tokens": total_output_tokens,
             "total_tokens": total_tokens,
-            "total_requests": self.total_requests,
+            "total_requests": total_requests,
             "estimated_cost_usd": round(estimated_cost, 6),
         }
 
+    def get_batch_stats(self) -> Dict[str, Any]:
+        """
+        Get micro-batching statistics.
+
+        Returns:
+            Dict with batching configuration and counts
+        """
+        if self._batcher is None:
+            return {"enabled": False}
+        return self._batcher.get_stats()
+
+    def get_failover_stats(self) -> Dict[str, Any]:
+        """
+        Get model failover state and per-model health.
+
+        Returns:
+            Dict with the active model and failover counts
+        """
+        if self._failover is None:
+            return {"enabled": False, "active_model_id": self.model_id}
+        return self._failover.get_stats()
+
+    def get_hedge_stats(self) -> Dict[str, Any]:
+        """
+        Get request hedging statistics.
+
+        Returns:
+            Dict with hedge rate and wins
+        """
+        if self._hedger is None:
+            return {"enabled": False}
+        return self._hedger.get_stats()
+
+    def get_usage_metrics(self) -> Dict[str, Any]:
+        """
+        Get usage, latency and error metrics per call site.
+
+        Returns:
+            Dict with 'call_sites' and 'totals'
+        """
+        return self.metrics.snapshot()
+
     def reset_token_usage(self):
         """Reset token usage counters."""
-        self.total_input_tokens = 0
-        self.total_output_tokens = 0
-        self.total_requests = 0
+        with self._usage_lock:
+            self.total_input_tokens = 0
+            self.total_output_tokens = 0
+            self.total_requests = 0
         logger.info("Token usage counters reset")
 
     def health_check(self) -> Dict[str, Any]:
@@ -307,20 +1077,59 @@ class WatsonxClient:
         Returns:
             Dict with health status
         """
+        if self.backend.name != "watsonx":
+            # Simulated backends make no network calls
+            return {**self.backend.health_check(), "model_id": self.model_id}
+
         try:
             # Try a simple generation
-            result = self.generate(prompt="Test", max_tokens=5, temperature=0.0)
+            result = self.generate(
+                prompt="Test", max_tokens=5, temperature=0.0, call_site="health_check"
+            )
 
             return {
                 "status": "healthy",
                 "model_id": self.model_id,
                 "project_id": self.project_id,
+                "backend": self.backend.name,
+                "active_model_id": result["model_id"],
+                "failover": self.get_failover_stats(),
+                "circuit_breaker": self.breaker.get_stats(),
                 "test_generation": result["text"][:50],
                 "token_usage": self.get_token_usage(),
             }
         except Exception as e:
             return {"status": "unhealthy", "error": str(e)}
 
+    def probe(self) -> Dict[str, Any]:
+        """
+        Check watsonx.ai is reachable without running a generation.
+
+        Reads the model's details, a metadata request that is not billed, so
+        it can run on a schedule (unlike health_check).
+
+        Returns:
+            Dict with health status
+        """
+        backend = getattr(self.backend, "inner", self.backend)
+        if not isinstance(backend, WatsonxBackend):
+            # Simulated backends make no network calls
+            return {**self.backend.health_check(), "model_id": self.model_id}
+
+        try:
+            details = backend.get_model(self.model_id).get_details()
+            return {
+                "status": "healthy",
+                "model_id": self.model_id,
+                "project_id": self.project_id,
+                "backend": backend.name,
+                "model_label": details.get("label"),
+                "failover": self.get_failover_stats(),
+                "circuit_breaker": self.breaker.get_stats(),
+            }
+        except Exception as e:
+            return {"status": "unhealthy", "error": str(e)}
+
 
 # ============================================================================
 # Singleton instance
@@ -340,3 +1149,16 @@ def get_watsonx_client() -> WatsonxClient:
     if _watsonx_client is None:
         _watsonx_client = WatsonxClient()
     return _watsonx_client
+
+
+def get_hedging_stats() -> Dict[str, Any]:
+    """
+    Get hedging and micro-batching statistics of the singleton client, without creating it.
+
+    Returns:
+        Dict with 'hedging' and 'batching' stats (both disabled until the client exists)
+    """
+    client = _watsonx_client
+    if client is None:
+        return {"hedging": {"enabled": False}, "batching": {"enabled": False}}
+    return {"hedging": client.get_hedge_stats(), "batching": client.get_batch_stats()}
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Migrate Cloudant Databases to Partitioned Copies
+IBM Dev Day AI Demystified Hackathon 2026
+Team: AI Kings 👑
+
+A database cannot be partitioned after it is created, so this script copies
+golden_clauses and historical_decisions into new partitioned databases
+(named with a suffix, "_partitioned" by default):
+- historical decisions get "<partition>:<id>" document IDs
+- Golden Clauses are copied once into the partition of each contract type
+
+Partition keys follow CLOUDANT_PARTITION_KEY ("contract_type" or
+"contract_type_jurisdiction"). Re-running the script skips documents that were
+already copied. The source databases are left untouched.
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+from dotenv import load_dotenv
+from ibmcloudant.cloudant_v1 import CloudantV1
+from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.cloudant_client import CloudantPartitioning  # noqa: E402
+
+# Load environment variables
+load_dotenv()
+
+
+class PartitionedMigration:
+    """Copy LexConductor databases into partitioned databases"""
+
+    def __init__(self, suffix: str = "_partitioned", batch_size: int = 500):
+        """Initialize Cloudant client"""
+        self.cloudant_url = os.getenv("CLOUDANT_URL")
+        self.cloudant_api_key = os.getenv("CLOUDANT_API_KEY")
+        self.suffix = suffix
+        self.batch_size = batch_size
+
+        if not self.cloudant_url or not self.cloudant_api_key:
+            raise ValueError(
+                "Missing Cloudant credentials. Please set CLOUDANT_URL and CLOUDANT_API_KEY "
+                "in your .env file"
+            )
+
+        # Initialize client
+        authenticator = IAMAuthenticator(self.cloudant_api_key)
+        self.client = CloudantV1(authenticator=authenticator)
+        self.client.set_service_url(self.cloudant_url)
+        self.partitioning = CloudantPartitioning(enabled=True)
+
+        print(f"✓ Connected to Cloudant: {self.cloudant_url}")
+        print(f"✓ Partitioned by: {self.partitioning.scheme}")
+
+    def create_partitioned_database(self, db_name: str) -> bool:
+        """Create the target database as a partitioned database if it doesn't exist"""
+        try:
+            db_info = self.client.get_database_information(db=db_name).get_result()
+        except Exception:
+            self.client.put_database(db=db_name, partitioned=True)
+            print(f"✓ Created partitioned database: {db_name}")
+            return True
+
+        if not (db_info.get("props") or {}).get("partitioned"):
+            raise ValueError(f"Target database '{db_name}' exists and is not partitioned")
+        print(f"  Partitioned database '{db_name}' already exists")
+        return False
+
+    def iter_documents(self, db_name: str) -> Iterator[List[Dict]]:
+        """Read all documents of a database in batches (design documents excluded)"""
+        start_key: Optional[str] = None
+        while True:
+            # One extra row gives the start key of the next batch
+            result = self.client.post_all_docs(
+                db=db_name,
+                include_docs=True,
+                limit=self.batch_size + 1,
+                start_key=start_key,
+            ).get_result()
+            rows = result.get("rows", [])
+
+            batch = rows[: self.batch_size]
+            docs = [
+                row["doc"]
+                for row in batch
+                if row.get("doc") and not row["id"].startswith("_design/")
+            ]
+            if docs:
+                yield docs
+
+            if len(rows) <= self.batch_size:
+                return
+            start_key = rows[-1]["id"]
+
+    def copy_database(
+        self,
+        source: str,
+        target: str,
+        transform: Callable[[Dict], List[Dict]],
+    ) -> Dict[str, int]:
+        """Copy documents from source to target, transformed to partitioned documents"""
+        print(f"\n📦 Copying {source} → {target}...")
+        self.create_partitioned_database(target)
+
+        counts = {"read": 0, "written": 0, "skipped": 0, "failed": 0}
+        for docs in self.iter_documents(source):
+            counts["read"] += len(docs)
+
+            new_docs = []
+            for doc in docs:
+                doc = {key: value for key, value in doc.items() if key != "_rev"}
+                new_docs.extend(transform(doc))
+
+            results = self.client.post_bulk_docs(
+                db=target, bulk_docs={"docs": new_docs}
+            ).get_result()
+
+            for result in results:
+                if not result.get("error"):
+                    counts["written"] += 1
+                elif result["error"] == "conflict":
+                    # Already copied by an earlier run
+                    counts["skipped"] += 1
+                else:
+                    counts["failed"] += 1
+                    print(f"✗ {result.get('id')}: {result['error']} {result.get('reason', '')}")
+
+            print(f"  {counts['read']} documents read, {counts['written']} written")
+
+        print(
+            f"✓ {source}: {counts['read']} documents → {counts['written']} written, "
+            f"{counts['skipped']} already present, {counts['failed']} failed"
+        )
+        return counts
+
+    def run_migration(self) -> bool:
+        """Copy the Golden Clause and historical decision databases"""
+        print("=" * 70)
+        print("LexConductor - Cloudant Partitioned Migration")
+        print("IBM Dev Day AI Demystified Hackathon 2026")
+        print("=" * 70)
+
+        golden_clauses = os.getenv("CLOUDANT_DB_GOLDEN_CLAUSES", "golden_clauses")
+        historical_decisions = os.getenv("CLOUDANT_DB_HISTORICAL_DECISIONS", "historical_decisions")
+
+        try:
+            results = [
+                self.copy_database(
+                    golden_clauses,
+                    golden_clauses + self.suffix,
+                    self.partitioning.golden_clause_documents,
+                ),
+                self.copy_database(
+                    historical_decisions,
+                    historical_decisions + self.suffix,
+                    lambda doc: [self.partitioning.precedent_document(doc)],
+                ),
+            ]
+        except Exception as e:
+            print(f"\n✗ Migration failed: {e}")
+            return False
+
+        if any(counts["failed"] for counts in results):
+            print("\n⚠️  Some documents failed to copy. Fix them and run the script again.")
+            return False
+
+        print("\n" + "=" * 70)
+        print("✅ Partitioned copies are ready!")
+        print("=" * 70)
+        print("\nNext steps:")
+        print("1. Set in your .env:")
+        print(f"   CLOUDANT_DB_GOLDEN_CLAUSES={golden_clauses + self.suffix}")
+        print(f"   CLOUDANT_DB_HISTORICAL_DECISIONS={historical_decisions + self.suffix}")
+        print("   CLOUDANT_PARTITIONED=true")
+        print(f"   CLOUDANT_PARTITION_KEY={self.partitioning.scheme}")
+        print("2. Run: python scripts/setup_cloudant_databases.py (creates the indexes)")
+        print("3. Restart the backend")
+        print("=" * 70)
+        return True
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Copy Cloudant databases to partitioned copies")
+    parser.add_argument(
+        "--suffix", default="_partitioned", help="Suffix of the partitioned database names"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=500, help="Documents read and written per request"
+    )
+    args = parser.parse_args()
+
+    try:
+        migration = PartitionedMigration(suffix=args.suffix, batch_size=args.batch_size)
+        success = migration.run_migration()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"\n✗ Fatal error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,12 +10,18 @@ for common contract types (NDA, MSA, Service Agreement).
 
 import os
 import sys
+from pathlib import Path
 from datetime import datetime
 from typing import List, Dict
 from dotenv import load_dotenv
 from ibmcloudant.cloudant_v1 import CloudantV1, Document
 from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
 
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.cloudant_client import CloudantClient, CloudantPartitioning  # noqa: E402
+
 # Load environment variables
 load_dotenv()
 
@@ -38,6 +44,8 @@ class GoldenClausesPopulator:
         authenticator = IAMAuthenticator(self.cloudant_api_key)
         self.client = CloudantV1(authenticator=authenticator)
         self.client.set_service_url(self.cloudant_url)
+        self.partitioning = CloudantPartitioning()
+        self.documents = CloudantClient(url=self.cloudant_url, api_key=self.cloudant_api_key)
 
         print(f"✓ Connected to Cloudant: {self.cloudant_url}")
         print(f"✓ Target database: {self.db_name}")
@@ -261,20 +269,29 @@ class GoldenClausesPopulator:
         """Populate Golden Clauses in Cloudant"""
         print(f"\n📚 Populating Golden Clauses in '{self.db_name}'...")
 
-        clauses = self.get_golden_clauses()
+        # One copy per contract type when the database is partitioned
+        clauses = [
+            document
+            for clause in self.get_golden_clauses()
+            for document in self.partitioning.golden_clause_documents(clause)
+        ]
         success_count = 0
         error_count = 0
 
+        # Check which clauses already exist in one _all_docs request
+        try:
+            existing = self.documents.get_documents_by_ids(
+                self.db_name, [clause["_id"] for clause in clauses]
+            )
+        except Exception as e:
+            print(f"✗ Failed to check existing clauses: {e}")
+            return False
+
         for clause in clauses:
             try:
-                # Check if clause already exists
-                try:
-                    self.client.get_document(db=self.db_name, doc_id=clause["_id"])
+                if existing.get(clause["_id"]) is not None:
                     print(f"  Clause '{clause['clause_id']}' already exists, skipping...")
                     continue
-                except Exception:
-                    # Clause doesn't exist, create it
-                    pass
 
                 # Create document
                 document = Document(**clause)
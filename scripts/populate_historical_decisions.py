@@ -10,12 +10,18 @@ historical decisions for common scenarios (NDA, MSA, Service Agreement).
 
 import os
 import sys
+from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict
 from dotenv import load_dotenv
 from ibmcloudant.cloudant_v1 import CloudantV1, Document
 from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
 
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.cloudant_client import CloudantClient, CloudantPartitioning  # noqa: E402
+
 # Load environment variables
 load_dotenv()
 
@@ -38,6 +44,8 @@ class HistoricalDecisionsPopulator:
         authenticator = IAMAuthenticator(self.cloudant_api_key)
         self.client = CloudantV1(authenticator=authenticator)
         self.client.set_service_url(self.cloudant_url)
+        self.partitioning = CloudantPartitioning()
+        self.documents = CloudantClient(url=self.cloudant_url, api_key=self.cloudant_api_key)
 
         print(f"✓ Connected to Cloudant: {self.cloudant_url}")
         print(f"✓ Target database: {self.db_name}")
@@ -243,19 +251,28 @@ class HistoricalDecisionsPopulator:
         """Populate historical decisions in Cloudant"""
         print(f"\n📜 Populating historical decisions in '{self.db_name}'...")
 
-        decisions = self.get_historical_decisions()
+        # Partitioned document IDs when the database is partitioned
+        decisions = [
+            self.partitioning.precedent_document(decision)
+            for decision in self.get_historical_decisions()
+        ]
         success_count = 0
         error_count = 0
 
+        # Check which decisions already exist in one _all_docs request
+        try:
+            existing = self.documents.get_documents_by_ids(
+                self.db_name, [decision["_id"] for decision in decisions]
+            )
+        except Exception as e:
+            print(f"✗ Failed to check existing decisions: {e}")
+            return False
+
         for decision in decisions:
             try:
-                # Check if decision already exists
-                try:
-                    self.client.get_document(db=self.db_name, doc_id=decision["_id"])
+                if existing.get(decision["_id"]) is not None:
                     print(f"  Decision '{decision['decision_id']}' already exists, skipping...")
                     continue
-                except Exception:
-                    pass
 
                 # Create document
                 document = Document(**decision)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Reconcile Cloudant Indexes
+IBM Dev Day AI Demystified Hackathon 2026
+Team: AI Kings 👑
+
+Creates the indexes of the declarative spec in backend/cloudant_indexes.py
+that are missing from the databases, then asks Cloudant (_explain) which
+index each query uses and reports queries that fall back to a full scan.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.cloudant_client import CloudantClient  # noqa: E402
+from backend.cloudant_indexes import (  # noqa: E402
+    QUERY_SPECS,
+    QueryPlanError,
+    reconcile_indexes,
+    verify_query_plans,
+)
+
+# Load environment variables
+load_dotenv()
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Create missing Cloudant indexes")
+    parser.add_argument("--dry-run", action="store_true", help="Only list the missing indexes")
+    parser.add_argument(
+        "--skip-verify", action="store_true", help="Do not check query plans with _explain"
+    )
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("LexConductor - Cloudant Index Reconciliation")
+    print("=" * 70)
+
+    try:
+        client = CloudantClient()
+
+        created = reconcile_indexes(client, dry_run=args.dry_run)
+        verb = "Missing" if args.dry_run else "Created"
+        for name in created:
+            print(f"✓ {verb} index: {name}")
+        if not created:
+            print("  All indexes already exist")
+
+        if args.skip_verify or args.dry_run:
+            sys.exit(0)
+
+        print("\n🔍 Verifying query plans...")
+        plans = verify_query_plans(client, strict=True)
+        for query in QUERY_SPECS:
+            plan = plans[query.name]
+            if plan["full_scan"]:
+                print(f"  {query.name}: full scan ({query.scan_reason})")
+            else:
+                print(f"✓ {query.name}: {plan['ddoc']}/{plan['index']}")
+
+        print("\n✅ Every query is served by an index")
+        sys.exit(0)
+    except QueryPlanError as e:
+        print(f"\n✗ {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ Fatal error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,16 +8,28 @@ This script creates the required Cloudant databases and indexes for LexConductor
 - golden_clauses database with contract_type index
 - historical_decisions database with decision_id index
 - regulatory_mappings database with jurisdiction index
+- composite indexes of the query spec in backend/cloudant_indexes.py
+
+Set CLOUDANT_PARTITIONED=true to create golden_clauses and historical_decisions
+as partitioned databases (partition key from CLOUDANT_PARTITION_KEY); existing
+databases are moved to partitioned copies by scripts/migrate_to_partitioned.py.
 """
 
 import os
 import sys
 import time
-from typing import List
+from pathlib import Path
+from typing import List, Optional
 from dotenv import load_dotenv
 from ibmcloudant.cloudant_v1 import CloudantV1
 from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
 
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.cloudant_client import CloudantClient  # noqa: E402
+from backend.cloudant_indexes import reconcile_indexes  # noqa: E402
+
 # Load environment variables
 load_dotenv()
 
@@ -30,6 +42,7 @@ class CloudantDatabaseSetup:
         # Get credentials from environment
         self.cloudant_url = os.getenv("CLOUDANT_URL")
         self.cloudant_api_key = os.getenv("CLOUDANT_API_KEY")
+        self.partitioned = os.getenv("CLOUDANT_PARTITIONED", "false").lower() == "true"
 
         if not self.cloudant_url or not self.cloudant_api_key:
             raise ValueError(
@@ -43,26 +56,43 @@ class CloudantDatabaseSetup:
         self.client.set_service_url(self.cloudant_url)
 
         print(f"✓ Connected to Cloudant: {self.cloudant_url}")
+        if self.partitioned:
+            print(f"✓ Partitioned by: {os.getenv('CLOUDANT_PARTITION_KEY', 'contract_type')}")
 
-    def create_database(self, db_name: str) -> bool:
-        """Create a database if it doesn't exist"""
+    def create_database(self, db_name: str, partitioned: bool = False) -> bool:
+        """Create a database if it doesn't exist (optionally partitioned)"""
         try:
             # Check if database exists
-            self.client.get_database_information(db=db_name)
-            print(f"  Database '{db_name}' already exists")
-            return False
+            db_info = self.client.get_database_information(db=db_name).get_result()
         except Exception:
             # Database doesn't exist, create it
             try:
-                self.client.put_database(db=db_name)
-                print(f"✓ Created database: {db_name}")
+                self.client.put_database(db=db_name, partitioned=partitioned or None)
+                kind = "partitioned database" if partitioned else "database"
+                print(f"✓ Created {kind}: {db_name}")
                 return True
             except Exception as e:
                 print(f"✗ Failed to create database '{db_name}': {e}")
                 raise
 
-    def create_index(self, db_name: str, index_name: str, fields: List[str]) -> bool:
-        """Create an index on specified fields"""
+        print(f"  Database '{db_name}' already exists")
+        is_partitioned = bool((db_info.get("props") or {}).get("partitioned"))
+        if partitioned and not is_partitioned:
+            # A database cannot be partitioned after creation
+            print(
+                f"  ⚠️  '{db_name}' is not partitioned. Copy it with "
+                "scripts/migrate_to_partitioned.py and point the app at the copy"
+            )
+        return False
+
+    def create_index(
+        self,
+        db_name: str,
+        index_name: str,
+        fields: List[str],
+        partitioned: Optional[bool] = None,
+    ) -> bool:
+        """Create an index on specified fields (partitioned=False for a global index)"""
         try:
             index_definition = {
                 "index": {"fields": fields},
@@ -74,6 +104,7 @@ class CloudantDatabaseSetup:
                 db=db_name,
                 index=index_definition["index"],
                 name=index_name,
+                partitioned=partitioned,
                 type=index_definition["type"],
             )
             print(f"✓ Created index '{index_name}' on {fields} in database '{db_name}'")
@@ -96,15 +127,21 @@ class CloudantDatabaseSetup:
         print(f"\n📚 Setting up {db_name} database...")
 
         # Create database
-        self.create_database(db_name)
+        self.create_database(db_name, partitioned=self.partitioned)
 
-        # Create indexes
+        # Create indexes (partition-scoped on a partitioned database)
         self.create_index(db_name, "idx_contract_type", ["contract_types"])
         self.create_index(db_name, "idx_clause_type", ["type"])
         self.create_index(db_name, "idx_jurisdiction", ["jurisdiction"])
         self.create_index(db_name, "idx_mandatory", ["mandatory"])
         self.create_index(db_name, "idx_risk_level", ["risk_level"])
 
+        if self.partitioned:
+            # Global index for queries that do not name a partition
+            self.create_index(
+                db_name, "idx_contract_type_global", ["contract_types"], partitioned=False
+            )
+
         print(f"✓ {db_name} database setup complete")
 
     def setup_historical_decisions_db(self):
@@ -113,15 +150,22 @@ class CloudantDatabaseSetup:
         print(f"\n📜 Setting up {db_name} database...")
 
         # Create database
-        self.create_database(db_name)
+        self.create_database(db_name, partitioned=self.partitioned)
 
-        # Create indexes
+        # Create indexes (partition-scoped on a partitioned database)
         self.create_index(db_name, "idx_decision_id", ["decision_id"])
         self.create_index(db_name, "idx_contract_type", ["contract_type"])
         self.create_index(db_name, "idx_jurisdiction", ["jurisdiction"])
         self.create_index(db_name, "idx_date", ["date"])
         self.create_index(db_name, "idx_confidence", ["confidence"])
 
+        if self.partitioned:
+            # Global indexes for queries that do not name a partition
+            self.create_index(
+                db_name, "idx_contract_type_global", ["contract_type"], partitioned=False
+            )
+            self.create_index(db_name, "idx_confidence_global", ["confidence"], partitioned=False)
+
         print(f"✓ {db_name} database setup complete")
 
     def setup_regulatory_mappings_db(self):
@@ -139,6 +183,26 @@ class CloudantDatabaseSetup:
 
         print(f"✓ {db_name} database setup complete")
 
+    def reconcile_query_indexes(self):
+        """Create the composite indexes the application queries need"""
+        print("\n🗂️  Reconciling query indexes (backend/cloudant_indexes.py)...")
+        client = CloudantClient(url=self.cloudant_url, api_key=self.cloudant_api_key)
+        created = reconcile_indexes(client)
+        for name in created:
+            print(f"✓ Created index: {name}")
+        if not created:
+            print("  All query indexes already exist")
+
+    def sync_stats_views(self):
+        """Create or update the MapReduce views behind the statistics endpoint"""
+        print("\n📊 Syncing statistics views (backend/cloudant_views.py)...")
+        client = CloudantClient(url=self.cloudant_url, api_key=self.cloudant_api_key)
+        updated = client.sync_design_documents()
+        for db_name in updated:
+            print(f"✓ Updated views: {db_name}/_design/stats")
+        if not updated:
+            print("  All statistics views are up to date")
+
     def verify_setup(self):
         """Verify all databases and indexes are created"""
         print("\n🔍 Verifying database setup...")
@@ -180,6 +244,8 @@ class CloudantDatabaseSetup:
             self.setup_golden_clauses_db()
             self.setup_historical_decisions_db()
             self.setup_regulatory_mappings_db()
+            self.reconcile_query_indexes()
+            self.sync_stats_views()
 
             # Verify setup
             self.verify_setup()
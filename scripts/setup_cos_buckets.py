@@ -13,6 +13,7 @@ This script:
 
 import os
 import sys
+from pathlib import Path
 from datetime import datetime
 from typing import List, Dict
 from dotenv import load_dotenv
@@ -21,6 +22,11 @@ from ibm_botocore.client import Config
 from ibmcloudant.cloudant_v1 import CloudantV1, Document
 from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
 
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.cloudant_client import CloudantClient  # noqa: E402
+
 # Load environment variables
 load_dotenv()
 
@@ -73,6 +79,7 @@ class COSBucketSetup:
         authenticator = IAMAuthenticator(self.cloudant_api_key)
         self.cloudant_client = CloudantV1(authenticator=authenticator)
         self.cloudant_client.set_service_url(self.cloudant_url)
+        self.documents = CloudantClient(url=self.cloudant_url, api_key=self.cloudant_api_key)
 
         print(f"✓ Connected to COS: {self.cos_endpoint}")
         print(f"✓ Connected to Cloudant: {self.cloudant_url}")
@@ -360,15 +367,20 @@ class COSBucketSetup:
         success_count = 0
         error_count = 0
 
+        # Check which mappings already exist in one _all_docs request
+        try:
+            existing = self.documents.get_documents_by_ids(
+                self.mappings_db, [mapping["_id"] for mapping in mappings]
+            )
+        except Exception as e:
+            print(f"✗ Failed to check existing mappings: {e}")
+            return False
+
         for mapping in mappings:
             try:
-                # Check if mapping already exists
-                try:
-                    self.cloudant_client.get_document(db=self.mappings_db, doc_id=mapping["_id"])
+                if existing.get(mapping["_id"]) is not None:
                     print(f"  Mapping '{mapping['regulation_id']}' already exists, skipping...")
                     continue
-                except Exception:
-                    pass
 
                 # Create document
                 document = Document(**mapping)
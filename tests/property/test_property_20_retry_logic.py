@@ -4,12 +4,14 @@ Feature: lex-conductor-implementation
 Validates: Requirements 9.5
 
 For any transient error, the retry logic should execute up to max_retries times
-with exponential backoff delays between attempts.
+with full-jitter exponential backoff delays between attempts.
 """
 
+import httpx
 import pytest
 from hypothesis import given, strategies as st, settings
 from unittest.mock import Mock, patch
+from ibm_cloud_sdk_core import ApiException
 from backend.cloudant_client import CloudantClient
 from backend.cos_client import COSClient
 from backend.watsonx_client import WatsonxClient
@@ -67,7 +69,7 @@ class TestProperty20RetryLogic:
     @settings(max_examples=10, deadline=10000)
     def test_cloudant_retry_uses_exponential_backoff(self, max_retries, retry_delay):
         """
-        Property: Retry delays follow exponential backoff pattern
+        Property: Retry delays are jittered below an exponentially growing ceiling
         """
         # Track sleep calls
         sleep_calls = []
@@ -99,15 +101,14 @@ class TestProperty20RetryLogic:
                         len(sleep_calls) == max_retries - 1
                     ), f"Should have {max_retries - 1} sleep calls, got {len(sleep_calls)}"
 
-                    # Verify each delay is approximately 2x the previous
+                    # Verify each delay is within the doubling full-jitter ceiling
                     for i in range(len(sleep_calls)):
-                        expected_delay = retry_delay * (2**i)
+                        ceiling = retry_delay * (2**i)
                         actual_delay = sleep_calls[i]
 
-                        # Allow small floating point error
                         assert (
-                            abs(actual_delay - expected_delay) < 0.01
-                        ), f"Sleep {i} should be ~{expected_delay}s, was {actual_delay}s"
+                            0 <= actual_delay <= ceiling
+                        ), f"Sleep {i} should be within [0, {ceiling}]s, was {actual_delay}s"
 
     def test_cloudant_retry_succeeds_on_second_attempt(self):
         """
@@ -137,8 +138,8 @@ class TestProperty20RetryLogic:
         """
         Test that certain errors are not retried
         """
-        # Create mock that raises "not found" error (should not retry)
-        mock_operation = Mock(side_effect=Exception("not found"))
+        # Create mock that raises a 404 (should not retry)
+        mock_operation = Mock(side_effect=ApiException(404, message="not found"))
 
         with patch.dict(
             "os.environ",
@@ -221,7 +222,12 @@ class TestProperty20RetryLogic:
         Test that authentication errors are not retried
         """
         # Create mock that raises auth error (should not retry)
-        mock_operation = Mock(side_effect=Exception("unauthorized"))
+        request = httpx.Request("POST", "https://us-south.ml.cloud.ibm.com/ml/v1/text/generation")
+        mock_operation = Mock(
+            side_effect=httpx.HTTPStatusError(
+                "unauthorized", request=request, response=httpx.Response(401, request=request)
+            )
+        )
 
         with patch.dict(
             "os.environ",
@@ -297,7 +303,7 @@ class TestRetryLogicIntegration:
 
     def test_exponential_backoff_timing(self):
         """
-        Test that exponential backoff timing is correct
+        Test that backoff ceilings double between attempts
         """
         sleep_calls = []
 
@@ -320,8 +326,8 @@ class TestRetryLogicIntegration:
                     with pytest.raises(Exception):
                         client._retry_operation(mock_operation)
 
-                    # Verify delays: 1.0, 2.0, 4.0 (no sleep after 4th attempt)
+                    # Verify delay ceilings: 1.0, 2.0, 4.0 (no sleep after 4th attempt)
                     assert len(sleep_calls) == 3
-                    assert abs(sleep_calls[0] - 1.0) < 0.01
-                    assert abs(sleep_calls[1] - 2.0) < 0.01
-                    assert abs(sleep_calls[2] - 4.0) < 0.01
+                    assert 0 <= sleep_calls[0] <= 1.0
+                    assert 0 <= sleep_calls[1] <= 2.0
+                    assert 0 <= sleep_calls[2] <= 4.0
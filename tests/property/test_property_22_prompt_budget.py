@@ -0,0 +1,111 @@
+"""
+Property Test 22: Prompt Token Budgeting
+Feature: lex-conductor-performance
+
+For any prompt sections and token budget, the budgeted prompt should fit the
+budget whenever the fixed instructions do, trimming lower priority sections first.
+"""
+
+from hypothesis import given, strategies as st, settings
+
+from backend.prompt_budget import (
+    TRUNCATION_MARKER,
+    PromptBudget,
+    PromptSection,
+    TokenCounter,
+)
+
+TEMPLATE = """Compare this Golden Clause with the contract text.
+
+Golden Clause:
+{clause_text}
+
+Contract Text (excerpt):
+{contract_text}
+
+Format as JSON: {{"alignment": "...", "confidence": 0.0}}"""
+
+legal_text = st.text(
+    min_size=0,
+    max_size=2000,
+    alphabet=st.characters(whitelist_categories=("Lu", "Ll", "Nd", "P", "Zs")),
+)
+
+
+@given(text=legal_text, max_tokens=st.integers(min_value=0, max_value=200))
+@settings(max_examples=100, deadline=None)
+def test_truncate_returns_prefix_within_budget(text, max_tokens):
+    """
+    Property: Truncation returns a prefix of the text with at most max_tokens tokens
+    """
+    counter = TokenCounter()
+    truncated = counter.truncate(text, max_tokens)
+
+    assert text.startswith(truncated)
+    assert counter.count(truncated) <= max_tokens
+
+
+@given(
+    clause_text=legal_text,
+    contract_text=legal_text,
+    max_input_tokens=st.integers(min_value=60, max_value=600),
+)
+@settings(max_examples=100, deadline=None)
+def test_budgeted_prompt_fits_budget(clause_text, contract_text, max_input_tokens):
+    """
+    Property: Budgeted prompt never exceeds the token budget
+    """
+    budget = PromptBudget(TokenCounter())
+    prompt = budget.fit(
+        TEMPLATE,
+        [
+            PromptSection("clause_text", clause_text, priority=5),
+            PromptSection("contract_text", contract_text, priority=0),
+        ],
+        max_input_tokens,
+    )
+
+    assert prompt.estimated_input_tokens <= max_input_tokens
+    assert prompt.estimated_input_tokens == budget.counter.count(prompt.text)
+
+
+def test_lowest_priority_section_trimmed_first():
+    """
+    Test that the contract excerpt is trimmed before the Golden Clause
+    """
+    counter = TokenCounter()
+    clause_text = "The liability of either party shall not exceed the fees paid. " * 5
+    contract_text = "Supplier shall indemnify Customer against all claims. " * 200
+
+    prompt = PromptBudget(counter).fit(
+        TEMPLATE,
+        [
+            PromptSection("clause_text", clause_text, priority=5),
+            PromptSection("contract_text", contract_text, priority=0),
+        ],
+        max_input_tokens=300,
+    )
+
+    assert prompt.trimmed_sections == ["contract_text"]
+    assert clause_text in prompt.text
+    assert TRUNCATION_MARKER in prompt.text
+    assert prompt.estimated_input_tokens <= 300
+
+
+def test_prompt_within_budget_is_unchanged():
+    """
+    Test that prompts already within budget are rendered verbatim
+    """
+    prompt = PromptBudget(TokenCounter()).fit(
+        TEMPLATE,
+        [
+            PromptSection("clause_text", "Short clause."),
+            PromptSection("contract_text", "Short contract."),
+        ],
+        max_input_tokens=1000,
+    )
+
+    assert not prompt.was_trimmed
+    assert prompt.text == TEMPLATE.format(
+        clause_text="Short clause.", contract_text="Short contract."
+    )
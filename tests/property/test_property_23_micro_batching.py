@@ -0,0 +1,171 @@
+"""
+Property Test 23: Micro-Batching of Concurrent Prompts
+Feature: lex-conductor-performance
+
+For any set of concurrent generation requests with compatible parameters, the
+micro-batcher should send them in fewer requests and return each caller its
+own result.
+"""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+from hypothesis import given, strategies as st, settings
+
+from backend.watsonx_client import WatsonxClient
+
+
+def _make_client(batch_window_ms: float, batch_max_size: int) -> WatsonxClient:
+    """Create a client whose model calls are answered locally."""
+    with patch.dict(
+        "os.environ",
+        {"WATSONX_API_KEY": "test_key", "WATSONX_PROJECT_ID": "test_project"},
+    ):
+        with patch("backend.watsonx_client.APIClient"):
+            client = WatsonxClient(batch_window_ms=batch_window_ms, batch_max_size=batch_max_size)
+
+    sent_batches = []
+
+    def fake_generate_batch(prompts, params):
+        sent_batches.append(list(prompts))
+        return [
+            {
+                "text": f"echo: {prompt}",
+                "input_tokens": len(prompt),
+                "output_tokens": 3,
+                "stop_reason": "eos_token",
+            }
+            for prompt in prompts
+        ]
+
+    client._generate_batch = fake_generate_batch
+    client.sent_batches = sent_batches
+    return client
+
+
+def _generate_concurrently(client: WatsonxClient, prompts, **kwargs):
+    """Run one generate call per prompt on its own thread."""
+    results = [None] * len(prompts)
+    barrier = threading.Barrier(len(prompts))
+
+    def worker(index, prompt):
+        barrier.wait()
+        results[index] = client.generate(prompt=prompt, **kwargs)
+
+    threads = [threading.Thread(target=worker, args=(i, p)) for i, p in enumerate(prompts)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+@given(
+    prompt_count=st.integers(min_value=2, max_value=12),
+    max_size=st.integers(min_value=2, max_value=6),
+)
+@settings(max_examples=10, deadline=None)
+def test_batched_results_routed_to_each_caller(prompt_count, max_size):
+    """
+    Property: Every caller receives the result for its own prompt, and no batch
+    exceeds the size cap
+    """
+    client = _make_client(batch_window_ms=200, batch_max_size=max_size)
+    prompts = [f"prompt {i}" for i in range(prompt_count)]
+
+    results = _generate_concurrently(client, prompts, max_tokens=50)
+
+    for prompt, result in zip(prompts, results):
+        assert result["text"] == f"echo: {prompt}"
+        assert result["input_tokens"] == len(prompt)
+
+    assert sum(len(batch) for batch in client.sent_batches) == prompt_count
+    assert all(len(batch) <= max_size for batch in client.sent_batches)
+    assert len(client.sent_batches) < prompt_count
+    assert client.total_requests == prompt_count
+
+
+def test_incompatible_parameters_not_batched_together():
+    """
+    Test that prompts with different parameters are sent in separate batches
+    """
+    client = _make_client(batch_window_ms=100, batch_max_size=8)
+    results = []
+
+    def worker(max_tokens):
+        results.append(client.generate(prompt=f"tokens {max_tokens}", max_tokens=max_tokens))
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in (100, 200)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(len(batch) for batch in client.sent_batches) == [1, 1]
+    assert len(results) == 2
+
+
+def test_batching_disabled_by_default():
+    """
+    Test that requests are sent one at a time when no batching window is set
+    """
+    client = _make_client(batch_window_ms=0, batch_max_size=8)
+
+    _generate_concurrently(client, ["a", "b", "c"])
+
+    assert sorted(client.sent_batches) == [["a"], ["b"], ["c"]]
+    assert client.get_batch_stats() == {"enabled": False}
+
+
+def test_async_callers_batched_without_blocking_the_loop():
+    """
+    Test that concurrent agenerate calls share batches while the loop keeps running
+    """
+    client = _make_client(batch_window_ms=50, batch_max_size=4)
+
+    async def run():
+        ticks = 0
+        calls = asyncio.gather(*(client.agenerate(f"prompt {i}") for i in range(4)))
+        while not calls.done():
+            ticks += 1
+            await asyncio.sleep(0.005)
+        return await calls, ticks
+
+    results, ticks = asyncio.run(run())
+
+    assert [result["text"] for result in results] == [f"echo: prompt {i}" for i in range(4)]
+    assert len(client.sent_batches) == 1
+    assert ticks >= 1
+
+
+def test_short_batch_response_fails_unmatched_callers():
+    """
+    Test that callers without a result in the response get an error instead of hanging
+    """
+    client = _make_client(batch_window_ms=100, batch_max_size=3)
+    client._generate_batch = lambda prompts, params: [
+        {"text": "only one", "input_tokens": 1, "output_tokens": 1, "stop_reason": "eos_token"}
+    ]
+    outcomes = []
+    barrier = threading.Barrier(3)
+
+    def worker(index):
+        barrier.wait()
+        try:
+            outcomes.append(client.generate(prompt=f"prompt {index}")["text"])
+        except RuntimeError as e:
+            outcomes.append(str(e))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert sorted(outcomes) == [
+        "Batched request returned 1 of 3 results",
+        "Batched request returned 1 of 3 results",
+        "only one",
+    ]
@@ -0,0 +1,188 @@
+"""
+Property Test 24: Hedged Requests
+Feature: lex-conductor-performance
+
+For any call slower than the hedge delay, a duplicate should be sent within the
+hedge budget and the first successful attempt should win.
+"""
+
+import threading
+import time
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+from backend.request_hedging import HedgeBudget, LatencyTracker, RequestHedger
+
+
+def _warm_up(hedger: RequestHedger, latency: float = 0.01):
+    """Fill the latency window so that hedging is active."""
+    for _ in range(hedger.min_samples):
+        hedger.latencies.record(latency)
+    for _ in range(int(1 / hedger.budget.ratio)):
+        hedger.budget.earn()
+
+
+@given(
+    latencies=st.lists(
+        st.floats(min_value=0.0, max_value=10.0, allow_nan=False), min_size=1, max_size=200
+    ),
+    percentile=st.floats(min_value=1.0, max_value=100.0),
+)
+@settings(max_examples=100, deadline=None)
+def test_percentile_is_a_recorded_latency(latencies, percentile):
+    """
+    Property: Percentile is one of the recorded latencies, bounded by min and max
+    """
+    tracker = LatencyTracker()
+    for latency in latencies:
+        tracker.record(latency)
+
+    value = tracker.percentile(percentile)
+
+    assert value in latencies
+    assert min(latencies) <= value <= max(latencies)
+
+
+@given(
+    ratio=st.floats(min_value=0.01, max_value=0.5),
+    requests=st.integers(min_value=1, max_value=500),
+)
+@settings(max_examples=100, deadline=None)
+def test_hedge_budget_caps_hedge_rate(ratio, requests):
+    """
+    Property: Hedges never exceed the budget ratio of requests
+    """
+    budget = HedgeBudget(ratio)
+    hedges = 0
+    for _ in range(requests):
+        budget.earn()
+        if budget.try_spend():
+            hedges += 1
+
+    assert hedges <= requests * ratio + 1e-9
+
+
+def test_slow_primary_is_hedged_and_hedge_wins():
+    """
+    Test that a slow call gets a duplicate and the faster duplicate wins
+    """
+    hedger = RequestHedger(percentile=95, budget_ratio=0.5, min_samples=5)
+    _warm_up(hedger)
+    calls = []
+    lock = threading.Lock()
+
+    def operation():
+        with lock:
+            attempt = len(calls)
+            calls.append(attempt)
+        if attempt == 0:
+            time.sleep(0.5)
+            return "primary"
+        return "hedge"
+
+    start = time.monotonic()
+    result = hedger.run(operation)
+
+    assert result == "hedge"
+    assert time.monotonic() - start < 0.4
+    stats = hedger.get_stats()
+    assert stats["total_hedges"] == 1
+    assert stats["hedge_wins"] == 1
+
+
+def test_fast_call_is_not_hedged():
+    """
+    Test that calls finishing before the hedge delay are not duplicated
+    """
+    hedger = RequestHedger(percentile=95, budget_ratio=0.5, min_samples=5)
+    _warm_up(hedger, latency=0.5)
+
+    assert hedger.run(lambda: "fast") == "fast"
+    assert hedger.get_stats()["total_hedges"] == 0
+
+
+def test_no_hedge_without_budget():
+    """
+    Test that slow calls are not duplicated once the hedge budget is spent
+    """
+    hedger = RequestHedger(percentile=95, budget_ratio=0.01, min_samples=5)
+    for _ in range(5):
+        hedger.latencies.record(0.001)
+    calls = []
+
+    def operation():
+        calls.append(1)
+        time.sleep(0.05)
+        return "done"
+
+    assert hedger.run(operation) == "done"
+    assert len(calls) == 1
+    assert hedger.get_stats()["total_hedges"] == 0
+
+
+def test_failed_attempt_falls_back_to_other():
+    """
+    Test that when the first attempt to finish fails, the other attempt's result is used
+    """
+    hedger = RequestHedger(percentile=95, budget_ratio=0.5, min_samples=5)
+    _warm_up(hedger)
+    calls = []
+    lock = threading.Lock()
+
+    def operation():
+        with lock:
+            attempt = len(calls)
+            calls.append(attempt)
+        if attempt == 0:
+            time.sleep(0.2)
+            return "primary"
+        raise RuntimeError("hedge failed")
+
+    assert hedger.run(operation) == "primary"
+
+    def always_fails():
+        time.sleep(0.05)
+        raise RuntimeError("both failed")
+
+    with pytest.raises(RuntimeError, match="both failed"):
+        hedger.run(always_fails)
+
+
+def test_hedging_metrics_endpoint(monkeypatch):
+    """
+    Test that hedging and batching stats of the shared client are served
+    """
+    pytest.importorskip("uvicorn")
+    from fastapi.testclient import TestClient
+
+    import backend.watsonx_client as watsonx_client
+    from backend.main import app
+
+    monkeypatch.setenv("LLM_BACKEND", "local")
+    monkeypatch.setenv("WATSONX_HEDGE_PERCENTILE", "95")
+    monkeypatch.setenv("WATSONX_BATCH_WINDOW_MS", "5")
+    monkeypatch.setattr(watsonx_client, "_watsonx_client", None)
+    watsonx_client.get_watsonx_client()
+
+    response = TestClient(app).get("/metrics/hedging")
+
+    assert response.status_code == 200
+    assert response.json()["hedging"]["enabled"] is True
+    assert response.json()["hedging"]["hedge_rate"] == 0.0
+    assert response.json()["batching"]["enabled"] is True
+
+
+def test_hedging_stats_do_not_create_the_client(monkeypatch):
+    """
+    Test that reading the stats leaves an unused client uncreated
+    """
+    import backend.watsonx_client as watsonx_client
+
+    monkeypatch.setattr(watsonx_client, "_watsonx_client", None)
+
+    assert watsonx_client.get_hedging_stats() == {
+        "hedging": {"enabled": False},
+        "batching": {"enabled": False},
+    }
+    assert watsonx_client._watsonx_client is None
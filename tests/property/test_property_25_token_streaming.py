@@ -0,0 +1,139 @@
+"""
+Property Test 25: Token Streaming
+Feature: lex-conductor-performance
+
+For any streamed generation, the concatenated chunks should equal the full
+completion, token usage should be tracked once, and retries should apply only
+before the first chunk.
+"""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+from backend.watsonx_client import WatsonxClient
+
+
+def _make_client(stream_factory) -> WatsonxClient:
+    """Create a client whose model streams events from stream_factory."""
+    with patch.dict(
+        "os.environ",
+        {"WATSONX_API_KEY": "test_key", "WATSONX_PROJECT_ID": "test_project"},
+    ):
+        with patch("backend.watsonx_client.APIClient"):
+            client = WatsonxClient(max_retries=3, retry_delay=0.01)
+
+    model = Mock()
+    model.generate_text_stream.side_effect = lambda **kwargs: stream_factory()
+    client.backend._models[client.model_id] = model
+    return client
+
+
+def _events(chunks, input_tokens=12):
+    """Build raw stream events for chunks."""
+    for i, chunk in enumerate(chunks):
+        yield {
+            "results": [
+                {
+                    "generated_text": chunk,
+                    "generated_token_count": i + 1,
+                    "input_token_count": input_tokens,
+                    "stop_reason": "eos_token" if i == len(chunks) - 1 else "not_finished",
+                }
+            ]
+        }
+
+
+chunk_lists = st.lists(st.text(min_size=1, max_size=20), min_size=1, max_size=30)
+
+
+@given(chunks=chunk_lists)
+@settings(max_examples=50, deadline=None)
+def test_stream_yields_all_chunks_and_tracks_usage(chunks):
+    """
+    Property: Streamed chunks concatenate to the completion and usage is tracked
+    """
+    client = _make_client(lambda: _events(chunks))
+
+    streamed = list(client.generate_stream("Justify this routing decision.", max_tokens=100))
+
+    assert streamed == chunks
+    usage = client.get_token_usage()
+    assert usage["total_requests"] == 1
+    assert usage["total_output_tokens"] == len(chunks)
+    assert usage["total_input_tokens"] == 12
+
+
+@given(chunks=chunk_lists)
+@settings(max_examples=25, deadline=None)
+def test_async_stream_matches_sync_stream(chunks):
+    """
+    Property: The async iterator yields the same chunks as the sync iterator
+    """
+    client = _make_client(lambda: _events(chunks))
+
+    async def consume():
+        return [chunk async for chunk in client.agenerate_stream("Narrate this trace.")]
+
+    assert asyncio.run(consume()) == chunks
+
+
+def test_stream_retries_before_first_chunk():
+    """
+    Test that failures before the first chunk are retried
+    """
+    attempts = []
+
+    def flaky_stream():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise Exception("Transient error")
+        return _events(["Routine ", "contract."])
+
+    client = _make_client(flaky_stream)
+
+    with patch("time.sleep"):
+        assert "".join(client.generate_stream("prompt")) == "Routine contract."
+    assert len(attempts) == 2
+
+
+def test_stream_does_not_retry_after_first_chunk():
+    """
+    Test that failures after the first chunk are raised without retrying
+    """
+    attempts = []
+
+    def failing_stream():
+        attempts.append(1)
+        yield from _events(["partial"])
+        raise Exception("Transient error")
+
+    client = _make_client(failing_stream)
+
+    received = []
+    with pytest.raises(Exception, match="Transient error"):
+        for chunk in client.generate_stream("prompt"):
+            received.append(chunk)
+
+    assert received == ["partial"]
+    assert len(attempts) == 1
+
+
+def test_async_stream_propagates_errors():
+    """
+    Test that stream errors reach the consuming coroutine
+    """
+
+    def failing_stream():
+        yield from _events(["partial"])
+        raise Exception("Transient error")
+
+    client = _make_client(failing_stream)
+
+    async def consume():
+        return [chunk async for chunk in client.agenerate_stream("prompt")]
+
+    with pytest.raises(Exception, match="Transient error"):
+        asyncio.run(consume())
@@ -0,0 +1,144 @@
+"""
+Property Test 26: Cassette Record/Replay Round-Trip
+Feature: lex-conductor-performance
+
+For any generation recorded to a cassette, replaying the same request offline
+should return the recorded response without credentials or network access.
+"""
+
+import os
+import tempfile
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+from backend.llm_backends import ReplayBackend
+from backend.llm_cassette import Cassette, CassetteMissError
+from backend.watsonx_client import WatsonxClient
+
+
+def _recording_client(cassette: Cassette, texts) -> WatsonxClient:
+    """Create a client that records generations answered by a fake model."""
+    with patch.dict(
+        "os.environ",
+        {"WATSONX_API_KEY": "test_key", "WATSONX_PROJECT_ID": "test_project"},
+    ):
+        with patch("backend.watsonx_client.APIClient"):
+            client = WatsonxClient(cassette=cassette)
+
+    responses = iter(texts)
+    model = Mock()
+    model.generate.side_effect = lambda **kwargs: {
+        "results": [
+            {
+                "generated_text": next(responses),
+                "generated_token_count": 7,
+                "input_token_count": 21,
+                "stop_reason": "eos_token",
+            }
+        ]
+    }
+    client.backend._models[client.model_id] = model
+    return client
+
+
+def _replaying_client(path: str, simulate_latency: bool = False) -> WatsonxClient:
+    """Create a replaying client with no credentials configured."""
+    with patch.dict("os.environ", {"WATSONX_API_KEY": "", "WATSONX_PROJECT_ID": ""}):
+        return WatsonxClient(
+            cassette=Cassette(path, mode="replay", simulate_latency=simulate_latency)
+        )
+
+
+@given(
+    prompts=st.lists(st.text(min_size=1, max_size=100), min_size=1, max_size=10, unique=True),
+)
+@settings(max_examples=25, deadline=None)
+def test_replay_returns_recorded_generations(prompts):
+    """
+    Property: Every recorded generation is replayed verbatim
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cassette.jsonl")
+        texts = [f"response {i}" for i in range(len(prompts))]
+
+        recorder = _recording_client(Cassette(path, mode="record"), texts)
+        recorded = [recorder.generate(prompt=prompt, max_tokens=50) for prompt in prompts]
+
+        replayer = _replaying_client(path)
+        assert replayer.api_client is None
+
+        for prompt, original in zip(prompts, recorded):
+            replayed = replayer.generate(prompt=prompt, max_tokens=50)
+            assert replayed["text"] == original["text"]
+            assert replayed["input_tokens"] == 21
+            assert replayed["output_tokens"] == 7
+
+        assert replayer.get_token_usage()["total_requests"] == len(prompts)
+
+
+def test_compressed_cassette_paths_are_rejected():
+    """
+    Test that a .gz cassette path fails instead of writing one gzip member per entry
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        with pytest.raises(ValueError):
+            Cassette(os.path.join(tmp, "cassette.jsonl.gz"), mode="record")
+
+
+def test_replay_miss_raises_without_retrying():
+    """
+    Test that unrecorded requests fail immediately in replay mode
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cassette.jsonl")
+        recorder = _recording_client(Cassette(path, mode="record"), ["recorded"])
+        recorder.generate(prompt="recorded prompt", max_tokens=50)
+
+        replayer = _replaying_client(path)
+        with patch("time.sleep") as mock_sleep:
+            with pytest.raises(CassetteMissError):
+                replayer.generate(prompt="recorded prompt", max_tokens=60)
+            mock_sleep.assert_not_called()
+
+
+def test_replay_simulates_recorded_latency():
+    """
+    Test that replay sleeps for the recorded latency when simulation is enabled
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cassette.jsonl")
+        cassette = Cassette(path, mode="record")
+        cassette.record(
+            "ibm/granite-3-8b-instruct",
+            "prompt",
+            {"max_new_tokens": 50},
+            {"text": "ok", "input_tokens": 1, "output_tokens": 1, "stop_reason": "eos_token"},
+            latency=0.2,
+        )
+
+        replaying = Cassette(path, mode="replay", simulate_latency=True)
+        start = time.monotonic()
+        [result] = ReplayBackend(replaying).generate(
+            "ibm/granite-3-8b-instruct", ["prompt"], {"max_new_tokens": 50}
+        )
+
+        assert result["text"] == "ok"
+        assert time.monotonic() - start >= 0.2
+
+
+def test_replayed_stream_reassembles_recording():
+    """
+    Test that streamed replay yields the recorded text
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cassette.jsonl")
+        text = "This contract is classified as STANDARD risk."
+        recorder = _recording_client(Cassette(path, mode="record"), [text])
+        recorder.generate(prompt="Justify routing.", max_tokens=150)
+
+        replayer = _replaying_client(path)
+
+        assert "".join(replayer.generate_stream("Justify routing.", max_tokens=150)) == text
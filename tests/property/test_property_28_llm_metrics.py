@@ -0,0 +1,130 @@
+"""
+Property Test 28: Per-Call-Site LLM Metrics
+Feature: lex-conductor-performance
+
+For any set of concurrent calls, usage metrics should account for every call
+exactly once, attributed to the call site that made it.
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from hypothesis import given, strategies as st, settings
+
+from backend.llm_backends import LocalBackend
+from backend.llm_metrics import LLMMetrics, get_llm_metrics
+from backend.watsonx_client import WatsonxClient
+
+CALL_SITES = ["fusion.internal", "fusion.external", "fusion.gaps", "routing.justification"]
+
+
+def _make_client(metrics: LLMMetrics) -> WatsonxClient:
+    """Create a client backed by the local backend."""
+    with patch.dict("os.environ", {"WATSONX_API_KEY": "", "WATSONX_PROJECT_ID": ""}):
+        return WatsonxClient(backend=LocalBackend(), metrics=metrics)
+
+
+@given(
+    calls=st.lists(st.sampled_from(CALL_SITES), min_size=1, max_size=40),
+    threads=st.integers(min_value=1, max_value=8),
+)
+@settings(max_examples=30, deadline=None)
+def test_concurrent_calls_counted_per_call_site(calls, threads):
+    """
+    Property: Concurrent calls are each counted once, under their call site
+    """
+    metrics = LLMMetrics()
+    client = _make_client(metrics)
+    lock = threading.Lock()
+    pending = list(calls)
+
+    def worker():
+        while True:
+            with lock:
+                if not pending:
+                    return
+                call_site = pending.pop()
+            client.generate(
+                prompt=f"Generate a justification for {call_site}.", call_site=call_site
+            )
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+    snapshot = metrics.snapshot()
+    usage = client.get_token_usage()
+
+    for call_site in set(calls):
+        site = snapshot["call_sites"][call_site]
+        assert site["requests"] == calls.count(call_site)
+        assert site["latency_seconds"]["count"] == calls.count(call_site)
+
+    assert snapshot["totals"]["requests"] == len(calls) == usage["total_requests"]
+    assert snapshot["totals"]["input_tokens"] == usage["total_input_tokens"]
+    assert snapshot["totals"]["output_tokens"] == usage["total_output_tokens"]
+
+
+def test_errors_counted_by_type():
+    """
+    Test that failed calls are counted as errors of their call site
+    """
+    metrics = LLMMetrics()
+    client = _make_client(metrics)
+    client.max_retries = 1
+
+    with patch.object(client.backend, "generate", side_effect=TimeoutError("timed out")):
+        try:
+            client.generate(prompt="Test", call_site="fusion.gaps")
+        except TimeoutError:
+            pass
+
+    site = metrics.snapshot()["call_sites"]["fusion.gaps"]
+    assert site["errors"] == 1
+    assert site["errors_by_type"] == {"TimeoutError": 1}
+    assert client.get_token_usage()["total_requests"] == 0
+
+
+def test_prometheus_histograms_are_cumulative():
+    """
+    Test that Prometheus histogram buckets are cumulative and end with the total count
+    """
+    metrics = LLMMetrics()
+    for latency in (0.01, 0.2, 0.2, 3.0, 120.0):
+        metrics.record_success("routing.justification", latency, 100, 20)
+
+    text = metrics.render_prometheus()
+    buckets = [
+        int(line.rsplit(" ", 1)[1])
+        for line in text.splitlines()
+        if line.startswith(
+            'lexconductor_llm_latency_seconds_bucket{call_site="routing.justification"'
+        )
+    ]
+
+    assert buckets == sorted(buckets)
+    assert buckets[-1] == 5
+    assert 'lexconductor_llm_requests_total{call_site="routing.justification"} 5' in text
+
+
+def test_metrics_endpoints():
+    """
+    Test that metrics are served as JSON and Prometheus text
+    """
+    pytest.importorskip("uvicorn")
+    from backend.main import app
+
+    get_llm_metrics().record_success("fusion.internal", 0.3, 50, 10)
+    client = TestClient(app)
+
+    json_response = client.get("/metrics/llm")
+    assert json_response.status_code == 200
+    assert json_response.json()["call_sites"]["fusion.internal"]["requests"] >= 1
+
+    text_response = client.get("/metrics")
+    assert text_response.status_code == 200
+    assert "lexconductor_llm_tokens_total" in text_response.text
@@ -0,0 +1,261 @@
+"""
+Property Test 29: Per-Tenant Quotas and Fair Scheduling
+Feature: lex-conductor-performance
+
+For any sequence of calls, a tenant should never be admitted beyond its
+sliding-window quota, and under contention tenants should be served in
+proportion to their weights.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+from backend.llm_backends import LocalBackend
+from backend.llm_metrics import LLMMetrics
+from backend.request_hedging import RequestHedger
+from backend.tenant_scheduler import (
+    QuotaExceededError,
+    TenantQuota,
+    TenantScheduler,
+    reset_current_tenant,
+    set_current_tenant,
+)
+from backend.watsonx_client import WatsonxClient
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@given(
+    calls=st.lists(
+        st.tuples(st.floats(min_value=0, max_value=20), st.integers(min_value=1, max_value=400)),
+        min_size=1,
+        max_size=60,
+    ),
+    token_limit=st.integers(min_value=400, max_value=2000),
+)
+@settings(max_examples=100, deadline=None)
+def test_admitted_tokens_never_exceed_window_quota(calls, token_limit):
+    """
+    Property: Tokens admitted within any window never exceed the tenant quota
+    """
+    clock = FakeClock()
+    window = 60.0
+    scheduler = TenantScheduler(
+        window_seconds=window,
+        quotas={"bulk": TenantQuota(tokens_per_window=token_limit)},
+        clock=clock,
+    )
+    admitted = []
+
+    for advance, tokens in calls:
+        clock.now += advance
+        try:
+            with scheduler.slot("bulk", tokens):
+                admitted.append((clock.now, tokens))
+        except QuotaExceededError as e:
+            assert 0 <= e.retry_after <= window
+
+            # The call fits once retry_after has elapsed
+            retry_at = clock.now + e.retry_after + 1e-6
+            in_window = sum(t for ts, t in admitted if ts > retry_at - window)
+            assert in_window + tokens <= token_limit
+
+    for now, _ in admitted:
+        assert sum(t for ts, t in admitted if now - window < ts <= now) <= token_limit
+
+
+def test_request_quota_rejects_fast_with_retry_after():
+    """
+    Test that a tenant over its request quota is rejected without waiting
+    """
+    clock = FakeClock()
+    scheduler = TenantScheduler(
+        window_seconds=10,
+        default_quota=TenantQuota(requests_per_window=2),
+        clock=clock,
+    )
+
+    for _ in range(2):
+        with scheduler.slot("emea", 10):
+            clock.now += 1
+
+    with pytest.raises(QuotaExceededError) as error:
+        scheduler.acquire("emea", 10)
+    assert error.value.retry_after == pytest.approx(8.0)
+
+    # Other tenants are unaffected
+    with scheduler.slot("apac", 10):
+        pass
+
+    clock.now += 8
+    with scheduler.slot("emea", 10):
+        pass
+
+
+def test_weighted_fair_queuing_shares_capacity_by_weight():
+    """
+    Test that queued calls are served in proportion to tenant weights
+    """
+    scheduler = TenantScheduler(
+        max_concurrency=1,
+        quotas={"legal": TenantQuota(weight=3.0), "bulk": TenantQuota(weight=1.0)},
+        max_queued_per_tenant=100,
+    )
+    order = []
+    order_lock = threading.Lock()
+
+    # Hold the only slot while both tenants queue up
+    blocker = scheduler.acquire("bulk", 100)
+
+    def call(tenant):
+        with scheduler.slot(tenant, 100):
+            with order_lock:
+                order.append(tenant)
+
+    threads = [threading.Thread(target=call, args=(tenant,)) for tenant in ["bulk"] * 12]
+    threads += [threading.Thread(target=call, args=(tenant,)) for tenant in ["legal"] * 12]
+    for thread in threads:
+        thread.start()
+    while scheduler.get_stats()["queued"] < len(threads):
+        time.sleep(0.01)
+
+    blocker.release()
+    for thread in threads:
+        thread.join()
+
+    # Among the first 12 calls served, legal gets roughly three times bulk's share
+    first = order[:12]
+    assert first.count("legal") >= 8
+    assert first.count("bulk") >= 2
+    assert scheduler.get_stats()["active"] == 0
+
+
+def test_client_calls_attributed_to_current_tenant():
+    """
+    Test that client calls are charged to the tenant from the request context
+    """
+    scheduler = TenantScheduler(quotas={"emea": TenantQuota(requests_per_window=1)})
+    metrics = LLMMetrics()
+    with patch.dict("os.environ", {"WATSONX_API_KEY": "", "WATSONX_PROJECT_ID": ""}):
+        client = WatsonxClient(backend=LocalBackend(), metrics=metrics, scheduler=scheduler)
+
+    token = set_current_tenant("emea")
+    try:
+        result = client.generate(prompt="Generate a justification.", max_tokens=100)
+        with pytest.raises(QuotaExceededError):
+            client.generate(prompt="Generate a justification.", max_tokens=100)
+    finally:
+        reset_current_tenant(token)
+
+    # Reservations are settled with the actual usage
+    stats = scheduler.get_stats()["tenants"]["emea"]
+    assert stats["window_tokens"] == result["input_tokens"] + result["output_tokens"]
+    assert stats["rejected"] == 1
+    assert metrics.snapshot()["totals"]["errors"] == 1
+
+    # The default tenant has its own quota
+    client.generate(prompt="Generate a justification.", max_tokens=100)
+
+
+class SlowBackend(LocalBackend):
+    """Local backend whose calls block for a while, the first one longest."""
+
+    def __init__(self, delays):
+        super().__init__()
+        self.delays = list(delays)
+
+    def generate(self, model_id, prompts, params):
+        time.sleep(self.delays.pop(0) if len(self.delays) > 1 else self.delays[0])
+        return super().generate(model_id, prompts, params)
+
+
+def test_async_calls_wait_for_their_share_off_the_event_loop():
+    """
+    Test that queued calls from async callers never block the event loop
+    """
+    scheduler = TenantScheduler(max_concurrency=1)
+    with patch.dict("os.environ", {"WATSONX_API_KEY": "", "WATSONX_PROJECT_ID": ""}):
+        client = WatsonxClient(
+            backend=SlowBackend([0.05]), metrics=LLMMetrics(), scheduler=scheduler
+        )
+
+    async def call(tenant):
+        token = set_current_tenant(tenant)
+        try:
+            return await client.agenerate("Generate a justification.", max_tokens=50)
+        finally:
+            reset_current_tenant(token)
+
+    async def run():
+        ticks, max_queued = 0, 0
+        calls = asyncio.gather(*(call(tenant) for tenant in ["bulk", "legal"] * 2))
+        while not calls.done():
+            ticks += 1
+            max_queued = max(max_queued, scheduler.get_stats()["queued"])
+            await asyncio.sleep(0.005)
+        return await calls, ticks, max_queued
+
+    results, ticks, max_queued = asyncio.run(run())
+
+    assert len(results) == 4
+    assert max_queued >= 2
+    assert ticks >= 10
+    assert set(scheduler.get_stats()["tenants"]) == {"bulk", "legal"}
+
+
+def test_hedged_duplicate_charged_to_tenant_quota():
+    """
+    Test that a hedged duplicate request is charged to the tenant's token quota
+    """
+    scheduler = TenantScheduler()
+    with patch.dict("os.environ", {"WATSONX_API_KEY": "", "WATSONX_PROJECT_ID": ""}):
+        client = WatsonxClient(
+            backend=SlowBackend([0.3, 0.0]), metrics=LLMMetrics(), scheduler=scheduler
+        )
+    client._hedger = RequestHedger(percentile=50.0, budget_ratio=1.0, min_samples=1)
+    client._hedger.latencies.record(0.01)
+
+    token = set_current_tenant("emea")
+    try:
+        result = client.generate(prompt="Generate a justification.", max_tokens=100)
+    finally:
+        reset_current_tenant(token)
+
+    assert client.get_hedge_stats()["total_hedges"] == 1
+    stats = scheduler.get_stats()["tenants"]["emea"]
+    assert stats["window_tokens"] == 2 * (result["input_tokens"] + result["output_tokens"])
+    assert stats["window_requests"] == 1
+
+
+def test_over_quota_request_gets_429():
+    """
+    Test that requests from a tenant over quota get 429 with Retry-After
+    """
+    pytest.importorskip("uvicorn")
+    from fastapi.testclient import TestClient
+
+    import backend.main as main
+
+    scheduler = TenantScheduler(quotas={"bulk": TenantQuota(requests_per_window=1)})
+    scheduler.acquire("bulk", 10).release()
+
+    with patch.object(main, "get_tenant_scheduler", return_value=scheduler):
+        response = TestClient(main.app).post(
+            "/routing/classify", json={}, headers={"X-Tenant-ID": "bulk"}
+        )
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
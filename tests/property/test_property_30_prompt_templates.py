@@ -0,0 +1,150 @@
+"""
+Property Test 30: Prompt Template Registry
+Feature: lex-conductor-performance
+
+For any field values, prompts rendered from a registered template should start
+with the template's static prefix, fit its token budget, and be accounted to
+the template version that produced them.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+from backend.llm_backends import LocalBackend
+from backend.llm_metrics import LLMMetrics
+from backend.prompt_templates import (
+    DEFAULT_TEMPLATES,
+    GOLDEN_CLAUSE_ALIGNMENT,
+    PromptRegistry,
+    PromptTemplate,
+    get_prompt_registry,
+)
+from backend.watsonx_client import WatsonxClient
+
+legal_text = st.text(
+    min_size=0,
+    max_size=3000,
+    alphabet=st.characters(whitelist_categories=("Lu", "Ll", "Nd", "P", "Zs")),
+)
+
+
+def _local_client() -> WatsonxClient:
+    """Create a client backed by the local backend."""
+    with patch.dict("os.environ", {"WATSONX_API_KEY": "", "WATSONX_PROJECT_ID": ""}):
+        return WatsonxClient(backend=LocalBackend(), metrics=LLMMetrics())
+
+
+@given(clause_text=legal_text, contract_text=legal_text)
+@settings(max_examples=100, deadline=None)
+def test_rendered_prompts_share_static_prefix(clause_text, contract_text):
+    """
+    Property: Rendered prompts start with the static prefix and fit the budget
+    """
+    registry = PromptRegistry()
+    registry.register(GOLDEN_CLAUSE_ALIGNMENT)
+
+    prompt = registry.render(
+        "fusion.golden_clause_alignment",
+        clause_type="liability",
+        clause_text=clause_text,
+        contract_text=contract_text,
+    )
+
+    assert prompt.text.startswith(GOLDEN_CLAUSE_ALIGNMENT.prefix)
+    assert prompt.estimated_input_tokens <= GOLDEN_CLAUSE_ALIGNMENT.max_input_tokens
+    assert prompt.template_id == "fusion.golden_clause_alignment@v1"
+
+
+def test_default_templates_compile():
+    """
+    Test that every default template compiles with a token estimate
+    """
+    registry = get_prompt_registry()
+
+    for template in DEFAULT_TEMPLATES:
+        compiled = registry.get(template.name)
+        assert compiled.prefix_tokens > 0
+        assert compiled.fixed_tokens >= compiled.prefix_tokens
+        assert compiled.fields
+
+
+def test_duplicate_version_rejected():
+    """
+    Test that a template version can only be registered once
+    """
+    registry = PromptRegistry()
+    registry.register(GOLDEN_CLAUSE_ALIGNMENT)
+
+    with pytest.raises(ValueError):
+        registry.register(GOLDEN_CLAUSE_ALIGNMENT)
+
+
+def test_shorter_version_shows_token_saving():
+    """
+    Test that traffic is tracked per version, so a shortened template shows its saving
+    """
+    registry = PromptRegistry()
+    registry.register(GOLDEN_CLAUSE_ALIGNMENT)
+    registry.register(
+        PromptTemplate(
+            name="fusion.golden_clause_alignment",
+            version="v2",
+            call_site="fusion.internal",
+            max_input_tokens=768,
+            prefix=(
+                "Alignment: MATCH, CONFLICT, PARTIAL, or UNKNOWN. Answer as JSON: "
+                '{"alignment": "...", "confidence": 0.0, "explanation": "..."}\n\n'
+            ),
+            body="Golden Clause ({clause_type}):\n{clause_text}\n\nContract:\n{contract_text}",
+        )
+    )
+    client = _local_client()
+    values = {
+        "clause_type": "liability",
+        "clause_text": "Liability is capped at the fees paid.",
+        "contract_text": "Supplier liability shall not exceed the fees paid in the prior year.",
+    }
+
+    for version in ("v1", "v2"):
+        for _ in range(3):
+            result = registry.generate(
+                client, "fusion.golden_clause_alignment", version=version, **values
+            )
+            assert result["template_id"] == f"fusion.golden_clause_alignment@{version}"
+
+    stats = registry.get_stats()
+    v1 = stats["fusion.golden_clause_alignment@v1"]
+    v2 = stats["fusion.golden_clause_alignment@v2"]
+
+    assert v1["requests"] == v2["requests"] == 3
+    assert v2["avg_input_tokens"] < v1["avg_input_tokens"]
+    assert v2["prefix_tokens"] < v1["prefix_tokens"]
+
+    # The latest registered version is the default
+    assert registry.get("fusion.golden_clause_alignment").template.version == "v2"
+
+
+def test_fusion_prompts_go_through_registry():
+    """
+    Test that Fusion Agent calls are accounted to their template
+    """
+    from backend.routers import fusion
+
+    registry = get_prompt_registry()
+    template_id = "fusion.golden_clause_alignment@v1"
+    before = registry.get_stats()[template_id]["requests"]
+
+    golden_clauses = [
+        {"clause_id": f"GC-{i}", "type": "liability", "text": f"Liability clause {i}."}
+        for i in range(3)
+    ]
+    with patch.object(fusion, "get_watsonx_client", return_value=_local_client()):
+        signals = asyncio.run(
+            fusion._analyze_internal_signals("Contract text.", [], golden_clauses)
+        )
+
+    assert len(signals) == 3
+    assert registry.get_stats()[template_id]["requests"] == before + 3
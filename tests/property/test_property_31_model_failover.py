@@ -0,0 +1,172 @@
+"""
+Property Test 31: Model Failover
+Feature: lex-conductor-performance
+
+For any sequence of primary model outcomes, traffic should move to the
+fallback model once the primary degrades, move back after a successful probe,
+and every result should name the model that actually served it.
+"""
+
+from hypothesis import given, strategies as st, settings
+
+from backend.llm_backends import LocalBackend
+from backend.model_failover import ModelFailover
+from backend.watsonx_client import WatsonxClient
+
+PRIMARY = "ibm/granite-3-8b-instruct"
+FALLBACK = "ibm/granite-3-2b-instruct"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FlakyBackend(LocalBackend):
+    """Local backend whose primary model fails while ``primary_down`` is set."""
+
+    def __init__(self):
+        super().__init__()
+        self.primary_down = True
+        self.calls = []
+
+    def generate(self, model_id, prompts, params):
+        self.calls.append(model_id)
+        if model_id == PRIMARY and self.primary_down:
+            raise RuntimeError("Service unavailable")
+        return super().generate(model_id, prompts, params)
+
+
+@given(outcomes=st.lists(st.booleans(), min_size=1, max_size=40))
+@settings(max_examples=100, deadline=None)
+def test_failover_follows_recent_error_rate(outcomes):
+    """
+    Property: The primary fails over exactly when its recent error rate crosses the threshold
+    """
+    failover = ModelFailover(PRIMARY, FALLBACK, min_samples=5, window_size=10, clock=FakeClock())
+
+    recent = []
+    for success in outcomes:
+        assert failover.select_model() == (PRIMARY, False)
+        failover.record(PRIMARY, success, latency=0.1)
+        recent = (recent + [success])[-10:]
+
+        error_rate = recent.count(False) / len(recent)
+        if len(recent) >= 5 and error_rate >= 0.5:
+            assert failover.active_model_id == FALLBACK
+            return
+
+    assert failover.active_model_id == PRIMARY
+    assert failover.failovers == 0
+
+
+def test_slow_primary_fails_over():
+    """
+    Test that sustained high latency triggers failover without errors
+    """
+    failover = ModelFailover(PRIMARY, FALLBACK, latency_threshold=2.0, min_samples=3)
+
+    for _ in range(3):
+        failover.record(PRIMARY, True, latency=5.0)
+
+    assert failover.active_model_id == FALLBACK
+
+
+def test_probe_fails_back_once_primary_recovers():
+    """
+    Test that one probe per interval goes to the primary and a good probe fails back
+    """
+    clock = FakeClock()
+    failover = ModelFailover(PRIMARY, FALLBACK, min_samples=2, probe_interval=30.0, clock=clock)
+    failover.record(PRIMARY, False, 0.1)
+    failover.record(PRIMARY, False, 0.1)
+    assert failover.select_model() == (FALLBACK, False)
+
+    # Failed probe keeps the fallback until the next interval
+    clock.now = 30.0
+    assert failover.select_model() == (PRIMARY, True)
+    assert failover.select_model() == (FALLBACK, False)
+    failover.record(PRIMARY, False, 0.1, probe=True)
+    assert failover.active_model_id == FALLBACK
+
+    clock.now = 60.0
+    assert failover.select_model() == (PRIMARY, True)
+    failover.record(PRIMARY, True, 0.1, probe=True)
+
+    assert failover.active_model_id == PRIMARY
+    assert failover.get_stats()["failbacks"] == 1
+
+
+def test_calls_started_before_failover_do_not_fail_back():
+    """
+    Test that a primary call already in flight at failover is not taken as the probe
+    """
+    clock = FakeClock()
+    failover = ModelFailover(PRIMARY, FALLBACK, min_samples=2, probe_interval=30.0, clock=clock)
+    model_id, probe = failover.select_model()
+    failover.record(PRIMARY, False, 0.1)
+    failover.record(PRIMARY, False, 0.1)
+    assert failover.active_model_id == FALLBACK
+
+    # The earlier call completes successfully after the failover
+    failover.record(model_id, True, 0.1, probe=probe)
+
+    assert failover.active_model_id == FALLBACK
+    assert failover.get_stats()["failbacks"] == 0
+
+    # The probe handed out later still decides
+    clock.now = 30.0
+    model_id, probe = failover.select_model()
+    failover.record(model_id, True, 0.1, probe=probe)
+    assert failover.active_model_id == PRIMARY
+
+
+def test_client_results_name_serving_model(monkeypatch):
+    """
+    Test that the client serves from the fallback model and reports it in results
+    """
+    monkeypatch.setenv("WATSONX_FAILOVER_MIN_SAMPLES", "2")
+    backend = FlakyBackend()
+    client = WatsonxClient(
+        model_id=PRIMARY,
+        fallback_model_id=FALLBACK,
+        backend=backend,
+        max_retries=3,
+        retry_delay=0,
+    )
+
+    result = client.generate(prompt="Generate a justification.", max_tokens=50)
+
+    assert backend.calls == [PRIMARY, PRIMARY, FALLBACK]
+    assert result["model_id"] == FALLBACK
+    assert client.get_failover_stats()["active_model_id"] == FALLBACK
+
+    # Without failover configured the primary is reported
+    healthy = WatsonxClient(model_id=PRIMARY, backend=LocalBackend())
+    assert healthy.generate(prompt="Generate a justification.")["model_id"] == PRIMARY
+    assert healthy.get_failover_stats() == {"enabled": False, "active_model_id": PRIMARY}
+
+
+def test_fallback_model_is_not_shut_out_by_primary_breaker(monkeypatch):
+    """
+    Test that the failures failing the primary over do not reject fallback calls
+    """
+    monkeypatch.delenv("WATSONX_FAILOVER_MIN_SAMPLES", raising=False)
+    monkeypatch.delenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", raising=False)
+    backend = FlakyBackend()
+    client = WatsonxClient(
+        model_id=PRIMARY,
+        fallback_model_id=FALLBACK,
+        backend=backend,
+        max_retries=6,
+        retry_delay=0,
+    )
+
+    result = client.generate(prompt="Generate a justification.", max_tokens=50)
+
+    assert backend.calls == [PRIMARY] * 5 + [FALLBACK]
+    assert result["model_id"] == FALLBACK
+    assert client.breaker.state == "open"
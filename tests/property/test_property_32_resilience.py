@@ -0,0 +1,249 @@
+"""
+Property Test 32: Shared Resilience Primitives
+Feature: lex-conductor-performance
+
+For any failure sequence, retries should be jittered below the backoff
+ceiling, stop at non-retryable errors, respect the request retry budget, and
+the circuit breaker should reject calls while a backend is down.
+"""
+
+import asyncio
+import random
+from unittest.mock import Mock, patch
+
+import pytest
+from hypothesis import given, strategies as st, settings
+from ibm_cloud_sdk_core import ApiException
+
+from backend.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    full_jitter_delay,
+    is_not_found,
+    is_retryable,
+    retry_budget,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@given(
+    attempt=st.integers(min_value=0, max_value=20),
+    base_delay=st.floats(min_value=0.01, max_value=5.0),
+    max_delay=st.floats(min_value=0.01, max_value=60.0),
+    seed=st.integers(0, 1000),
+)
+@settings(max_examples=100, deadline=None)
+def test_full_jitter_delay_stays_below_capped_ceiling(attempt, base_delay, max_delay, seed):
+    """
+    Property: Delays are drawn from [0, min(max_delay, base_delay * 2**attempt)]
+    """
+    delay = full_jitter_delay(attempt, base_delay, max_delay, random.Random(seed))
+
+    assert 0 <= delay <= min(max_delay, base_delay * 2**attempt)
+
+
+@given(status=st.integers(min_value=400, max_value=599))
+@settings(max_examples=100, deadline=None)
+def test_only_transient_statuses_are_retryable(status):
+    """
+    Property: HTTP errors are retried only for timeouts, rate limiting and server errors
+    """
+    expected = status in (408, 425, 429) or status in (500, 502, 503, 504)
+
+    assert is_retryable(ApiException(status)) == expected
+
+
+def test_error_types_are_classified():
+    """
+    Test classification of connection, programming and S3 errors
+    """
+    assert is_retryable(ConnectionError("reset by peer"))
+    assert is_retryable(TimeoutError())
+    assert not is_retryable(ValueError("bad prompt"))
+    assert not is_retryable(CircuitOpenError("cloudant", 10.0))
+
+    no_such_key = Exception("NoSuchKey")
+    no_such_key.response = {"Error": {"Code": "NoSuchKey"}}
+    assert not is_retryable(no_such_key)
+
+
+def test_missing_document_is_classified_by_status():
+    """
+    Test that a Cloudant 404 reads as a missing document, whatever its message
+    """
+    from backend.cloudant_client import CloudantClient
+
+    assert is_not_found(ApiException(404))
+    assert not is_not_found(ApiException(500, message="not found"))
+
+    env = {"CLOUDANT_URL": "https://test.cloudant.com", "CLOUDANT_API_KEY": "test_key"}
+    with patch.dict("os.environ", env), patch("backend.cloudant_client.CloudantV1"):
+        client = CloudantClient(max_retries=1)
+    client.client = Mock()
+    client.client.get_document.side_effect = ApiException(404, message="not_found")
+
+    assert client.get_document_by_id("golden_clauses", "missing") is None
+
+
+@given(failures=st.integers(min_value=0, max_value=10), threshold=st.integers(1, 5))
+@settings(max_examples=100, deadline=None)
+def test_breaker_opens_after_consecutive_failures(failures, threshold):
+    """
+    Property: The breaker opens exactly when consecutive failures reach the threshold
+    """
+    breaker = CircuitBreaker("test", failure_threshold=threshold, clock=FakeClock())
+
+    for _ in range(failures):
+        breaker.record_failure()
+
+    if failures >= threshold:
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+    else:
+        assert breaker.state == "closed"
+        breaker.before_call()
+
+
+def test_breaker_half_opens_for_one_trial_call():
+    """
+    Test that after the reset timeout one trial call decides the breaker state
+    """
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30.0, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 30.0
+    assert breaker.state == "half_open"
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    # Failed trial reopens; a successful one closes
+    breaker.record_failure()
+    assert breaker.state == "open"
+    clock.now = 60.0
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_cancelled_trial_call_releases_half_open_breaker():
+    """
+    Test that a trial call cancelled mid-flight lets the next call through
+    """
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30.0, clock=clock)
+    policy = RetryPolicy("test", max_retries=1, base_delay=0.0, breaker=breaker)
+    breaker.record_failure()
+    clock.now = 30.0
+
+    async def cancelled():
+        raise asyncio.CancelledError()
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(policy.acall(cancelled))
+    with pytest.raises(KeyboardInterrupt):
+        policy.call(Mock(side_effect=KeyboardInterrupt()))
+
+    assert policy.call(Mock(return_value="ok")) == "ok"
+    assert breaker.state == "closed"
+
+
+def test_open_breaker_stops_retries():
+    """
+    Test that a policy stops calling a backend once its breaker opens
+    """
+    breaker = CircuitBreaker("test", failure_threshold=2)
+    policy = RetryPolicy("test", max_retries=5, base_delay=0.0, breaker=breaker)
+    operation = Mock(side_effect=ConnectionError("down"))
+
+    with pytest.raises(CircuitOpenError):
+        policy.call(operation)
+
+    assert operation.call_count == 2
+    assert breaker.get_stats()["rejected_calls"] == 1
+
+
+def test_non_retryable_errors_do_not_trip_breaker():
+    """
+    Test that client errors neither retry nor count against backend health
+    """
+    breaker = CircuitBreaker("test", failure_threshold=1)
+    policy = RetryPolicy("test", max_retries=3, base_delay=0.0, breaker=breaker)
+    operation = Mock(side_effect=ApiException(404))
+
+    with pytest.raises(ApiException):
+        policy.call(operation)
+
+    assert operation.call_count == 1
+    assert breaker.state == "closed"
+
+
+@given(budget=st.integers(min_value=0, max_value=6), calls=st.integers(min_value=1, max_value=4))
+@settings(max_examples=50, deadline=None)
+def test_retry_budget_caps_retries_across_calls(budget, calls):
+    """
+    Property: Retries across all calls of a request never exceed the request budget
+    """
+    policy = RetryPolicy("test", max_retries=3, base_delay=0.0)
+    operation = Mock(side_effect=ConnectionError("down"))
+
+    with retry_budget(budget):
+        for _ in range(calls):
+            with pytest.raises(ConnectionError):
+                policy.call(operation)
+
+    retries = operation.call_count - calls
+    assert retries == min(budget, 2 * calls)
+
+
+def test_async_retries_await_between_attempts():
+    """
+    Test that the async path sleeps on the event loop instead of blocking
+    """
+    policy = RetryPolicy("test", max_retries=3, base_delay=0.5)
+    attempts = []
+
+    async def operation():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("down")
+        return "ok"
+
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    with patch("backend.resilience.asyncio.sleep", fake_sleep), patch(
+        "backend.resilience.time.sleep"
+    ) as blocking_sleep:
+        assert asyncio.run(policy.acall(operation)) == "ok"
+
+    assert len(delays) == 2
+    blocking_sleep.assert_not_called()
+
+
+def test_routers_report_the_breaker_they_use(monkeypatch):
+    import backend.watsonx_client as watsonx_client
+    from backend.resilience import get_circuit_breaker_states
+    from backend.routers import fusion, routing
+
+    monkeypatch.setenv("LLM_BACKEND", "local")
+    monkeypatch.setattr(watsonx_client, "_watsonx_client", None)
+
+    client = fusion.get_watsonx_client()
+    assert routing.get_watsonx_client() is client
+
+    for _ in range(client.breaker.failure_threshold):
+        client.breaker.record_failure()
+    assert get_circuit_breaker_states()["watsonx"]["state"] == "open"
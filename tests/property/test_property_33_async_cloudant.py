@@ -0,0 +1,157 @@
+"""
+Property Test 33: Async Cloudant Client
+Feature: lex-conductor-performance
+
+For any number of concurrent queries, the async Cloudant client should return
+the same documents as Cloudant sends, authenticate with one shared token, and
+retry transient errors without blocking the event loop.
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+from hypothesis import given, strategies as st, settings
+
+from backend.async_cloudant_client import AsyncCloudantClient
+from backend.models import HistoricalDecision
+from backend.resilience import CircuitBreaker
+
+
+class CountingAuthenticator:
+    """Authenticator issuing a bearer token and counting token requests."""
+
+    def __init__(self):
+        self.token_requests = 0
+
+    def authenticate(self, request):
+        self.token_requests += 1
+        request["headers"]["Authorization"] = "Bearer test-token"
+
+
+def precedent(index: int) -> dict:
+    return {
+        "_id": f"doc-{index}",
+        "decision_id": f"DEC-{index:03d}",
+        "contract_type": "NDA",
+        "contract_id": f"C-{index}",
+        "clause_modified": "confidentiality",
+        "original_text": "original",
+        "modified_text": "modified",
+        "rationale": "rationale",
+        "approved_by": "legal",
+        "date": "2025-01-01",
+        "jurisdiction": "US",
+        "confidence": 0.9,
+    }
+
+
+def make_client(handler, **kwargs) -> AsyncCloudantClient:
+    return AsyncCloudantClient(
+        url="https://test.cloudant.com",
+        authenticator=CountingAuthenticator(),
+        transport=httpx.MockTransport(handler),
+        breaker=CircuitBreaker("test"),
+        **kwargs,
+    )
+
+
+@given(concurrency=st.integers(min_value=1, max_value=30))
+@settings(max_examples=20, deadline=None)
+def test_concurrent_queries_share_one_token(concurrency):
+    """
+    Property: Concurrent queries all succeed and fetch the IAM token only once
+    """
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        body = json.loads(request.content)
+        assert request.headers["Authorization"] == "Bearer test-token"
+        assert body["selector"]["contract_type"] == "NDA"
+        return httpx.Response(200, json={"docs": [precedent(i) for i in range(body["limit"])]})
+
+    client = make_client(handler)
+
+    async def run():
+        try:
+            return await asyncio.gather(
+                *(
+                    client.get_precedents("NDA", jurisdiction="US", limit=3)
+                    for _ in range(concurrency)
+                )
+            )
+        finally:
+            await client.aclose()
+
+    results = asyncio.run(run())
+
+    assert len(requests) == concurrency
+    assert all(
+        [d.decision_id for d in result] == ["DEC-000", "DEC-001", "DEC-002"] for result in results
+    )
+    assert client.authenticator.token_requests == 1
+
+
+def test_transient_errors_are_retried():
+    """
+    Test that a 503 is retried and a missing document returns None
+    """
+    responses = iter([httpx.Response(503), httpx.Response(200, json={"_id": "doc-1"})])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/missing"):
+            return httpx.Response(404, json={"error": "not_found"})
+        return next(responses)
+
+    client = make_client(handler, retry_delay=0.0)
+
+    async def run():
+        try:
+            found = await client.get_document_by_id("golden_clauses", "doc-1")
+            missing = await client.get_document_by_id("golden_clauses", "missing")
+            return found, missing
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(run()) == ({"_id": "doc-1"}, None)
+
+
+def test_store_precedent_posts_without_revision():
+    """
+    Test that stored precedents drop _id and _rev and return the new ID
+    """
+    stored = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        stored.append(json.loads(request.content))
+        return httpx.Response(201, json={"ok": True, "id": "new-id", "rev": "1-a"})
+
+    client = make_client(handler)
+
+    async def run():
+        try:
+            return await client.store_precedent(HistoricalDecision(**precedent(1)))
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(run()) == "new-id"
+    assert "_id" not in stored[0] and stored[0]["decision_id"] == "DEC-001"
+
+
+def test_pool_size_configurable():
+    """
+    Test that connection pool limits come from the environment
+    """
+    with patch.dict(
+        "os.environ",
+        {"CLOUDANT_POOL_MAX_CONNECTIONS": "4", "CLOUDANT_POOL_MAX_KEEPALIVE": "2"},
+    ):
+        client = make_client(lambda request: httpx.Response(200, json={}))
+
+    stats = client.get_pool_stats()
+    asyncio.run(client.aclose())
+
+    assert stats["max_connections"] == 4
+    assert stats["max_keepalive_connections"] == 2
@@ -0,0 +1,218 @@
+"""
+Property Test 34: Golden Clause Cache
+Feature: lex-conductor-performance
+
+For any sequence of Golden Clause changes, the cache should answer queries
+exactly as a Mango query over the same documents would, and should fall
+through to Cloudant once it is stale.
+"""
+
+import asyncio
+
+import httpx
+from hypothesis import given, strategies as st, settings
+
+from backend.async_cloudant_client import AsyncCloudantClient
+from backend.golden_clause_cache import GoldenClauseCache
+from backend.resilience import CircuitBreaker
+
+CONTRACT_TYPES = ["NDA", "MSA", "SOW", "SLA"]
+JURISDICTIONS = ["US", "EU", "UK"]
+
+
+class NoAuthenticator:
+    def authenticate(self, request):
+        pass
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def clause_doc(doc_id: str, contract_types, jurisdiction: str, mandatory: bool) -> dict:
+    return {
+        "_id": doc_id,
+        "clause_id": doc_id.upper(),
+        "type": "confidentiality",
+        "contract_types": list(contract_types),
+        "text": f"Clause {doc_id}",
+        "jurisdiction": jurisdiction,
+        "mandatory": mandatory,
+        "risk_level": "medium",
+        "last_reviewed": "2025-01-01",
+        "approved_by": "legal",
+    }
+
+
+change_strategy = st.one_of(
+    st.builds(
+        lambda i, types, jurisdiction, mandatory: {
+            "id": f"gc-{i}",
+            "doc": clause_doc(f"gc-{i}", types, jurisdiction, mandatory),
+        },
+        st.integers(0, 9),
+        st.lists(st.sampled_from(CONTRACT_TYPES), min_size=1, max_size=3, unique=True),
+        st.sampled_from(JURISDICTIONS),
+        st.booleans(),
+    ),
+    st.builds(lambda i: {"id": f"gc-{i}", "deleted": True}, st.integers(0, 9)),
+)
+
+
+@given(
+    changes=st.lists(change_strategy, max_size=40),
+    contract_type=st.sampled_from(CONTRACT_TYPES),
+    jurisdiction=st.one_of(st.none(), st.sampled_from(JURISDICTIONS)),
+    mandatory_only=st.booleans(),
+)
+@settings(max_examples=100, deadline=None)
+def test_cache_matches_query_over_current_documents(
+    changes, contract_type, jurisdiction, mandatory_only
+):
+    """
+    Property: Cached query results equal filtering the latest version of every document
+    """
+    cache = GoldenClauseCache(client=object(), db_name="golden_clauses")
+    documents = {}
+
+    for change in changes:
+        cache.apply_change(change)
+        if change.get("deleted"):
+            documents.pop(change["id"], None)
+        else:
+            documents[change["id"]] = change["doc"]
+
+    expected = [
+        doc_id
+        for doc_id, doc in sorted(documents.items())
+        if contract_type in doc["contract_types"]
+        and (not jurisdiction or doc["jurisdiction"] == jurisdiction)
+        and (not mandatory_only or doc["mandatory"])
+    ]
+    results = cache.query(contract_type, jurisdiction, mandatory_only)
+
+    assert [clause.id for clause in results] == expected
+
+
+def test_cold_load_then_changes_feed_then_stale_fallback():
+    """
+    Test the full lifecycle: cold load, incremental update, fallback once the feed fails
+    """
+    find_requests = []
+    changes_served = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/golden_clauses":
+            return httpx.Response(200, json={"update_seq": "1-abc"})
+        if path == "/golden_clauses/_all_docs":
+            rows = [
+                {"id": "gc-1", "doc": clause_doc("gc-1", ["NDA"], "US", True)},
+                {"id": "_design/idx", "doc": {"_id": "_design/idx"}},
+            ]
+            return httpx.Response(200, json={"rows": rows})
+        if path == "/golden_clauses/_changes":
+            if changes_served:
+                return httpx.Response(503)
+            assert request.url.params["since"] == "1-abc"
+            changes_served.append(True)
+            results = [
+                {"id": "gc-2", "doc": clause_doc("gc-2", ["NDA"], "US", False)},
+                {"id": "gc-1", "deleted": True},
+            ]
+            return httpx.Response(200, json={"results": results, "last_seq": "2-def"})
+        if path == "/golden_clauses/_find":
+            find_requests.append(request)
+            return httpx.Response(200, json={"docs": []})
+        return httpx.Response(404)
+
+    client = AsyncCloudantClient(
+        url="https://test.cloudant.com",
+        authenticator=NoAuthenticator(),
+        transport=httpx.MockTransport(handler),
+        breaker=CircuitBreaker("test"),
+    )
+    clock = FakeClock()
+    cache = GoldenClauseCache(client=client, max_staleness=60, clock=clock)
+
+    async def run():
+        await cache.load()
+        cold = [c.id for c in cache.query("NDA")]
+
+        assert await cache.sync_once() == 2
+        synced = [c.id for c in cache.query("NDA")]
+
+        # Feed failing for longer than the max staleness: read through to Cloudant
+        clock.now += 120
+        stale = await cache.query_golden_clauses("NDA")
+
+        await cache.stop()
+        await client.aclose()
+        return cold, synced, stale
+
+    cold, synced, stale = asyncio.run(run())
+
+    assert cold == ["gc-1"]
+    assert synced == ["gc-2"]
+    assert cache.last_seq == "2-def"
+    assert stale == [] and len(find_requests) == 1
+
+    stats = cache.get_stats()
+    assert stats["fresh"] is False
+    assert stats["staleness_seconds"] == 120
+    assert stats["changes_applied"] == 2
+    assert stats["fallbacks"] == 1
+
+
+def test_failed_load_backs_off_before_retrying():
+    """
+    Test that queries during an outage fall through without each attempting a load
+    """
+    load_requests = []
+    find_requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/golden_clauses":
+            load_requests.append(request)
+            if len(load_requests) == 1:
+                return httpx.Response(404, json={"error": "not_found"})
+            return httpx.Response(200, json={"update_seq": "1-abc"})
+        if path == "/golden_clauses/_all_docs":
+            rows = [{"id": "gc-1", "doc": clause_doc("gc-1", ["NDA"], "US", True)}]
+            return httpx.Response(200, json={"rows": rows})
+        if path == "/golden_clauses/_changes":
+            return httpx.Response(200, json={"results": [], "last_seq": "1-abc"})
+        if path == "/golden_clauses/_find":
+            find_requests.append(request)
+            return httpx.Response(200, json={"docs": []})
+        return httpx.Response(404)
+
+    client = AsyncCloudantClient(
+        url="https://test.cloudant.com",
+        authenticator=NoAuthenticator(),
+        transport=httpx.MockTransport(handler),
+        breaker=CircuitBreaker("test"),
+    )
+    clock = FakeClock()
+    cache = GoldenClauseCache(client=client, clock=clock)
+
+    async def run():
+        during_outage = [await cache.query_golden_clauses("NDA") for _ in range(5)]
+        clock.now += 61
+        recovered = await cache.query_golden_clauses("NDA")
+        await cache.stop()
+        await client.aclose()
+        return during_outage, recovered
+
+    during_outage, recovered = asyncio.run(run())
+
+    assert during_outage == [[]] * 5
+    assert len(find_requests) == 5
+    assert len(load_requests) == 2
+    assert [c.id for c in recovered] == ["gc-1"]
+    assert cache.get_stats()["load_failures"] == 0
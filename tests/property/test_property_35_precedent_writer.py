@@ -0,0 +1,155 @@
+"""
+Property Test 35: Write-Behind Precedent Batching
+Feature: lex-conductor-performance
+
+For any set of submitted decisions, the precedent writer should store each
+exactly once through _bulk_docs batches within the configured limits, and
+resolve each caller's future with its own outcome.
+"""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+from backend.models import HistoricalDecision
+from backend.precedent_writer import PrecedentWriteError, PrecedentWriter
+
+
+def decision(index: int, doc_id: str = None) -> HistoricalDecision:
+    fields = {
+        "decision_id": f"DEC-{index:04d}",
+        "contract_type": "NDA",
+        "contract_id": f"C-{index}",
+        "clause_modified": "Section 4",
+        "original_text": "original",
+        "modified_text": "modified" * (index % 5 + 1),
+        "rationale": "rationale",
+        "approved_by": "legal",
+        "date": "2025-01-01",
+        "jurisdiction": "US",
+        "confidence": 0.9,
+    }
+    if doc_id:
+        fields["_id"] = doc_id
+    return HistoricalDecision(**fields)
+
+
+class FakeCloudant:
+    """Cloudant client recording _bulk_docs batches."""
+
+    db_historical_decisions = "historical_decisions"
+
+    def __init__(self, existing_ids=()):
+        self.batches = []
+        self.existing = set(existing_ids)
+        self.lock = threading.Lock()
+
+    def bulk_store_documents(self, db_name, documents):
+        with self.lock:
+            self.batches.append(documents)
+            results = []
+            for doc in documents:
+                doc_id = doc.get("_id") or f"auto-{doc['decision_id']}"
+                if doc_id in self.existing:
+                    results.append(
+                        {"id": doc_id, "error": "conflict", "reason": "Document update conflict."}
+                    )
+                else:
+                    self.existing.add(doc_id)
+                    results.append({"id": doc_id, "rev": "1-a", "ok": True})
+            return results
+
+
+@given(
+    count=st.integers(min_value=1, max_value=60),
+    max_batch_docs=st.integers(min_value=1, max_value=20),
+)
+@settings(max_examples=30, deadline=None)
+def test_every_decision_stored_once_within_batch_limits(count, max_batch_docs):
+    """
+    Property: Each decision is written exactly once, in batches no larger than the limit
+    """
+    client = FakeCloudant()
+    writer = PrecedentWriter(client, max_batch_docs=max_batch_docs, flush_interval=10.0)
+
+    futures = [writer.submit(decision(i)) for i in range(count)]
+    assert writer.flush(timeout=10)
+    writer.close()
+
+    written = [doc["decision_id"] for batch in client.batches for doc in batch]
+    assert sorted(written) == sorted(f"DEC-{i:04d}" for i in range(count))
+    assert all(len(batch) <= max_batch_docs for batch in client.batches)
+    assert [f.result() for f in futures] == [f"auto-DEC-{i:04d}" for i in range(count)]
+
+
+def test_batches_split_by_size():
+    """
+    Test that a batch never exceeds the byte limit unless a single document does
+    """
+    client = FakeCloudant()
+    writer = PrecedentWriter(client, max_batch_docs=100, max_batch_bytes=800, flush_interval=10.0)
+
+    for i in range(10):
+        writer.submit(decision(i))
+    writer.close()
+
+    assert len(client.batches) > 1
+    assert sum(len(batch) for batch in client.batches) == 10
+
+
+def test_conflicts_fail_only_their_own_future():
+    """
+    Test that a per-document conflict does not fail the rest of the batch
+    """
+    client = FakeCloudant(existing_ids={"dec-1"})
+    with PrecedentWriter(client, flush_interval=0.01) as writer:
+        ok = writer.submit(decision(0, doc_id="dec-0"))
+        conflict = writer.submit(decision(1, doc_id="dec-1"))
+
+        assert ok.result(timeout=5) == "dec-0"
+        with pytest.raises(PrecedentWriteError) as error:
+            conflict.result(timeout=5)
+
+    assert error.value.is_conflict
+    assert writer.get_stats()["total_conflicts"] == 1
+
+
+def test_missing_results_fail_their_futures():
+    """
+    Test that documents without a result in the response fail instead of hanging
+    """
+    client = Mock(db_historical_decisions="historical_decisions")
+    client.bulk_store_documents.return_value = [{"id": "dec-0", "rev": "1-a", "ok": True}]
+    writer = PrecedentWriter(client, flush_interval=60.0)
+    stored = writer.submit(decision(0, doc_id="dec-0"))
+    missing = writer.submit(decision(1, doc_id="dec-1"))
+    writer.close(timeout=5)
+
+    assert client.bulk_store_documents.call_count == 1
+    assert stored.result(timeout=1) == "dec-0"
+    with pytest.raises(PrecedentWriteError) as error:
+        missing.result(timeout=1)
+    assert error.value.doc_id == "dec-1"
+    assert error.value.error == "missing_result"
+    assert writer.get_stats()["total_errors"] == 1
+
+
+def test_batch_failure_fails_every_future_and_close_flushes():
+    """
+    Test that a failed request fails its batch, and that close sends what is buffered
+    """
+    client = Mock(db_historical_decisions="historical_decisions")
+    client.bulk_store_documents.side_effect = ConnectionError("down")
+    writer = PrecedentWriter(client, flush_interval=60.0)
+
+    futures = [writer.submit(decision(i)) for i in range(3)]
+    writer.close(timeout=5)
+
+    assert client.bulk_store_documents.call_count == 1
+    for future in futures:
+        with pytest.raises(ConnectionError):
+            future.result(timeout=1)
+    with pytest.raises(RuntimeError):
+        writer.submit(decision(4))
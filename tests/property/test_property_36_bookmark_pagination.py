@@ -0,0 +1,155 @@
+"""
+Property Test 36: Bookmark Pagination
+Feature: lex-conductor-performance
+
+For any result set size and page size, the sync and async iterators should
+yield every matching document exactly once by following bookmarks, and should
+request the next page while the caller processes the current one.
+"""
+
+import asyncio
+import json
+import threading
+from unittest.mock import Mock, patch
+
+import httpx
+from hypothesis import given, strategies as st, settings
+
+from backend.async_cloudant_client import AsyncCloudantClient
+from backend.cloudant_client import CloudantClient
+from backend.resilience import CircuitBreaker
+
+CLOUDANT_ENV = {"CLOUDANT_URL": "https://test.cloudant.com", "CLOUDANT_API_KEY": "test_key"}
+
+
+class FakeFind:
+    """post_find over an in-memory database, paginated with bookmarks."""
+
+    def __init__(self, count: int):
+        self.docs = [{"_id": f"doc-{i:04d}", "n": i} for i in range(count)]
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def page(self, limit: int, bookmark=None) -> dict:
+        with self.lock:
+            self.requests.append(bookmark)
+        start = int(bookmark) if bookmark else 0
+        docs = self.docs[start : start + limit]
+        return {"docs": docs, "bookmark": str(start + len(docs))}
+
+    def post_find(self, db, selector, limit=None, bookmark=None, **kwargs):
+        return Mock(get_result=Mock(return_value=self.page(limit, bookmark)))
+
+
+class NoAuthenticator:
+    def authenticate(self, request):
+        pass
+
+
+def expected_requests(count: int, page_size: int) -> int:
+    # A full last page needs one more (empty) request to find the end
+    return count // page_size + 1
+
+
+@given(count=st.integers(min_value=0, max_value=120), page_size=st.integers(1, 25))
+@settings(max_examples=50, deadline=None)
+def test_sync_iterator_yields_every_document_once(count, page_size):
+    """
+    Property: iter_find yields all documents in order, one request per page
+    """
+    fake = FakeFind(count)
+    with patch.dict("os.environ", CLOUDANT_ENV), patch("backend.cloudant_client.CloudantV1"):
+        client = CloudantClient()
+    client.client = fake
+
+    docs = list(client.iter_find("historical_decisions", {}, page_size=page_size))
+
+    assert [doc["n"] for doc in docs] == list(range(count))
+    assert len(fake.requests) == expected_requests(count, page_size)
+
+
+@given(count=st.integers(min_value=0, max_value=120), page_size=st.integers(1, 25))
+@settings(max_examples=30, deadline=None)
+def test_async_iterator_yields_every_document_once(count, page_size):
+    """
+    Property: aiter_find yields all documents in order, one request per page
+    """
+    fake = FakeFind(count)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        return httpx.Response(200, json=fake.page(body["limit"], body.get("bookmark")))
+
+    async def run():
+        client = AsyncCloudantClient(
+            url="https://test.cloudant.com",
+            authenticator=NoAuthenticator(),
+            transport=httpx.MockTransport(handler),
+            breaker=CircuitBreaker("test"),
+        )
+        try:
+            return [doc async for doc in client.aiter_find("db", {}, page_size=page_size)]
+        finally:
+            await client.aclose()
+
+    docs = asyncio.run(run())
+
+    assert [doc["n"] for doc in docs] == list(range(count))
+    assert len(fake.requests) == expected_requests(count, page_size)
+
+
+def test_next_page_prefetched_while_current_page_is_processed():
+    """
+    Test that the second page is requested before the first page is consumed
+    """
+    fake = FakeFind(10)
+    with patch.dict("os.environ", CLOUDANT_ENV), patch("backend.cloudant_client.CloudantV1"):
+        client = CloudantClient()
+    client.client = fake
+
+    iterator = client.iter_find("historical_decisions", {}, page_size=5)
+    first = next(iterator)
+    for _ in range(100):
+        if len(fake.requests) == 2:
+            break
+        threading.Event().wait(0.01)
+
+    assert first["n"] == 0
+    assert fake.requests == [None, "5"]
+    iterator.close()
+
+
+def test_typed_iterator_scans_all_precedents():
+    """
+    Test that iter_precedents without filters scans every decision
+    """
+    with patch.dict("os.environ", CLOUDANT_ENV), patch("backend.cloudant_client.CloudantV1"):
+        client = CloudantClient()
+    client.iter_find = Mock(
+        return_value=iter(
+            [
+                {
+                    "_id": "d1",
+                    "decision_id": "DEC-1",
+                    "contract_type": "NDA",
+                    "contract_id": "C-1",
+                    "clause_modified": "s1",
+                    "original_text": "a",
+                    "modified_text": "b",
+                    "rationale": "r",
+                    "approved_by": "legal",
+                    "date": "2025-01-01",
+                    "jurisdiction": "US",
+                    "confidence": 0.8,
+                },
+                {"_id": "invalid"},
+            ]
+        )
+    )
+
+    decisions = list(client.iter_precedents(page_size=50))
+
+    assert [d.decision_id for d in decisions] == ["DEC-1"]
+    db_name, selector = client.iter_find.call_args.args
+    assert db_name == "historical_decisions"
+    assert selector == {"confidence": {"$gte": 0.0}}
@@ -0,0 +1,233 @@
+"""
+Property Test 37: Partitioned Databases
+Feature: lex-conductor-performance
+
+For any contract type and jurisdiction, partitioned document IDs should land in
+the partition that queries for that contract type read, and queries naming a
+contract type should only read that partition, however many documents the
+other partitions hold.
+"""
+
+import asyncio
+import json
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+from hypothesis import given, strategies as st, settings
+
+from backend.async_cloudant_client import AsyncCloudantClient
+from backend.cloudant_client import CloudantClient, CloudantPartitioning, partition_key
+from backend.models import ContractType, Jurisdiction
+from backend.resilience import CircuitBreaker
+
+CLOUDANT_ENV = {"CLOUDANT_URL": "https://test.cloudant.com", "CLOUDANT_API_KEY": "test_key"}
+
+contract_types = st.sampled_from([contract_type.value for contract_type in ContractType])
+jurisdictions = st.sampled_from([jurisdiction.value for jurisdiction in Jurisdiction])
+schemes = st.sampled_from(["contract_type", "contract_type_jurisdiction"])
+
+
+def precedent(index: int, contract_type: str = "NDA", jurisdiction: str = "US") -> dict:
+    return {
+        "decision_id": f"DEC-{index:03d}",
+        "contract_type": contract_type,
+        "contract_id": f"C-{index}",
+        "clause_modified": "confidentiality",
+        "original_text": "original",
+        "modified_text": "modified",
+        "rationale": "rationale",
+        "approved_by": "legal",
+        "date": "2025-01-01",
+        "jurisdiction": jurisdiction,
+        "confidence": 0.9,
+    }
+
+
+class FakePartitionedDatabase:
+    """Partitioned database counting the documents each query reads."""
+
+    def __init__(self, partitioning: CloudantPartitioning):
+        self.partitioning = partitioning
+        self.partitions = {}
+        self.docs_read = 0
+
+    def add(self, doc: dict):
+        doc = self.partitioning.precedent_document(doc)
+        partition = doc["_id"].split(":", 1)[0]
+        self.partitions.setdefault(partition, []).append(doc)
+
+    def _result(self, docs, limit):
+        self.docs_read += len(docs)
+        return Mock(get_result=Mock(return_value={"docs": docs[:limit], "bookmark": None}))
+
+    def post_partition_find(self, db, partition_key, selector, limit=None, **kwargs):
+        return self._result(self.partitions.get(partition_key, []), limit)
+
+    def post_find(self, db, selector, limit=None, **kwargs):
+        docs = [doc for partition in self.partitions.values() for doc in partition]
+        return self._result(docs, limit)
+
+
+def make_client(partitioning: CloudantPartitioning) -> CloudantClient:
+    with patch.dict("os.environ", CLOUDANT_ENV), patch("backend.cloudant_client.CloudantV1"):
+        return CloudantClient(partitioning=partitioning)
+
+
+@given(text=st.text(max_size=30), other=st.one_of(st.none(), st.text(max_size=30)))
+@settings(max_examples=100)
+def test_partition_keys_are_valid(text, other):
+    """
+    Property: Partition keys never contain ':' or start with '_'
+    """
+    key = partition_key(text, other)
+
+    assert key
+    assert ":" not in key
+    assert not key.startswith("_")
+    assert key == partition_key(text, other)
+
+
+@given(contract_type=contract_types, jurisdiction=jurisdictions, scheme=schemes)
+@settings(max_examples=50)
+def test_documents_land_in_the_partition_queries_read(contract_type, jurisdiction, scheme):
+    """
+    Property: A stored decision's partition is the one its query is scoped to
+    """
+    partitioning = CloudantPartitioning(enabled=True, scheme=scheme)
+
+    doc = partitioning.precedent_document(precedent(1, contract_type, jurisdiction))
+    partition, local_id = doc["_id"].split(":", 1)
+
+    assert partition == partitioning.key_for(contract_type, jurisdiction)
+    assert local_id
+    # Re-partitioning keeps the local ID
+    assert partitioning.precedent_document(doc)["_id"] == doc["_id"]
+
+
+@given(scheme=schemes)
+@settings(max_examples=10)
+def test_queries_without_their_partition_run_globally(scheme):
+    """
+    Property: Queries missing part of the partition key are not scoped
+    """
+    partitioning = CloudantPartitioning(enabled=True, scheme=scheme)
+
+    assert partitioning.key_for(None, "US") is None
+    if scheme == "contract_type_jurisdiction":
+        assert partitioning.key_for("NDA") is None
+    else:
+        assert partitioning.key_for("NDA") == "nda"
+    assert CloudantPartitioning(enabled=False, scheme=scheme).key_for("NDA", "US") is None
+
+
+def test_unknown_scheme_rejected():
+    with pytest.raises(ValueError):
+        CloudantPartitioning(enabled=True, scheme="jurisdiction")
+
+
+@given(types=st.lists(contract_types, min_size=1, max_size=5, unique=True), scheme=schemes)
+@settings(max_examples=30)
+def test_golden_clauses_copied_into_each_contract_type_partition(types, scheme):
+    """
+    Property: A Golden Clause has one copy per contract type, each in its partition
+    """
+    partitioning = CloudantPartitioning(enabled=True, scheme=scheme)
+    clause = {"_id": "golden_001", "clause_id": "golden_001", "contract_types": types}
+    clause["jurisdiction"] = "EU"
+
+    copies = partitioning.golden_clause_documents(clause)
+
+    assert [copy["contract_types"] for copy in copies] == [[t] for t in types]
+    assert len({copy["_id"] for copy in copies}) == len(types)
+    for copy in copies:
+        partition = copy["_id"].split(":", 1)[0]
+        assert partition == partitioning.key_for(copy["contract_types"][0], "EU")
+        assert copy["_id"].endswith(":golden_001")
+
+
+@given(
+    partition_size=st.integers(min_value=1, max_value=20),
+    other_volume=st.integers(min_value=0, max_value=500),
+)
+@settings(max_examples=30, deadline=None)
+def test_partition_query_cost_independent_of_total_volume(partition_size, other_volume):
+    """
+    Property: A contract type query reads only its partition, whatever the total volume
+    """
+    partitioning = CloudantPartitioning(enabled=True, scheme="contract_type")
+    db = FakePartitionedDatabase(partitioning)
+    for i in range(partition_size):
+        db.add(precedent(i, "NDA"))
+    for i in range(other_volume):
+        db.add(precedent(i, "MSA"))
+
+    client = make_client(partitioning)
+    client.client = db
+
+    precedents = client.get_precedents("NDA", limit=100)
+
+    assert len(precedents) == partition_size
+    assert all(decision.contract_type == "NDA" for decision in precedents)
+    assert db.docs_read == partition_size
+
+
+def test_unpartitioned_client_uses_global_queries():
+    client = make_client(CloudantPartitioning(enabled=False))
+    client.client = Mock()
+    client.client.post_find.return_value.get_result.return_value = {"docs": []}
+
+    client.get_precedents("NDA", jurisdiction="US")
+    client.store_precedent(Mock(model_dump=Mock(return_value=precedent(1))))
+
+    client.client.post_partition_find.assert_not_called()
+    assert "_id" not in client.client.post_document.call_args.kwargs["document"]
+
+
+def test_partitioned_store_assigns_partitioned_id():
+    client = make_client(CloudantPartitioning(enabled=True, scheme="contract_type_jurisdiction"))
+    client.client = Mock()
+    client.client.post_document.return_value.get_result.return_value = {"id": "x"}
+
+    client.store_precedent(Mock(model_dump=Mock(return_value=precedent(1, "MSA", "EU"))))
+
+    assert client.client.post_document.call_args.kwargs["document"]["_id"].startswith("msa.eu:")
+
+
+class NoAuthenticator:
+    def authenticate(self, request):
+        pass
+
+
+@given(contract_type=contract_types, jurisdiction=jurisdictions, scheme=schemes)
+@settings(max_examples=20, deadline=None)
+def test_async_queries_use_partition_endpoint(contract_type, jurisdiction, scheme):
+    """
+    Property: The async client sends scoped queries to the _partition endpoint
+    """
+    partitioning = CloudantPartitioning(enabled=True, scheme=scheme)
+    paths = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        assert json.loads(request.content)["selector"]["contract_type"] == contract_type
+        return httpx.Response(200, json={"docs": []})
+
+    client = AsyncCloudantClient(
+        url="https://test.cloudant.com",
+        authenticator=NoAuthenticator(),
+        transport=httpx.MockTransport(handler),
+        breaker=CircuitBreaker("test"),
+        partitioning=partitioning,
+    )
+
+    async def run():
+        try:
+            await client.get_precedents(contract_type, jurisdiction=jurisdiction)
+        finally:
+            await client.aclose()
+
+    asyncio.run(run())
+
+    partition = partitioning.key_for(contract_type, jurisdiction)
+    assert paths == [f"/historical_decisions/_partition/{partition}/_find"]
@@ -0,0 +1,168 @@
+"""
+Property Test 38: Field Projection
+Feature: lex-conductor-performance
+
+For any set of candidate precedents, the memory agent should rank them on a
+projection of their scoring fields and fetch full documents only for the
+top-k, which come back in rank order.
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+from hypothesis import given, strategies as st, settings
+
+from backend.async_cloudant_client import AsyncCloudantClient
+from backend.cloudant_client import PRECEDENT_SCORING_FIELDS
+from backend.resilience import CircuitBreaker
+from backend.routers import memory
+
+
+class NoAuthenticator:
+    def authenticate(self, request):
+        pass
+
+
+def precedent(index: int, confidence: float, tags=()) -> dict:
+    return {
+        "_id": f"doc-{index:03d}",
+        "decision_id": f"DEC-{index:03d}",
+        "contract_type": "NDA",
+        "contract_id": f"C-{index}",
+        "clause_modified": "confidentiality",
+        "original_text": "original " * 200,
+        "modified_text": "modified",
+        "rationale": "rationale",
+        "approved_by": "legal",
+        "date": "2025-01-01",
+        "jurisdiction": "US",
+        "confidence": confidence,
+        "tags": list(tags),
+    }
+
+
+class FakeDatabase:
+    """_find and _all_docs endpoints over in-memory precedents, honouring fields, keys and limit."""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.queries = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        query = json.loads(request.content)
+        self.queries.append(query)
+
+        if request.url.path.endswith("/_all_docs"):
+            by_id = {doc["_id"]: doc for doc in self.docs}
+            rows = [
+                (
+                    {"key": key, "id": key, "doc": by_id[key]}
+                    if key in by_id
+                    else {"key": key, "error": "not_found"}
+                )
+                for key in query["keys"]
+            ]
+            return httpx.Response(200, json={"rows": rows})
+
+        docs = sorted(self.docs, key=lambda doc: doc["confidence"], reverse=True)
+        docs = docs[: query["limit"]]
+        if "fields" in query:
+            docs = [{k: v for k, v in doc.items() if k in query["fields"]} for doc in docs]
+        return httpx.Response(200, json={"docs": docs})
+
+    def client(self) -> AsyncCloudantClient:
+        return AsyncCloudantClient(
+            url="https://test.cloudant.com",
+            authenticator=NoAuthenticator(),
+            transport=httpx.MockTransport(self.handler),
+            breaker=CircuitBreaker("test"),
+        )
+
+
+candidate_lists = st.lists(
+    st.tuples(st.floats(min_value=0.0, max_value=1.0), st.booleans()), min_size=0, max_size=40
+)
+
+
+@given(candidates=candidate_lists, limit=st.integers(min_value=1, max_value=10))
+@settings(max_examples=40, deadline=None)
+def test_memory_agent_fetches_only_top_k_in_full(candidates, limit):
+    """
+    Property: Candidates are ranked on scoring fields; only the top-k are fetched in full
+    """
+    docs = [
+        precedent(i, confidence, ["liability"] if tagged else [])
+        for i, (confidence, tagged) in enumerate(candidates)
+    ]
+    db = FakeDatabase(docs)
+    client = db.client()
+    request = memory.MemoryQueryRequest(
+        contract_type="NDA", jurisdiction="US", clause_type="liability", limit=limit
+    )
+
+    async def run():
+        try:
+            with patch.object(memory, "get_async_cloudant_client", return_value=client):
+                return await memory.query_precedents(request)
+        finally:
+            await client.aclose()
+
+    response = asyncio.run(run())
+
+    candidate_query, *full_queries = db.queries
+    assert candidate_query["fields"] == PRECEDENT_SCORING_FIELDS
+    # One full fetch of the top-k (none when nothing matched)
+    assert len(full_queries) == (1 if docs else 0)
+    for full_query in full_queries:
+        assert full_query["include_docs"] is True
+        assert len(full_query["keys"]) == min(limit, len(docs))
+
+    # Results are the best-scoring candidates, in rank order
+    scores = [p.similarity_score for p in response.precedents]
+    expected = sorted(
+        (memory._calculate_similarity_score(doc, "liability") for doc in docs), reverse=True
+    )
+    assert scores == expected[:limit]
+    assert response.total_found == min(limit, len(docs))
+
+
+@given(count=st.integers(min_value=1, max_value=20), data=st.data())
+@settings(max_examples=30, deadline=None)
+def test_precedents_by_ids_keep_requested_order(count, data):
+    """
+    Property: get_precedents_by_ids returns the requested documents in order, skipping missing
+    """
+    docs = [precedent(i, 0.5) for i in range(count)]
+    requested = data.draw(
+        st.lists(st.sampled_from([doc["_id"] for doc in docs] + ["missing"]), unique=True)
+    )
+    client = FakeDatabase(docs).client()
+
+    async def run():
+        try:
+            return await client.get_precedents_by_ids(requested)
+        finally:
+            await client.aclose()
+
+    decisions = asyncio.run(run())
+
+    assert [decision.id for decision in decisions] == [i for i in requested if i != "missing"]
+
+
+def test_projected_results_are_not_validated():
+    docs = [precedent(i, 0.9) for i in range(3)]
+    db = FakeDatabase(docs)
+    client = db.client()
+
+    async def run():
+        try:
+            return await client.get_precedents("NDA", fields=["_id", "confidence"])
+        finally:
+            await client.aclose()
+
+    projected = asyncio.run(run())
+
+    assert projected == [{"_id": doc["_id"], "confidence": 0.9} for doc in docs]
+    assert db.queries[0]["fields"] == ["_id", "confidence"]
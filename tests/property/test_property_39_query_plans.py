@@ -0,0 +1,180 @@
+"""
+Property Test 39: Query Plans
+Feature: lex-conductor-performance
+
+For any filters, every Mango query CloudantClient issues should be served by
+an index of the declarative spec, reconciliation should create exactly the
+missing indexes, and query plan verification should fail loudly on a query
+that falls back to a full scan.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+from backend.cloudant_client import CloudantClient, CloudantPartitioning
+from backend.cloudant_indexes import (
+    INDEX_SPECS,
+    QUERY_SPECS,
+    QueryPlanError,
+    index_can_serve,
+    reconcile_indexes,
+    serving_indexes,
+    verify_query_plans,
+)
+from backend.models import ContractType, Jurisdiction
+
+CLOUDANT_ENV = {"CLOUDANT_URL": "https://test.cloudant.com", "CLOUDANT_API_KEY": "test_key"}
+
+contract_types = st.sampled_from([contract_type.value for contract_type in ContractType])
+jurisdictions = st.one_of(
+    st.none(), st.sampled_from([jurisdiction.value for jurisdiction in Jurisdiction])
+)
+
+
+def make_client(partitioned: bool = False) -> CloudantClient:
+    with patch.dict("os.environ", CLOUDANT_ENV), patch("backend.cloudant_client.CloudantV1"):
+        client = CloudantClient(max_retries=1, partitioning=CloudantPartitioning(partitioned))
+    client.client = Mock()
+    client.client.post_find.return_value.get_result.return_value = {"docs": []}
+    return client
+
+
+def assert_indexed(db: str, call):
+    selector = call.kwargs["selector"]
+    sort = call.kwargs.get("sort")
+    assert any(
+        index.db == db and index_can_serve(index.fields, selector, sort) for index in INDEX_SPECS
+    ), f"No index serves {selector} sorted by {sort}"
+
+
+@pytest.mark.parametrize("query", QUERY_SPECS, ids=lambda query: query.name)
+def test_every_query_has_a_serving_index(query):
+    """
+    Property: Each spec query is served by a spec index unless declared a scan
+    """
+    if query.allow_scan:
+        assert query.scan_reason
+    else:
+        assert serving_indexes(query), f"{query.name} would fall back to a full scan"
+
+
+@given(
+    contract_type=contract_types,
+    jurisdiction=jurisdictions,
+    min_confidence=st.floats(min_value=0.0, max_value=1.0),
+)
+@settings(max_examples=50, deadline=None)
+def test_issued_precedent_queries_are_indexed(contract_type, jurisdiction, min_confidence):
+    """
+    Property: Precedent queries the client issues match a spec index, sort included
+    """
+    client = make_client()
+
+    client.get_precedents(contract_type, jurisdiction, min_confidence)
+    list(client.iter_precedents(contract_type, jurisdiction, min_confidence))
+    list(client.iter_precedents(min_confidence=min_confidence))
+
+    for call in client.client.post_find.call_args_list:
+        assert_indexed("historical_decisions", call)
+
+
+@given(contract_type=contract_types, jurisdiction=jurisdictions, mandatory_only=st.booleans())
+@settings(max_examples=50, deadline=None)
+def test_issued_golden_clause_and_mapping_queries_are_indexed(
+    contract_type, jurisdiction, mandatory_only
+):
+    """
+    Property: Golden Clause and regulatory mapping queries with an indexable filter use an index
+    """
+    client = make_client()
+
+    client.query_golden_clauses(contract_type, jurisdiction, mandatory_only)
+    if jurisdiction or mandatory_only:
+        assert_indexed("golden_clauses", client.client.post_find.call_args)
+
+    client.get_regulatory_mappings(jurisdiction, "privacy")
+    assert_indexed("regulatory_mappings", client.client.post_find.call_args)
+
+
+class FakeIndexes:
+    """_index endpoint of several databases."""
+
+    def __init__(self, existing=None):
+        self.indexes = {db: list(indexes) for db, indexes in (existing or {}).items()}
+
+    def get_indexes_information(self, db):
+        return Mock(get_result=Mock(return_value={"indexes": self.indexes.get(db, [])}))
+
+    def post_index(self, db, index, ddoc, name, partitioned, type):
+        definition = {"fields": [{field: "asc"} for field in index["fields"]]}
+        self.indexes.setdefault(db, []).append(
+            {"ddoc": f"_design/{ddoc}", "name": name, "type": type, "def": definition}
+            | ({"partitioned": partitioned} if partitioned is not None else {})
+        )
+        return Mock(get_result=Mock(return_value={"result": "created"}))
+
+
+@given(partitioned=st.booleans(), existing=st.sets(st.sampled_from(INDEX_SPECS)))
+@settings(max_examples=30, deadline=None)
+def test_reconcile_creates_only_missing_indexes(partitioned, existing):
+    """
+    Property: Reconciliation creates each missing index once and is idempotent
+    """
+    client = make_client(partitioned)
+    names = {
+        "golden_clauses": client.db_golden_clauses,
+        "historical_decisions": client.db_historical_decisions,
+        "regulatory_mappings": client.db_regulatory_mappings,
+    }
+    fake = FakeIndexes()
+    for index in existing:
+        fake.post_index(names[index.db], {"fields": list(index.fields)}, "x", "x", None, "json")
+    client.client = fake
+
+    created = reconcile_indexes(client)
+
+    variants = 2 if partitioned else 1
+    expected = sum(
+        variants if partitioned and index.db != "regulatory_mappings" else 1
+        for index in INDEX_SPECS
+    )
+    # Indexes made by hand (global) are matched by fields, not by name
+    assert len(created) == expected - len(existing)
+    assert reconcile_indexes(client) == []
+
+
+def explain_with(scanning):
+    """post_explain answering with a full scan for the given selectors."""
+
+    def post_explain(db, selector, **kwargs):
+        index = {"ddoc": "_design/idx", "name": "idx", "type": "json"}
+        if selector in scanning:
+            index = {"ddoc": None, "name": "_all_docs", "type": "special"}
+        return Mock(get_result=Mock(return_value={"index": index}))
+
+    return post_explain
+
+
+def test_full_scan_fails_loudly_in_strict_mode():
+    client = make_client()
+    query = next(query for query in QUERY_SPECS if not query.allow_scan)
+    client.client.post_explain.side_effect = explain_with([query.selector])
+
+    with pytest.raises(QueryPlanError, match=query.name):
+        verify_query_plans(client, strict=True)
+
+    plans = verify_query_plans(client, strict=False)
+    assert plans[query.name]["full_scan"] is True
+
+
+def test_declared_scans_pass_verification():
+    client = make_client()
+    client.client.post_explain.side_effect = explain_with(
+        [query.selector for query in QUERY_SPECS if query.allow_scan]
+    )
+
+    plans = verify_query_plans(client, strict=True)
+
+    assert set(plans) == {query.name for query in QUERY_SPECS}
@@ -0,0 +1,205 @@
+"""
+Property Test 40: MapReduce Views
+Feature: lex-conductor-performance
+
+For any set of precedents, the statistics read from the reduced views should
+equal the statistics computed over the documents, and syncing the design
+documents should write them only when their views changed.
+"""
+
+import asyncio
+import json
+from collections import defaultdict
+from unittest.mock import Mock, patch
+
+import httpx
+from hypothesis import given, strategies as st, settings
+from ibm_cloud_sdk_core import ApiException
+
+from backend.async_cloudant_client import AsyncCloudantClient
+from backend.cloudant_client import CloudantClient
+from backend.cloudant_views import DESIGN_DOCUMENTS, key_range, summarize_stats
+from backend.resilience import CircuitBreaker
+
+CLOUDANT_ENV = {"CLOUDANT_URL": "https://test.cloudant.com", "CLOUDANT_API_KEY": "test_key"}
+
+precedents = st.lists(
+    st.fixed_dictionaries(
+        {
+            "contract_type": st.sampled_from(["NDA", "MSA", "SOW"]),
+            "jurisdiction": st.sampled_from(["US", "EU", "UK"]),
+            "clause_modified": st.sampled_from(["liability", "termination"]),
+            "confidence": st.floats(min_value=0.0, max_value=1.0),
+            "outcome": st.sampled_from([None, "accepted", "rejected"]),
+        }
+    ),
+    max_size=30,
+)
+
+
+def emit(doc):
+    """Python rendering of the historical_decisions map functions."""
+    accepted = 1 if doc["outcome"] in (None, "accepted") else 0
+    return {
+        "confidence_by_contract_type": (
+            [doc["contract_type"], doc["jurisdiction"]],
+            doc["confidence"],
+        ),
+        "decisions_by_jurisdiction": ([doc["jurisdiction"], doc["contract_type"]], None),
+        "modification_outcomes": ([doc["contract_type"], doc["clause_modified"]], accepted),
+    }
+
+
+class FakeViews:
+    """Grouped _stats/_count reduction of the views over in-memory documents."""
+
+    def __init__(self, docs):
+        self.docs = docs
+
+    def rows(self, view, group_level, start_key=None, end_key=None):
+        reducer = DESIGN_DOCUMENTS["historical_decisions"]["views"][view]["reduce"]
+        groups = defaultdict(list)
+        for doc in self.docs:
+            key, value = emit(doc)[view]
+            if start_key and key[: len(start_key)] != start_key:
+                continue
+            groups[tuple(key[:group_level])].append(value)
+
+        rows = []
+        for key, values in sorted(groups.items()):
+            if reducer == "_count":
+                value = len(values)
+            else:
+                value = {
+                    "sum": sum(values),
+                    "count": len(values),
+                    "min": min(values),
+                    "max": max(values),
+                    "sumsqr": sum(v * v for v in values),
+                }
+            rows.append({"key": list(key), "value": value})
+        return rows
+
+    def post_view(self, db, ddoc, view, group_level, **kwargs):
+        return Mock(get_result=Mock(return_value={"rows": self.rows(view, group_level, **kwargs)}))
+
+
+def make_client() -> CloudantClient:
+    with patch.dict("os.environ", CLOUDANT_ENV), patch("backend.cloudant_client.CloudantV1"):
+        client = CloudantClient(max_retries=1)
+    client.client = Mock()
+    return client
+
+
+class NoAuthenticator:
+    def authenticate(self, request):
+        pass
+
+
+@given(docs=precedents)
+@settings(max_examples=50, deadline=None)
+def test_view_statistics_match_documents(docs):
+    """
+    Property: Statistics read from the views equal those computed from the documents
+    """
+    client = make_client()
+    client.client.post_view.side_effect = FakeViews(docs).post_view
+
+    by_type = client.get_confidence_stats_by_contract_type()
+    counts = client.get_decision_counts_by_jurisdiction()
+    rates = client.get_modification_acceptance_rates("NDA")
+
+    for contract_type in {doc["contract_type"] for doc in docs}:
+        confidences = [d["confidence"] for d in docs if d["contract_type"] == contract_type]
+        assert by_type[contract_type]["count"] == len(confidences)
+        assert by_type[contract_type]["avg"] == round(sum(confidences) / len(confidences), 4)
+        assert by_type[contract_type]["max"] == max(confidences)
+
+    for jurisdiction in {doc["jurisdiction"] for doc in docs}:
+        assert counts[jurisdiction] == sum(d["jurisdiction"] == jurisdiction for d in docs)
+
+    nda = [doc for doc in docs if doc["contract_type"] == "NDA"]
+    assert set(rates) == {doc["clause_modified"] for doc in nda}
+    for clause, rate in rates.items():
+        decisions = [d for d in nda if d["clause_modified"] == clause]
+        accepted = sum(d["outcome"] != "rejected" for d in decisions)
+        assert rate["decisions"] == len(decisions)
+        assert rate["acceptance_rate"] == round(accepted / len(decisions), 4)
+
+
+@given(docs=precedents)
+@settings(max_examples=20, deadline=None)
+def test_async_view_queries_match_sync(docs):
+    """
+    Property: The async client reads the same statistics over HTTP
+    """
+    views = FakeViews(docs)
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append((request.url.path, body))
+        view = request.url.path.rsplit("/", 1)[-1]
+        rows = views.rows(view, body.get("group_level"), body.get("start_key"), body.get("end_key"))
+        return httpx.Response(200, json={"rows": rows})
+
+    client = AsyncCloudantClient(
+        url="https://test.cloudant.com",
+        authenticator=NoAuthenticator(),
+        transport=httpx.MockTransport(handler),
+        breaker=CircuitBreaker("test"),
+    )
+
+    async def run():
+        try:
+            return await client.get_confidence_stats_by_jurisdiction("MSA")
+        finally:
+            await client.aclose()
+
+    by_jurisdiction = asyncio.run(run())
+
+    sync_client = make_client()
+    sync_client.client.post_view.side_effect = views.post_view
+    assert by_jurisdiction == sync_client.get_confidence_stats_by_jurisdiction("MSA")
+
+    path, body = requests[0]
+    assert path == "/historical_decisions/_design/stats/_view/confidence_by_contract_type"
+    assert body == {"group_level": 2, **key_range(["MSA"])}
+
+
+class FakeDesignDocuments:
+    def __init__(self):
+        self.docs = {}
+        self.writes = 0
+
+    def get_design_document(self, db, ddoc):
+        if (db, ddoc) not in self.docs:
+            raise ApiException(404, message="not_found")
+        return Mock(get_result=Mock(return_value=self.docs[(db, ddoc)]))
+
+    def put_design_document(self, db, ddoc, design_document):
+        existing = self.docs.get((db, ddoc))
+        assert design_document.get("_rev") == (existing["_rev"] if existing else None)
+        self.writes += 1
+        self.docs[(db, ddoc)] = {**design_document, "_rev": f"{self.writes}-x"}
+        return Mock(get_result=Mock(return_value={"ok": True}))
+
+
+def test_design_documents_sync_only_when_changed():
+    client = make_client()
+    fake = FakeDesignDocuments()
+    client.client = fake
+
+    assert set(client.sync_design_documents()) == {"historical_decisions", "golden_clauses"}
+    assert client.sync_design_documents() == []
+
+    # A changed view definition is written over the current revision
+    fake.docs[("golden_clauses", "stats")]["views"] = {}
+    assert client.sync_design_documents() == ["golden_clauses"]
+    assert fake.writes == 3
+
+
+def test_summarize_stats_of_empty_group():
+    assert summarize_stats({}) == {"count": 0, "avg": 0.0, "min": None, "max": None}
+    assert key_range() == {}
+    assert key_range(["NDA"]) == {"start_key": ["NDA"], "end_key": ["NDA", {}]}
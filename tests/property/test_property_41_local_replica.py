@@ -0,0 +1,272 @@
+"""
+Property Test 41: Local Replica
+Feature: lex-conductor-performance
+
+For any sequence of writes and deletions in Cloudant, a replica synced from
+the _changes feed should answer queries like Cloudant does, and CloudantClient
+(and the async client the routers use) should serve reads of replicated
+databases locally, through Cloudant outages, while writing through to Cloudant.
+"""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import httpx
+from hypothesis import given, strategies as st, settings
+
+from backend.async_cloudant_client import AsyncCloudantClient
+from backend.cloudant_client import CloudantClient, CloudantPartitioning
+from backend.cloudant_replica import CloudantReplica, ReplicaDatabase, field
+from backend.models import HistoricalDecision
+from backend.query_coalescer import CloudantQueryCoalescer
+from backend.resilience import CircuitBreaker
+
+CLOUDANT_ENV = {"CLOUDANT_URL": "https://test.cloudant.com", "CLOUDANT_API_KEY": "test_key"}
+
+
+class FakeChanges:
+    """Cloudant database with a _changes feed (latest revision of each changed document)."""
+
+    def __init__(self):
+        self.docs = {}
+        self.seq = 0
+        self.changed = {}
+        self.generations = {}
+
+    def write(self, doc_id, body=None):
+        # Revision generations continue after a deletion, as in Cloudant
+        generation = self.generations[doc_id] = self.generations.get(doc_id, 0) + 1
+        self.seq += 1
+        if body is None:
+            doc = {"_id": doc_id, "_rev": f"{generation}-x", "_deleted": True}
+            self.docs.pop(doc_id, None)
+        else:
+            doc = {**body, "_id": doc_id, "_rev": f"{generation}-x"}
+            self.docs[doc_id] = doc
+        self.changed[doc_id] = (self.seq, doc)
+
+    def get_changes(self, db_name, since="0", limit=None):
+        changes = sorted(
+            (seq, doc) for seq, doc in self.changed.values() if seq > int(since.split("-")[0])
+        )[:limit]
+        results = [
+            {"id": doc["_id"], "seq": f"{seq}-g", "changes": [{"rev": doc["_rev"]}], "doc": doc}
+            | ({"deleted": True} if doc.get("_deleted") else {})
+            for seq, doc in changes
+        ]
+        last_seq = results[-1]["seq"] if results else since
+        return {"results": results, "last_seq": last_seq}
+
+
+def make_client(**kwargs) -> CloudantClient:
+    with patch.dict("os.environ", CLOUDANT_ENV), patch("backend.cloudant_client.CloudantV1"):
+        client = CloudantClient(max_retries=1, partitioning=CloudantPartitioning(False), **kwargs)
+    client.client = Mock()
+    return client
+
+
+precedent_bodies = st.fixed_dictionaries(
+    {
+        "contract_type": st.sampled_from(["NDA", "MSA"]),
+        "jurisdiction": st.sampled_from(["US", "EU"]),
+        "confidence": st.floats(min_value=0.0, max_value=1.0),
+    }
+)
+operations = st.lists(
+    st.tuples(st.sampled_from([f"doc-{i}" for i in range(8)]), st.none() | precedent_bodies),
+    max_size=40,
+)
+
+
+@given(
+    batches=st.lists(operations, min_size=1, max_size=4),
+    batch_size=st.integers(min_value=1, max_value=10),
+    min_confidence=st.floats(min_value=0.0, max_value=1.0),
+)
+@settings(max_examples=50, deadline=None)
+def test_replica_matches_cloudant_after_sync(batches, batch_size, min_confidence):
+    """
+    Property: After each sync the replica holds Cloudant's documents and queries match
+    """
+    cloudant = FakeChanges()
+    replica = ReplicaDatabase("historical_decisions", ":memory:", [("contract_type", "confidence")])
+
+    for batch in batches:
+        for doc_id, body in batch:
+            cloudant.write(doc_id, body)
+        replica.sync(cloudant, batch_size)
+
+        assert replica.ready
+        assert replica.get_documents(list(cloudant.docs)) == cloudant.docs
+        assert replica.count() == len(cloudant.docs)
+
+        expected = sorted(
+            (
+                doc
+                for doc in cloudant.docs.values()
+                if doc["contract_type"] == "NDA" and doc["confidence"] >= min_confidence
+            ),
+            key=lambda doc: (-doc["confidence"], doc["_id"]),
+        )
+        assert replica.precedents("NDA", min_confidence=min_confidence) == expected
+
+
+def test_older_revisions_do_not_overwrite_newer():
+    replica = ReplicaDatabase("historical_decisions", ":memory:")
+    replica.put({"_id": "a", "_rev": "2-b", "confidence": 0.9})
+
+    replica.apply_changes(
+        [{"id": "a", "changes": [{"rev": "1-a"}], "doc": {"_id": "a", "_rev": "1-a"}}], "1"
+    )
+    assert replica.get_documents(["a"])["a"]["_rev"] == "2-b"
+
+    replica.apply_changes([{"id": "a", "changes": [{"rev": "1-a"}], "deleted": True}], "2")
+    assert replica.count() == 1
+
+
+def test_queries_use_json1_indexes():
+    replica = CloudantReplica({"historical_decisions": "historical_decisions"}, ":memory:")
+    local = replica.get("historical_decisions")
+
+    plan = local._conn.execute(
+        f"EXPLAIN QUERY PLAN SELECT body FROM docs WHERE {field('contract_type')} = ? "
+        f"AND {field('confidence')} >= ?",
+        ("NDA", 0.5),
+    ).fetchall()
+
+    assert "USING INDEX idx_contract_type" in str(plan)
+
+
+def golden_clause(clause_id, contract_types, jurisdiction="US", mandatory=False):
+    return {
+        "clause_id": clause_id,
+        "type": "confidentiality",
+        "contract_types": contract_types,
+        "text": "text",
+        "jurisdiction": jurisdiction,
+        "mandatory": mandatory,
+        "risk_level": "low",
+        "last_reviewed": "2025-01-01",
+        "approved_by": "legal",
+    }
+
+
+def test_client_serves_replicated_reads_through_cloudant_outage():
+    cloudant = FakeChanges()
+    cloudant.write("gc-1", golden_clause("GC-1", ["NDA"], mandatory=True))
+    cloudant.write("gc-2", golden_clause("GC-2", ["NDA", "MSA"], "EU"))
+    cloudant.write("gc-3", golden_clause("GC-3", ["MSA"]))
+
+    replica = CloudantReplica({"golden_clauses": "golden_clauses"}, ":memory:")
+    client = make_client(replica=replica)
+
+    # Not synced yet: reads go to Cloudant
+    client.client.post_find.return_value.get_result.return_value = {"docs": []}
+    assert client.query_golden_clauses("NDA") == []
+
+    replica.sync(cloudant)
+    client.client.post_find.reset_mock()
+    client.client.post_find.side_effect = ConnectionError("Cloudant unreachable")
+
+    assert [c.clause_id for c in client.query_golden_clauses("NDA")] == ["GC-1", "GC-2"]
+    assert [c.clause_id for c in client.query_golden_clauses("NDA", "EU")] == ["GC-2"]
+    assert [c.clause_id for c in client.query_golden_clauses("NDA", mandatory_only=True)] == [
+        "GC-1"
+    ]
+    assert client.query_golden_clauses("MSA", fields=["clause_id"]) == [
+        {"clause_id": "GC-2"},
+        {"clause_id": "GC-3"},
+    ]
+    assert client.get_document_by_id("golden_clauses", "gc-3")["clause_id"] == "GC-3"
+    client.client.post_find.assert_not_called()
+
+
+class NoAuthenticator:
+    def authenticate(self, request):
+        pass
+
+
+def test_async_client_serves_replicated_reads_through_cloudant_outage():
+    cloudant = FakeChanges()
+    cloudant.write("gc-1", golden_clause("GC-1", ["NDA"], mandatory=True))
+    cloudant.write("gc-2", golden_clause("GC-2", ["MSA"]))
+    for doc_id, confidence in [("p-1", 0.6), ("p-2", 0.9), ("p-3", 0.3)]:
+        cloudant.write(
+            doc_id, {"contract_type": "NDA", "jurisdiction": "US", "confidence": confidence}
+        )
+    replica = CloudantReplica(
+        {"golden_clauses": "golden_clauses", "historical_decisions": "historical_decisions"},
+        ":memory:",
+    )
+    replica.sync(cloudant)
+    requests = []
+
+    def unreachable(request):
+        requests.append(request)
+        raise httpx.ConnectError("Cloudant unreachable")
+
+    async def run():
+        client = AsyncCloudantClient(
+            url="https://test.cloudant.com",
+            max_retries=1,
+            authenticator=NoAuthenticator(),
+            transport=httpx.MockTransport(unreachable),
+            breaker=CircuitBreaker("test"),
+            partitioning=CloudantPartitioning(False),
+            replica=replica,
+        )
+        # The routers' lookups go through the coalescer
+        lookups = CloudantQueryCoalescer(client, window_ms=0)
+        try:
+            clauses = await lookups.query_golden_clauses("NDA")
+            candidates = await lookups.get_precedents("NDA", "US", limit=2, fields=["_id"])
+            docs = await client.get_documents_by_ids("historical_decisions", ["p-3"])
+            return clauses, candidates, docs
+        finally:
+            await client.aclose()
+
+    clauses, candidates, docs = asyncio.run(run())
+
+    assert [clause.clause_id for clause in clauses] == ["GC-1"]
+    assert candidates == [{"_id": "p-2"}, {"_id": "p-1"}]
+    assert docs["p-3"]["confidence"] == 0.3
+    assert requests == []
+
+
+def test_writes_go_through_to_cloudant_and_replica():
+    replica = CloudantReplica({"historical_decisions": "historical_decisions"}, ":memory:")
+    replica.sync(FakeChanges())
+    client = make_client(replica=replica)
+    client.client.post_document.return_value.get_result.return_value = {"id": "p-1", "rev": "1-a"}
+    client.client.post_bulk_docs.return_value.get_result.return_value = [
+        {"id": "p-2", "rev": "1-b", "ok": True},
+        {"id": "p-3", "error": "conflict", "reason": "Document update conflict."},
+    ]
+    decision = dict(
+        decision_id="DEC-1",
+        contract_type="NDA",
+        contract_id="C-1",
+        clause_modified="liability",
+        original_text="original",
+        modified_text="modified",
+        rationale="rationale",
+        approved_by="legal",
+        date="2025-01-01",
+        jurisdiction="US",
+        confidence=0.8,
+    )
+
+    client.store_precedent(HistoricalDecision(**decision))
+    client.bulk_store_documents(
+        "historical_decisions",
+        [{**decision, "_id": "p-2", "decision_id": "DEC-2"}, {**decision, "_id": "p-3"}],
+    )
+
+    client.client.post_document.assert_called_once()
+    local = replica.get("historical_decisions")
+    assert set(local.get_documents(["p-1", "p-2", "p-3"])) == {"p-1", "p-2"}
+    assert [d.decision_id for d in client.get_precedents_by_ids(["p-2", "p-1"])] == [
+        "DEC-2",
+        "DEC-1",
+    ]
+    client.client.post_find.assert_not_called()
@@ -0,0 +1,133 @@
+"""
+Property Test 42: Multi-Document Fetch
+Feature: lex-conductor-performance
+
+For any set of document IDs, get_documents_by_ids should resolve them with
+_all_docs in requests of at most chunk_size keys, returning every requested ID
+once, in order, with missing and deleted documents marked as None.
+"""
+
+import asyncio
+import json
+import math
+from unittest.mock import Mock, patch
+
+import httpx
+from hypothesis import given, strategies as st, settings
+
+from backend.async_cloudant_client import AsyncCloudantClient
+from backend.cloudant_client import CloudantClient
+from backend.cloudant_replica import CloudantReplica
+from backend.resilience import CircuitBreaker
+
+CLOUDANT_ENV = {"CLOUDANT_URL": "https://test.cloudant.com", "CLOUDANT_API_KEY": "test_key"}
+
+STORED = {f"doc-{i}": {"_id": f"doc-{i}", "_rev": "1-a", "value": i} for i in range(10)}
+DELETED = {"deleted-1", "deleted-2"}
+
+
+def all_docs_rows(keys):
+    """_all_docs rows for keys: documents, deleted tombstones and not_found errors."""
+    rows = []
+    for key in keys:
+        if key in STORED:
+            rows.append({"id": key, "key": key, "value": {"rev": "1-a"}, "doc": STORED[key]})
+        elif key in DELETED:
+            rows.append(
+                {"id": key, "key": key, "value": {"rev": "2-b", "deleted": True}, "doc": None}
+            )
+        else:
+            rows.append({"key": key, "error": "not_found"})
+    return rows
+
+
+def expected_documents(doc_ids):
+    return {doc_id: STORED.get(doc_id) for doc_id in dict.fromkeys(doc_ids)}
+
+
+class NoAuthenticator:
+    def authenticate(self, request):
+        pass
+
+
+def make_client(**kwargs) -> CloudantClient:
+    with patch.dict("os.environ", CLOUDANT_ENV), patch("backend.cloudant_client.CloudantV1"):
+        client = CloudantClient(max_retries=1, **kwargs)
+    client.client = Mock()
+    client.client.post_all_docs.side_effect = lambda db, keys, include_docs: Mock(
+        get_result=Mock(return_value={"rows": all_docs_rows(keys)})
+    )
+    return client
+
+
+document_ids = st.lists(
+    st.sampled_from(sorted(STORED) + sorted(DELETED) + ["missing-1", "missing-2"]), max_size=30
+)
+
+
+@given(doc_ids=document_ids, chunk_size=st.integers(min_value=1, max_value=8))
+@settings(max_examples=100, deadline=None)
+def test_documents_fetched_in_chunks(doc_ids, chunk_size):
+    """
+    Property: Every ID resolves once, in order, with at most chunk_size keys per request
+    """
+    client = make_client()
+
+    documents = client.get_documents_by_ids("db", doc_ids, chunk_size=chunk_size)
+
+    assert documents == expected_documents(doc_ids)
+    assert list(documents) == list(dict.fromkeys(doc_ids))
+
+    calls = client.client.post_all_docs.call_args_list
+    assert len(calls) == math.ceil(len(documents) / chunk_size)
+    for call in calls:
+        assert call.kwargs["include_docs"] is True
+        assert 0 < len(call.kwargs["keys"]) <= chunk_size
+
+
+@given(doc_ids=document_ids, chunk_size=st.integers(min_value=1, max_value=8))
+@settings(max_examples=50, deadline=None)
+def test_async_documents_fetched_in_chunks(doc_ids, chunk_size):
+    """
+    Property: The async client resolves the same documents over concurrent _all_docs requests
+    """
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append(body)
+        assert request.url.path == "/db/_all_docs"
+        return httpx.Response(200, json={"rows": all_docs_rows(body["keys"])})
+
+    client = AsyncCloudantClient(
+        url="https://test.cloudant.com",
+        authenticator=NoAuthenticator(),
+        transport=httpx.MockTransport(handler),
+        breaker=CircuitBreaker("test"),
+    )
+
+    async def run():
+        try:
+            return await client.get_documents_by_ids("db", doc_ids, chunk_size=chunk_size)
+        finally:
+            await client.aclose()
+
+    documents = asyncio.run(run())
+
+    assert documents == expected_documents(doc_ids)
+    assert list(documents) == list(dict.fromkeys(doc_ids))
+    assert len(requests) == math.ceil(len(documents) / chunk_size)
+    assert all(body["include_docs"] and len(body["keys"]) <= chunk_size for body in requests)
+
+
+def test_replica_held_documents_are_not_fetched():
+    replica = CloudantReplica({"golden_clauses": "golden_clauses"}, ":memory:")
+    replica.sync(Mock(get_changes=Mock(return_value={"results": [], "last_seq": "1"})))
+    replica.get("golden_clauses").put(STORED["doc-1"])
+    client = make_client(replica=replica)
+
+    documents = client.get_documents_by_ids("golden_clauses", ["doc-1", "doc-2", "missing-1"])
+
+    assert documents == expected_documents(["doc-1", "doc-2", "missing-1"])
+    client.client.post_all_docs.assert_called_once()
+    assert client.client.post_all_docs.call_args.kwargs["keys"] == ["doc-2", "missing-1"]
@@ -0,0 +1,223 @@
+"""
+Property Test 43: Shared IAM Tokens
+Feature: lex-conductor-performance
+
+For any number of concurrent callers, a token provider should request one IAM
+token, serve it from its cache until the refresh point, and refresh it there
+without callers waiting on IAM; clients using the same API key should share it.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import httpx
+from hypothesis import given, strategies as st, settings
+
+from backend.async_cloudant_client import AsyncCloudantClient
+from backend.iam_tokens import (
+    IAMTokenProvider,
+    SharedCOSTokenManager,
+    SharedIAMAuthenticator,
+    get_iam_token_provider,
+    stop_iam_token_providers,
+)
+from backend.resilience import CircuitBreaker
+
+
+class FakeIAM:
+    """IAM token endpoint issuing numbered tokens."""
+
+    def __init__(self, expires_in=3600, delay=0.0):
+        self.expires_in = expires_in
+        self.delay = delay
+        self.requests = 0
+
+    def request_token(self):
+        self.requests += 1
+        time.sleep(self.delay)
+        return {"access_token": f"token-{self.requests}", "expires_in": self.expires_in}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_provider(iam, clock=time.time, refresh_fraction=0.8):
+    return IAMTokenProvider(
+        "api-key",
+        token_manager=iam,
+        refresh_fraction=refresh_fraction,
+        background_refresh=False,
+        clock=clock,
+    )
+
+
+@given(callers=st.integers(min_value=1, max_value=16))
+@settings(max_examples=20, deadline=None)
+def test_concurrent_callers_share_one_token_request(callers):
+    """
+    Property: Concurrent callers without a token trigger a single IAM request
+    """
+    iam = FakeIAM(delay=0.01)
+    provider = make_provider(iam)
+    barrier = threading.Barrier(callers)
+    tokens = []
+
+    def call():
+        barrier.wait()
+        tokens.append(provider.get_token())
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert iam.requests == 1
+    assert tokens == ["token-1"] * callers
+
+
+@given(
+    expires_in=st.integers(min_value=60, max_value=7200),
+    refresh_fraction=st.floats(min_value=0.1, max_value=0.9),
+    elapsed=st.floats(min_value=0.0, max_value=1.0),
+)
+@settings(max_examples=100, deadline=None)
+def test_token_refreshed_at_fraction_of_lifetime(expires_in, refresh_fraction, elapsed):
+    """
+    Property: The token is reused until the refresh point and valid until expiry
+    """
+    iam = FakeIAM(expires_in=expires_in)
+    clock = FakeClock()
+    provider = make_provider(iam, clock, refresh_fraction)
+    provider.refresh()
+
+    clock.now += expires_in * elapsed
+    due = clock.now >= 1000.0 + expires_in * refresh_fraction
+
+    # Callers never fetch while the token is valid
+    if clock.now < provider._expires_at:
+        assert provider.get_token() == "token-1"
+        assert provider.request_path_fetches == 0
+
+    # The background refresh requests a new token only once due
+    assert provider.refresh() == ("token-2" if due else "token-1")
+    assert iam.requests == (2 if due else 1)
+
+
+def test_expired_token_fetched_on_request_path():
+    iam = FakeIAM(expires_in=100)
+    clock = FakeClock()
+    provider = make_provider(iam, clock)
+    provider.refresh()
+
+    clock.now += 100
+    assert provider.cached_token() is None
+    assert provider.get_token() == "token-2"
+    assert provider.request_path_fetches == 1
+
+
+def test_background_refresh_keeps_requests_off_iam():
+    iam = FakeIAM(expires_in=2)
+    provider = IAMTokenProvider("api-key", token_manager=iam, refresh_fraction=0.05)
+    try:
+        provider.get_token()
+        deadline = time.time() + 5
+        while iam.requests < 3 and time.time() < deadline:
+            time.sleep(0.05)
+        assert provider.get_stats()["refresh_running"]
+        assert iam.requests >= 3
+    finally:
+        provider.stop(timeout=5.0)
+
+    assert provider.request_path_fetches == 1
+    assert not provider.get_stats()["refresh_running"]
+
+
+def test_adapters_sign_with_shared_token():
+    provider = make_provider(FakeIAM())
+    request = {"headers": {}}
+
+    SharedIAMAuthenticator(provider).authenticate(request)
+
+    assert request["headers"]["Authorization"] == "Bearer token-1"
+    assert SharedCOSTokenManager(provider).get_token() == "token-1"
+
+
+def test_clients_of_one_api_key_share_provider():
+    try:
+        provider = get_iam_token_provider("shared-key")
+        assert get_iam_token_provider("shared-key") is provider
+        assert get_iam_token_provider("other-key") is not provider
+
+        provider.token_manager = FakeIAM()
+        provider.background_refresh = False
+        provider.refresh()
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.headers["Authorization"])
+            return httpx.Response(200, json={"db_name": "db"})
+
+        with patch.dict("os.environ", {"CLOUDANT_URL": "https://test.cloudant.com"}):
+            clients = [
+                AsyncCloudantClient(
+                    api_key="shared-key",
+                    transport=httpx.MockTransport(handler),
+                    breaker=CircuitBreaker("test"),
+                )
+                for _ in range(2)
+            ]
+
+        async def run():
+            try:
+                for client in clients:
+                    await client.get_database_info("db")
+            finally:
+                for client in clients:
+                    await client.aclose()
+
+        asyncio.run(run())
+
+        assert requests == ["Bearer token-1", "Bearer token-1"]
+        assert provider.token_manager.requests == 1
+    finally:
+        stop_iam_token_providers()
+
+
+def test_watsonx_backend_takes_current_token_before_each_call():
+    from backend.watsonx_client import WatsonxBackend
+
+    try:
+        clock = FakeClock()
+        provider = get_iam_token_provider("watsonx-key")
+        provider.token_manager = FakeIAM(expires_in=100)
+        provider.background_refresh = False
+        provider.clock = clock
+        provider.refresh()
+
+        with patch("backend.watsonx_client.APIClient"), patch(
+            "backend.watsonx_client.ModelInference"
+        ):
+            backend = WatsonxBackend("watsonx-key", "project", "https://test")
+            backend.get_model("model")
+            backend.api_client.set_token.assert_not_called()
+
+            # Expired without a background refresh: fetched before the call
+            clock.now += 100
+            backend.get_model("model")
+            backend.api_client.set_token.assert_called_once_with("token-2")
+
+            # Without a warm token, the SDK keeps signing with the API key
+            # (both backends share the mocked SDK client)
+            unwarmed = WatsonxBackend("other-watsonx-key", "project", "https://test")
+            unwarmed.get_model("model")
+            assert unwarmed.api_client.set_token.call_count == 1
+    finally:
+        stop_iam_token_providers()
@@ -0,0 +1,324 @@
+"""
+Property Test 44: Query Coalescing
+Feature: lex-conductor-performance
+
+For any set of concurrent Golden Clause and precedent lookups, the coalescer
+should return each caller the documents its own query would have returned,
+while sending one Cloudant query per group of compatible lookups, however many
+callers repeat them.
+"""
+
+import asyncio
+import json
+
+import httpx
+from hypothesis import given, strategies as st, settings
+
+from backend.async_cloudant_client import AsyncCloudantClient
+from backend.cloudant_client import CloudantPartitioning, PRECEDENT_SCORING_FIELDS
+from backend.query_coalescer import CloudantQueryCoalescer, get_query_coalescer
+from backend.resilience import CircuitBreaker
+
+CONTRACT_TYPES = ["NDA", "MSA", "SOW"]
+JURISDICTIONS = ["US", "EU", "UK"]
+
+
+def matches(value, condition):
+    """Evaluate the Mango operators used by the clients."""
+    if not isinstance(condition, dict):
+        return value == condition
+    for operator, operand in condition.items():
+        if operator == "$eq" and value != operand:
+            return False
+        if operator == "$in" and value not in operand:
+            return False
+        if operator == "$gte" and (value is None or value < operand):
+            return False
+        if operator == "$elemMatch" and not any(matches(v, operand) for v in value or []):
+            return False
+    return True
+
+
+class FakeCloudant:
+    """_find over in-memory documents, with sort, projection and bookmarks."""
+
+    def __init__(self, databases):
+        self.databases = databases
+        self.queries = []
+        self.returned = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        db = request.url.path.split("/")[1]
+        query = json.loads(request.content)
+        self.queries.append(query)
+
+        docs = [
+            doc
+            for doc in self.databases[db]
+            if all(matches(doc.get(name), cond) for name, cond in query["selector"].items())
+        ]
+        for entry in reversed(query.get("sort", [])):
+            ((name, direction),) = entry.items()
+            docs.sort(key=lambda doc: doc[name], reverse=direction == "desc")
+
+        start = int(query.get("bookmark", 0))
+        page = docs[start : start + query["limit"]]
+        if query.get("fields"):
+            page = [{k: doc[k] for k in query["fields"] if k in doc} for doc in page]
+        self.returned += len(page)
+        return httpx.Response(200, json={"docs": page, "bookmark": str(start + len(page))})
+
+
+def make_client(fake) -> AsyncCloudantClient:
+    class NoAuthenticator:
+        def authenticate(self, request):
+            pass
+
+    return AsyncCloudantClient(
+        url="https://test.cloudant.com",
+        authenticator=NoAuthenticator(),
+        transport=httpx.MockTransport(fake.handler),
+        breaker=CircuitBreaker("test"),
+        partitioning=CloudantPartitioning(False),
+    )
+
+
+@st.composite
+def databases(draw):
+    # Distinct confidences: the order of precedents is fully determined
+    confidences = draw(
+        st.lists(st.integers(min_value=0, max_value=1000), unique=True, min_size=0, max_size=30)
+    )
+    precedents = [
+        {
+            "_id": f"p-{i}",
+            "decision_id": f"DEC-{i}",
+            "contract_type": draw(st.sampled_from(CONTRACT_TYPES)),
+            "contract_id": "C-1",
+            "clause_modified": "liability",
+            "original_text": "original",
+            "modified_text": "modified",
+            "rationale": "rationale",
+            "approved_by": "legal",
+            "date": "2025-01-01",
+            "jurisdiction": draw(st.sampled_from(JURISDICTIONS)),
+            "confidence": confidence / 1000,
+        }
+        for i, confidence in enumerate(confidences)
+    ]
+    golden_clauses = [
+        {
+            "_id": f"gc-{i}",
+            "clause_id": f"GC-{i}",
+            "type": "confidentiality",
+            "contract_types": draw(
+                st.lists(st.sampled_from(CONTRACT_TYPES), min_size=1, max_size=3, unique=True)
+            ),
+            "text": "text",
+            "jurisdiction": draw(st.sampled_from(JURISDICTIONS)),
+            "mandatory": draw(st.booleans()),
+            "risk_level": "low",
+            "last_reviewed": "2025-01-01",
+            "approved_by": "legal",
+        }
+        for i in range(draw(st.integers(min_value=0, max_value=15)))
+    ]
+    return {"historical_decisions": precedents, "golden_clauses": golden_clauses}
+
+
+precedent_lookups = st.tuples(
+    st.just("precedents"),
+    st.sampled_from(CONTRACT_TYPES),
+    st.none() | st.sampled_from(JURISDICTIONS),
+    st.sampled_from([0.0, 0.5]),
+    st.integers(min_value=1, max_value=8),
+    st.booleans(),
+)
+golden_clause_lookups = st.tuples(
+    st.just("golden_clauses"),
+    st.sampled_from(CONTRACT_TYPES),
+    st.none() | st.sampled_from(JURISDICTIONS),
+    st.booleans(),
+    st.integers(min_value=1, max_value=8),
+    st.just(False),
+)
+
+
+def lookup(source, kind, contract_type, jurisdiction, option, limit, projected):
+    if kind == "precedents":
+        fields = PRECEDENT_SCORING_FIELDS if projected else None
+        return source.get_precedents(contract_type, jurisdiction, option, limit, fields)
+    return source.query_golden_clauses(contract_type, jurisdiction, option, limit)
+
+
+def ids(results):
+    return [r["_id"] if isinstance(r, dict) else r.id for r in results]
+
+
+@given(
+    data=databases(),
+    lookups=st.lists(precedent_lookups | golden_clause_lookups, min_size=1, max_size=12),
+    window_ms=st.sampled_from([0, 1]),
+)
+@settings(max_examples=60, deadline=None)
+def test_coalesced_results_match_direct_queries(data, lookups, window_ms):
+    """
+    Property: Every caller gets its own query's documents, in the same order
+    """
+    fake = FakeCloudant(data)
+    client = make_client(fake)
+    coalescer = CloudantQueryCoalescer(client, window_ms=window_ms)
+
+    async def run():
+        try:
+            coalesced = await asyncio.gather(*(lookup(coalescer, *args) for args in lookups))
+            direct = [await lookup(client, *args) for args in lookups]
+            return coalesced, direct
+        finally:
+            await client.aclose()
+
+    coalesced, direct = asyncio.run(run())
+
+    for args, got, expected in zip(lookups, coalesced, direct):
+        # Golden Clause queries are unsorted: compare as sets
+        if args[0] == "golden_clauses":
+            assert sorted(ids(got)) == sorted(ids(expected))
+        else:
+            assert ids(got) == ids(expected)
+            assert got == expected
+
+
+@given(
+    data=databases(),
+    lookups=st.lists(precedent_lookups, min_size=1, max_size=6, unique=True),
+    repeats=st.integers(min_value=1, max_value=10),
+)
+@settings(max_examples=40, deadline=None)
+def test_query_count_grows_with_distinct_lookups(data, lookups, repeats):
+    """
+    Property: Repeating the lookups adds callers but not Cloudant queries
+    """
+    queries = []
+    for times in (1, repeats):
+        fake = FakeCloudant(data)
+        client = make_client(fake)
+        coalescer = CloudantQueryCoalescer(client, window_ms=0)
+
+        async def run():
+            try:
+                return await asyncio.gather(*(lookup(coalescer, *args) for args in lookups * times))
+            finally:
+                await client.aclose()
+
+        results = asyncio.run(run())
+        assert results == results[: len(lookups)] * times
+        assert coalescer.deduplicated == len(lookups) * (times - 1)
+        # One query per projection group of precedents, besides lookups the
+        # bounded merged read left short
+        assert coalescer.queries - coalescer.split_lookups == len({args[5] for args in lookups})
+        queries.append(len(fake.queries))
+
+    assert queries[0] == queries[1]
+
+
+def test_merged_query_uses_in_over_contract_types_and_jurisdictions():
+    fake = FakeCloudant({"historical_decisions": [], "golden_clauses": []})
+    client = make_client(fake)
+    coalescer = CloudantQueryCoalescer(client, window_ms=0)
+
+    async def run():
+        try:
+            await asyncio.gather(
+                coalescer.get_precedents("NDA", "US", 0.5, limit=5),
+                coalescer.get_precedents("MSA", "EU", 0.2, limit=3),
+            )
+        finally:
+            await client.aclose()
+
+    asyncio.run(run())
+
+    (query,) = fake.queries
+    assert query["selector"] == {
+        "confidence": {"$gte": 0.2},
+        "contract_type": {"$in": ["MSA", "NDA"]},
+        "jurisdiction": {"$in": ["EU", "US"]},
+    }
+    assert query["sort"] == [{"confidence": "desc"}]
+    assert coalescer.merged_queries == 1
+
+
+def test_merged_read_is_bounded_when_a_lookup_is_rare():
+    precedent = {
+        "contract_id": "C-1",
+        "clause_modified": "liability",
+        "original_text": "original",
+        "modified_text": "modified",
+        "rationale": "rationale",
+        "approved_by": "legal",
+        "date": "2025-01-01",
+    }
+    precedents = [
+        {
+            **precedent,
+            "_id": f"p-{i}",
+            "decision_id": f"DEC-{i}",
+            "contract_type": "NDA" if i % 500 else "MSA",
+            "jurisdiction": "US",
+            "confidence": 1 - i / 10000,
+        }
+        for i in range(2000)
+    ]
+    fake = FakeCloudant({"historical_decisions": precedents, "golden_clauses": []})
+    client = make_client(fake)
+    coalescer = CloudantQueryCoalescer(client, window_ms=0)
+
+    async def run():
+        try:
+            merged = await asyncio.gather(
+                coalescer.get_precedents("NDA", "US", limit=5),
+                coalescer.get_precedents("MSA", "US", limit=10),
+            )
+            direct = [
+                await client.get_precedents("NDA", "US", limit=5),
+                await client.get_precedents("MSA", "US", limit=10),
+            ]
+            return merged, direct
+        finally:
+            await client.aclose()
+
+    merged, direct = asyncio.run(run())
+
+    assert merged == direct
+    assert [len(results) for results in merged] == [5, 4]
+    # 15 documents read by the merged query, then the rare lookup on its own
+    assert coalescer.split_lookups == 1
+    assert fake.returned == 15 + 4 + 5 + 4
+
+
+def test_failures_reach_every_caller(monkeypatch):
+    fake = FakeCloudant({"historical_decisions": [], "golden_clauses": []})
+    client = make_client(fake)
+    client.retry_policy.max_retries = 1
+
+    async def unavailable(*args, **kwargs):
+        raise ValueError("Cloudant unavailable")
+
+    monkeypatch.setattr(client, "_request", unavailable)
+    coalescer = get_query_coalescer(client)
+    assert get_query_coalescer(client) is coalescer
+
+    async def run():
+        try:
+            return await asyncio.gather(
+                coalescer.get_precedents("NDA", "US"),
+                coalescer.get_precedents("MSA"),
+                return_exceptions=True,
+            )
+        finally:
+            await client.aclose()
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, Exception) for result in results)
+
+    monkeypatch.setenv("CLOUDANT_COALESCE_ENABLED", "false")
+    assert get_query_coalescer(client) is None
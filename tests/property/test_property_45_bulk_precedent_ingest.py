@@ -0,0 +1,295 @@
+"""
+Property Test 45: Bulk Precedent Ingestion
+Feature: lex-conductor-performance
+
+For any NDJSON stream of historical decisions, however its bytes are split,
+the bulk import should report every record once, store exactly the valid
+ones through _bulk_docs chunks of bounded size, keep a bounded number of
+records between reading and reporting them, and report conflicts on re-runs.
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from hypothesis import given, strategies as st, settings
+
+from backend.async_cloudant_client import AsyncCloudantClient
+from backend.cloudant_client import CloudantPartitioning
+from backend.precedent_ingest import ingest_precedents, iter_ndjson_lines
+from backend.resilience import CircuitBreaker
+from backend.routers import memory
+
+
+def decision(i, **overrides):
+    return {
+        "decision_id": f"DEC-{i}",
+        "contract_type": "NDA",
+        "contract_id": f"C-{i}",
+        "clause_modified": "liability",
+        "original_text": "original",
+        "modified_text": "modified",
+        "rationale": "rationale",
+        "approved_by": "legal",
+        "date": "2025-01-01",
+        "jurisdiction": "US",
+        "confidence": 0.8,
+        **overrides,
+    }
+
+
+class FakeBulkDocs:
+    """_bulk_docs of one database: conflicts on existing IDs, like Cloudant."""
+
+    def __init__(self):
+        self.docs = {}
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/historical_decisions/_bulk_docs"
+        documents = json.loads(request.content)["docs"]
+        self.requests.append(documents)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+
+        results = []
+        for doc in documents:
+            if doc["_id"] in self.docs:
+                results.append(
+                    {"id": doc["_id"], "error": "conflict", "reason": "Document update conflict."}
+                )
+            else:
+                self.docs[doc["_id"]] = doc
+                results.append({"id": doc["_id"], "rev": "1-a", "ok": True})
+        return httpx.Response(201, json=results)
+
+
+def make_client(fake) -> AsyncCloudantClient:
+    class NoAuthenticator:
+        def authenticate(self, request):
+            pass
+
+    return AsyncCloudantClient(
+        url="https://test.cloudant.com",
+        authenticator=NoAuthenticator(),
+        transport=httpx.MockTransport(fake.handler),
+        breaker=CircuitBreaker("test"),
+        partitioning=CloudantPartitioning(False),
+    )
+
+
+def split(data: bytes, cuts):
+    """Split bytes at the given offsets."""
+    offsets = sorted({cut % (len(data) + 1) for cut in cuts})
+    return [data[a:b] for a, b in zip([0] + offsets, offsets + [len(data)])]
+
+
+async def stream(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+record_kinds = st.lists(
+    st.sampled_from(["valid", "valid", "valid", "invalid", "not_json", "blank", "oversized"]),
+    max_size=40,
+)
+
+
+def render(kinds):
+    """NDJSON lines for record kinds, with the expected outcome of each non-blank line."""
+    lines, expected = [], {}
+    for i, kind in enumerate(kinds):
+        if kind == "valid":
+            lines.append(json.dumps(decision(i)))
+            expected[i + 1] = f"DEC-{i}"
+        elif kind == "invalid":
+            lines.append(json.dumps(decision(i, confidence=2.0)))
+            expected[i + 1] = None
+        elif kind == "not_json":
+            lines.append("{not json")
+            expected[i + 1] = None
+        elif kind == "oversized":
+            lines.append(json.dumps(decision(i, rationale="x" * 2000)))
+            expected[i + 1] = None
+        else:
+            lines.append("   ")
+    return "\n".join(lines).encode(), expected
+
+
+@given(
+    kinds=record_kinds,
+    cuts=st.lists(st.integers(min_value=0, max_value=100000), max_size=20),
+    chunk_docs=st.integers(min_value=1, max_value=7),
+    max_in_flight=st.integers(min_value=1, max_value=3),
+)
+@settings(max_examples=100, deadline=None)
+def test_every_record_reported_once_and_valid_ones_stored(kinds, cuts, chunk_docs, max_in_flight):
+    """
+    Property: Each record gets one result; exactly the valid ones are stored
+    """
+    data, expected = render(kinds)
+    fake = FakeBulkDocs()
+    client = make_client(fake)
+
+    async def run():
+        try:
+            return [
+                result
+                async for result in ingest_precedents(
+                    client,
+                    stream(split(data, cuts)),
+                    chunk_docs=chunk_docs,
+                    max_in_flight=max_in_flight,
+                    max_line_bytes=1000,
+                )
+            ]
+        finally:
+            await client.aclose()
+
+    *results, summary = asyncio.run(run())
+
+    assert sorted(result["line"] for result in results) == sorted(expected)
+    for result in results:
+        assert result["ok"] == (expected[result["line"]] is not None)
+        if result["ok"]:
+            assert result["id"] == expected[result["line"]]
+
+    valid = {decision_id for decision_id in expected.values() if decision_id}
+    assert set(fake.docs) == valid
+    assert all(0 < len(documents) <= chunk_docs for documents in fake.requests)
+    assert fake.max_in_flight <= max_in_flight
+    assert summary["summary"] == {
+        "received": len(expected),
+        "stored": len(valid),
+        "conflicts": 0,
+        "invalid": len(expected) - len(valid),
+        "errors": 0,
+    }
+
+
+@given(
+    records=st.integers(min_value=1, max_value=60),
+    chunk_docs=st.integers(min_value=1, max_value=5),
+    max_in_flight=st.integers(min_value=1, max_value=3),
+)
+@settings(max_examples=40, deadline=None)
+def test_records_held_in_memory_are_bounded(records, chunk_docs, max_in_flight):
+    """
+    Property: Records read but not yet reported never exceed the chunks in flight
+    """
+    fake = FakeBulkDocs()
+    client = make_client(fake)
+    read = 0
+
+    async def body():
+        nonlocal read
+        for i in range(records):
+            read += 1
+            yield json.dumps(decision(i)).encode() + b"\n"
+
+    async def run():
+        reported = 0
+        try:
+            async for result in ingest_precedents(
+                client, body(), chunk_docs=chunk_docs, max_in_flight=max_in_flight
+            ):
+                if "summary" not in result:
+                    reported += 1
+                assert read - reported <= (max_in_flight + 1) * chunk_docs + 1
+        finally:
+            await client.aclose()
+        return reported
+
+    assert asyncio.run(run()) == records
+
+
+def test_rerun_reports_conflicts_and_failures():
+    fake = FakeBulkDocs()
+    client = make_client(fake)
+    data = b"\n".join(json.dumps(decision(i)).encode() for i in range(3))
+
+    async def ingest():
+        return [result async for result in ingest_precedents(client, stream([data]))]
+
+    async def run():
+        try:
+            first = await ingest()
+            second = await ingest()
+            client.retry_policy.max_retries = 0
+            with patch.object(client, "_request", side_effect=ValueError("Cloudant down")):
+                failed = await ingest()
+            return first, second, failed
+        finally:
+            await client.aclose()
+
+    first, second, failed = asyncio.run(run())
+
+    assert first[-1]["summary"]["stored"] == 3
+    assert [r["error"] for r in second[:-1]] == ["conflict"] * 3
+    assert second[-1]["summary"]["conflicts"] == 3
+    assert {r["error"] for r in failed[:-1]} == {"bulk_failed"}
+    assert failed[-1]["summary"]["errors"] == 3
+
+
+def test_short_bulk_response_reports_every_record():
+    fake = FakeBulkDocs()
+    client = make_client(fake)
+    data = b"\n".join(json.dumps(decision(i)).encode() for i in range(3))
+
+    async def store_first_only(db_name, documents):
+        return [{"id": documents[0]["_id"], "rev": "1-a", "ok": True}]
+
+    async def run():
+        try:
+            with patch.object(client, "bulk_store_documents", side_effect=store_first_only):
+                return [result async for result in ingest_precedents(client, stream([data]))]
+        finally:
+            await client.aclose()
+
+    *results, summary = asyncio.run(run())
+
+    assert [result["line"] for result in results] == [1, 2, 3]
+    assert [result.get("error") for result in results] == [None, "missing_result", "missing_result"]
+    assert summary["summary"]["stored"] == 1
+    assert summary["summary"]["errors"] == 2
+
+
+def test_oversized_lines_are_not_buffered():
+    async def lines():
+        return [
+            item
+            async for item in iter_ndjson_lines(
+                stream([b'{"a": 1}\n', b"x" * 50, b"x" * 50, b'\n{"b"', b": 2}"]), 60
+            )
+        ]
+
+    assert asyncio.run(lines()) == [(1, b'{"a": 1}'), (2, None), (3, b'{"b": 2}')]
+
+
+def test_endpoint_streams_ndjson_results():
+    fake = FakeBulkDocs()
+    client = make_client(fake)
+    app = FastAPI()
+    app.include_router(memory.router, prefix="/memory")
+    body = b"\n".join([json.dumps(decision(1)).encode(), b"{bad", json.dumps(decision(2)).encode()])
+
+    with patch.object(memory, "get_async_cloudant_client", return_value=client):
+        response = TestClient(app).post(
+            "/memory/precedents/bulk",
+            content=iter([body[:50], body[50:]]),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[0] == {"line": 2, "ok": False, "error": "invalid", "reason": lines[0]["reason"]}
+    assert sorted(line["id"] for line in lines[1:-1]) == ["DEC-1", "DEC-2"]
+    assert lines[-1]["summary"]["stored"] == 2
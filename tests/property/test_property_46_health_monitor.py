@@ -0,0 +1,232 @@
+"""
+Property Test 46: Health Monitor
+Feature: lex-conductor-performance
+
+For any set of dependency probe outcomes, the health monitor should probe the
+dependencies concurrently, each on its own interval, record each one's latest
+status and latency, and serve them without calling any dependency.
+"""
+
+import asyncio
+import threading
+from unittest.mock import Mock, patch
+
+import httpx
+from hypothesis import given, strategies as st, settings
+
+from backend.async_cloudant_client import AsyncCloudantClient
+from backend import health_monitor
+from backend.health_monitor import DependencyCheck, HealthMonitor
+from backend.resilience import CircuitBreaker
+from backend.watsonx_client import WatsonxBackend, WatsonxClient
+
+
+class FakeProbe:
+    """Dependency probe with a given outcome, tracking concurrent calls."""
+
+    running = 0
+    max_running = 0
+
+    def __init__(self, outcome, delay=0.01):
+        self.outcome = outcome
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        FakeProbe.running += 1
+        FakeProbe.max_running = max(FakeProbe.max_running, FakeProbe.running)
+        try:
+            await asyncio.sleep(1.0 if self.outcome == "hang" else self.delay)
+            if self.outcome == "raise":
+                raise ConnectionError("unreachable")
+            return {"status": self.outcome, "detail": 1}
+        finally:
+            FakeProbe.running -= 1
+
+
+outcomes = st.lists(
+    st.sampled_from(["healthy", "unhealthy", "degraded", "raise", "hang"]), min_size=1, max_size=5
+)
+
+
+@given(outcomes=outcomes)
+@settings(max_examples=30, deadline=None)
+def test_snapshot_reflects_concurrent_probe_results(outcomes):
+    """
+    Property: Every dependency is probed concurrently and its result recorded
+    """
+    FakeProbe.max_running = 0
+    probes = [FakeProbe(outcome) for outcome in outcomes]
+    monitor = HealthMonitor(
+        [DependencyCheck(f"dep-{i}", probe, 60, 0.1) for i, probe in enumerate(probes)]
+    )
+    assert monitor.status == "starting"
+
+    asyncio.run(monitor.check_all())
+
+    assert FakeProbe.max_running == len(probes)
+    snapshot = monitor.snapshot()
+    for i, outcome in enumerate(outcomes):
+        status = snapshot[f"dep-{i}"]
+        expected = outcome if outcome in ("healthy", "unhealthy", "degraded") else "unhealthy"
+        assert status["status"] == expected
+        assert status["latency_ms"] is not None
+        assert status["consecutive_failures"] == (0 if expected == "healthy" else 1)
+        if outcome == "hang":
+            assert status["error"].startswith("Timed out")
+        if outcome == "raise":
+            assert status["error"] == "unreachable"
+
+    assert monitor.status == ("healthy" if set(outcomes) == {"healthy"} else "degraded")
+
+    # Reading the snapshot calls no dependency
+    monitor.summary()
+    monitor.snapshot()
+    assert all(probe.calls == 1 for probe in probes)
+
+
+def test_each_dependency_probed_on_its_own_interval():
+    fast, slow = FakeProbe("healthy", 0), FakeProbe("healthy", 0)
+    monitor = HealthMonitor(
+        [DependencyCheck("fast", fast, 0.01, 1.0), DependencyCheck("slow", slow, 10.0, 1.0)]
+    )
+
+    async def run():
+        monitor.start()
+        await asyncio.sleep(0.2)
+        await monitor.stop()
+
+    asyncio.run(run())
+
+    assert slow.calls == 1
+    assert fast.calls >= 5
+
+
+def test_consecutive_failures_reset_on_recovery():
+    probe = FakeProbe("unhealthy", 0)
+    monitor = HealthMonitor([DependencyCheck("dep", probe, 60, 1.0)])
+
+    async def run():
+        await monitor.run_check("dep")
+        await monitor.run_check("dep")
+        failures = monitor.snapshot()["dep"]["consecutive_failures"]
+        probe.outcome = "healthy"
+        await monitor.run_check("dep")
+        return failures
+
+    assert asyncio.run(run()) == 2
+    assert monitor.snapshot()["dep"]["consecutive_failures"] == 0
+    assert monitor.status == "healthy"
+
+
+def test_hung_threaded_probe_is_not_started_again():
+    release = threading.Event()
+    calls = []
+
+    def hang():
+        calls.append(1)
+        release.wait(5)
+        return {"status": "healthy"}
+
+    async def probe():
+        return await asyncio.to_thread(hang)
+
+    monitor = HealthMonitor([DependencyCheck("cos", probe, 60, 0.05)])
+
+    async def run():
+        first = await monitor.run_check("cos")
+        second = await monitor.run_check("cos")
+        release.set()
+        await asyncio.sleep(0.05)
+        third = await monitor.run_check("cos")
+        return first, second, third
+
+    first, second, third = asyncio.run(run())
+
+    assert first.error.startswith("Timed out")
+    assert second.error == "Previous probe still running"
+    assert second.consecutive_failures == 2
+    assert third.status == "healthy"
+    assert len(calls) == 2
+
+
+def test_unconfigured_dependency_does_not_degrade_service():
+    healthy = FakeProbe("healthy", 0)
+    monitor = HealthMonitor(
+        [
+            DependencyCheck("cloudant", healthy, 60, 1.0),
+            DependencyCheck("cos", health_monitor._probe_cos, 60, 1.0),
+        ]
+    )
+
+    with patch.object(
+        health_monitor, "get_cos_client", side_effect=ValueError("COS credentials required.")
+    ):
+        asyncio.run(monitor.check_all())
+
+    assert monitor.summary()["cos"]["status"] == "not_configured"
+    assert monitor.snapshot()["cos"]["consecutive_failures"] == 0
+    assert monitor.status == "healthy"
+
+
+def test_async_cloudant_health_check_queries_databases_concurrently():
+    running, max_running = 0, 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if request.url.path == "/":
+            return httpx.Response(200, json={"version": "3.4"})
+        if request.url.path == "/regulatory_mappings":
+            return httpx.Response(404, json={"error": "not_found"})
+        return httpx.Response(200, json={"doc_count": 7})
+
+    class NoAuthenticator:
+        def authenticate(self, request):
+            pass
+
+    client = AsyncCloudantClient(
+        url="https://test.cloudant.com",
+        authenticator=NoAuthenticator(),
+        transport=httpx.MockTransport(handler),
+        breaker=CircuitBreaker("test"),
+    )
+
+    async def run():
+        try:
+            return await client.health_check()
+        finally:
+            await client.aclose()
+
+    health = asyncio.run(run())
+
+    assert max_running == 4
+    assert health["status"] == "degraded"
+    assert health["version"] == "3.4"
+    assert health["databases"]["golden_clauses"] == {"status": "ok", "doc_count": 7}
+    assert health["databases"]["regulatory_mappings"]["status"] == "error"
+
+
+def test_watsonx_probe_runs_no_generation():
+    with patch.dict(
+        "os.environ",
+        {"LLM_BACKEND": "local", "WATSONX_API_KEY": "", "WATSONX_PROJECT_ID": ""},
+    ):
+        client = WatsonxClient()
+    client.generate = Mock()
+    assert client.probe()["status"] == "healthy"
+
+    backend = Mock(spec=WatsonxBackend)
+    backend.name = "watsonx"
+    backend.get_model.return_value.get_details.return_value = {"label": "granite"}
+    client.backend = backend
+
+    probe = client.probe()
+
+    assert probe["status"] == "healthy"
+    assert probe["model_label"] == "granite"
+    client.generate.assert_not_called()